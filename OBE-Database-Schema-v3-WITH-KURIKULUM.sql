@@ -651,6 +651,9 @@ CREATE TABLE documents (
 -- Kurikulum indexes
 CREATE INDEX idx_kurikulum_prodi ON kurikulum(id_prodi, status);
 CREATE INDEX idx_kurikulum_tahun ON kurikulum(tahun_berlaku, tahun_berakhir);
+-- Keyset pagination of GET /kurikulum on (tahun_berlaku, id_kurikulum)
+CREATE INDEX idx_kurikulum_keyset ON kurikulum(tahun_berlaku, id_kurikulum);
+CREATE INDEX idx_kurikulum_prodi_keyset ON kurikulum(id_prodi, tahun_berlaku, id_kurikulum);
 
 -- CPL indexes
 CREATE INDEX idx_cpl_kurikulum ON cpl(id_kurikulum);
@@ -762,7 +765,9 @@ SELECT
     p.id_prodi,
     p.nama as nama_prodi,
     COUNT(DISTINCT cpl.id_cpl) as jumlah_cpl,
+    COUNT(DISTINCT CASE WHEN cpl.is_active = TRUE THEN cpl.id_cpl END) as jumlah_cpl_aktif,
     COUNT(DISTINCT mk.kode_mk) as jumlah_mk,
+    COUNT(DISTINCT m.nim) as jumlah_mahasiswa,
     COUNT(DISTINCT CASE WHEN m.status = 'aktif' THEN m.nim END) as mahasiswa_aktif,
     COUNT(DISTINCT CASE WHEN m.status = 'lulus' THEN m.nim END) as mahasiswa_lulus,
     COUNT(DISTINCT m.angkatan) as jumlah_angkatan
@@ -774,6 +779,8 @@ LEFT JOIN mahasiswa m ON m.id_kurikulum = kur.id_kurikulum
 GROUP BY kur.id_kurikulum, kur.kode_kurikulum, kur.nama_kurikulum, kur.status, 
          kur.tahun_berlaku, p.id_prodi, p.nama;
 
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY,
+-- which the backend runs (debounced) after curriculum writes
 CREATE UNIQUE INDEX ON mv_statistik_kurikulum (id_kurikulum);
 
 -- =============================================================
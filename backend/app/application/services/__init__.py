@@ -3,3 +3,15 @@ Service Layer
 
 Business logic services.
 """
+
+from app.application.services.ketercapaian_engine import (
+    KetercapaianEngine,
+    KetercapaianCPMKResult,
+    KetercapaianCPLResult,
+)
+
+__all__ = [
+    "KetercapaianEngine",
+    "KetercapaianCPMKResult",
+    "KetercapaianCPLResult",
+]
@@ -0,0 +1,321 @@
+"""
+Ketercapaian Engine
+
+Vectorized CPMK and CPL achievement calculation (FR-008.4).
+Following Clean Code: Pure computation, No database access.
+
+Per class, grades form a dense students × komponen matrix and component
+weights a komponen × CPMK matrix; CPMK achievement is their weighted
+average computed with two matrix products. CPL achievement rolls the
+students × CPMK matrix up through the CPMK × CPL contribution weights.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from app.infrastructure.repositories.ketercapaian_repository import PenilaianSnapshot
+
+# numpy is imported on first use rather than at import time, keeping it out
+# of the worker cold start (IMPORT_TIME_BUDGET_MS)
+if TYPE_CHECKING:
+    import numpy as np
+
+
+
+@dataclass
+class KetercapaianCPMKResult:
+    """
+    CPMK achievement per enrollment, one entry per graded (enrollment, CPMK).
+
+    Attributes:
+        enrollment_ids: (M,) enrollment of each entry
+        cpmk_ids: (M,) CPMK of each entry
+        nilai: (M,) weighted average in percent, rounded to 2 decimals
+        tercapai: (M,) nilai >= batas_kelulusan_cpmk of the CPMK
+    """
+
+    enrollment_ids: "np.ndarray"
+    cpmk_ids: "np.ndarray"
+    nilai: "np.ndarray"
+    tercapai: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.enrollment_ids)
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        Rows for the ketercapaian_cpmk upsert.
+
+        Returns:
+            List[Dict]: id_enrollment, id_cpmk, nilai_cpmk, status_tercapai
+        """
+        return [
+            {
+                "id_enrollment": id_enrollment,
+                "id_cpmk": id_cpmk,
+                "nilai_cpmk": nilai,
+                "status_tercapai": tercapai,
+            }
+            for id_enrollment, id_cpmk, nilai, tercapai in zip(
+                self.enrollment_ids.tolist(),
+                self.cpmk_ids.tolist(),
+                self.nilai.tolist(),
+                self.tercapai.tolist(),
+            )
+        ]
+
+    def summary(self) -> Dict[int, Dict[str, float]]:
+        """
+        Per-CPMK class statistics.
+
+        Returns:
+            Dict[int, Dict]: id_cpmk → jumlah_mahasiswa, rata_rata,
+                jumlah_tercapai, persentase_tercapai
+        """
+        import numpy as np
+
+        cpmk_ids, column, counts = np.unique(
+            self.cpmk_ids, return_inverse=True, return_counts=True
+        )
+        totals = np.bincount(column, weights=self.nilai, minlength=len(cpmk_ids))
+        passed = np.bincount(column, weights=self.tercapai, minlength=len(cpmk_ids))
+        return {
+            id_cpmk: {
+                "jumlah_mahasiswa": int(count),
+                "rata_rata": round(float(total / count), 2),
+                "jumlah_tercapai": int(passed_count),
+                "persentase_tercapai": round(float(passed_count / count * 100), 2),
+            }
+            for id_cpmk, count, total, passed_count in zip(
+                cpmk_ids.tolist(), counts, totals, passed
+            )
+        }
+
+
+@dataclass
+class KetercapaianCPLResult:
+    """
+    CPL achievement per student.
+
+    Attributes:
+        nims: (S,) students
+        cpl_ids: (L,) CPL
+        nilai: (S, L) weighted average in percent; NaN where none of the
+            student's graded CPMK contribute to the CPL
+    """
+
+    nims: "np.ndarray"
+    cpl_ids: "np.ndarray"
+    nilai: "np.ndarray"
+
+    def summary(self) -> Dict[int, Dict[str, float]]:
+        """
+        Per-CPL cohort statistics.
+
+        Returns:
+            Dict[int, Dict]: id_cpl → jumlah_mahasiswa, rata_rata
+        """
+        import numpy as np
+
+        graded = ~np.isnan(self.nilai)
+        counts = graded.sum(axis=0)
+        totals = np.where(graded, self.nilai, 0.0).sum(axis=0)
+        return {
+            id_cpl: {
+                "jumlah_mahasiswa": int(count),
+                "rata_rata": round(float(total / count), 2) if count else None,
+            }
+            for id_cpl, count, total in zip(self.cpl_ids.tolist(), counts, totals)
+        }
+
+
+def _index_of(keys: "np.ndarray", values: "np.ndarray") -> "np.ndarray":
+    """
+    Positions of values in keys (-1 where absent).
+
+    Args:
+        keys: (n,) unique keys, any order
+        values: (m,) values to look up
+
+    Returns:
+        np.ndarray: (m,) positions into keys
+    """
+    import numpy as np
+
+    if len(keys) == 0:
+        return np.full(len(values), -1, dtype=np.int64)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    found = np.searchsorted(sorted_keys, values)
+    found = np.minimum(found, len(keys) - 1)
+    positions = order[found]
+    return np.where(sorted_keys[found] == values, positions, -1)
+
+
+def _group(labels: "np.ndarray", groups: "np.ndarray"):
+    """
+    Stable grouping of rows by label.
+
+    Args:
+        labels: (n,) label of each row
+        groups: (g,) sorted labels to group by
+
+    Returns:
+        Tuple: (order, starts, ends, rank) where the rows of groups[i] are
+            order[starts[i]:ends[i]] and rank[row] is the row's position in order
+    """
+    import numpy as np
+
+    order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[order]
+    starts = np.searchsorted(sorted_labels, groups, side="left")
+    ends = np.searchsorted(sorted_labels, groups, side="right")
+    rank = np.empty(len(labels), dtype=np.int64)
+    rank[order] = np.arange(len(labels))
+    return order, starts, ends, rank
+
+
+def weighted_average(scores: "np.ndarray", weights: "np.ndarray") -> "np.ndarray":
+    """
+    Weighted average over graded columns via matrix products.
+
+    Args:
+        scores: (n, k) values, NaN where not graded
+        weights: (k, m) weight of column k toward output m
+
+    Returns:
+        np.ndarray: (n, m) averages; NaN where no graded column has weight
+    """
+    import numpy as np
+
+    graded = ~np.isnan(scores)
+    total = np.where(graded, scores, 0.0) @ weights
+    weight = graded.astype(np.float64) @ weights
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(weight > 0, total / weight, np.nan)
+
+
+class KetercapaianEngine:
+    """
+    Computes CPMK and CPL achievement from a PenilaianSnapshot.
+
+    A CPMK is averaged over the components graded so far, weighted by
+    component weight; components without a score do not count yet. A CPL
+    is averaged over the student's graded CPMK, weighted by
+    bobot_kontribusi, using the latest attempt of retaken courses.
+    """
+
+    def hitung_cpmk(self, snapshot: PenilaianSnapshot) -> KetercapaianCPMKResult:
+        """
+        Compute CPMK achievement of every enrollment in the snapshot.
+
+        Args:
+            snapshot: Grades of a class or cohort
+
+        Returns:
+            KetercapaianCPMKResult: One entry per graded (enrollment, CPMK)
+        """
+        import numpy as np
+
+        kelas_ids = np.unique(snapshot.komponen_kelas)
+        e_order, e_start, e_end, e_rank = _group(snapshot.enrollment_kelas, kelas_ids)
+        k_order, k_start, k_end, k_rank = _group(snapshot.komponen_kelas, kelas_ids)
+
+        # Locate each score's enrollment and component; drop scores outside scope
+        n_enrollment = _index_of(snapshot.enrollment_ids, snapshot.nilai_enrollment)
+        n_komponen = _index_of(snapshot.komponen_ids, snapshot.nilai_komponen)
+        valid = (n_enrollment >= 0) & (n_komponen >= 0)
+        n_enrollment, n_komponen = n_enrollment[valid], n_komponen[valid]
+        persen = snapshot.nilai_persen[valid]
+        same_kelas = (
+            snapshot.enrollment_kelas[n_enrollment] == snapshot.komponen_kelas[n_komponen]
+        )
+        n_enrollment, n_komponen = n_enrollment[same_kelas], n_komponen[same_kelas]
+        persen = persen[same_kelas]
+        n_order, n_start, n_end, _ = _group(snapshot.komponen_kelas[n_komponen], kelas_ids)
+
+        batas = snapshot.cpmk_batas
+        enrollment_parts, cpmk_parts, nilai_parts = [], [], []
+        for g in range(len(kelas_ids)):
+            rows = e_order[e_start[g]:e_end[g]]
+            if len(rows) == 0:
+                continue
+            columns = k_order[k_start[g]:k_end[g]]
+            cpmk_ids, cpmk_column = np.unique(
+                snapshot.komponen_cpmk[columns], return_inverse=True
+            )
+
+            # komponen × CPMK weights: each component assesses one CPMK
+            weights = np.zeros((len(columns), len(cpmk_ids)))
+            weights[np.arange(len(columns)), cpmk_column] = snapshot.komponen_bobot[columns]
+
+            # students × komponen scores of this class
+            scores = np.full((len(rows), len(columns)), np.nan)
+            picked = n_order[n_start[g]:n_end[g]]
+            scores[
+                e_rank[n_enrollment[picked]] - e_start[g],
+                k_rank[n_komponen[picked]] - k_start[g],
+            ] = persen[picked]
+
+            nilai = weighted_average(scores, weights)
+            row, column = np.nonzero(~np.isnan(nilai))
+            enrollment_parts.append(snapshot.enrollment_ids[rows[row]])
+            cpmk_parts.append(cpmk_ids[column])
+            nilai_parts.append(nilai[row, column])
+
+        if not enrollment_parts:
+            empty = np.empty(0, dtype=np.int64)
+            return KetercapaianCPMKResult(empty, empty, np.empty(0), np.empty(0, dtype=bool))
+
+        cpmk_ids = np.concatenate(cpmk_parts)
+        nilai = np.round(np.concatenate(nilai_parts), 2)
+        position = _index_of(snapshot.cpmk_ids, cpmk_ids)
+        threshold = np.where(position >= 0, batas[position], np.inf)
+        return KetercapaianCPMKResult(
+            enrollment_ids=np.concatenate(enrollment_parts),
+            cpmk_ids=cpmk_ids,
+            nilai=nilai,
+            tercapai=nilai >= threshold,
+        )
+
+    def hitung_cpl(
+        self,
+        snapshot: PenilaianSnapshot,
+        cpmk: KetercapaianCPMKResult
+    ) -> KetercapaianCPLResult:
+        """
+        Roll CPMK achievement up to CPL for every student in the snapshot.
+
+        Args:
+            snapshot: Grades the CPMK result was computed from
+            cpmk: Result of hitung_cpmk
+
+        Returns:
+            KetercapaianCPLResult: students × CPL matrix
+        """
+        import numpy as np
+
+        students, cpmk_count = len(snapshot.nims), len(snapshot.cpmk_ids)
+
+        # students × CPMK, latest attempt only (unique per student and CPMK)
+        enrollment = _index_of(snapshot.enrollment_ids, cpmk.enrollment_ids)
+        column = _index_of(snapshot.cpmk_ids, cpmk.cpmk_ids)
+        keep = (enrollment >= 0) & (column >= 0)
+        keep[keep] = snapshot.enrollment_current[enrollment[keep]]
+        student_cpmk = np.full((students, cpmk_count), np.nan)
+        student_cpmk[snapshot.enrollment_student[enrollment[keep]], column[keep]] = (
+            cpmk.nilai[keep]
+        )
+
+        # CPMK × CPL contribution weights
+        contribution = np.zeros((cpmk_count, len(snapshot.cpl_ids)))
+        row = _index_of(snapshot.cpmk_ids, snapshot.relasi_cpmk)
+        col = _index_of(snapshot.cpl_ids, snapshot.relasi_cpl)
+        known = (row >= 0) & (col >= 0)
+        contribution[row[known], col[known]] = snapshot.relasi_bobot[known]
+
+        return KetercapaianCPLResult(
+            nims=snapshot.nims,
+            cpl_ids=snapshot.cpl_ids,
+            nilai=np.round(weighted_average(student_cpmk, contribution), 2),
+        )
@@ -5,7 +5,28 @@ Application-specific business rules.
 """
 
 from app.application.use_cases.kurikulum_use_cases import KurikulumUseCases
+from app.application.use_cases.async_kurikulum_use_cases import AsyncKurikulumUseCases
+from app.application.use_cases.import_use_cases import (
+    ImportUseCases,
+    ImportResult,
+    ImportRowError,
+)
+from app.application.use_cases.prasyarat_use_cases import PrasyaratUseCases
+from app.application.use_cases.auth_use_cases import AuthUseCases, LoginResult
+from app.application.use_cases.ketercapaian_use_cases import (
+    KetercapaianUseCases,
+    KetercapaianAngkatanResult,
+)
 
 __all__ = [
     "KurikulumUseCases",
+    "AsyncKurikulumUseCases",
+    "ImportUseCases",
+    "ImportResult",
+    "ImportRowError",
+    "PrasyaratUseCases",
+    "AuthUseCases",
+    "LoginResult",
+    "KetercapaianUseCases",
+    "KetercapaianAngkatanResult",
 ]
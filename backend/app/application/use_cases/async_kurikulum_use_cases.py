@@ -0,0 +1,551 @@
+"""
+Async Kurikulum Use Cases
+
+Async counterpart of KurikulumUseCases for `async def` routers.
+Following Clean Architecture: Use cases orchestrate the flow of data.
+"""
+
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
+
+from app.domain.entities import (
+    KurikulumEntity,
+    KurikulumStatus,
+)
+from app.domain.exceptions import (
+    NotFoundException,
+    DuplicateException,
+    InvalidOperationException,
+    PrimaryCurriculumConflictException,
+)
+from app.infrastructure.repositories.async_kurikulum_repository import AsyncKurikulumRepository
+from app.infrastructure.repositories.kurikulum_repository import is_primary_conflict
+from app.infrastructure.pagination import CountStrategy, Page
+from app.infrastructure.unit_of_work import AsyncUnitOfWork
+from app.infrastructure.cache import CacheBackend, get_cache_backend, invalidate_kurikulum
+from app.infrastructure.statistics import (
+    MaterializedViewRefresher,
+    get_statistics_refresher,
+)
+from app.infrastructure.models.kurikulum_models import (
+    Kurikulum,
+    KurikulumStatus as KurikulumStatusModel,
+)
+from app.infrastructure.replicas import read_only
+from app.infrastructure.tracing import trace_methods
+
+
+@trace_methods("use_case")
+class AsyncKurikulumUseCases:
+    """
+    Async use cases for Kurikulum management.
+
+    Same business rules as KurikulumUseCases, awaiting the database
+    instead of blocking a worker thread. State transitions run in one
+    AsyncUnitOfWork each.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        kurikulum_repo: Optional[AsyncKurikulumRepository] = None,
+        statistics_refresher: Optional[MaterializedViewRefresher] = None,
+        cache_backend: Optional[CacheBackend] = None,
+    ):
+        """
+        Initialize use cases with repositories.
+
+        Args:
+            session: Async database session
+            kurikulum_repo: Async Kurikulum repository (optional, created if not provided)
+            statistics_refresher: Refresher for mv_statistik_kurikulum
+                (optional, process-wide refresher if not provided)
+            cache_backend: Cache shared with the sync read path; writes
+                invalidate it (optional, process-wide backend if not provided)
+        """
+        self.session = session
+        self.kurikulum_repo = kurikulum_repo or AsyncKurikulumRepository(session)
+        self.statistics_refresher = statistics_refresher or get_statistics_refresher()
+        self.cache_backend = cache_backend or get_cache_backend()
+
+    async def create_kurikulum(
+        self,
+        id_prodi: str,
+        kode_kurikulum: str,
+        nama_kurikulum: str,
+        tahun_berlaku: int,
+        tahun_berakhir: Optional[int] = None,
+        deskripsi: Optional[str] = None,
+        is_primary: bool = False,
+    ) -> Kurikulum:
+        """
+        Create new curriculum.
+
+        Args:
+            id_prodi: Program study ID
+            kode_kurikulum: Curriculum code
+            nama_kurikulum: Curriculum name
+            tahun_berlaku: Year curriculum becomes effective
+            tahun_berakhir: Optional year curriculum ends
+            deskripsi: Optional description
+            is_primary: Whether this is primary curriculum
+
+        Returns:
+            Kurikulum: Created curriculum
+
+        Raises:
+            DuplicateException: If curriculum code already exists for program
+            InvalidOperationException: If business rules violated
+        """
+        if await self.kurikulum_repo.check_duplicate_code(id_prodi, kode_kurikulum):
+            raise DuplicateException(
+                f"Kurikulum dengan kode '{kode_kurikulum}' sudah ada untuk prodi '{id_prodi}'"
+            )
+
+        # Validate using domain entity (will raise ValueError if invalid)
+        try:
+            KurikulumEntity(
+                id_kurikulum=None,
+                id_prodi=id_prodi,
+                kode_kurikulum=kode_kurikulum,
+                nama_kurikulum=nama_kurikulum,
+                tahun_berlaku=tahun_berlaku,
+                tahun_berakhir=tahun_berakhir,
+                deskripsi=deskripsi,
+                status=KurikulumStatus.DRAFT,
+                is_primary=is_primary,
+            )
+        except ValueError as e:
+            raise InvalidOperationException(str(e))
+
+        previous_primary: List[int] = []
+        try:
+            async with AsyncUnitOfWork(self.session):
+                if is_primary:
+                    previous_primary = await self._unset_primary_curricula(id_prodi)
+
+                created = await self.kurikulum_repo.create(
+                    id_prodi=id_prodi,
+                    kode_kurikulum=kode_kurikulum,
+                    nama_kurikulum=nama_kurikulum,
+                    tahun_berlaku=tahun_berlaku,
+                    tahun_berakhir=tahun_berakhir,
+                    deskripsi=deskripsi,
+                    status=KurikulumStatusModel.DRAFT,
+                    is_primary=is_primary,
+                )
+        except IntegrityError as e:
+            if is_primary_conflict(e):
+                raise PrimaryCurriculumConflictException(id_prodi)
+            raise
+
+        self._on_kurikulum_changed(created.id_kurikulum, id_prodi, previous_primary)
+        return created
+
+    async def get_kurikulum_by_id(
+        self,
+        id_kurikulum: int,
+        include_statistics: bool = False
+    ) -> Kurikulum:
+        """
+        Get curriculum by ID.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            include_statistics: Whether to include statistics
+
+        Returns:
+            Kurikulum: Curriculum object
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        if include_statistics:
+            result = await self.kurikulum_repo.get_with_statistics(id_kurikulum)
+            return result["kurikulum"]
+        return await self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+    @read_only
+    async def get_kurikulum_with_statistics(self, id_kurikulum: int) -> Dict[str, Any]:
+        """
+        Get curriculum with detailed statistics.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Dict containing curriculum and statistics
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        return await self.kurikulum_repo.get_with_statistics(id_kurikulum)
+
+    @read_only
+    async def list_kurikulum(
+        self,
+        id_prodi: Optional[str] = None,
+        status: Optional[KurikulumStatus] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Page:
+        """
+        List one page of curricula with optional filters, newest first.
+
+        Args:
+            id_prodi: Optional program study ID filter
+            status: Optional status filter
+            limit: Page size
+            cursor: next_cursor of the previous page (optional)
+            fields: Columns to return; items are dictionaries when given
+            count: How to compute the total (exact, estimate or none)
+
+        Returns:
+            Page: Curricula page with next cursor
+
+        Raises:
+            ValidationException: If cursor or fields are invalid
+        """
+        filters = {}
+        if id_prodi:
+            filters["id_prodi"] = id_prodi
+        if status:
+            # Convert domain enum to model enum
+            filters["status"] = KurikulumStatusModel(status.value)
+
+        return await self.kurikulum_repo.get_newest_page(
+            limit=limit,
+            after=cursor,
+            fields=fields,
+            count=count,
+            **filters
+        )
+
+    @read_only
+    async def get_kurikulum_version(self, id_kurikulum: int) -> datetime:
+        """
+        Get the version stamp of a curriculum (for ETag pre-checks).
+
+        Reads only updated_at; the entity itself is not loaded.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            datetime: Last modification time
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        updated_at = await self.kurikulum_repo.get_updated_at(id_kurikulum)
+        if updated_at is None:
+            raise NotFoundException("Kurikulum", str(id_kurikulum))
+        return updated_at
+
+    @read_only
+    async def get_list_version(
+        self,
+        id_prodi: Optional[str] = None,
+        status: Optional[KurikulumStatus] = None,
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Get the version stamp of a filtered curriculum list.
+
+        Args:
+            id_prodi: Optional program study ID filter
+            status: Optional status filter
+
+        Returns:
+            Tuple[Optional[datetime], int]: max(updated_at) and row count
+        """
+        filters = {}
+        if id_prodi:
+            filters["id_prodi"] = id_prodi
+        if status:
+            filters["status"] = KurikulumStatusModel(status.value)
+
+        return await self.kurikulum_repo.get_list_version(**filters)
+
+    async def update_kurikulum(
+        self,
+        id_kurikulum: int,
+        nama_kurikulum: Optional[str] = None,
+        tahun_berakhir: Optional[int] = None,
+        deskripsi: Optional[str] = None,
+        nomor_sk: Optional[str] = None,
+        tanggal_sk: Optional[date] = None,
+    ) -> Kurikulum:
+        """
+        Update curriculum.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            nama_kurikulum: Optional new name
+            tahun_berakhir: Optional end year
+            deskripsi: Optional description
+            nomor_sk: Optional SK number
+            tanggal_sk: Optional SK date
+
+        Returns:
+            Kurikulum: Updated curriculum
+
+        Raises:
+            NotFoundException: If curriculum not found
+            InvalidOperationException: If curriculum cannot be modified
+        """
+        kurikulum = await self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+        if kurikulum.status not in [KurikulumStatusModel.DRAFT, KurikulumStatusModel.REVIEW]:
+            raise InvalidOperationException(
+                f"Kurikulum dengan status '{kurikulum.status}' tidak dapat dimodifikasi"
+            )
+
+        update_data = {}
+        if nama_kurikulum is not None:
+            update_data["nama_kurikulum"] = nama_kurikulum
+        if tahun_berakhir is not None:
+            update_data["tahun_berakhir"] = tahun_berakhir
+        if deskripsi is not None:
+            update_data["deskripsi"] = deskripsi
+        if nomor_sk is not None:
+            update_data["nomor_sk"] = nomor_sk
+        if tanggal_sk is not None:
+            update_data["tanggal_sk"] = tanggal_sk
+
+        async with AsyncUnitOfWork(self.session):
+            updated = await self.kurikulum_repo.update(kurikulum, **update_data)
+
+        self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
+        return updated
+
+    async def activate_kurikulum(
+        self,
+        id_kurikulum: int,
+        nomor_sk: str,
+        tanggal_sk: date,
+        set_as_primary: bool = False,
+    ) -> Kurikulum:
+        """
+        Activate curriculum.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            nomor_sk: SK number for activation
+            tanggal_sk: SK date
+            set_as_primary: Whether to set as primary curriculum
+
+        Returns:
+            Kurikulum: Activated curriculum
+
+        Raises:
+            NotFoundException: If curriculum not found
+            InvalidOperationException: If curriculum cannot be activated
+        """
+        kurikulum = await self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+        if kurikulum.status != KurikulumStatusModel.APPROVED:
+            raise InvalidOperationException(
+                f"Kurikulum dengan status '{kurikulum.status}' tidak dapat diaktifkan. "
+                "Status harus APPROVED."
+            )
+
+        id_prodi = kurikulum.id_prodi
+        previous_primary: List[int] = []
+        try:
+            async with AsyncUnitOfWork(self.session):
+                if set_as_primary:
+                    previous_primary = await self._unset_primary_curricula(id_prodi)
+
+                updated = await self.kurikulum_repo.update(
+                    kurikulum,
+                    status=KurikulumStatusModel.AKTIF,
+                    nomor_sk=nomor_sk,
+                    tanggal_sk=tanggal_sk,
+                    is_primary=set_as_primary,
+                )
+        except IntegrityError as e:
+            if is_primary_conflict(e):
+                raise PrimaryCurriculumConflictException(id_prodi)
+            raise
+
+        self._on_kurikulum_changed(id_kurikulum, id_prodi, previous_primary)
+        return updated
+
+    async def deactivate_kurikulum(self, id_kurikulum: int) -> Kurikulum:
+        """
+        Deactivate curriculum.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Kurikulum: Deactivated curriculum
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        kurikulum = await self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+        if kurikulum.status == KurikulumStatusModel.AKTIF:
+            async with AsyncUnitOfWork(self.session):
+                updated = await self.kurikulum_repo.update(
+                    kurikulum,
+                    status=KurikulumStatusModel.NON_AKTIF
+                )
+            self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
+            return updated
+
+        return kurikulum
+
+    async def approve_kurikulum(self, id_kurikulum: int) -> Kurikulum:
+        """
+        Approve curriculum (from REVIEW to APPROVED).
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Kurikulum: Approved curriculum
+
+        Raises:
+            NotFoundException: If curriculum not found
+            InvalidOperationException: If curriculum not in REVIEW status
+        """
+        kurikulum = await self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+        if kurikulum.status != KurikulumStatusModel.REVIEW:
+            raise InvalidOperationException(
+                f"Kurikulum dengan status '{kurikulum.status}' tidak dapat disetujui. "
+                "Status harus REVIEW."
+            )
+
+        async with AsyncUnitOfWork(self.session):
+            updated = await self.kurikulum_repo.update(
+                kurikulum,
+                status=KurikulumStatusModel.APPROVED
+            )
+
+        self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
+        return updated
+
+    async def submit_for_review(self, id_kurikulum: int) -> Kurikulum:
+        """
+        Submit curriculum for review (from DRAFT to REVIEW).
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Kurikulum: Submitted curriculum
+
+        Raises:
+            NotFoundException: If curriculum not found
+            InvalidOperationException: If curriculum not in DRAFT status
+        """
+        kurikulum = await self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+        if kurikulum.status != KurikulumStatusModel.DRAFT:
+            raise InvalidOperationException(
+                f"Kurikulum dengan status '{kurikulum.status}' tidak dapat diajukan review. "
+                "Status harus DRAFT."
+            )
+
+        async with AsyncUnitOfWork(self.session):
+            updated = await self.kurikulum_repo.update(
+                kurikulum,
+                status=KurikulumStatusModel.REVIEW
+            )
+
+        self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
+        return updated
+
+    async def delete_kurikulum(self, id_kurikulum: int) -> None:
+        """
+        Delete curriculum (only if in DRAFT status).
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Raises:
+            NotFoundException: If curriculum not found
+            InvalidOperationException: If curriculum cannot be deleted
+        """
+        kurikulum = await self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+        if kurikulum.status != KurikulumStatusModel.DRAFT:
+            raise InvalidOperationException(
+                f"Kurikulum dengan status '{kurikulum.status}' tidak dapat dihapus. "
+                "Hanya kurikulum DRAFT yang dapat dihapus."
+            )
+
+        id_prodi = kurikulum.id_prodi
+        async with AsyncUnitOfWork(self.session):
+            await self.kurikulum_repo.delete(kurikulum)
+
+        self._on_kurikulum_changed(id_kurikulum, id_prodi)
+
+    @read_only
+    async def get_active_curricula(self, id_prodi: str) -> List[Kurikulum]:
+        """
+        Get all active curricula for a program.
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            List[Kurikulum]: List of active curricula
+        """
+        return await self.kurikulum_repo.get_active_curricula(id_prodi)
+
+    @read_only
+    async def get_primary_curriculum(self, id_prodi: str) -> Optional[Kurikulum]:
+        """
+        Get primary curriculum for a program.
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            Optional[Kurikulum]: Primary curriculum if exists
+        """
+        return await self.kurikulum_repo.get_primary_curriculum(id_prodi)
+
+    async def _unset_primary_curricula(self, id_prodi: str) -> List[int]:
+        """
+        Unset all primary curricula for a program (internal helper).
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            List[int]: IDs of the curricula that were primary
+        """
+        return await self.kurikulum_repo.unset_primary(id_prodi)
+
+    def _on_kurikulum_changed(
+        self,
+        id_kurikulum: int,
+        id_prodi: str,
+        also_changed: Sequence[int] = ()
+    ) -> None:
+        """
+        React to a committed curriculum write (internal helper).
+
+        Invalidates cached lookups of the curriculum and its prodi, and
+        schedules a debounced refresh of mv_statistik_kurikulum.
+
+        Args:
+            id_kurikulum: Changed curriculum ID
+            id_prodi: Program study of the changed curriculum
+            also_changed: Other curricula touched by the write
+                (e.g. the previous primary curriculum)
+        """
+        invalidate_kurikulum(self.cache_backend, id_kurikulum, id_prodi)
+        for other_id in also_changed:
+            if other_id != id_kurikulum:
+                invalidate_kurikulum(self.cache_backend, id_kurikulum=other_id)
+        self.statistics_refresher.schedule()
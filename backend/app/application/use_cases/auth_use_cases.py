@@ -0,0 +1,126 @@
+"""
+Auth Use Cases
+
+Login with password verification off the event loop.
+Following Clean Architecture: Use cases orchestrate the flow of data.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.password_hashing import PasswordHashingService, get_password_hashing_service
+from app.core.security import TokenManager
+from app.domain.exceptions import AuthenticationException
+from app.infrastructure.cache import PermissionCache, get_permission_cache
+from app.infrastructure.models.user_models import User
+from app.infrastructure.repositories.async_user_repository import AsyncUserRepository
+from app.infrastructure.unit_of_work import AsyncUnitOfWork
+from app.infrastructure.tracing import trace_methods
+
+
+@dataclass
+class LoginResult:
+    """
+    Outcome of a successful login.
+
+    Attributes:
+        user: Authenticated user
+        access_token: JWT access token
+        refresh_token: JWT refresh token
+        rehashed: True if the stored hash was upgraded during this login
+    """
+
+    user: User
+    access_token: str
+    refresh_token: str
+    rehashed: bool = False
+
+
+@trace_methods("use_case")
+class AuthUseCases:
+    """
+    Async use cases for authentication.
+
+    bcrypt runs on PasswordHashingService, so a login never blocks the
+    event loop; when the pool is saturated the login is shed with
+    ServiceOverloadedException instead of queueing.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        user_repo: Optional[AsyncUserRepository] = None,
+        hashing_service: Optional[PasswordHashingService] = None,
+        permission_cache: Optional[PermissionCache] = None,
+    ):
+        """
+        Initialize use cases with repositories.
+
+        Args:
+            session: Async database session
+            user_repo: Async User repository (optional, created if not provided)
+            hashing_service: Password hashing service (optional,
+                process-wide service if not provided)
+            permission_cache: Compiled permission cache (optional,
+                process-wide cache if not provided)
+        """
+        self.session = session
+        self.user_repo = user_repo or AsyncUserRepository(session)
+        self.hashing_service = hashing_service or get_password_hashing_service()
+        self.permission_cache = permission_cache or get_permission_cache()
+
+    async def login(self, username: str, password: str) -> LoginResult:
+        """
+        Authenticate a user and issue tokens.
+
+        Unknown usernames still cost one bcrypt verification so response
+        times do not reveal which usernames exist. A hash whose cost no
+        longer matches BCRYPT_ROUNDS is replaced in the same transaction
+        that records last_login. With JWT_PERMISSION_VERSION the user's
+        permissions are compiled (priming the permission cache) and their
+        version is embedded in the access token as the pv claim.
+
+        Args:
+            username: Username
+            password: Plain text password
+
+        Returns:
+            LoginResult: User and issued tokens
+
+        Raises:
+            AuthenticationException: If credentials are wrong or user inactive
+            ServiceOverloadedException: If the hashing queue is full
+        """
+        user = await self.user_repo.get_by_username(username)
+        valid, new_hash = await self.hashing_service.verify_and_update(
+            password,
+            user.password_hash if user is not None else None
+        )
+        if not valid:
+            raise AuthenticationException("Username atau password salah")
+        if not user.is_active:
+            raise AuthenticationException("Akun tidak aktif")
+
+        update_data = {"last_login": datetime.utcnow()}
+        if new_hash is not None:
+            update_data["password_hash"] = new_hash
+
+        async with AsyncUnitOfWork(self.session):
+            await self.user_repo.update(user, **update_data)
+
+        claims = {"username": user.username, "user_type": user.user_type.value}
+        if settings.security.jwt_permission_version:
+            roles = await self.user_repo.get_role_names(user.id_user)
+            claims["pv"] = self.permission_cache.store(user.id_user, roles).version
+
+        subject = str(user.id_user)
+        return LoginResult(
+            user=user,
+            access_token=TokenManager.create_access_token(subject, claims),
+            refresh_token=TokenManager.create_refresh_token(subject),
+            rehashed=new_hash is not None,
+        )
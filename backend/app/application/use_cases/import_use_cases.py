@@ -0,0 +1,410 @@
+"""
+Import Use Cases
+
+Bulk import of CPL and MataKuliah lists from CSV/XLSX files (FR-008.3).
+Following Clean Architecture: Use cases orchestrate the flow of data.
+"""
+
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domain.entities import CPLEntity, CPLKategori, JenisMK, MataKuliahEntity
+from app.domain.exceptions import InvalidOperationException
+from app.infrastructure.cache import CachedPrerequisiteGraphs, get_cache_backend
+from app.infrastructure.importing import CopyLoader, ImportRow, chunked, read_rows
+from app.infrastructure.models.kurikulum_models import (
+    CPL,
+    CPLKategori as CPLKategoriModel,
+    JenisMK as JenisMKModel,
+    KurikulumStatus as KurikulumStatusModel,
+    MataKuliah,
+)
+from app.infrastructure.repositories.cpl_repository import CPLRepository
+from app.infrastructure.repositories.kurikulum_repository import KurikulumRepository
+from app.infrastructure.repositories.matakuliah_repository import MataKuliahRepository
+from app.infrastructure.statistics import (
+    MaterializedViewRefresher,
+    get_statistics_refresher,
+)
+from app.infrastructure.unit_of_work import UnitOfWork
+from app.infrastructure.tracing import trace_methods
+
+
+CPL_REQUIRED_COLUMNS = ("kode_cpl", "deskripsi", "kategori")
+CPL_COLUMNS = ("id_kurikulum", "kode_cpl", "deskripsi", "kategori", "urutan", "is_active")
+
+MATAKULIAH_REQUIRED_COLUMNS = ("kode_mk", "nama_mk", "sks", "semester", "jenis_mk")
+MATAKULIAH_COLUMNS = (
+    "kode_mk", "id_kurikulum", "nama_mk", "nama_mk_eng",
+    "sks", "semester", "rumpun", "jenis_mk", "is_active",
+)
+
+# Upper bound enforced by chk on matakuliah.sks in the database schema
+MAX_SKS = 6
+
+
+@dataclass
+class ImportRowError:
+    """A rejected row of an import file."""
+
+    row: int
+    kode: Optional[str]
+    message: str
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of one import.
+
+    Attributes:
+        total_rows: Non-blank data rows read
+        inserted: Rows inserted as new records
+        updated: Existing records overwritten (update_existing only)
+        errors: Rejected rows; valid rows are imported regardless
+    """
+
+    total_rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    errors: List[ImportRowError] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        """Number of rejected rows."""
+        return len(self.errors)
+
+
+@trace_methods("use_case")
+class ImportUseCases:
+    """
+    Use cases for bulk CPL and MataKuliah import.
+
+    Files are read as a stream and processed in chunks. Each chunk is
+    validated in memory (domain rules plus duplicate codes against one
+    prefetched key set) and written with one COPY + INSERT ... ON CONFLICT.
+    Invalid rows are reported and skipped; the whole import commits once.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        kurikulum_repo: Optional[KurikulumRepository] = None,
+        cpl_repo: Optional[CPLRepository] = None,
+        mk_repo: Optional[MataKuliahRepository] = None,
+        statistics_refresher: Optional[MaterializedViewRefresher] = None,
+        chunk_size: Optional[int] = None,
+        prerequisite_graphs: Optional[CachedPrerequisiteGraphs] = None,
+    ):
+        """
+        Initialize use cases with repositories.
+
+        Args:
+            session: Database session
+            kurikulum_repo: Kurikulum repository (optional, created if not provided)
+            cpl_repo: CPL repository (optional)
+            mk_repo: MataKuliah repository (optional)
+            statistics_refresher: Refresher for mv_statistik_kurikulum
+                (optional, process-wide refresher if not provided)
+            chunk_size: Rows per batch (optional, DATABASE_IMPORT_CHUNK_SIZE)
+            prerequisite_graphs: Prerequisite graph cache, invalidated after
+                course imports (optional, process-wide cache backend if not provided)
+        """
+        self.session = session
+        self.kurikulum_repo = kurikulum_repo or KurikulumRepository(session)
+        self.cpl_repo = cpl_repo or CPLRepository(session)
+        self.mk_repo = mk_repo or MataKuliahRepository(session)
+        self.statistics_refresher = statistics_refresher or get_statistics_refresher()
+        self.chunk_size = chunk_size or settings.database.import_chunk_size
+        self.prerequisite_graphs = prerequisite_graphs or CachedPrerequisiteGraphs(
+            self.mk_repo,
+            get_cache_backend(),
+            settings.cache.ttl_seconds
+        )
+
+    def import_cpl(
+        self,
+        id_kurikulum: int,
+        stream: IO[bytes],
+        filename: str,
+        update_existing: bool = False
+    ) -> ImportResult:
+        """
+        Import CPL rows into a curriculum.
+
+        Columns: kode_cpl, deskripsi, kategori, urutan (optional).
+
+        Args:
+            id_kurikulum: Target curriculum ID
+            stream: Uploaded file (binary)
+            filename: Original file name (.csv or .xlsx)
+            update_existing: Overwrite CPL whose code already exists
+                instead of rejecting the row
+
+        Returns:
+            ImportResult: Counts and per-row errors
+
+        Raises:
+            NotFoundException: If curriculum not found
+            InvalidOperationException: If curriculum cannot be modified
+            ValidationException: If the file format or header is invalid
+        """
+        self._get_modifiable_kurikulum(id_kurikulum)
+        rows = read_rows(stream, filename, CPL_REQUIRED_COLUMNS)
+
+        loader = CopyLoader(
+            self.session,
+            CPL,
+            CPL_COLUMNS,
+            conflict_columns=("id_kurikulum", "kode_cpl"),
+            update_columns=(
+                ("deskripsi", "kategori", "urutan", "is_active")
+                if update_existing else ()
+            ),
+        )
+        return self._import(
+            rows,
+            parse=lambda record: self._parse_cpl(id_kurikulum, record),
+            code_field="kode_cpl",
+            existing=self.cpl_repo.get_codes(id_kurikulum),
+            loader=loader,
+            update_existing=update_existing,
+        )
+
+    def import_matakuliah(
+        self,
+        id_kurikulum: int,
+        stream: IO[bytes],
+        filename: str,
+        update_existing: bool = False
+    ) -> ImportResult:
+        """
+        Import MataKuliah rows into a curriculum.
+
+        Columns: kode_mk, nama_mk, sks, semester, jenis_mk,
+        nama_mk_eng (optional), rumpun (optional).
+
+        Args:
+            id_kurikulum: Target curriculum ID
+            stream: Uploaded file (binary)
+            filename: Original file name (.csv or .xlsx)
+            update_existing: Overwrite courses whose code already exists
+                instead of rejecting the row
+
+        Returns:
+            ImportResult: Counts and per-row errors
+
+        Raises:
+            NotFoundException: If curriculum not found
+            InvalidOperationException: If curriculum cannot be modified
+            ValidationException: If the file format or header is invalid
+        """
+        self._get_modifiable_kurikulum(id_kurikulum)
+        rows = read_rows(stream, filename, MATAKULIAH_REQUIRED_COLUMNS)
+
+        loader = CopyLoader(
+            self.session,
+            MataKuliah,
+            MATAKULIAH_COLUMNS,
+            conflict_columns=("kode_mk", "id_kurikulum"),
+            update_columns=(
+                ("nama_mk", "nama_mk_eng", "sks", "semester", "rumpun", "jenis_mk", "is_active")
+                if update_existing else ()
+            ),
+        )
+        result = self._import(
+            rows,
+            parse=lambda record: self._parse_matakuliah(id_kurikulum, record),
+            code_field="kode_mk",
+            existing=self.mk_repo.get_codes(id_kurikulum),
+            loader=loader,
+            update_existing=update_existing,
+        )
+        if result.inserted or result.updated:
+            self.prerequisite_graphs.invalidate(id_kurikulum)
+        return result
+
+    def _get_modifiable_kurikulum(self, id_kurikulum: int) -> None:
+        """Ensure the curriculum exists and is still editable (internal helper)."""
+        kurikulum = self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+        if kurikulum.status not in [KurikulumStatusModel.DRAFT, KurikulumStatusModel.REVIEW]:
+            raise InvalidOperationException(
+                f"Kurikulum dengan status '{kurikulum.status}' tidak dapat dimodifikasi"
+            )
+
+    def _import(
+        self,
+        rows: Iterable[ImportRow],
+        parse: Callable[[Dict[str, Any]], Dict[str, Any]],
+        code_field: str,
+        existing: Set[str],
+        loader: CopyLoader,
+        update_existing: bool
+    ) -> ImportResult:
+        """
+        Validate and load rows chunk by chunk in one unit of work (internal helper).
+
+        Args:
+            rows: Rows from read_rows
+            parse: Converts a record into column values, raises ValueError
+            code_field: Column holding the code that must be unique
+            existing: Codes already stored in the curriculum
+            loader: Bulk loader for the target table
+            update_existing: Whether existing codes are overwritten
+
+        Returns:
+            ImportResult: Counts and per-row errors
+        """
+        result = ImportResult()
+        seen: Set[str] = set()
+        code_index = loader.conflict_columns.index(code_field)
+
+        with UnitOfWork(self.session):
+            for chunk in chunked(rows, self.chunk_size):
+                valid: List[Dict[str, Any]] = []
+                row_numbers: List[int] = []
+                for row_number, record in chunk:
+                    result.total_rows += 1
+                    raw_code = _text(record.get(code_field)) or None
+                    try:
+                        data = parse(record)
+                    except ValueError as e:
+                        result.errors.append(ImportRowError(row_number, raw_code, str(e)))
+                        continue
+
+                    kode = data[code_field]
+                    if kode in seen:
+                        message = f"Kode '{kode}' muncul lebih dari sekali dalam berkas"
+                    elif kode in existing and not update_existing:
+                        message = f"Kode '{kode}' sudah ada di kurikulum"
+                    else:
+                        seen.add(kode)
+                        valid.append(data)
+                        row_numbers.append(row_number)
+                        continue
+                    result.errors.append(ImportRowError(row_number, kode, message))
+
+                written = {key[code_index] for key in loader.load(valid)}
+
+                for row_number, data in zip(row_numbers, valid):
+                    kode = data[code_field]
+                    if kode not in written:
+                        # Inserted by someone else after the codes were prefetched
+                        result.errors.append(ImportRowError(
+                            row_number, kode, f"Kode '{kode}' sudah ada di kurikulum"
+                        ))
+                    elif kode in existing:
+                        result.updated += 1
+                    else:
+                        result.inserted += 1
+
+        if result.inserted or result.updated:
+            self.statistics_refresher.schedule()
+        result.errors.sort(key=lambda error: error.row)
+        return result
+
+    @staticmethod
+    def _parse_cpl(id_kurikulum: int, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a CPL record into column values (internal helper).
+
+        Raises:
+            ValueError: If the row violates a domain rule or column format
+        """
+        kategori_value = "_".join(_text(record.get("kategori")).lower().split())
+        try:
+            kategori = CPLKategori(kategori_value)
+        except ValueError:
+            raise ValueError(f"Kategori CPL tidak valid: '{record.get('kategori')}'")
+
+        entity = CPLEntity(
+            id_cpl=None,
+            id_kurikulum=id_kurikulum,
+            kode_cpl=_text(record.get("kode_cpl"), "Kode CPL", 20),
+            deskripsi=_text(record.get("deskripsi")),
+            kategori=kategori,
+            urutan=_integer(record.get("urutan"), "Urutan", required=False),
+        )
+        return {
+            "id_kurikulum": entity.id_kurikulum,
+            "kode_cpl": entity.kode_cpl,
+            "deskripsi": entity.deskripsi,
+            "kategori": CPLKategoriModel(entity.kategori.value),
+            "urutan": entity.urutan,
+            "is_active": True,
+        }
+
+    @staticmethod
+    def _parse_matakuliah(id_kurikulum: int, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a MataKuliah record into column values (internal helper).
+
+        Raises:
+            ValueError: If the row violates a domain rule or column format
+        """
+        jenis_value = _text(record.get("jenis_mk")).lower()
+        jenis = next((jenis for jenis in JenisMK if jenis.value.lower() == jenis_value), None)
+        if jenis is None:
+            raise ValueError(f"Jenis MK tidak valid: '{record.get('jenis_mk')}'")
+
+        entity = MataKuliahEntity(
+            kode_mk=_text(record.get("kode_mk"), "Kode MK", 20),
+            id_kurikulum=id_kurikulum,
+            nama_mk=_text(record.get("nama_mk"), "Nama MK", 100),
+            sks=_integer(record.get("sks"), "SKS"),
+            semester=_integer(record.get("semester"), "Semester"),
+            jenis_mk=jenis,
+            nama_mk_eng=_text(record.get("nama_mk_eng"), "Nama MK (Inggris)", 100) or None,
+            rumpun=_text(record.get("rumpun"), "Rumpun", 50) or None,
+        )
+        if entity.sks > MAX_SKS:
+            raise ValueError(f"SKS tidak boleh lebih dari {MAX_SKS}")
+
+        return {
+            "kode_mk": entity.kode_mk,
+            "id_kurikulum": entity.id_kurikulum,
+            "nama_mk": entity.nama_mk,
+            "nama_mk_eng": entity.nama_mk_eng,
+            "sks": entity.sks,
+            "semester": entity.semester,
+            "rumpun": entity.rumpun,
+            "jenis_mk": JenisMKModel(entity.jenis_mk.value),
+            "is_active": True,
+        }
+
+
+def _text(value: Any, label: Optional[str] = None, max_length: Optional[int] = None) -> str:
+    """
+    Cell value as stripped text ("" for empty cells).
+
+    Raises:
+        ValueError: If the text is longer than max_length
+    """
+    text = "" if value is None else str(value).strip()
+    if max_length is not None and len(text) > max_length:
+        raise ValueError(f"{label} maksimal {max_length} karakter")
+    return text
+
+
+def _integer(value: Any, label: str, required: bool = True) -> Optional[int]:
+    """
+    Cell value as int; spreadsheet numbers such as 3.0 are accepted.
+
+    Raises:
+        ValueError: If the value is missing (when required) or not a whole number
+    """
+    text = _text(value)
+    if not text:
+        if required:
+            raise ValueError(f"{label} wajib diisi")
+        return None
+    try:
+        number = float(text)
+    except ValueError:
+        raise ValueError(f"{label} harus berupa bilangan bulat")
+    if not number.is_integer():
+        raise ValueError(f"{label} harus berupa bilangan bulat")
+    return int(number)
@@ -0,0 +1,118 @@
+"""
+Ketercapaian Use Cases
+
+CPMK and CPL achievement calculation for a class or a cohort (FR-008.4).
+Following Clean Architecture: Use cases orchestrate the flow of data.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.application.services.ketercapaian_engine import (
+    KetercapaianCPLResult,
+    KetercapaianCPMKResult,
+    KetercapaianEngine,
+)
+from app.domain.exceptions import NotFoundException
+from app.infrastructure.repositories.ketercapaian_repository import KetercapaianRepository
+from app.infrastructure.repositories.kurikulum_repository import KurikulumRepository
+from app.infrastructure.unit_of_work import UnitOfWork
+from app.infrastructure.tracing import trace_methods
+
+
+@dataclass
+class KetercapaianAngkatanResult:
+    """
+    Achievement of a cohort.
+
+    Attributes:
+        cpmk: CPMK achievement per enrollment (stored in ketercapaian_cpmk)
+        cpl: CPL achievement per student
+    """
+
+    cpmk: KetercapaianCPMKResult
+    cpl: KetercapaianCPLResult
+
+
+@trace_methods("use_case")
+class KetercapaianUseCases:
+    """
+    Use cases for achievement calculation.
+
+    Loads a whole class or cohort at once, computes every achievement with
+    KetercapaianEngine and stores CPMK achievement with one bulk upsert,
+    instead of per-row triggers or the mv_ketercapaian_cpl join.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        ketercapaian_repo: Optional[KetercapaianRepository] = None,
+        kurikulum_repo: Optional[KurikulumRepository] = None,
+        engine: Optional[KetercapaianEngine] = None,
+    ):
+        """
+        Initialize use cases with repositories.
+
+        Args:
+            session: Database session
+            ketercapaian_repo: Ketercapaian repository (optional, created if not provided)
+            kurikulum_repo: Kurikulum repository (optional)
+            engine: Calculation engine (optional)
+        """
+        self.session = session
+        self.ketercapaian_repo = ketercapaian_repo or KetercapaianRepository(session)
+        self.kurikulum_repo = kurikulum_repo or KurikulumRepository(session)
+        self.engine = engine or KetercapaianEngine()
+
+    def hitung_kelas(self, id_kelas: int) -> KetercapaianCPMKResult:
+        """
+        Calculate and store CPMK achievement of every student in a class.
+
+        Args:
+            id_kelas: Class ID
+
+        Returns:
+            KetercapaianCPMKResult: CPMK achievement per enrollment
+
+        Raises:
+            NotFoundException: If class not found
+        """
+        if self.ketercapaian_repo.get_kelas(id_kelas) is None:
+            raise NotFoundException("Kelas", str(id_kelas))
+
+        snapshot = self.ketercapaian_repo.load_kelas(id_kelas)
+        result = self.engine.hitung_cpmk(snapshot)
+
+        with UnitOfWork(self.session):
+            self.ketercapaian_repo.upsert(result.to_rows())
+        return result
+
+    def hitung_angkatan(self, id_kurikulum: int, angkatan: str) -> KetercapaianAngkatanResult:
+        """
+        Calculate CPMK and CPL achievement of a cohort.
+
+        CPMK achievement of every class the cohort took is stored;
+        CPL achievement is returned.
+
+        Args:
+            id_kurikulum: Curriculum ID of the students
+            angkatan: Cohort year, e.g. "2024"
+
+        Returns:
+            KetercapaianAngkatanResult: CPMK and CPL achievement
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+
+        snapshot = self.ketercapaian_repo.load_angkatan(id_kurikulum, angkatan)
+        cpmk = self.engine.hitung_cpmk(snapshot)
+        cpl = self.engine.hitung_cpl(snapshot, cpmk)
+
+        with UnitOfWork(self.session):
+            self.ketercapaian_repo.upsert(cpmk.to_rows())
+        return KetercapaianAngkatanResult(cpmk=cpmk, cpl=cpl)
@@ -5,9 +5,10 @@ Application layer business logic for curriculum management.
 Following Clean Architecture: Use cases orchestrate the flow of data.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from datetime import date
+from datetime import date, datetime
 
 from app.domain.entities import (
     KurikulumEntity,
@@ -20,21 +21,38 @@ from app.domain.exceptions import (
     NotFoundException,
     DuplicateException,
     InvalidOperationException,
+    PrimaryCurriculumConflictException,
+)
+from app.infrastructure.repositories.kurikulum_repository import (
+    KurikulumRepository,
+    is_primary_conflict,
 )
-from app.infrastructure.repositories.kurikulum_repository import KurikulumRepository
 from app.infrastructure.repositories.cpl_repository import CPLRepository
 from app.infrastructure.repositories.matakuliah_repository import MataKuliahRepository
+from app.infrastructure.pagination import CountStrategy, Page
+from app.infrastructure.unit_of_work import UnitOfWork
+from app.infrastructure.cache import CachedKurikulumRepository, get_cache_backend
+from app.core.config import settings
+from app.infrastructure.statistics import (
+    MaterializedViewRefresher,
+    get_statistics_refresher,
+)
 from app.infrastructure.models.kurikulum_models import (
     Kurikulum,
     KurikulumStatus as KurikulumStatusModel,
 )
+from app.infrastructure.replicas import read_only
+from app.infrastructure.tracing import trace_methods
 
 
+@trace_methods("use_case")
 class KurikulumUseCases:
     """
     Use cases for Kurikulum management.
 
     Orchestrates business logic for curriculum operations.
+    Each state transition runs in one UnitOfWork: repositories only
+    flush, and a single commit happens when the use case returns.
     """
 
     def __init__(
@@ -43,6 +61,8 @@ class KurikulumUseCases:
         kurikulum_repo: Optional[KurikulumRepository] = None,
         cpl_repo: Optional[CPLRepository] = None,
         mk_repo: Optional[MataKuliahRepository] = None,
+        statistics_refresher: Optional[MaterializedViewRefresher] = None,
+        kurikulum_cache: Optional[CachedKurikulumRepository] = None,
     ):
         """
         Initialize use cases with repositories.
@@ -52,11 +72,21 @@ class KurikulumUseCases:
             kurikulum_repo: Kurikulum repository (optional, created if not provided)
             cpl_repo: CPL repository (optional)
             mk_repo: MataKuliah repository (optional)
+            statistics_refresher: Refresher for mv_statistik_kurikulum
+                (optional, process-wide refresher if not provided)
+            kurikulum_cache: Read-through cache for hot lookups
+                (optional, process-wide cache backend if not provided)
         """
         self.session = session
         self.kurikulum_repo = kurikulum_repo or KurikulumRepository(session)
         self.cpl_repo = cpl_repo or CPLRepository(session)
         self.mk_repo = mk_repo or MataKuliahRepository(session)
+        self.statistics_refresher = statistics_refresher or get_statistics_refresher()
+        self.kurikulum_cache = kurikulum_cache or CachedKurikulumRepository(
+            self.kurikulum_repo,
+            get_cache_backend(),
+            settings.cache.ttl_seconds
+        )
 
     def create_kurikulum(
         self,
@@ -109,32 +139,36 @@ class KurikulumUseCases:
         except ValueError as e:
             raise InvalidOperationException(str(e))
 
-        # If is_primary, unset other primary curricula
-        if is_primary:
-            self._unset_primary_curricula(id_prodi)
-
-        # Create database model
-        kurikulum = Kurikulum(
-            id_prodi=id_prodi,
-            kode_kurikulum=kode_kurikulum,
-            nama_kurikulum=nama_kurikulum,
-            tahun_berlaku=tahun_berlaku,
-            tahun_berakhir=tahun_berakhir,
-            deskripsi=deskripsi,
-            status=KurikulumStatusModel.DRAFT,
-            is_primary=is_primary,
-        )
-
-        created = self.kurikulum_repo.create(kurikulum)
-        self.session.commit()
-        self.session.refresh(created)
-
+        previous_primary: List[int] = []
+        try:
+            with UnitOfWork(self.session):
+                # If is_primary, unset other primary curricula
+                if is_primary:
+                    previous_primary = self._unset_primary_curricula(id_prodi)
+
+                created = self.kurikulum_repo.create(
+                    id_prodi=id_prodi,
+                    kode_kurikulum=kode_kurikulum,
+                    nama_kurikulum=nama_kurikulum,
+                    tahun_berlaku=tahun_berlaku,
+                    tahun_berakhir=tahun_berakhir,
+                    deskripsi=deskripsi,
+                    status=KurikulumStatusModel.DRAFT,
+                    is_primary=is_primary,
+                )
+        except IntegrityError as e:
+            if is_primary_conflict(e):
+                raise PrimaryCurriculumConflictException(id_prodi)
+            raise
+
+        self._on_kurikulum_changed(created.id_kurikulum, id_prodi, previous_primary)
         return created
 
     def get_kurikulum_by_id(
         self,
         id_kurikulum: int,
-        include_statistics: bool = False
+        include_statistics: bool = False,
+        version: Optional[datetime] = None
     ) -> Kurikulum:
         """
         Get curriculum by ID.
@@ -142,6 +176,8 @@ class KurikulumUseCases:
         Args:
             id_kurikulum: Curriculum ID
             include_statistics: Whether to include statistics
+            version: updated_at from get_kurikulum_version(); a cached
+                copy of another version is reloaded (optional)
 
         Returns:
             Kurikulum: Curriculum object
@@ -153,8 +189,9 @@ class KurikulumUseCases:
             result = self.kurikulum_repo.get_with_statistics(id_kurikulum)
             return result["kurikulum"]
         else:
-            return self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
+            return self.kurikulum_cache.get_by_id_or_fail(id_kurikulum, version)
 
+    @read_only
     def get_kurikulum_with_statistics(self, id_kurikulum: int) -> Dict[str, Any]:
         """
         Get curriculum with detailed statistics.
@@ -170,20 +207,32 @@ class KurikulumUseCases:
         """
         return self.kurikulum_repo.get_with_statistics(id_kurikulum)
 
+    @read_only
     def list_kurikulum(
         self,
         id_prodi: Optional[str] = None,
         status: Optional[KurikulumStatus] = None,
-    ) -> List[Kurikulum]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        count: CountStrategy = CountStrategy.EXACT,
+    ) -> Page:
         """
-        List curricula with optional filters.
+        List one page of curricula with optional filters, newest first.
 
         Args:
             id_prodi: Optional program study ID filter
             status: Optional status filter
+            limit: Page size
+            cursor: next_cursor of the previous page (optional)
+            fields: Columns to return; items are dictionaries when given
+            count: How to compute the total (exact, estimate or none)
 
         Returns:
-            List[Kurikulum]: List of curricula
+            Page: Curricula page with next cursor
+
+        Raises:
+            ValidationException: If cursor or fields are invalid
         """
         filters = {}
         if id_prodi:
@@ -192,7 +241,72 @@ class KurikulumUseCases:
             # Convert domain enum to model enum
             filters["status"] = KurikulumStatusModel(status.value)
 
-        return self.kurikulum_repo.get_by_criteria(**filters)
+        return self.kurikulum_repo.get_newest_page(
+            limit=limit,
+            after=cursor,
+            fields=fields,
+            count=count,
+            **filters
+        )
+
+    @read_only
+    def get_kurikulum_version(self, id_kurikulum: int) -> datetime:
+        """
+        Get the version stamp of a curriculum (for ETag pre-checks).
+
+        Reads only updated_at; the entity itself is not loaded.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            datetime: Last modification time
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        updated_at = self.kurikulum_repo.get_updated_at(id_kurikulum)
+        if updated_at is None:
+            raise NotFoundException("Kurikulum", str(id_kurikulum))
+        return updated_at
+
+    @read_only
+    def get_list_version(
+        self,
+        id_prodi: Optional[str] = None,
+        status: Optional[KurikulumStatus] = None,
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        Get the version stamp of a filtered curriculum list.
+
+        Args:
+            id_prodi: Optional program study ID filter
+            status: Optional status filter
+
+        Returns:
+            Tuple[Optional[datetime], int]: max(updated_at) and row count
+        """
+        filters = {}
+        if id_prodi:
+            filters["id_prodi"] = id_prodi
+        if status:
+            filters["status"] = KurikulumStatusModel(status.value)
+
+        return self.kurikulum_repo.get_list_version(**filters)
+
+    @read_only
+    def get_primary_version(self, id_prodi: str) -> Tuple[Optional[int], Optional[datetime]]:
+        """
+        Get the version stamp of a program's primary curriculum.
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            Tuple[Optional[int], Optional[datetime]]: (id_kurikulum, updated_at),
+                (None, None) without a primary curriculum
+        """
+        return self.kurikulum_repo.get_primary_version(id_prodi)
 
     def update_kurikulum(
         self,
@@ -242,10 +356,10 @@ class KurikulumUseCases:
         if tanggal_sk is not None:
             update_data["tanggal_sk"] = tanggal_sk
 
-        updated = self.kurikulum_repo.update(kurikulum, **update_data)
-        self.session.commit()
-        self.session.refresh(updated)
+        with UnitOfWork(self.session):
+            updated = self.kurikulum_repo.update(kurikulum, **update_data)
 
+        self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
         return updated
 
     def activate_kurikulum(
@@ -280,22 +394,28 @@ class KurikulumUseCases:
                 "Status harus APPROVED."
             )
 
-        # If set_as_primary, unset other primary curricula
-        if set_as_primary:
-            self._unset_primary_curricula(kurikulum.id_prodi)
-
-        # Update to active
-        updated = self.kurikulum_repo.update(
-            kurikulum,
-            status=KurikulumStatusModel.AKTIF,
-            nomor_sk=nomor_sk,
-            tanggal_sk=tanggal_sk,
-            is_primary=set_as_primary,
-        )
-
-        self.session.commit()
-        self.session.refresh(updated)
-
+        id_prodi = kurikulum.id_prodi
+        previous_primary: List[int] = []
+        try:
+            with UnitOfWork(self.session):
+                # If set_as_primary, unset other primary curricula
+                if set_as_primary:
+                    previous_primary = self._unset_primary_curricula(id_prodi)
+
+                # Update to active
+                updated = self.kurikulum_repo.update(
+                    kurikulum,
+                    status=KurikulumStatusModel.AKTIF,
+                    nomor_sk=nomor_sk,
+                    tanggal_sk=tanggal_sk,
+                    is_primary=set_as_primary,
+                )
+        except IntegrityError as e:
+            if is_primary_conflict(e):
+                raise PrimaryCurriculumConflictException(id_prodi)
+            raise
+
+        self._on_kurikulum_changed(id_kurikulum, id_prodi, previous_primary)
         return updated
 
     def deactivate_kurikulum(self, id_kurikulum: int) -> Kurikulum:
@@ -314,12 +434,12 @@ class KurikulumUseCases:
         kurikulum = self.kurikulum_repo.get_by_id_or_fail(id_kurikulum)
 
         if kurikulum.status == KurikulumStatusModel.AKTIF:
-            updated = self.kurikulum_repo.update(
-                kurikulum,
-                status=KurikulumStatusModel.NON_AKTIF
-            )
-            self.session.commit()
-            self.session.refresh(updated)
+            with UnitOfWork(self.session):
+                updated = self.kurikulum_repo.update(
+                    kurikulum,
+                    status=KurikulumStatusModel.NON_AKTIF
+                )
+            self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
             return updated
 
         return kurikulum
@@ -346,13 +466,13 @@ class KurikulumUseCases:
                 "Status harus REVIEW."
             )
 
-        updated = self.kurikulum_repo.update(
-            kurikulum,
-            status=KurikulumStatusModel.APPROVED
-        )
-        self.session.commit()
-        self.session.refresh(updated)
+        with UnitOfWork(self.session):
+            updated = self.kurikulum_repo.update(
+                kurikulum,
+                status=KurikulumStatusModel.APPROVED
+            )
 
+        self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
         return updated
 
     def submit_for_review(self, id_kurikulum: int) -> Kurikulum:
@@ -377,13 +497,13 @@ class KurikulumUseCases:
                 "Status harus DRAFT."
             )
 
-        updated = self.kurikulum_repo.update(
-            kurikulum,
-            status=KurikulumStatusModel.REVIEW
-        )
-        self.session.commit()
-        self.session.refresh(updated)
+        with UnitOfWork(self.session):
+            updated = self.kurikulum_repo.update(
+                kurikulum,
+                status=KurikulumStatusModel.REVIEW
+            )
 
+        self._on_kurikulum_changed(id_kurikulum, updated.id_prodi)
         return updated
 
     def delete_kurikulum(self, id_kurikulum: int) -> None:
@@ -406,44 +526,84 @@ class KurikulumUseCases:
                 "Hanya kurikulum DRAFT yang dapat dihapus."
             )
 
-        self.kurikulum_repo.delete(kurikulum)
-        self.session.commit()
+        id_prodi = kurikulum.id_prodi
+        with UnitOfWork(self.session):
+            self.kurikulum_repo.delete(kurikulum)
+
+        self._on_kurikulum_changed(id_kurikulum, id_prodi)
 
-    def get_active_curricula(self, id_prodi: str) -> List[Kurikulum]:
+    def get_active_curricula(
+        self,
+        id_prodi: str,
+        version: Optional[Tuple[Optional[datetime], int]] = None
+    ) -> List[Kurikulum]:
         """
         Get all active curricula for a program.
 
         Args:
             id_prodi: Program study ID
+            version: get_list_version() of the active curricula; a cached
+                list of another version is reloaded (optional)
 
         Returns:
             List[Kurikulum]: List of active curricula
         """
-        return self.kurikulum_repo.get_active_curricula(id_prodi)
+        return self.kurikulum_cache.get_active_curricula(id_prodi, version)
 
-    def get_primary_curriculum(self, id_prodi: str) -> Optional[Kurikulum]:
+    def get_primary_curriculum(
+        self,
+        id_prodi: str,
+        version: Optional[Tuple[Optional[int], Optional[datetime]]] = None
+    ) -> Optional[Kurikulum]:
         """
         Get primary curriculum for a program.
 
         Args:
             id_prodi: Program study ID
+            version: get_primary_version(); a cached copy of another
+                version is reloaded (optional)
 
         Returns:
             Optional[Kurikulum]: Primary curriculum if exists
         """
-        return self.kurikulum_repo.get_primary_curriculum(id_prodi)
+        return self.kurikulum_cache.get_primary_curriculum(id_prodi, version)
 
-    def _unset_primary_curricula(self, id_prodi: str) -> None:
+    def _unset_primary_curricula(self, id_prodi: str) -> List[int]:
         """
         Unset all primary curricula for a program (internal helper).
 
+        One set-based UPDATE inside the caller's unit of work. Concurrent
+        switches are serialized by the partial unique index
+        idx_kurikulum_primary; the loser gets an IntegrityError.
+
         Args:
             id_prodi: Program study ID
+
+        Returns:
+            List[int]: IDs of the curricula that were primary
         """
-        active_curricula = self.kurikulum_repo.get_by_criteria(
-            id_prodi=id_prodi,
-            is_primary=True
-        )
+        return self.kurikulum_repo.unset_primary(id_prodi)
+
+    def _on_kurikulum_changed(
+        self,
+        id_kurikulum: int,
+        id_prodi: str,
+        also_changed: Sequence[int] = ()
+    ) -> None:
+        """
+        React to a committed curriculum write (internal helper).
+
+        Invalidates cached lookups of the curriculum and its prodi, and
+        schedules a debounced refresh of mv_statistik_kurikulum.
 
-        for kurikulum in active_curricula:
-            self.kurikulum_repo.update(kurikulum, is_primary=False)
+        Args:
+            id_kurikulum: Changed curriculum ID
+            id_prodi: Program study of the changed curriculum
+            also_changed: Other curricula touched by the write
+                (e.g. the previous primary curriculum)
+        """
+        self.kurikulum_cache.invalidate(id_kurikulum=id_kurikulum, id_prodi=id_prodi)
+        for other_id in also_changed:
+            if other_id != id_kurikulum:
+                self.kurikulum_cache.invalidate(id_kurikulum=other_id)
+        self.statistics_refresher.schedule()
@@ -0,0 +1,266 @@
+"""
+Prasyarat Use Cases
+
+Application layer logic for course prerequisites (prasyarat_mk).
+Following Clean Architecture: Use cases orchestrate the flow of data.
+"""
+
+from typing import Iterable, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domain.entities import PrerequisiteGraph, TipePrasyarat
+from app.domain.exceptions import (
+    NotFoundException,
+    DuplicateException,
+    InvalidOperationException,
+    PrerequisiteCycleException,
+)
+from app.infrastructure.cache import CachedPrerequisiteGraphs, get_cache_backend
+from app.infrastructure.models.kurikulum_models import (
+    Kurikulum,
+    KurikulumStatus as KurikulumStatusModel,
+    PrasyaratMK,
+    TipePrasyarat as TipePrasyaratModel,
+)
+from app.infrastructure.repositories.kurikulum_repository import KurikulumRepository
+from app.infrastructure.repositories.matakuliah_repository import (
+    MataKuliahRepository,
+    is_prerequisite_conflict,
+)
+from app.infrastructure.unit_of_work import UnitOfWork
+from app.infrastructure.tracing import trace_methods
+
+
+@trace_methods("use_case")
+class PrasyaratUseCases:
+    """
+    Use cases for course prerequisites.
+
+    Every question is answered from the cached in-memory graph of the
+    curriculum (one query per curriculum until it changes) instead of
+    recursive per-row queries. Writes validate against the graph loaded
+    fresh inside their transaction, with the curriculum row locked.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        kurikulum_repo: Optional[KurikulumRepository] = None,
+        mk_repo: Optional[MataKuliahRepository] = None,
+        prerequisite_graphs: Optional[CachedPrerequisiteGraphs] = None,
+    ):
+        """
+        Initialize use cases with repositories.
+
+        Args:
+            session: Database session
+            kurikulum_repo: Kurikulum repository (optional, created if not provided)
+            mk_repo: MataKuliah repository (optional)
+            prerequisite_graphs: Graph cache
+                (optional, process-wide cache backend if not provided)
+        """
+        self.session = session
+        self.kurikulum_repo = kurikulum_repo or KurikulumRepository(session)
+        self.mk_repo = mk_repo or MataKuliahRepository(session)
+        self.prerequisite_graphs = prerequisite_graphs or CachedPrerequisiteGraphs(
+            self.mk_repo,
+            get_cache_backend(),
+            settings.cache.ttl_seconds
+        )
+
+    def get_graph(self, id_kurikulum: int) -> PrerequisiteGraph:
+        """
+        Get the prerequisite graph of a curriculum.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            PrerequisiteGraph: Graph of the active courses
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        graph = self.prerequisite_graphs.get(id_kurikulum)
+        if not graph.semesters and not self.kurikulum_repo.exists(id_kurikulum=id_kurikulum):
+            raise NotFoundException("Kurikulum", str(id_kurikulum))
+        return graph
+
+    def add_prerequisite(
+        self,
+        id_kurikulum: int,
+        kode_mk: str,
+        kode_mk_prasyarat: str,
+        tipe_prasyarat: TipePrasyarat = TipePrasyarat.WAJIB
+    ) -> PrasyaratMK:
+        """
+        Add a prerequisite to a course.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            kode_mk: Course code
+            kode_mk_prasyarat: Prerequisite course code (same curriculum)
+            tipe_prasyarat: Prerequisite type
+
+        Returns:
+            PrasyaratMK: Created prerequisite
+
+        Raises:
+            NotFoundException: If curriculum or a course not found
+            InvalidOperationException: If curriculum cannot be modified
+            DuplicateException: If the prerequisite already exists
+            PrerequisiteCycleException: If the prerequisite creates a cycle
+        """
+        try:
+            with UnitOfWork(self.session):
+                # Edits of one curriculum run one at a time, each validated
+                # against the committed graph rather than a cached copy
+                kurikulum = self.kurikulum_repo.lock_for_update(id_kurikulum)
+                self._ensure_status_modifiable(kurikulum)
+                graph = self.mk_repo.get_prerequisite_graph(id_kurikulum)
+                self._ensure_courses(graph, id_kurikulum, kode_mk, kode_mk_prasyarat)
+
+                if kode_mk_prasyarat in graph.prerequisites_of(kode_mk):
+                    raise self._duplicate(kode_mk, kode_mk_prasyarat)
+                graph.check_new_prerequisite(kode_mk, kode_mk_prasyarat)
+
+                prasyarat = self.mk_repo.add_prerequisite(
+                    kode_mk=kode_mk,
+                    id_kurikulum=id_kurikulum,
+                    kode_mk_prasyarat=kode_mk_prasyarat,
+                    tipe_prasyarat=TipePrasyaratModel(tipe_prasyarat.value),
+                )
+        except IntegrityError as e:
+            if is_prerequisite_conflict(e):
+                raise self._duplicate(kode_mk, kode_mk_prasyarat)
+            raise
+
+        self.prerequisite_graphs.invalidate(id_kurikulum)
+        return prasyarat
+
+    def remove_prerequisite(
+        self,
+        id_kurikulum: int,
+        kode_mk: str,
+        kode_mk_prasyarat: str
+    ) -> None:
+        """
+        Remove a prerequisite from a course.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            kode_mk: Course code
+            kode_mk_prasyarat: Prerequisite course code
+
+        Raises:
+            NotFoundException: If the prerequisite does not exist
+            InvalidOperationException: If curriculum cannot be modified
+        """
+        self._ensure_modifiable(id_kurikulum)
+
+        with UnitOfWork(self.session):
+            removed = self.mk_repo.remove_prerequisite(kode_mk, id_kurikulum, kode_mk_prasyarat)
+        if not removed:
+            raise NotFoundException("Prasyarat", f"{kode_mk} → {kode_mk_prasyarat}")
+
+        self.prerequisite_graphs.invalidate(id_kurikulum)
+
+    def get_prerequisites(
+        self,
+        id_kurikulum: int,
+        kode_mk: str,
+        transitive: bool = False
+    ) -> List[str]:
+        """
+        Get prerequisites of a course.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            kode_mk: Course code
+            transitive: Include indirect prerequisites
+
+        Returns:
+            List[str]: Prerequisite codes, in planned order
+
+        Raises:
+            NotFoundException: If curriculum or course not found
+        """
+        graph = self.get_graph(id_kurikulum)
+        self._ensure_courses(graph, id_kurikulum, kode_mk)
+
+        codes = (
+            graph.transitive_prerequisites(kode_mk) if transitive
+            else set(graph.prerequisites_of(kode_mk))
+        )
+        return [kode for kode in graph.courses if kode in codes]
+
+    def get_study_plan(self, id_kurikulum: int) -> PrerequisiteGraph:
+        """
+        Get the graph for a semester-layered study plan.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            PrerequisiteGraph: Graph verified to be acyclic; use
+                semester_layers() and semester_conflicts()
+
+        Raises:
+            NotFoundException: If curriculum not found
+            PrerequisiteCycleException: If stored prerequisites form a cycle
+        """
+        graph = self.get_graph(id_kurikulum)
+        cycle = graph.find_cycle()
+        if cycle:
+            raise PrerequisiteCycleException(cycle)
+        return graph
+
+    def get_available_courses(
+        self,
+        id_kurikulum: int,
+        passed: Iterable[str]
+    ) -> List[str]:
+        """
+        Courses a student can take next.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            passed: Codes of the courses the student has passed
+
+        Returns:
+            List[str]: Courses whose prerequisites are satisfied, in planned order
+
+        Raises:
+            NotFoundException: If curriculum not found
+        """
+        return self.get_graph(id_kurikulum).available_courses(passed)
+
+    def _ensure_modifiable(self, id_kurikulum: int) -> None:
+        """Ensure the curriculum exists and is still editable (internal helper)."""
+        self._ensure_status_modifiable(self.kurikulum_repo.get_by_id_or_fail(id_kurikulum))
+
+    @staticmethod
+    def _ensure_status_modifiable(kurikulum: Kurikulum) -> None:
+        """Ensure a loaded curriculum is still editable (internal helper)."""
+        if kurikulum.status not in [KurikulumStatusModel.DRAFT, KurikulumStatusModel.REVIEW]:
+            raise InvalidOperationException(
+                f"Kurikulum dengan status '{kurikulum.status}' tidak dapat dimodifikasi"
+            )
+
+    @staticmethod
+    def _duplicate(kode_mk: str, kode_mk_prasyarat: str) -> DuplicateException:
+        """Error for an existing prerequisite edge (internal helper)."""
+        return DuplicateException("Prasyarat", "kode_mk", f"{kode_mk} → {kode_mk_prasyarat}")
+
+    @staticmethod
+    def _ensure_courses(graph: PrerequisiteGraph, id_kurikulum: int, *codes: str) -> None:
+        """Ensure every course is an active course of the curriculum (internal helper)."""
+        for kode_mk in codes:
+            if not graph.has_course(kode_mk):
+                raise NotFoundException(
+                    "MataKuliah",
+                    f"{kode_mk} (kurikulum: {id_kurikulum})"
+                )
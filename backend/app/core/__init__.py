@@ -10,7 +10,8 @@ from app.core.security import (
     create_refresh_token,
     decode_token,
     PasswordHasher,
-    TokenManager
+    TokenManager,
+    AuthContext
 )
 
 __all__ = [
@@ -23,4 +24,5 @@ __all__ = [
     "decode_token",
     "PasswordHasher",
     "TokenManager",
+    "AuthContext",
 ]
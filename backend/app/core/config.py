@@ -5,7 +5,7 @@ This module manages all application settings using Pydantic's BaseSettings.
 Following Clean Code principles: Single Responsibility, Type Safety, and Clear naming.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
@@ -23,6 +23,112 @@ class DatabaseSettings(BaseSettings):
     name: str = Field(default="obe_system", description="Database name")
     user: str = Field(default="obe_user", description="Database user")
     password: str = Field(default="", description="Database password")
+    connection_budget: int = Field(
+        default=60,
+        ge=2,
+        description="Connections this service may hold on the server, across all workers"
+    )
+    workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Worker processes sharing the budget (WEB_CONCURRENCY if not set)"
+    )
+    pool_overflow_ratio: float = Field(
+        default=0.25,
+        ge=0.0,
+        le=1.0,
+        description="Share of each pool's connections opened only under load (max_overflow)"
+    )
+    pool_recycle_seconds: int = Field(
+        default=3600,
+        description="Connections older than this are replaced on checkout"
+    )
+    pool_warmup_connections: int = Field(
+        default=2,
+        ge=0,
+        description="Connections opened per pool at startup (0 disables)"
+    )
+    liveness_check_interval_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Interval of the background pool ping (0 pings on every checkout instead)"
+    )
+    statement_timeout_ms: int = Field(
+        default=30000,
+        ge=0,
+        description="statement_timeout sent in the connection startup packet"
+    )
+    application_name: str = Field(
+        default="obe-backend",
+        description="application_name shown in pg_stat_activity"
+    )
+    pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer transaction pooling (no session state)"
+    )
+    query_cache_size: int = Field(
+        default=1200,
+        ge=0,
+        description="Compiled SQL statements cached per engine (SQLAlchemy query_cache_size)"
+    )
+    prepared_statement_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="Server-side prepared statements kept per asyncpg connection"
+    )
+    statistics_refresh_debounce_seconds: float = Field(
+        default=5.0,
+        description="Quiet period after curriculum writes before refreshing mv_statistik_kurikulum"
+    )
+    statistics_refresh_max_wait_seconds: float = Field(
+        default=60.0,
+        description="Maximum delay between a curriculum write and the statistics refresh"
+    )
+    import_chunk_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Rows per COPY + INSERT ... ON CONFLICT batch in CPL/MK imports"
+    )
+    replica_urls: List[str] = Field(
+        default_factory=list,
+        description="psycopg2 URLs of streaming replicas serving @read_only use cases"
+    )
+    replica_max_lag_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="Replicas lagging more than this get no reads"
+    )
+    replica_check_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Interval of the replication lag check"
+    )
+    replica_ejection_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="How long a replica whose connection failed gets no reads"
+    )
+    slow_query_ms: float = Field(
+        default=500.0,
+        ge=0.0,
+        description="Statements at least this slow go to the slow query log (0 disables)"
+    )
+    slow_query_log_size: int = Field(
+        default=200,
+        ge=1,
+        description="Slow queries kept per worker; the oldest are dropped first"
+    )
+    slow_query_explain_sample_rate: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of slow reads re-run with EXPLAIN (ANALYZE, BUFFERS)"
+    )
+    slow_query_explain_cooldown_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Minimum interval between plans of the same statement"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="DATABASE_",
@@ -43,6 +149,18 @@ class DatabaseSettings(BaseSettings):
             f"@{self.host}:{self.port}/{self.name}"
         )
 
+    def get_async_connection_url(self) -> str:
+        """
+        Generate PostgreSQL connection URL for the asyncpg driver.
+
+        Returns:
+            str: SQLAlchemy-compatible async database URL
+        """
+        return (
+            f"postgresql+asyncpg://{self.user}:{self.password}"
+            f"@{self.host}:{self.port}/{self.name}"
+        )
+
 
 class SecuritySettings(BaseSettings):
     """
@@ -56,6 +174,23 @@ class SecuritySettings(BaseSettings):
         description="Secret key for JWT encoding (MUST be changed in production)"
     )
     algorithm: str = Field(default="HS256", description="JWT encoding algorithm")
+    jwt_key_id: str = Field(
+        default="default",
+        description="kid of secret_key; new tokens are signed with it"
+    )
+    jwt_verification_keys: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Retired keys still accepted for verification, as JSON {kid: secret}"
+    )
+    jwt_permission_version: bool = Field(
+        default=False,
+        description="Embed the user's permission version (pv claim) in access tokens"
+    )
+    token_cache_size: int = Field(
+        default=10000,
+        ge=0,
+        description="Verified token claims kept in memory; 0 disables the cache"
+    )
     access_token_expire_minutes: int = Field(
         default=120,
         description="Access token expiration time in minutes"
@@ -64,6 +199,22 @@ class SecuritySettings(BaseSettings):
         default=7,
         description="Refresh token expiration time in days"
     )
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor (see python -m app.core.password_hashing)"
+    )
+    password_hash_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Processes hashing passwords; 0 uses half the CPU cores"
+    )
+    password_hash_queue_per_worker: int = Field(
+        default=4,
+        ge=1,
+        description="Hashes queued per worker before logins are rejected with 429"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -78,6 +229,16 @@ class SecuritySettings(BaseSettings):
             raise ValueError("SECRET_KEY must be at least 32 characters long")
         return value
 
+    @validator("jwt_verification_keys")
+    def validate_verification_keys(cls, value: Dict[str, str]) -> Dict[str, str]:
+        """Apply the secret key length rule to retired keys as well."""
+        for kid, secret in value.items():
+            if len(secret) < 32:
+                raise ValueError(
+                    f"JWT_VERIFICATION_KEYS['{kid}'] must be at least 32 characters long"
+                )
+        return value
+
 
 class CORSSettings(BaseSettings):
     """
@@ -111,6 +272,219 @@ class CORSSettings(BaseSettings):
     )
 
 
+class CacheSettings(BaseSettings):
+    """
+    Read-through cache configuration.
+
+    Controls the backend used for hot curriculum lookups.
+    """
+
+    backend: str = Field(
+        default="memory",
+        description="Cache backend: memory, redis or none"
+    )
+    ttl_seconds: int = Field(
+        default=300,
+        description="Time-to-live of cached entries in seconds"
+    )
+    max_entries: int = Field(
+        default=2048,
+        description="Maximum entries of the in-process LRU cache"
+    )
+    redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis connection URL (backend=redis)"
+    )
+    key_prefix: str = Field(
+        default="obe:",
+        description="Prefix applied to every cache key"
+    )
+    permission_ttl_seconds: int = Field(
+        default=300,
+        description="Time-to-live of compiled permissions in Redis (backend=redis)"
+    )
+    permission_local_ttl_seconds: int = Field(
+        default=30,
+        description="Time-to-live of compiled permissions in the worker process"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore"
+    )
+
+    @validator("backend")
+    def validate_backend(cls, value: str) -> str:
+        """Ensure backend is one of the supported backends."""
+        value = value.lower()
+        if value not in ("memory", "redis", "none"):
+            raise ValueError("CACHE_BACKEND must be memory, redis or none")
+        return value
+
+
+class AccessLogSettings(BaseSettings):
+    """
+    Access log configuration.
+
+    Controls the per-request JSON access log.
+    """
+
+    enabled: bool = Field(default=True, description="Emit one access record per request")
+    sample_rate_2xx: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of 2xx requests logged; errors are always logged"
+    )
+    slow_request_ms: Optional[float] = Field(
+        default=1000.0,
+        description="Requests slower than this are always logged, even if sampled out"
+    )
+    queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Access records buffered for the log thread before dropping"
+    )
+    repeated_statement_threshold: Optional[int] = Field(
+        default=5,
+        ge=2,
+        description="Executions of one SQL fingerprint in a request logged as a likely N+1"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="ACCESS_LOG_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore"
+    )
+
+
+class ProfilingSettings(BaseSettings):
+    """
+    On-demand request profiling configuration.
+
+    When enabled, a request carrying a profiling token (minted by an
+    admin) is sampled and its profile kept for download.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Install the profiling middleware (no middleware at all when off)"
+    )
+    header_name: str = Field(
+        default="X-Profile-Token",
+        description="Request header carrying the profiling token"
+    )
+    interval_ms: float = Field(
+        default=1.0,
+        gt=0,
+        description="Sampling interval in milliseconds"
+    )
+    max_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Sampling stops after this long, even if the request continues"
+    )
+    token_ttl_seconds: int = Field(
+        default=600,
+        ge=1,
+        description="Lifetime of profiling tokens"
+    )
+    store_size: int = Field(
+        default=20,
+        ge=1,
+        description="Profiles kept per worker"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="PROFILING_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore"
+    )
+
+
+class TracingSettings(BaseSettings):
+    """
+    Distributed tracing configuration.
+
+    OpenTelemetry spans per request, use case, repository call and SQL
+    statement; needs the opentelemetry packages when enabled.
+    """
+
+    enabled: bool = Field(default=False, description="Record and export spans")
+    service_name: str = Field(default="obe-backend", description="service.name resource attribute")
+    exporter: str = Field(
+        default="otlp",
+        pattern="^(otlp|file|memory|console)$",
+        description="Span exporter: otlp, file (JSON lines), memory (tests) or console"
+    )
+    otlp_endpoint: str = Field(
+        default="http://localhost:4318/v1/traces",
+        description="OTLP/HTTP traces endpoint of the collector"
+    )
+    file_path: str = Field(default="traces.jsonl", description="Output of the file exporter")
+    sample_ratio: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of new traces sampled; incoming traceparent decisions are kept"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="TRACING_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore"
+    )
+
+
+class HealthSettings(BaseSettings):
+    """
+    Health monitor configuration.
+
+    A background check samples the database, pools, replicas and the
+    statistics view; /health, /health/live and /health/ready only read
+    its last result.
+    """
+
+    check_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Interval of the background health check"
+    )
+    max_snapshot_age_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Liveness fails when the last check is older than this"
+    )
+    probe_timeout_seconds: float = Field(
+        default=2.0,
+        gt=0,
+        description="Connect and statement timeout of the database probe"
+    )
+    max_pool_saturation: float = Field(
+        default=0.95,
+        gt=0.0,
+        le=1.0,
+        description="A pool with this share of its connections checked out marks the service degraded"
+    )
+    max_view_staleness_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="A statistics refresh pending longer than this marks the service degraded"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="HEALTH_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore"
+    )
+
+
 class ApplicationSettings(BaseSettings):
     """
     Main application settings.
@@ -134,6 +508,12 @@ class ApplicationSettings(BaseSettings):
         description="API version 1 URL prefix"
     )
 
+    # Cold start: median `import app.main` allowed by python -m app.core.import_budget
+    import_time_budget_ms: float = Field(
+        default=2000.0,
+        description="Import-time budget of app.main in milliseconds"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=False,
@@ -144,6 +524,11 @@ class ApplicationSettings(BaseSettings):
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     cors: CORSSettings = Field(default_factory=CORSSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    access_log: AccessLogSettings = Field(default_factory=AccessLogSettings)
+    profiling: ProfilingSettings = Field(default_factory=ProfilingSettings)
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
+    health: HealthSettings = Field(default_factory=HealthSettings)
 
     def is_development(self) -> bool:
         """Check if application is running in development mode."""
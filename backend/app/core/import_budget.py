@@ -0,0 +1,184 @@
+"""
+Import-Time Budget
+
+Measures how long `import app.main` takes in a fresh interpreter, the part
+of every worker cold start (uvicorn/gunicorn spawn, autoscaling, reload)
+that happens before the first request can be served.
+Following Clean Code: Single Responsibility, Fail fast on regressions.
+
+Each sample runs `python -X importtime -c "import app.main"` in a
+subprocess; the median of the samples is compared with the budget and the
+slowest modules (cumulative time) of the median run are listed, so a new
+top-level import of a heavy dependency shows up by name.
+
+    python -m app.core.import_budget --samples 5 --budget-ms 2000
+
+Exits with status 1 when the median exceeds the budget
+(IMPORT_TIME_BUDGET_MS by default), which makes it usable as a CI step.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+# "import time:   self [us] | cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+DEFAULT_TARGET_MODULE = "app.main"
+
+
+@dataclass
+class ImportProfile:
+    """
+    One `-X importtime` run.
+
+    Attributes:
+        total_ms: Cumulative import time of the target module
+        modules: (module, cumulative ms, nesting depth) per imported module
+    """
+
+    total_ms: float
+    modules: List[Tuple[str, float, int]] = field(default_factory=list)
+
+    def slowest(self, limit: int, max_depth: Optional[int] = None) -> List[Tuple[str, float, int]]:
+        """
+        Modules with the highest cumulative import time.
+
+        Args:
+            limit: Number of modules to return
+            max_depth: Skip modules nested deeper than this (optional)
+
+        Returns:
+            List[Tuple[str, float, int]]: (module, cumulative ms, depth)
+        """
+        modules = [
+            entry for entry in self.modules
+            if max_depth is None or entry[2] <= max_depth
+        ]
+        return sorted(modules, key=lambda entry: entry[1], reverse=True)[:limit]
+
+
+def parse_import_times(output: str, target_module: str) -> ImportProfile:
+    """
+    Parse the stderr of `python -X importtime`.
+
+    Args:
+        output: importtime report
+        target_module: Module whose cumulative time is the total
+
+    Returns:
+        ImportProfile: Parsed run
+
+    Raises:
+        ValueError: If the target module does not appear in the report
+    """
+    modules = []
+    total_ms = None
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        cumulative_ms = int(match.group(2)) / 1000
+        depth = (len(match.group(3)) - 1) // 2
+        module = match.group(4)
+        modules.append((module, cumulative_ms, depth))
+        if module == target_module and depth == 0:
+            total_ms = cumulative_ms
+    if total_ms is None:
+        raise ValueError(f"{target_module} not found in the importtime report")
+    return ImportProfile(total_ms=total_ms, modules=modules)
+
+
+def measure_import_time(target_module: str = DEFAULT_TARGET_MODULE) -> ImportProfile:
+    """
+    Import a module in a fresh interpreter and profile it.
+
+    Bytecode is written on the first run, so callers should discard or
+    warm up once before sampling.
+
+    Args:
+        target_module: Module to import
+
+    Returns:
+        ImportProfile: Import times of the run
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target_module}"],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+        raise RuntimeError(f"import {target_module} failed: {error}")
+    return parse_import_times(result.stderr, target_module)
+
+
+def median_import_profile(
+    samples: int = 5,
+    target_module: str = DEFAULT_TARGET_MODULE
+) -> Tuple[ImportProfile, List[float]]:
+    """
+    Median of several fresh-interpreter imports after one warm-up run.
+
+    Args:
+        samples: Number of timed imports
+        target_module: Module to import
+
+    Returns:
+        Tuple[ImportProfile, List[float]]: (run with the median total,
+            total ms of every sample)
+    """
+    measure_import_time(target_module)
+    profiles = sorted(
+        (measure_import_time(target_module) for _ in range(max(samples, 1))),
+        key=lambda profile: profile.total_ms
+    )
+    totals = [profile.total_ms for profile in profiles]
+    return profiles[len(profiles) // 2], totals
+
+
+def main() -> None:
+    """Command line entry point for the import-time budget check."""
+    parser = argparse.ArgumentParser(
+        description="Fail when importing the application exceeds its import-time budget"
+    )
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Budget in ms (default: IMPORT_TIME_BUDGET_MS)")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15,
+                        help="Slowest modules to list")
+    parser.add_argument("--max-depth", type=int, default=None,
+                        help="Only list modules nested at most this deep")
+    parser.add_argument("--module", default=DEFAULT_TARGET_MODULE)
+    args = parser.parse_args()
+
+    budget_ms = args.budget_ms
+    if budget_ms is None:
+        from app.core.config import settings
+        budget_ms = settings.import_time_budget_ms
+
+    profile, totals = median_import_profile(args.samples, args.module)
+    print(f"import {args.module}: median {profile.total_ms:.0f} ms "
+          f"(samples: {', '.join(f'{total:.0f}' for total in totals)} ms), "
+          f"budget {budget_ms:.0f} ms")
+    print(f"{'cumulative':>12}  module")
+    for module, cumulative_ms, depth in profile.slowest(args.top, args.max_depth):
+        print(f"{cumulative_ms:9.1f} ms  {'  ' * depth}{module}")
+
+    if profile.total_ms > budget_ms:
+        print(f"✗ import {args.module} exceeds the budget by "
+              f"{profile.total_ms - budget_ms:.0f} ms")
+        sys.exit(1)
+    print(f"✓ import {args.module} within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+"""
+Password Hashing Service
+
+Runs bcrypt off the event loop in a bounded process pool.
+Following Clean Code: Single Responsibility, Fail fast under overload.
+
+bcrypt is deliberately CPU-bound. Called inline it blocks the event loop
+(or pins a threadpool worker and a core) for the whole cost of the hash,
+so a login storm starves every other request.
+The service hands each hash to a small process pool and caps how many may
+be queued per process; beyond that it raises ServiceOverloadedException,
+which the API turns into 429 with Retry-After before the CPU saturates.
+
+Pick the bcrypt cost for this hardware with:
+
+    python -m app.core.password_hashing --target-ms 250
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.security import get_password_context
+from app.domain.exceptions import ServiceOverloadedException
+
+logger = logging.getLogger(__name__)
+
+
+# ===== Worker functions (run inside the pool processes) =====
+
+def _hash(plain_password: str) -> str:
+    """Hash a password with the configured cost."""
+    return get_password_context().hash(plain_password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash."""
+    return get_password_context().verify(plain_password, hashed_password)
+
+
+def _verify_and_update(
+    plain_password: str,
+    hashed_password: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its cost is outdated.
+
+    Without a stored hash a dummy verification runs instead, so unknown
+    usernames take as long as wrong passwords.
+
+    Returns:
+        Tuple[bool, Optional[str]]: (valid, new hash or None)
+    """
+    if hashed_password is None:
+        get_password_context().dummy_verify()
+        return False, None
+    return get_password_context().verify_and_update(plain_password, hashed_password)
+
+
+def default_worker_count() -> int:
+    """
+    Default pool size: half the CPU cores, at least one.
+
+    Leaves the other half to the event loop and database work.
+
+    Returns:
+        int: Number of hashing processes
+    """
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class PasswordHashingService:
+    """
+    Async password hashing on a bounded process pool.
+
+    The pool is created on first use. At most workers × queue_per_worker
+    hashes are pending at once; further calls are rejected immediately
+    instead of queueing behind work that would already time out.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        queue_per_worker: Optional[int] = None,
+        retry_after_seconds: int = 1,
+    ):
+        """
+        Initialize hashing service.
+
+        Args:
+            workers: Pool processes (optional, PASSWORD_HASH_WORKERS or
+                half the CPU cores if not provided)
+            queue_per_worker: Pending hashes allowed per process
+                (optional, PASSWORD_HASH_QUEUE_PER_WORKER if not provided)
+            retry_after_seconds: Retry-After hint of shed requests
+        """
+        security = settings.security
+        self.workers = workers or security.password_hash_workers or default_worker_count()
+        self.queue_per_worker = queue_per_worker or security.password_hash_queue_per_worker
+        self.retry_after_seconds = retry_after_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+
+    @property
+    def max_pending(self) -> int:
+        """Hashes allowed in flight before load is shed."""
+        return self.workers * self.queue_per_worker
+
+    @property
+    def pending(self) -> int:
+        """Hashes currently queued or running."""
+        return self._pending
+
+    @property
+    def rejected(self) -> int:
+        """Calls shed with ServiceOverloadedException since start."""
+        return self._rejected
+
+    async def hash(self, plain_password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            plain_password: The password to hash
+
+        Returns:
+            str: Hashed password
+
+        Raises:
+            ServiceOverloadedException: If the hashing queue is full
+        """
+        return await self._run(_hash, plain_password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password against a hash.
+
+        Args:
+            plain_password: The plain text password
+            hashed_password: The hashed password to compare against
+
+        Returns:
+            bool: True if password matches, False otherwise
+
+        Raises:
+            ServiceOverloadedException: If the hashing queue is full
+        """
+        return await self._run(_verify, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: Optional[str]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and produce a replacement hash when needed.
+
+        A new hash is returned when CryptContext.needs_update() holds for
+        the stored one, e.g. after BCRYPT_ROUNDS changed.
+
+        Args:
+            plain_password: The plain text password
+            hashed_password: Stored hash, or None for an unknown user
+                (a dummy verification keeps the timing the same)
+
+        Returns:
+            Tuple[bool, Optional[str]]: (valid, new hash or None)
+
+        Raises:
+            ServiceOverloadedException: If the hashing queue is full
+        """
+        return await self._run(_verify_and_update, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Stop the pool processes (called on application shutdown)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, function: Callable, *args):
+        """
+        Submit work to the pool unless the queue is full.
+
+        Args:
+            function: Module-level worker function
+            *args: Its arguments
+
+        Returns:
+            Result of the worker function
+
+        Raises:
+            ServiceOverloadedException: If the hashing queue is full
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise ServiceOverloadedException(retry_after=self.retry_after_seconds)
+            self._pending += 1
+            executor = self._get_executor()
+
+        try:
+            future = executor.submit(function, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Optional[Future] = None) -> None:
+        """Free one queue slot."""
+        with self._lock:
+            self._pending -= 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the pool on first use (caller holds the lock)."""
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and holds
+            # database connections is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(
+                f"Password hashing pool started: {self.workers} workers, "
+                f"{self.max_pending} pending max"
+            )
+        return self._executor
+
+
+_password_hashing_service: Optional[PasswordHashingService] = None
+_password_hashing_service_lock = threading.Lock()
+
+
+def get_password_hashing_service() -> PasswordHashingService:
+    """
+    Get the process-wide password hashing service.
+
+    Returns:
+        PasswordHashingService: Shared service instance
+    """
+    global _password_hashing_service
+    with _password_hashing_service_lock:
+        if _password_hashing_service is None:
+            _password_hashing_service = PasswordHashingService()
+        return _password_hashing_service
+
+
+# ===== Cost calibration =====
+
+def measure_bcrypt_rounds(rounds: int, samples: int = 3) -> float:
+    """
+    Median time of one bcrypt hash at a given cost.
+
+    Args:
+        rounds: bcrypt cost factor
+        samples: Hashes to time
+
+    Returns:
+        float: Milliseconds per hash
+    """
+    context = get_password_context().copy(bcrypt__rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    samples: int = 3,
+) -> Tuple[int, Dict[int, float]]:
+    """
+    Highest bcrypt cost whose hash time stays within a target.
+
+    Each extra round doubles the cost, so measuring stops at the first
+    cost over the target. min_rounds is returned even if it is slower
+    than the target; going below it is not an acceptable trade.
+
+    Args:
+        target_ms: Target milliseconds per hash on this machine
+        min_rounds: Lowest acceptable cost
+        max_rounds: Highest cost to try
+        samples: Hashes timed per cost
+
+    Returns:
+        Tuple[int, Dict[int, float]]: (chosen rounds, ms per measured rounds)
+    """
+    chosen = min_rounds
+    timings: Dict[int, float] = {}
+    for rounds in range(min_rounds, max_rounds + 1):
+        timings[rounds] = measure_bcrypt_rounds(rounds, samples)
+        if timings[rounds] > target_ms:
+            break
+        chosen = rounds
+    return chosen, timings
+
+
+def main() -> None:
+    """Command line entry point for cost calibration."""
+    parser = argparse.ArgumentParser(
+        description="Pick BCRYPT_ROUNDS for a target hash latency on this machine"
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    rounds, timings = calibrate_bcrypt_rounds(
+        args.target_ms, args.min_rounds, args.max_rounds, args.samples
+    )
+    for measured, elapsed in timings.items():
+        marker = "  <-" if measured == rounds else ""
+        print(f"rounds={measured:>2}  {elapsed:8.1f} ms{marker}")
+
+    workers = settings.security.password_hash_workers or default_worker_count()
+    print(f"\nBCRYPT_ROUNDS={rounds}")
+    print(
+        f"# ~{workers * 1000 / timings[rounds]:.0f} logins/s with "
+        f"{workers} hashing workers"
+    )
+
+
+if __name__ == "__main__":
+    main()
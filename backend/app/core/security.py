@@ -5,17 +5,45 @@ Handles authentication, password hashing, and JWT token management.
 Following Clean Code: Single Responsibility, Clear naming, Type safety.
 """
 
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from app.core.config import settings
+from app.core.token_cache import VerifiedClaimsCache, token_digest
 
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
-# Password hashing context using bcrypt
-# Separated from class for reusability and testability
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib/bcrypt and python-jose are imported on first use rather than at
+# import time, keeping them out of the worker cold start (IMPORT_TIME_BUDGET_MS)
+_pwd_context: Optional["CryptContext"] = None
+_pwd_context_lock = threading.Lock()
+
+
+def get_password_context() -> "CryptContext":
+    """
+    Get the password hashing context using bcrypt.
+
+    Separated from class for reusability and testability. Hashes made with
+    a different cost than BCRYPT_ROUNDS report needs_update() and are
+    rehashed on the next successful login.
+
+    Returns:
+        CryptContext: Process-wide bcrypt context
+    """
+    global _pwd_context
+    with _pwd_context_lock:
+        if _pwd_context is None:
+            from passlib.context import CryptContext
+
+            _pwd_context = CryptContext(
+                schemes=["bcrypt"],
+                deprecated="auto",
+                bcrypt__rounds=settings.security.bcrypt_rounds
+            )
+        return _pwd_context
 
 
 class PasswordHasher:
@@ -23,6 +51,8 @@ class PasswordHasher:
     Handles password hashing and verification.
 
     Separated into its own class following Single Responsibility Principle.
+    These calls block for the full bcrypt cost; request handlers should use
+    PasswordHashingService (app.core.password_hashing) instead.
     """
 
     @staticmethod
@@ -36,7 +66,7 @@ class PasswordHasher:
         Returns:
             str: Hashed password
         """
-        return pwd_context.hash(plain_password)
+        return get_password_context().hash(plain_password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -50,14 +80,35 @@ class PasswordHasher:
         Returns:
             bool: True if password matches, False otherwise
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return get_password_context().verify(plain_password, hashed_password)
+
+
+# Claims of tokens whose signature was already verified, so a token is
+# HMAC-checked once per worker instead of once per request
+claims_cache = VerifiedClaimsCache(settings.security.token_cache_size)
+
+
+def get_signing_keys() -> Dict[str, str]:
+    """
+    Key ring for token verification.
+
+    Returns:
+        Dict[str, str]: kid → secret; the current key plus retired keys
+            listed in JWT_VERIFICATION_KEYS
+    """
+    security = settings.security
+    keys = dict(security.jwt_verification_keys)
+    keys[security.jwt_key_id] = security.secret_key
+    return keys
 
 
 class TokenManager:
     """
     Manages JWT token creation and validation.
 
-    Handles both access and refresh tokens.
+    Handles both access and refresh tokens. Tokens are signed with the
+    current key and carry its kid in the header; verification picks the
+    key by kid, so keys rotate without invalidating issued tokens.
     """
 
     @staticmethod
@@ -102,6 +153,26 @@ class TokenManager:
             token_type="refresh"
         )
 
+    @staticmethod
+    def create_profiling_token(subject: str, path_prefix: str = "/") -> str:
+        """
+        Create a short-lived token that enables profiling of requests.
+
+        Args:
+            subject: The admin who requested it (user ID)
+            path_prefix: Only requests under this path are profiled
+
+        Returns:
+            str: Encoded JWT profiling token
+        """
+        expires_delta = timedelta(seconds=settings.profiling.token_ttl_seconds)
+        return TokenManager._create_token(
+            subject=subject,
+            expires_delta=expires_delta,
+            additional_claims={"path": path_prefix},
+            token_type="profile"
+        )
+
     @staticmethod
     def _create_token(
         subject: str,
@@ -116,7 +187,7 @@ class TokenManager:
             subject: The subject of the token
             expires_delta: How long until token expires
             additional_claims: Extra data to include
-            token_type: Type of token (access or refresh)
+            token_type: Type of token (access, refresh or profile)
 
         Returns:
             str: Encoded JWT token
@@ -135,11 +206,14 @@ class TokenManager:
         if additional_claims:
             to_encode.update(additional_claims)
 
+        from jose import jwt
+
         # Encode token
         encoded_jwt = jwt.encode(
             to_encode,
             settings.security.secret_key,
-            algorithm=settings.security.algorithm
+            algorithm=settings.security.algorithm,
+            headers={"kid": settings.security.jwt_key_id}
         )
 
         return encoded_jwt
@@ -149,27 +223,47 @@ class TokenManager:
         """
         Decode and validate a JWT token.
 
+        Verified claims are served from claims_cache until the token's
+        exp. Tokens without a kid (issued before key rotation support)
+        are verified with the current key.
+
         Args:
             token: The JWT token to decode
 
         Returns:
             Optional[Dict]: Token payload if valid, None otherwise
         """
+        keys = get_signing_keys()
+        digest = token_digest(token)
+        payload = claims_cache.get(digest, keys)
+        if payload is not None:
+            return payload
+
+        from jose import JWTError, jwt
+
         try:
+            kid = jwt.get_unverified_header(token).get("kid") or settings.security.jwt_key_id
+            key = keys.get(kid)
+            if key is None:
+                return None
             payload = jwt.decode(
                 token,
-                settings.security.secret_key,
+                key,
                 algorithms=[settings.security.algorithm]
             )
-            return payload
         except JWTError:
             return None
 
+        claims_cache.set(digest, kid, payload)
+        return payload
+
     @staticmethod
     def verify_token_type(token: str, expected_type: str) -> bool:
         """
         Verify that a token is of the expected type.
 
+        Prefer AuthContext when the caller also needs other claims.
+
         Args:
             token: The JWT token
             expected_type: Expected token type (access or refresh)
@@ -201,6 +295,72 @@ class TokenManager:
         return payload.get("sub")
 
 
+@dataclass(frozen=True)
+class AuthContext:
+    """
+    Verified claims of the token presented with one request.
+
+    Built once per request (see get_auth_context in the presentation
+    layer) so type checks and claim reads share a single verification.
+    """
+
+    token: str
+    claims: Dict[str, Any]
+
+    @classmethod
+    def from_token(cls, token: str) -> Optional["AuthContext"]:
+        """
+        Verify a token once and wrap its claims.
+
+        Args:
+            token: The JWT token
+
+        Returns:
+            Optional[AuthContext]: Context if token is valid, None otherwise
+        """
+        claims = TokenManager.decode_token(token)
+        if claims is None:
+            return None
+        return cls(token=token, claims=claims)
+
+    @property
+    def user_id(self) -> Optional[str]:
+        """Subject of the token (user ID)."""
+        return self.claims.get("sub")
+
+    @property
+    def token_type(self) -> Optional[str]:
+        """Token type (access or refresh)."""
+        return self.claims.get("type")
+
+    @property
+    def username(self) -> Optional[str]:
+        """Username claim of access tokens."""
+        return self.claims.get("username")
+
+    @property
+    def user_type(self) -> Optional[str]:
+        """User type claim of access tokens."""
+        return self.claims.get("user_type")
+
+    @property
+    def permission_version(self) -> Optional[str]:
+        """Permission version (pv claim) when JWT_PERMISSION_VERSION is on."""
+        return self.claims.get("pv")
+
+    def is_type(self, expected_type: str) -> bool:
+        """
+        Check the token type.
+
+        Args:
+            expected_type: Expected token type (access or refresh)
+
+        Returns:
+            bool: True if token type matches, False otherwise
+        """
+        return self.token_type == expected_type
+
+
 # Convenience functions for backward compatibility and ease of use
 def hash_password(password: str) -> str:
     """Hash a password."""
@@ -0,0 +1,107 @@
+"""
+Verified Token Cache
+
+Bounded LRU of JWT claims that already passed signature verification.
+Following Clean Code: Single Responsibility, Bounded memory.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Collection, Dict, Optional, Tuple
+
+
+def token_digest(token: str) -> bytes:
+    """
+    Cache key of a token.
+
+    The raw token is never kept as a key; a SHA-256 digest is enough to
+    tell tokens apart and cannot be replayed.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        bytes: SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedClaimsCache:
+    """
+    LRU of verified claims, each entry expiring at its token's exp.
+
+    An entry also remembers the kid that verified it; once that key is
+    dropped from the key ring the entry stops being served, so retiring
+    a compromised key takes effect without flushing the cache.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Initialize claims cache.
+
+        Args:
+            max_entries: Capacity; 0 disables caching
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: bytes, valid_kids: Collection[str]) -> Optional[Dict[str, Any]]:
+        """
+        Claims of a previously verified token.
+
+        Args:
+            digest: token_digest() of the token
+            valid_kids: Key IDs currently accepted for verification
+
+        Returns:
+            Optional[Dict]: Copy of the claims, None on miss or expiry
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, kid, claims = entry
+            if expires_at <= time.time() or kid not in valid_kids:
+                del self._entries[digest]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return dict(claims)
+
+    def set(self, digest: bytes, kid: str, claims: Dict[str, Any]) -> None:
+        """
+        Remember verified claims until the token's exp.
+
+        Tokens without a numeric exp are not cached.
+
+        Args:
+            digest: token_digest() of the token
+            kid: Key ID that verified the signature
+            claims: Decoded claims
+        """
+        expires_at = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        with self._lock:
+            self._entries[digest] = (float(expires_at), kid, dict(claims))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -12,6 +12,14 @@ from app.domain.entities.kurikulum_entities import (
     KurikulumStatus,
     CPLKategori,
     JenisMK,
+    TipePrasyarat,
+)
+from app.domain.entities.prerequisite_graph import PrerequisiteGraph, PrerequisiteEdge
+from app.domain.entities.permissions import (
+    Permission,
+    PermissionSet,
+    ROLE_PERMISSIONS,
+    compile_permissions,
 )
 
 __all__ = [
@@ -22,4 +30,11 @@ __all__ = [
     "KurikulumStatus",
     "CPLKategori",
     "JenisMK",
+    "TipePrasyarat",
+    "PrerequisiteGraph",
+    "PrerequisiteEdge",
+    "Permission",
+    "PermissionSet",
+    "ROLE_PERMISSIONS",
+    "compile_permissions",
 ]
@@ -39,6 +39,18 @@ class JenisMK(str, Enum):
     MKWU = "MKWU"
 
 
+class TipePrasyarat(str, Enum):
+    """
+    Prerequisite type.
+
+    All WAJIB prerequisites of a course must be passed; of its ALTERNATIF
+    prerequisites, passing any one is enough.
+    """
+
+    WAJIB = "wajib"
+    ALTERNATIF = "alternatif"
+
+
 @dataclass
 class KurikulumEntity:
     """
@@ -0,0 +1,219 @@
+"""
+Permissions
+
+Role matrix of the specification compiled into permission bitsets.
+Following Clean Architecture: Pure domain logic, no database access.
+"""
+
+import zlib
+from dataclasses import dataclass
+from enum import IntFlag
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+class Permission(IntFlag):
+    """
+    Permissions of the role matrix (User Roles & Permissions).
+
+    One bit each, so a user's permissions are a single int and a check
+    is one AND. New permissions are appended; bits are never reused.
+    """
+
+    NONE = 0
+    # Master data
+    MANAGE_PRODI = 1 << 0
+    MANAGE_CPL = 1 << 1
+    VIEW_CPL = 1 << 2
+    # RPS
+    CREATE_RPS = 1 << 3
+    EDIT_RPS_DRAFT = 1 << 4
+    EDIT_OWN_RPS_DRAFT = 1 << 5
+    APPROVE_RPS = 1 << 6
+    VIEW_RPS = 1 << 7
+    # CPMK
+    CREATE_CPMK = 1 << 8
+    MAP_CPMK_CPL = 1 << 9
+    VIEW_CPMK = 1 << 10
+    # Penilaian
+    INPUT_NILAI = 1 << 11
+    VIEW_NILAI_ALL = 1 << 12
+    VIEW_NILAI_KELAS = 1 << 13
+    VIEW_NILAI_OWN = 1 << 14
+    OVERRIDE_NILAI = 1 << 15
+    # Analytics
+    VIEW_DASHBOARD_PRODI = 1 << 16
+    VIEW_DASHBOARD_KELAS = 1 << 17
+    GENERATE_REPORTS = 1 << 18
+    EXPORT_DATA = 1 << 19
+    # Kurikulum and mata kuliah (FR-003.1: Admin/Kaprodi)
+    MANAGE_KURIKULUM = 1 << 20
+    MANAGE_MATAKULIAH = 1 << 21
+    # Operations (slow query log and other diagnostics)
+    VIEW_DIAGNOSTICS = 1 << 22
+
+
+_VIEW_ALL = Permission.VIEW_CPL | Permission.VIEW_RPS | Permission.VIEW_CPMK
+
+ROLE_PERMISSIONS: Dict[str, Permission] = {
+    "admin": (
+        _VIEW_ALL
+        | Permission.MANAGE_PRODI
+        | Permission.MANAGE_CPL
+        | Permission.VIEW_NILAI_ALL
+        | Permission.VIEW_DASHBOARD_PRODI
+        | Permission.GENERATE_REPORTS
+        | Permission.EXPORT_DATA
+        | Permission.MANAGE_KURIKULUM
+        | Permission.MANAGE_MATAKULIAH
+        | Permission.VIEW_DIAGNOSTICS
+    ),
+    "kaprodi": (
+        _VIEW_ALL
+        | Permission.MANAGE_CPL
+        | Permission.CREATE_RPS
+        | Permission.EDIT_RPS_DRAFT
+        | Permission.APPROVE_RPS
+        | Permission.CREATE_CPMK
+        | Permission.MAP_CPMK_CPL
+        | Permission.VIEW_NILAI_ALL
+        | Permission.OVERRIDE_NILAI
+        | Permission.VIEW_DASHBOARD_PRODI
+        | Permission.VIEW_DASHBOARD_KELAS
+        | Permission.GENERATE_REPORTS
+        | Permission.EXPORT_DATA
+        | Permission.MANAGE_KURIKULUM
+        | Permission.MANAGE_MATAKULIAH
+    ),
+    "dosen": (
+        _VIEW_ALL
+        | Permission.CREATE_RPS
+        | Permission.EDIT_OWN_RPS_DRAFT
+        | Permission.CREATE_CPMK
+        | Permission.MAP_CPMK_CPL
+        | Permission.INPUT_NILAI
+        | Permission.VIEW_NILAI_KELAS
+        | Permission.VIEW_DASHBOARD_KELAS
+        | Permission.GENERATE_REPORTS
+        | Permission.EXPORT_DATA
+    ),
+    "mahasiswa": _VIEW_ALL | Permission.VIEW_NILAI_OWN,
+}
+
+
+def permission_version(roles: Iterable[str], permissions: Permission) -> str:
+    """
+    Compact version of a user's permissions.
+
+    Changes whenever the user's roles or the role matrix change; short
+    enough to travel in every JWT.
+
+    Args:
+        roles: Role names
+        permissions: Compiled permissions
+
+    Returns:
+        str: 8 hex characters
+    """
+    source = f"{int(permissions)}|{','.join(sorted(roles))}"
+    return f"{zlib.crc32(source.encode()):08x}"
+
+
+@dataclass(frozen=True)
+class PermissionSet:
+    """
+    Compiled, immutable permissions of one user.
+
+    Attributes:
+        id_user: User ID
+        roles: Sorted role names the permissions were compiled from
+        permissions: Union of the roles' permissions
+        version: permission_version() of roles and permissions
+    """
+
+    id_user: int
+    roles: Tuple[str, ...]
+    permissions: Permission
+    version: str
+
+    def has(self, required: Permission) -> bool:
+        """
+        Check that every required permission is granted.
+
+        Args:
+            required: One permission or several OR-ed together
+
+        Returns:
+            bool: True if all are granted
+        """
+        return self.permissions & required == required
+
+    def names(self) -> List[str]:
+        """
+        Names of the granted permissions.
+
+        Returns:
+            List[str]: Permission names in bit order
+        """
+        return [
+            permission.name
+            for permission in Permission
+            if permission and self.permissions & permission
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-compatible form for shared caches.
+
+        Returns:
+            Dict[str, Any]: id_user, roles, permissions, version
+        """
+        return {
+            "id_user": self.id_user,
+            "roles": list(self.roles),
+            "permissions": int(self.permissions),
+            "version": self.version,
+        }
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "PermissionSet":
+        """
+        Rebuild from to_dict() output.
+
+        Args:
+            values: Stored form
+
+        Returns:
+            PermissionSet: Permission set
+        """
+        return cls(
+            id_user=values["id_user"],
+            roles=tuple(values["roles"]),
+            permissions=Permission(values["permissions"]),
+            version=values["version"],
+        )
+
+
+def compile_permissions(id_user: int, roles: Iterable[str]) -> PermissionSet:
+    """
+    Turn a user's roles into a permission bitset.
+
+    Unknown role names grant nothing.
+
+    Args:
+        id_user: User ID
+        roles: Role names (roles.role_name)
+
+    Returns:
+        PermissionSet: Compiled permissions
+    """
+    role_names = tuple(sorted(set(roles)))
+    permissions = Permission.NONE
+    for role_name in role_names:
+        permissions |= ROLE_PERMISSIONS.get(role_name, Permission.NONE)
+
+    return PermissionSet(
+        id_user=id_user,
+        roles=role_names,
+        permissions=permissions,
+        version=permission_version(role_names, permissions),
+    )
@@ -0,0 +1,478 @@
+"""
+Prerequisite Graph
+
+In-memory prerequisite graph (prasyarat_mk) of one curriculum.
+Following Clean Architecture: Pure domain logic, no database access.
+"""
+
+import heapq
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.domain.entities.kurikulum_entities import TipePrasyarat
+from app.domain.exceptions import PrerequisiteCycleException
+
+# (kode_mk, kode_mk_prasyarat, tipe): kode_mk requires kode_mk_prasyarat
+PrerequisiteEdge = Tuple[str, str, TipePrasyarat]
+
+
+class PrerequisiteGraph:
+    """
+    Prerequisite graph of a curriculum.
+
+    Courses are vertices; an edge A -> B means "A requires B". Adjacency
+    lists are kept in both directions, so every traversal below is
+    O(V + E) on the graph of one curriculum.
+
+    Business rules:
+    - Prerequisites are courses of the same curriculum
+    - The graph must stay acyclic
+    - All WAJIB prerequisites must be passed; for ALTERNATIF ones, any one
+      of them is enough
+    """
+
+    def __init__(
+        self,
+        id_kurikulum: int,
+        semesters: Dict[str, int],
+        edges: Iterable[PrerequisiteEdge] = ()
+    ):
+        """
+        Initialize graph.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            semesters: Planned semester of every course (kode_mk -> semester)
+            edges: Prerequisite edges; edges touching an unknown course
+                (e.g. a deactivated one) are ignored
+        """
+        self.id_kurikulum = id_kurikulum
+        self.semesters: Dict[str, int] = dict(semesters)
+        self._prerequisites: Dict[str, Dict[str, TipePrasyarat]] = {
+            kode: {} for kode in self.semesters
+        }
+        self._dependents: Dict[str, Set[str]] = {kode: set() for kode in self.semesters}
+
+        for kode_mk, kode_prasyarat, tipe in edges:
+            if kode_mk in self.semesters and kode_prasyarat in self.semesters:
+                self._link(kode_mk, kode_prasyarat, TipePrasyarat(tipe))
+
+    # ===== Structure =====
+
+    @property
+    def courses(self) -> List[str]:
+        """Course codes, in planned order (semester, code)."""
+        return sorted(self.semesters, key=self._order_key)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of prerequisite edges."""
+        return sum(len(prerequisites) for prerequisites in self._prerequisites.values())
+
+    def has_course(self, kode_mk: str) -> bool:
+        """Check whether a course belongs to the graph."""
+        return kode_mk in self.semesters
+
+    def edges(self) -> List[PrerequisiteEdge]:
+        """
+        All edges, ordered by course then prerequisite.
+
+        Returns:
+            List[PrerequisiteEdge]: (kode_mk, kode_mk_prasyarat, tipe)
+        """
+        return [
+            (kode_mk, kode_prasyarat, tipe)
+            for kode_mk in self.courses
+            for kode_prasyarat, tipe in sorted(self._prerequisites[kode_mk].items())
+        ]
+
+    def prerequisites_of(self, kode_mk: str) -> Dict[str, TipePrasyarat]:
+        """
+        Direct prerequisites of a course.
+
+        Args:
+            kode_mk: Course code
+
+        Returns:
+            Dict[str, TipePrasyarat]: Prerequisite code -> type
+        """
+        return dict(self._prerequisites.get(kode_mk, {}))
+
+    def dependents_of(self, kode_mk: str) -> Set[str]:
+        """
+        Courses that directly require a course.
+
+        Args:
+            kode_mk: Course code
+
+        Returns:
+            Set[str]: Dependent course codes
+        """
+        return set(self._dependents.get(kode_mk, ()))
+
+    # ===== Mutation =====
+
+    def check_new_prerequisite(self, kode_mk: str, kode_prasyarat: str) -> None:
+        """
+        Verify that adding "kode_mk requires kode_prasyarat" keeps the graph acyclic.
+
+        The edge closes a cycle exactly when kode_prasyarat already
+        (transitively) requires kode_mk: one BFS, O(V + E).
+
+        Args:
+            kode_mk: Course code
+            kode_prasyarat: Prerequisite course code
+
+        Raises:
+            PrerequisiteCycleException: If the edge would create a cycle
+        """
+        if kode_mk == kode_prasyarat:
+            raise PrerequisiteCycleException([kode_mk, kode_mk])
+
+        path = self._find_path(kode_prasyarat, kode_mk)
+        if path is not None:
+            raise PrerequisiteCycleException([kode_mk, *path])
+
+    def add_prerequisite(
+        self,
+        kode_mk: str,
+        kode_prasyarat: str,
+        tipe: TipePrasyarat = TipePrasyarat.WAJIB
+    ) -> None:
+        """
+        Add an edge after checking it keeps the graph acyclic.
+
+        Args:
+            kode_mk: Course code
+            kode_prasyarat: Prerequisite course code
+            tipe: Prerequisite type
+
+        Raises:
+            ValueError: If either course is not in the graph
+            PrerequisiteCycleException: If the edge would create a cycle
+        """
+        for kode in (kode_mk, kode_prasyarat):
+            if kode not in self.semesters:
+                raise ValueError(f"Mata kuliah '{kode}' tidak ada di kurikulum")
+        self.check_new_prerequisite(kode_mk, kode_prasyarat)
+        self._link(kode_mk, kode_prasyarat, TipePrasyarat(tipe))
+
+    def remove_prerequisite(self, kode_mk: str, kode_prasyarat: str) -> bool:
+        """
+        Remove an edge.
+
+        Args:
+            kode_mk: Course code
+            kode_prasyarat: Prerequisite course code
+
+        Returns:
+            bool: True if the edge existed
+        """
+        if self._prerequisites.get(kode_mk, {}).pop(kode_prasyarat, None) is None:
+            return False
+        self._dependents[kode_prasyarat].discard(kode_mk)
+        return True
+
+    # ===== Traversal =====
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """
+        Find a cycle with an iterative three-colour DFS, O(V + E).
+
+        Returns:
+            Optional[List[str]]: Cycle as [A, B, ..., A] (A requires B ...),
+                None if the graph is acyclic
+        """
+        visiting, done = 1, 2
+        state: Dict[str, int] = {}
+        parent: Dict[str, str] = {}
+
+        for root in self.courses:
+            if root in state:
+                continue
+            state[root] = visiting
+            stack = [(root, iter(sorted(self._prerequisites[root])))]
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    state[node] = done
+                    stack.pop()
+                elif child not in state:
+                    state[child] = visiting
+                    parent[child] = node
+                    stack.append((child, iter(sorted(self._prerequisites[child]))))
+                elif state[child] == visiting:
+                    cycle = [child, node]
+                    while node != child:
+                        node = parent[node]
+                        cycle.append(node)
+                    return cycle[::-1]
+        return None
+
+    def transitive_prerequisites(self, kode_mk: str) -> Set[str]:
+        """
+        Every course a course depends on, directly or indirectly.
+
+        Args:
+            kode_mk: Course code
+
+        Returns:
+            Set[str]: Transitive prerequisites (excluding kode_mk)
+        """
+        return self._reachable(kode_mk, self._prerequisites)
+
+    def transitive_dependents(self, kode_mk: str) -> Set[str]:
+        """
+        Every course that depends on a course, directly or indirectly.
+
+        Args:
+            kode_mk: Course code
+
+        Returns:
+            Set[str]: Transitive dependents (excluding kode_mk)
+        """
+        return self._reachable(kode_mk, self._dependents)
+
+    def transitive_closure(self) -> Dict[str, Set[str]]:
+        """
+        Transitive prerequisites of every course.
+
+        Built in topological order so each course unions the closures
+        of its direct prerequisites only once.
+
+        Returns:
+            Dict[str, Set[str]]: Course -> transitive prerequisites
+
+        Raises:
+            PrerequisiteCycleException: If the graph has a cycle
+        """
+        closure: Dict[str, Set[str]] = {}
+        for kode_mk in self.topological_order():
+            reachable: Set[str] = set()
+            for kode_prasyarat in self._prerequisites[kode_mk]:
+                reachable.add(kode_prasyarat)
+                reachable |= closure[kode_prasyarat]
+            closure[kode_mk] = reachable
+        return closure
+
+    def topological_order(self) -> List[str]:
+        """
+        Courses ordered so that prerequisites come first (Kahn's algorithm).
+
+        Ties are broken by planned semester, then code.
+
+        Returns:
+            List[str]: Course codes
+
+        Raises:
+            PrerequisiteCycleException: If the graph has a cycle
+        """
+        remaining = {kode: len(prerequisites) for kode, prerequisites in self._prerequisites.items()}
+        ready = [self._order_key(kode) for kode, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+
+        order: List[str] = []
+        while ready:
+            _, kode = heapq.heappop(ready)
+            order.append(kode)
+            for dependent in self._dependents[kode]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(ready, self._order_key(dependent))
+
+        if len(order) != len(self.semesters):
+            raise PrerequisiteCycleException(self.find_cycle() or [])
+        return order
+
+    def semester_layers(self) -> List[List[str]]:
+        """
+        Group courses into the earliest term each can be taken.
+
+        Layer 0 holds courses without prerequisites. A course sits one
+        layer after the latest of its WAJIB prerequisites and after the
+        earliest of its ALTERNATIF prerequisites.
+
+        Returns:
+            List[List[str]]: Layers, each in planned order
+
+        Raises:
+            PrerequisiteCycleException: If the graph has a cycle
+        """
+        level: Dict[str, int] = {}
+        for kode_mk in self.topological_order():
+            wajib = [
+                level[kode] for kode, tipe in self._prerequisites[kode_mk].items()
+                if tipe == TipePrasyarat.WAJIB
+            ]
+            alternatif = [
+                level[kode] for kode, tipe in self._prerequisites[kode_mk].items()
+                if tipe == TipePrasyarat.ALTERNATIF
+            ]
+            level[kode_mk] = max(
+                max(wajib, default=-1) + 1,
+                min(alternatif, default=-1) + 1
+            )
+
+        layers: List[List[str]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for kode_mk in self.courses:
+            layers[level[kode_mk]].append(kode_mk)
+        return layers
+
+    def semester_conflicts(self) -> List[PrerequisiteEdge]:
+        """
+        Edges the planned semesters do not respect.
+
+        A WAJIB prerequisite must be planned in an earlier semester than
+        the course; for ALTERNATIF prerequisites at least one must be.
+
+        Returns:
+            List[PrerequisiteEdge]: Offending edges
+        """
+        conflicts: List[PrerequisiteEdge] = []
+        for kode_mk, kode_prasyarat, tipe in self.edges():
+            if self.semesters[kode_prasyarat] < self.semesters[kode_mk]:
+                continue
+            if tipe == TipePrasyarat.ALTERNATIF and any(
+                self.semesters[kode] < self.semesters[kode_mk]
+                for kode, other in self._prerequisites[kode_mk].items()
+                if other == TipePrasyarat.ALTERNATIF
+            ):
+                continue
+            conflicts.append((kode_mk, kode_prasyarat, tipe))
+        return conflicts
+
+    # ===== Eligibility =====
+
+    def missing_prerequisites(
+        self,
+        kode_mk: str,
+        passed: Set[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Prerequisites still blocking a course.
+
+        Args:
+            kode_mk: Course code
+            passed: Codes of passed courses
+
+        Returns:
+            Tuple[List[str], List[str]]: (missing WAJIB prerequisites,
+                ALTERNATIF options when none of them is passed yet)
+        """
+        prerequisites = self._prerequisites.get(kode_mk, {})
+        missing_wajib = sorted(
+            kode for kode, tipe in prerequisites.items()
+            if tipe == TipePrasyarat.WAJIB and kode not in passed
+        )
+        alternatif = sorted(
+            kode for kode, tipe in prerequisites.items()
+            if tipe == TipePrasyarat.ALTERNATIF
+        )
+        if any(kode in passed for kode in alternatif):
+            alternatif = []
+        return missing_wajib, alternatif
+
+    def can_take(self, kode_mk: str, passed: Set[str]) -> bool:
+        """
+        Check whether a course's prerequisites are satisfied.
+
+        Args:
+            kode_mk: Course code
+            passed: Codes of passed courses
+
+        Returns:
+            bool: True if the course can be taken
+        """
+        missing_wajib, alternatif = self.missing_prerequisites(kode_mk, passed)
+        return not missing_wajib and not alternatif
+
+    def available_courses(self, passed: Iterable[str]) -> List[str]:
+        """
+        Courses that can be taken next, O(V + E).
+
+        Args:
+            passed: Codes of passed courses
+
+        Returns:
+            List[str]: Not yet passed courses whose prerequisites are
+                satisfied, in planned order
+        """
+        passed = set(passed)
+        return [
+            kode_mk for kode_mk in self.courses
+            if kode_mk not in passed and self.can_take(kode_mk, passed)
+        ]
+
+    # ===== Serialization =====
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-compatible representation (for caching).
+
+        Returns:
+            Dict[str, Any]: Curriculum, semesters and edges
+        """
+        return {
+            "id_kurikulum": self.id_kurikulum,
+            "semesters": self.semesters,
+            "edges": [[kode_mk, kode, tipe.value] for kode_mk, kode, tipe in self.edges()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PrerequisiteGraph":
+        """
+        Rebuild a graph from to_dict() output.
+
+        Args:
+            data: Serialized graph
+
+        Returns:
+            PrerequisiteGraph: Graph instance
+        """
+        return cls(
+            data["id_kurikulum"],
+            data["semesters"],
+            [(kode_mk, kode, TipePrasyarat(tipe)) for kode_mk, kode, tipe in data["edges"]],
+        )
+
+    # ===== Internal helpers =====
+
+    def _link(self, kode_mk: str, kode_prasyarat: str, tipe: TipePrasyarat) -> None:
+        self._prerequisites[kode_mk][kode_prasyarat] = tipe
+        self._dependents[kode_prasyarat].add(kode_mk)
+
+    def _order_key(self, kode_mk: str) -> Tuple[int, str]:
+        return self.semesters[kode_mk], kode_mk
+
+    @staticmethod
+    def _reachable(start: str, adjacency: Dict[str, Any]) -> Set[str]:
+        seen: Set[str] = set()
+        queue = deque(adjacency.get(start, ()))
+        while queue:
+            kode = queue.popleft()
+            if kode in seen:
+                continue
+            seen.add(kode)
+            queue.extend(adjacency[kode])
+        seen.discard(start)
+        return seen
+
+    def _find_path(self, start: str, goal: str) -> Optional[List[str]]:
+        """BFS along prerequisite edges; returns [start, ..., goal] or None."""
+        if start not in self._prerequisites:
+            return None
+        parent: Dict[str, Optional[str]] = {start: None}
+        queue = deque([start])
+        while queue:
+            kode = queue.popleft()
+            if kode == goal:
+                path = [kode]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            for kode_prasyarat in self._prerequisites[kode]:
+                if kode_prasyarat not in parent:
+                    parent[kode_prasyarat] = kode
+                    queue.append(kode_prasyarat)
+        return None
@@ -52,6 +52,18 @@ class AuthorizationException(DomainException):
         super().__init__(message, "AUTHORIZATION_FAILED")
 
 
+class ServiceOverloadedException(DomainException):
+    """Raised when a bounded worker queue is full and the request is shed."""
+
+    def __init__(
+        self,
+        message: str = "Server sedang sibuk. Silakan coba lagi sebentar lagi.",
+        retry_after: int = 1
+    ):
+        self.retry_after = retry_after
+        super().__init__(message, "SERVICE_OVERLOADED")
+
+
 class ValidationException(DomainException):
     """Raised when data validation fails."""
 
@@ -70,6 +82,27 @@ class CurriculumImmutableException(InvalidOperationException):
         )
 
 
+class PrimaryCurriculumConflictException(InvalidOperationException):
+    """Raised when a concurrent request changed the primary curriculum first."""
+
+    def __init__(self, id_prodi: str):
+        super().__init__(
+            f"Kurikulum primary untuk prodi '{id_prodi}' sedang diubah oleh "
+            "proses lain. Silakan coba lagi. Ini adalah business rule BR-K08."
+        )
+
+
+class PrerequisiteCycleException(InvalidOperationException):
+    """Raised when a prerequisite would make the course graph cyclic."""
+
+    def __init__(self, cycle: list):
+        self.cycle = cycle
+        super().__init__(
+            f"Prasyarat membentuk siklus: {' → '.join(cycle)}. "
+            "Mata kuliah tidak boleh menjadi prasyarat bagi dirinya sendiri."
+        )
+
+
 class EnrollmentCurriculumMismatchException(InvalidOperationException):
     """Raised when student tries to enroll in wrong curriculum."""
 
@@ -0,0 +1,111 @@
+"""
+Cache Package
+
+Pluggable cache backends and the read-through curriculum cache.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from app.core.config import settings
+from app.infrastructure.cache.base import CacheBackend, CacheStats, NullCacheBackend
+from app.infrastructure.cache.memory import InMemoryCacheBackend
+from app.infrastructure.cache.redis_backend import RedisCacheBackend
+from app.infrastructure.cache.single_flight import SingleFlight
+from app.infrastructure.cache.kurikulum_cache import (
+    CachedKurikulumRepository,
+    CachedPrerequisiteGraphs,
+    invalidate_kurikulum,
+    list_version,
+    primary_version,
+)
+from app.infrastructure.cache.permission_cache import PermissionCache, permission_key
+
+logger = logging.getLogger(__name__)
+
+_cache_backend: Optional[CacheBackend] = None
+_cache_backend_lock = threading.Lock()
+_permission_cache: Optional[PermissionCache] = None
+_permission_cache_lock = threading.Lock()
+
+
+def create_cache_backend() -> CacheBackend:
+    """
+    Build the backend selected by CACHE_BACKEND.
+
+    Falls back to the in-process backend when redis is selected but the
+    redis package is not installed.
+
+    Returns:
+        CacheBackend: New backend instance
+    """
+    cache_settings = settings.cache
+    if cache_settings.backend == "none":
+        return NullCacheBackend()
+
+    if cache_settings.backend == "redis":
+        try:
+            return RedisCacheBackend(cache_settings.redis_url, cache_settings.key_prefix)
+        except ImportError:
+            logger.warning("redis package not installed, using in-process cache")
+
+    return InMemoryCacheBackend(max_entries=cache_settings.max_entries)
+
+
+def get_cache_backend() -> CacheBackend:
+    """
+    Get the process-wide cache backend.
+
+    Returns:
+        CacheBackend: Shared backend instance
+    """
+    global _cache_backend
+    with _cache_backend_lock:
+        if _cache_backend is None:
+            _cache_backend = create_cache_backend()
+        return _cache_backend
+
+
+def get_permission_cache() -> PermissionCache:
+    """
+    Get the process-wide permission cache.
+
+    Compiled permissions are shared through Redis when CACHE_BACKEND is
+    redis; with the in-process backend they stay per worker.
+
+    Returns:
+        PermissionCache: Shared cache instance
+    """
+    global _permission_cache
+    with _permission_cache_lock:
+        if _permission_cache is None:
+            backend = get_cache_backend()
+            cache_settings = settings.cache
+            _permission_cache = PermissionCache(
+                shared=backend if isinstance(backend, RedisCacheBackend) else None,
+                shared_ttl_seconds=cache_settings.permission_ttl_seconds,
+                local_ttl_seconds=cache_settings.permission_local_ttl_seconds,
+                max_entries=cache_settings.max_entries,
+            )
+        return _permission_cache
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "NullCacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "SingleFlight",
+    "CachedKurikulumRepository",
+    "CachedPrerequisiteGraphs",
+    "invalidate_kurikulum",
+    "list_version",
+    "primary_version",
+    "PermissionCache",
+    "permission_key",
+    "create_cache_backend",
+    "get_cache_backend",
+    "get_permission_cache",
+]
@@ -0,0 +1,188 @@
+"""
+Cache Backend Interface
+
+Contract shared by all cache backends plus their counters.
+Following Clean Code: Dependency Inversion, Pluggable backends.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Optional
+
+
+@dataclass
+class CacheStats:
+    """
+    Cache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to load from the database
+        evictions: Entries dropped because of capacity or expiry
+        invalidations: Entries removed because the data changed
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters as a dictionary (for health/metrics output)."""
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+class CacheBackend(ABC):
+    """
+    Key-value cache backend.
+
+    Values are JSON-compatible (dicts, lists, strings, numbers, None), so
+    every backend can store them without custom serialization.
+    """
+
+    name = "abstract"
+
+    def __init__(self) -> None:
+        """Initialize counters and key generations."""
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        self._generation_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: Cached value, None on miss
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """
+        Store value.
+
+        Args:
+            key: Cache key
+            value: JSON-compatible value (must not be None)
+            ttl_seconds: Time-to-live in seconds
+        """
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> int:
+        """
+        Remove keys.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            int: Number of keys that were present
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry of this backend."""
+
+    # ===== Generations =====
+    # A loader that read the database before a concurrent write must not
+    # store its result after the write's invalidation. Invalidation bumps
+    # the key's generation; the loader stores only if it is unchanged.
+
+    def generation(self, key: str) -> int:
+        """
+        Current generation of a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            int: Generation, 0 for keys never invalidated
+        """
+        with self._generation_lock:
+            return self._generations.get(key, 0)
+
+    def bump_generations(self, keys: Iterable[str]) -> None:
+        """
+        Advance the generation of keys, so in-flight loads are not stored.
+
+        Args:
+            keys: Cache keys
+        """
+        with self._generation_lock:
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def set_if_generation(self, key: str, value: Any, ttl_seconds: int, generation: int) -> bool:
+        """
+        Store value unless the key was invalidated since generation was read.
+
+        Args:
+            key: Cache key
+            value: JSON-compatible value (must not be None)
+            ttl_seconds: Time-to-live in seconds
+            generation: generation(key) read before loading the value
+
+        Returns:
+            bool: True if the value was stored
+        """
+        with self._generation_lock:
+            if self._generations.get(key, 0) != generation:
+                return False
+            self.set(key, value, ttl_seconds)
+            return True
+
+    def record(self, hits: int = 0, misses: int = 0, evictions: int = 0, invalidations: int = 0) -> None:
+        """
+        Add to the counters.
+
+        Args:
+            hits: Hits to add
+            misses: Misses to add
+            evictions: Evictions to add
+            invalidations: Invalidations to add
+        """
+        with self._stats_lock:
+            self._stats.hits += hits
+            self._stats.misses += misses
+            self._stats.evictions += evictions
+            self._stats.invalidations += invalidations
+
+    def stats(self) -> CacheStats:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            CacheStats: Copy of the current counters
+        """
+        with self._stats_lock:
+            return CacheStats(**asdict(self._stats))
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that stores nothing (CACHE_BACKEND=none)."""
+
+    name = "none"
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        return None
+
+    def delete(self, keys: Iterable[str]) -> int:
+        return 0
+
+    def clear(self) -> None:
+        return None
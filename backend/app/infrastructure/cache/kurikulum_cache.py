@@ -0,0 +1,397 @@
+"""
+Kurikulum Cache
+
+Read-through cache in front of KurikulumRepository for hot lookups,
+and of the per-curriculum prerequisite graph.
+Following Clean Code: Decorator pattern, Explicit invalidation.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Date, DateTime, inspect
+
+from app.domain.entities import PrerequisiteGraph
+from app.domain.exceptions import EntityNotFoundException
+from app.infrastructure.cache.base import CacheBackend
+from app.infrastructure.cache.single_flight import SingleFlight
+from app.infrastructure.models.kurikulum_models import Kurikulum
+from app.infrastructure.repositories.kurikulum_repository import KurikulumRepository
+from app.infrastructure.repositories.matakuliah_repository import MataKuliahRepository
+
+# Process-wide so concurrent requests share in-flight loads
+_single_flight = SingleFlight()
+
+
+def by_id_key(id_kurikulum: int) -> str:
+    """Cache key of one curriculum."""
+    return f"kurikulum:id:{id_kurikulum}"
+
+
+def primary_key(id_prodi: str) -> str:
+    """Cache key of the primary curriculum of a prodi."""
+    return f"kurikulum:prodi:{id_prodi}:primary"
+
+
+def active_key(id_prodi: str) -> str:
+    """Cache key of the active curricula of a prodi."""
+    return f"kurikulum:prodi:{id_prodi}:active"
+
+
+def prerequisite_graph_key(id_kurikulum: int) -> str:
+    """Cache key of the prerequisite graph of one curriculum."""
+    return f"kurikulum:id:{id_kurikulum}:prasyarat"
+
+
+def read_through(
+    backend: CacheBackend,
+    key: str,
+    ttl_seconds: int,
+    load: Callable[[], Any]
+) -> Any:
+    """
+    Return the cached value for key, loading it once on a miss.
+
+    Values are wrapped as {"v": value} so that "no primary curriculum"
+    is cached too instead of hitting the database on every call. The
+    key's generation is read before loading; if a write invalidated the
+    key meanwhile, the (possibly stale) result is returned but not stored.
+
+    Args:
+        backend: Cache backend
+        key: Cache key
+        ttl_seconds: Time-to-live of a stored value
+        load: Loads a JSON-compatible value from the database
+
+    Returns:
+        Any: Cached or freshly loaded value
+    """
+    entry = backend.get(key)
+    if entry is not None:
+        backend.record(hits=1)
+        return entry["v"]
+
+    backend.record(misses=1)
+
+    def load_and_store() -> Any:
+        generation = backend.generation(key)
+        value = load()
+        backend.set_if_generation(key, {"v": value}, ttl_seconds, generation)
+        return value
+
+    return _single_flight.do(key, load_and_store)
+
+
+def snapshot(kurikulum: Kurikulum) -> Dict[str, Any]:
+    """
+    JSON-compatible copy of a curriculum's column values.
+
+    Args:
+        kurikulum: Curriculum model
+
+    Returns:
+        Dict[str, Any]: Column values
+    """
+    values = {}
+    for attr in inspect(Kurikulum).column_attrs:
+        value = getattr(kurikulum, attr.key)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        values[attr.key] = value
+    return values
+
+
+def restore(values: Dict[str, Any]) -> Kurikulum:
+    """
+    Rebuild a detached Kurikulum from a snapshot.
+
+    The result is transient (not attached to any session): fine for
+    serialization, not meant to be modified and flushed.
+
+    Args:
+        values: Snapshot produced by snapshot()
+
+    Returns:
+        Kurikulum: Detached curriculum
+    """
+    data = {}
+    for attr in inspect(Kurikulum).column_attrs:
+        value = values.get(attr.key)
+        if value is not None:
+            column_type = attr.columns[0].type
+            if isinstance(column_type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column_type, Date):
+                value = date.fromisoformat(value)
+            elif getattr(column_type, "enum_class", None) is not None:
+                value = column_type.enum_class(value)
+        data[attr.key] = value
+    return Kurikulum(**data)
+
+
+def list_version(curricula: Sequence[Kurikulum]) -> Tuple[Optional[datetime], int]:
+    """
+    Version stamp of a curriculum list, as KurikulumRepository.get_list_version.
+
+    Args:
+        curricula: Curricula of the list
+
+    Returns:
+        Tuple[Optional[datetime], int]: max(updated_at) and count
+    """
+    latest = max((kurikulum.updated_at for kurikulum in curricula), default=None)
+    return latest, len(curricula)
+
+
+def primary_version(kurikulum: Optional[Kurikulum]) -> Tuple[Optional[int], Optional[datetime]]:
+    """
+    Version stamp of a prodi's primary curriculum.
+
+    Args:
+        kurikulum: Primary curriculum, None if the prodi has none
+
+    Returns:
+        Tuple[Optional[int], Optional[datetime]]: (id_kurikulum, updated_at)
+    """
+    if kurikulum is None:
+        return None, None
+    return kurikulum.id_kurikulum, kurikulum.updated_at
+
+
+def invalidate_kurikulum(
+    backend: CacheBackend,
+    id_kurikulum: Optional[int] = None,
+    id_prodi: Optional[str] = None
+) -> None:
+    """
+    Drop cached entries affected by a curriculum write.
+
+    Args:
+        backend: Cache backend
+        id_kurikulum: Changed curriculum ID
+        id_prodi: Program study of the changed curriculum
+    """
+    keys = []
+    if id_kurikulum is not None:
+        keys.extend([by_id_key(id_kurikulum), prerequisite_graph_key(id_kurikulum)])
+    if id_prodi is not None:
+        keys.extend([primary_key(id_prodi), active_key(id_prodi)])
+
+    backend.bump_generations(keys)
+    removed = backend.delete(keys)
+    backend.record(invalidations=removed)
+
+
+class CachedKurikulumRepository:
+    """
+    Read-through cache for curriculum lookups.
+
+    Only the read paths are cached. Use cases keep loading entities they
+    are going to modify from KurikulumRepository, and call invalidate()
+    after every committed write.
+
+    Invalidation only reaches this worker's in-process cache, so lookups
+    take an optional version read from the database: a cached copy of a
+    different version is dropped and loaded again.
+    """
+
+    def __init__(
+        self,
+        repository: KurikulumRepository,
+        backend: CacheBackend,
+        ttl_seconds: int
+    ):
+        """
+        Initialize cached repository.
+
+        Args:
+            repository: Underlying Kurikulum repository
+            backend: Cache backend
+            ttl_seconds: Time-to-live of cached entries
+        """
+        self.repository = repository
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def get_by_id_or_fail(
+        self,
+        id_kurikulum: int,
+        version: Optional[datetime] = None
+    ) -> Kurikulum:
+        """
+        Get curriculum by ID.
+
+        Args:
+            id_kurikulum: Curriculum ID
+            version: Current updated_at in the database (optional)
+
+        Returns:
+            Kurikulum: Detached curriculum
+
+        Raises:
+            EntityNotFoundException: If curriculum not found
+        """
+        def load() -> Optional[Dict[str, Any]]:
+            kurikulum = self.repository.get_by_id(id_kurikulum)
+            return snapshot(kurikulum) if kurikulum else None
+
+        values = self._read_through_version(
+            by_id_key(id_kurikulum),
+            load,
+            version,
+            lambda values: restore(values).updated_at if values is not None else None
+        )
+        if values is None:
+            raise EntityNotFoundException("Kurikulum", str(id_kurikulum))
+        return restore(values)
+
+    def get_primary_curriculum(
+        self,
+        id_prodi: str,
+        version: Optional[Tuple[Optional[int], Optional[datetime]]] = None
+    ) -> Optional[Kurikulum]:
+        """
+        Get primary curriculum for a program.
+
+        Args:
+            id_prodi: Program study ID
+            version: Current primary_version() in the database (optional)
+
+        Returns:
+            Optional[Kurikulum]: Detached primary curriculum if exists
+        """
+        def load() -> Optional[Dict[str, Any]]:
+            kurikulum = self.repository.get_primary_curriculum(id_prodi)
+            return snapshot(kurikulum) if kurikulum else None
+
+        values = self._read_through_version(
+            primary_key(id_prodi),
+            load,
+            version,
+            lambda values: primary_version(restore(values) if values is not None else None)
+        )
+        return restore(values) if values is not None else None
+
+    def get_active_curricula(
+        self,
+        id_prodi: str,
+        version: Optional[Tuple[Optional[datetime], int]] = None
+    ) -> List[Kurikulum]:
+        """
+        Get all active curricula for a program.
+
+        Args:
+            id_prodi: Program study ID
+            version: Current list_version() in the database (optional)
+
+        Returns:
+            List[Kurikulum]: Detached active curricula
+        """
+        def load() -> List[Dict[str, Any]]:
+            return [
+                snapshot(kurikulum)
+                for kurikulum in self.repository.get_active_curricula(id_prodi)
+            ]
+
+        entries = self._read_through_version(
+            active_key(id_prodi),
+            load,
+            version,
+            lambda entries: list_version([restore(values) for values in entries])
+        )
+        return [restore(values) for values in entries]
+
+    def invalidate(self, id_kurikulum: Optional[int] = None, id_prodi: Optional[str] = None) -> None:
+        """
+        Drop cached entries affected by a curriculum write.
+
+        Args:
+            id_kurikulum: Changed curriculum ID
+            id_prodi: Program study of the changed curriculum
+        """
+        invalidate_kurikulum(self.backend, id_kurikulum, id_prodi)
+
+    def _read_through(self, key: str, load: Callable[[], Any]) -> Any:
+        """Read-through lookup with this repository's TTL."""
+        return read_through(self.backend, key, self.ttl_seconds, load)
+
+    def _read_through_version(
+        self,
+        key: str,
+        load: Callable[[], Any],
+        version: Any,
+        version_of: Callable[[Any], Any]
+    ) -> Any:
+        """Read-through lookup that reloads a cached value of another version."""
+        values = self._read_through(key, load)
+        if version is None or version_of(values) == version:
+            return values
+
+        self.backend.bump_generations([key])
+        removed = self.backend.delete([key])
+        self.backend.record(invalidations=removed)
+        return self._read_through(key, load)
+
+
+class CachedPrerequisiteGraphs:
+    """
+    Read-through cache of prerequisite graphs, one entry per curriculum.
+
+    The graph is loaded with a single query and kept until the
+    curriculum changes: prerequisite writes call invalidate(), and
+    invalidate_kurikulum() drops it together with the curriculum itself.
+    """
+
+    def __init__(
+        self,
+        repository: MataKuliahRepository,
+        backend: CacheBackend,
+        ttl_seconds: int
+    ):
+        """
+        Initialize graph cache.
+
+        Args:
+            repository: MataKuliah repository that loads graphs
+            backend: Cache backend
+            ttl_seconds: Time-to-live of cached graphs
+        """
+        self.repository = repository
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, id_kurikulum: int) -> PrerequisiteGraph:
+        """
+        Get the prerequisite graph of a curriculum.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            PrerequisiteGraph: Graph (a private copy; safe to modify)
+        """
+        def load() -> Dict[str, Any]:
+            return self.repository.get_prerequisite_graph(id_kurikulum).to_dict()
+
+        values = read_through(
+            self.backend,
+            prerequisite_graph_key(id_kurikulum),
+            self.ttl_seconds,
+            load
+        )
+        return PrerequisiteGraph.from_dict(values)
+
+    def invalidate(self, id_kurikulum: int) -> None:
+        """
+        Drop the cached graph of a curriculum.
+
+        Args:
+            id_kurikulum: Changed curriculum ID
+        """
+        keys = [prerequisite_graph_key(id_kurikulum)]
+        self.backend.bump_generations(keys)
+        removed = self.backend.delete(keys)
+        self.backend.record(invalidations=removed)
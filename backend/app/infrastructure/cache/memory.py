@@ -0,0 +1,79 @@
+"""
+In-Process Cache Backend
+
+Thread-safe LRU cache with per-entry TTL.
+Following Clean Code: Single Responsibility, Bounded memory.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+from app.infrastructure.cache.base import CacheBackend
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    LRU + TTL cache living in the worker process.
+
+    Each worker has its own copy, so invalidations only reach the worker
+    that made the write; other workers converge within ttl_seconds. Use
+    the Redis backend when running several workers.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 2048):
+        """
+        Initialize in-process cache.
+
+        Args:
+            max_entries: Capacity; least recently used entries are evicted
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.record(evictions=1)
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.record(evictions=evicted)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,212 @@
+"""
+Permission Cache
+
+Compiled permission bitsets per user, cached in the worker process and
+optionally shared through Redis.
+Following Clean Code: Two-level cache, Invalidation on commit.
+"""
+
+import logging
+from itertools import chain
+from typing import Callable, Iterable, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.domain.entities.permissions import PermissionSet, compile_permissions
+from app.infrastructure.cache.base import CacheBackend
+from app.infrastructure.cache.memory import InMemoryCacheBackend
+from app.infrastructure.models.user_models import Role, UserRole
+
+logger = logging.getLogger(__name__)
+
+# session.info key collecting users whose roles changed in the transaction
+_CHANGED_USERS_KEY = "permission_changed_users"
+# Marker for "a role itself changed": every user may be affected
+_ALL_USERS = -1
+
+
+def permission_key(id_user: int) -> str:
+    """Cache key of one user's compiled permissions."""
+    return f"permissions:user:{id_user}"
+
+
+class PermissionCache:
+    """
+    Two-level cache of PermissionSet.
+
+    The local level holds frozen PermissionSet objects (no
+    deserialization on a hit) for local_ttl_seconds. The shared level,
+    when configured, holds their JSON form in Redis so one compilation
+    serves every worker. A role change invalidates both levels on the
+    committing worker; other workers notice within local_ttl_seconds,
+    or immediately when the token's permission version differs.
+    """
+
+    def __init__(
+        self,
+        shared: Optional[CacheBackend] = None,
+        shared_ttl_seconds: int = 300,
+        local_ttl_seconds: int = 30,
+        max_entries: int = 2048,
+    ):
+        """
+        Initialize permission cache.
+
+        Args:
+            shared: Cache shared between workers (optional, local only if None)
+            shared_ttl_seconds: Time-to-live in the shared cache
+            local_ttl_seconds: Time-to-live in this process
+            max_entries: Capacity of the local level
+        """
+        self.shared = shared
+        self.shared_ttl_seconds = shared_ttl_seconds
+        self.local_ttl_seconds = local_ttl_seconds
+        self.local = InMemoryCacheBackend(max_entries=max_entries)
+
+    def lookup(self, id_user: int, version: Optional[str] = None) -> Optional[PermissionSet]:
+        """
+        Cached permissions of a user.
+
+        Args:
+            id_user: User ID
+            version: Permission version from the user's token; a cached
+                entry with another version is treated as stale
+
+        Returns:
+            Optional[PermissionSet]: Permissions, None on miss or stale entry
+        """
+        key = permission_key(id_user)
+        permissions = self.local.get(key)
+        if permissions is not None and version in (None, permissions.version):
+            self.local.record(hits=1)
+            return permissions
+
+        if self.shared is not None:
+            values = self.shared.get(key)
+            if values is not None and version in (None, values["version"]):
+                self.shared.record(hits=1)
+                permissions = PermissionSet.from_dict(values)
+                self.local.set(key, permissions, self.local_ttl_seconds)
+                return permissions
+            self.shared.record(misses=1)
+
+        self.local.record(misses=1)
+        return None
+
+    def store(self, id_user: int, roles: Iterable[str]) -> PermissionSet:
+        """
+        Compile and cache a user's permissions.
+
+        Args:
+            id_user: User ID
+            roles: Role names loaded from user_roles
+
+        Returns:
+            PermissionSet: Compiled permissions
+        """
+        permissions = compile_permissions(id_user, roles)
+        key = permission_key(id_user)
+        self.local.set(key, permissions, self.local_ttl_seconds)
+        if self.shared is not None:
+            self.shared.set(key, permissions.to_dict(), self.shared_ttl_seconds)
+        return permissions
+
+    def get(
+        self,
+        id_user: int,
+        load_roles: Callable[[], List[str]],
+        version: Optional[str] = None
+    ) -> PermissionSet:
+        """
+        Read-through lookup for sync callers.
+
+        Args:
+            id_user: User ID
+            load_roles: Loads the user's role names from the database
+            version: Permission version from the user's token
+
+        Returns:
+            PermissionSet: Cached or freshly compiled permissions
+        """
+        permissions = self.lookup(id_user, version)
+        if permissions is None:
+            permissions = self.store(id_user, load_roles())
+        return permissions
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        """
+        Drop cached permissions of users whose roles changed.
+
+        Args:
+            user_ids: Affected user IDs
+        """
+        keys = [permission_key(id_user) for id_user in user_ids]
+        removed = self.local.delete(keys)
+        self.local.record(invalidations=removed)
+        if self.shared is not None:
+            removed = self.shared.delete(keys)
+            self.shared.record(invalidations=removed)
+
+    def invalidate_all(self) -> None:
+        """Drop every cached permission set (a role itself changed)."""
+        self.local.clear()
+        if self.shared is not None:
+            # Clears the whole shared cache, curriculum entries included;
+            # acceptable for something as rare as editing a role row
+            self.shared.clear()
+
+
+# ===== Invalidation on user_roles changes =====
+
+def changed_users(session: Session) -> Set[int]:
+    """
+    Users whose role assignments the session has flushed, not yet committed.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Set[int]: User IDs; contains -1 if a role row itself changed
+    """
+    return session.info.setdefault(_CHANGED_USERS_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_role_changes(session: Session, flush_context) -> None:
+    """Remember user_roles / roles rows written by this flush."""
+    changed = None
+    for instance in chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, UserRole):
+            changed = changed if changed is not None else changed_users(session)
+            changed.add(instance.id_user)
+        elif isinstance(instance, Role) and (
+            instance in session.deleted
+            or session.is_modified(instance, include_collections=False)
+        ) and instance not in session.new:
+            changed = changed if changed is not None else changed_users(session)
+            changed.add(_ALL_USERS)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_role_changes(session: Session) -> None:
+    """Invalidate cached permissions once role changes are durable."""
+    changed = session.info.pop(_CHANGED_USERS_KEY, None)
+    if not changed:
+        return
+
+    # Imported here: the process-wide cache lives in the package __init__
+    from app.infrastructure.cache import get_permission_cache
+
+    cache = get_permission_cache()
+    if _ALL_USERS in changed:
+        cache.invalidate_all()
+    else:
+        cache.invalidate(changed)
+    logger.debug(f"Permissions invalidated for users {sorted(changed)}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_role_changes(session: Session) -> None:
+    """Forget role changes of a transaction that did not commit."""
+    session.info.pop(_CHANGED_USERS_KEY, None)
@@ -0,0 +1,137 @@
+"""
+Redis Cache Backend
+
+Shared cache for multi-worker deployments (NFR-004.4).
+Following Clean Code: Fail open - a cache outage degrades to database reads.
+"""
+
+import json
+import logging
+from typing import Any, Iterable, List, Optional
+
+from app.infrastructure.cache.base import CacheBackend, CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Generations are shared by all workers; they outlive any cached value
+GENERATION_TTL_SECONDS = 86400
+
+# SETEX only while the generation key still holds the loader's generation
+SET_IF_GENERATION_SCRIPT = """
+if tonumber(redis.call('GET', KEYS[1]) or '0') ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('SETEX', KEYS[2], ARGV[2], ARGV[3])
+return 1
+"""
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backed by Redis.
+
+    Values are stored as JSON with SETEX. Redis errors are logged and
+    treated as misses so a cache outage never fails a request.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, key_prefix: str = ""):
+        """
+        Initialize Redis backend.
+
+        Args:
+            url: Redis connection URL
+            key_prefix: Prefix applied to every key
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        super().__init__()
+        import redis
+
+        self.key_prefix = key_prefix
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5
+        )
+        self._error = redis.RedisError
+        self._set_if_generation = self._client.register_script(SET_IF_GENERATION_SCRIPT)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(self.key_prefix + key)
+        except self._error as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        try:
+            self._client.setex(
+                self.key_prefix + key,
+                ttl_seconds,
+                json.dumps(value, separators=(",", ":"))
+            )
+        except self._error as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    def delete(self, keys: Iterable[str]) -> int:
+        names: List[str] = [self.key_prefix + key for key in keys]
+        if not names:
+            return 0
+        try:
+            return int(self._client.delete(*names))
+        except self._error as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+            return 0
+
+    def generation(self, key: str) -> int:
+        try:
+            raw = self._client.get(self._generation_key(key))
+        except self._error as e:
+            logger.warning(f"Redis cache generation get failed: {e}")
+            # Matches no stored generation, so the loaded value is not cached
+            return -1
+        return int(raw) if raw is not None else 0
+
+    def bump_generations(self, keys: Iterable[str]) -> None:
+        try:
+            pipeline = self._client.pipeline()
+            for key in keys:
+                pipeline.incr(self._generation_key(key))
+                pipeline.expire(self._generation_key(key), GENERATION_TTL_SECONDS)
+            pipeline.execute()
+        except self._error as e:
+            logger.warning(f"Redis cache generation bump failed: {e}")
+
+    def set_if_generation(self, key: str, value: Any, ttl_seconds: int, generation: int) -> bool:
+        try:
+            return bool(self._set_if_generation(
+                keys=[self._generation_key(key), self.key_prefix + key],
+                args=[generation, ttl_seconds, json.dumps(value, separators=(",", ":"))]
+            ))
+        except self._error as e:
+            logger.warning(f"Redis cache set failed: {e}")
+            return False
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self.key_prefix}gen:{key}"
+
+    def clear(self) -> None:
+        try:
+            names = list(self._client.scan_iter(match=f"{self.key_prefix}*"))
+            if names:
+                self._client.delete(*names)
+        except self._error as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+
+    def stats(self) -> CacheStats:
+        """Local hit/miss counters plus server-side evicted_keys."""
+        stats = super().stats()
+        try:
+            stats.evictions += int(self._client.info("stats").get("evicted_keys", 0))
+        except self._error:
+            pass
+        return stats
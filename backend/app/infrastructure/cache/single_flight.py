@@ -0,0 +1,69 @@
+"""
+Single-Flight
+
+Collapses concurrent loads of the same cold key into one database query.
+Following Clean Code: Single Responsibility.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    """In-flight load shared by the leader and its followers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Run at most one loader per key at a time (per process).
+
+    The first caller of a key runs the loader; callers arriving while it
+    runs wait and receive the same result (or exception).
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Load a key, sharing the work with concurrent callers.
+
+        Args:
+            key: Key being loaded
+            loader: Function producing the value
+
+        Returns:
+            Any: Loader result
+
+        Raises:
+            Exception: Whatever the loader raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = loader()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,327 @@
+"""
+Connection Lifecycle
+
+Pool sizing from a connection budget, connection options, warm-up and
+background liveness checks for the SQLAlchemy engines.
+Following Clean Code: Single Responsibility, No work on the checkout path.
+
+- Sizing: DATABASE_CONNECTION_BUDGET is shared by every worker process
+  and by the sync and async engine of each worker, so N uvicorn workers
+  never exceed what was budgeted on the server.
+- Session settings (statement_timeout, application_name) travel in the
+  startup packet (libpq options / asyncpg server_settings) instead of a
+  SET statement per new connection.
+- Liveness: instead of pool_pre_ping (one SELECT 1 per checkout) a
+  background ping takes one idle connection per interval; a disconnect
+  makes SQLAlchemy invalidate the whole pool, so a restarted server is
+  noticed within one interval without taxing requests.
+- Statement caches: compiled SQL is cached per engine
+  (DATABASE_QUERY_CACHE_SIZE); asyncpg additionally prepares statements
+  server-side per connection (DATABASE_PREPARED_STATEMENT_CACHE_SIZE).
+  psycopg2 has no server-side prepare, so the sync engine relies on the
+  compiled cache alone.
+- PgBouncer transaction pooling: nothing may depend on session state,
+  so no startup options (PgBouncer rejects them; set the timeout with
+  ALTER ROLE ... SET statement_timeout instead), no prepared
+  statement caches on asyncpg, and globally unique names for the
+  statements asyncpg still prepares (see unique_statement_name).
+"""
+
+import asyncio
+import logging
+import math
+import os
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Engines per worker sharing the budget (sync psycopg2 + async asyncpg)
+ENGINES_PER_WORKER = 2
+
+
+def resolve_workers() -> int:
+    """
+    Worker processes sharing the connection budget.
+
+    Returns:
+        int: DATABASE_WORKERS, else WEB_CONCURRENCY (uvicorn / gunicorn), else 1
+    """
+    if settings.database.workers:
+        return settings.database.workers
+    try:
+        return max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))
+    except ValueError:
+        return 1
+
+
+def pool_sizes(
+    budget: int,
+    workers: int,
+    engines: int = ENGINES_PER_WORKER,
+    overflow_ratio: float = 0.25
+) -> Tuple[int, int]:
+    """
+    Split a connection budget into one engine's pool_size and max_overflow.
+
+    Args:
+        budget: Connections allowed across all workers
+        workers: Worker processes
+        engines: Engines per worker
+        overflow_ratio: Share of each engine's connections kept as overflow
+
+    Returns:
+        Tuple[int, int]: (pool_size, max_overflow), pool_size at least 1
+    """
+    per_engine = max(1, budget // (workers * engines))
+    max_overflow = int(per_engine * overflow_ratio)
+    return max(1, per_engine - max_overflow), max_overflow
+
+
+def unique_statement_name() -> str:
+    """
+    Name of a statement prepared by asyncpg behind PgBouncer.
+
+    SQLAlchemy's asyncpg adapter prepares every statement even with the
+    caches off, and asyncpg numbers them per client connection
+    (__asyncpg_stmt_1__, ...). Under transaction pooling clients share
+    server backends, so those names collide ("prepared statement ...
+    already exists"); a UUID cannot.
+
+    Returns:
+        str: Unique statement name
+    """
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def engine_options(use_async: bool = False) -> Dict[str, Any]:
+    """
+    create_engine() / create_async_engine() arguments from DatabaseSettings.
+
+    Args:
+        use_async: Options for the asyncpg driver
+
+    Returns:
+        Dict[str, Any]: Pool and connect arguments
+    """
+    database = settings.database
+    pool_size, max_overflow = pool_sizes(
+        database.connection_budget,
+        resolve_workers(),
+        overflow_ratio=database.pool_overflow_ratio
+    )
+    options: Dict[str, Any] = {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": database.pool_recycle_seconds,
+        # Without the background liveness check, fall back to pinging on checkout
+        "pool_pre_ping": database.liveness_check_interval_seconds <= 0,
+        "query_cache_size": database.query_cache_size,
+        "echo": settings.debug,
+    }
+
+    session_settings = {
+        "statement_timeout": str(database.statement_timeout_ms),
+        "application_name": database.application_name,
+    }
+    if use_async:
+        connect_args: Dict[str, Any] = {}
+        if database.pgbouncer:
+            # Server-side prepared statements do not survive transaction pooling
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = unique_statement_name
+        else:
+            connect_args["server_settings"] = session_settings
+            connect_args["prepared_statement_cache_size"] = database.prepared_statement_cache_size
+    else:
+        connect_args = {}
+        if not database.pgbouncer:
+            connect_args["options"] = " ".join(
+                f"-c {name}={value}" for name, value in session_settings.items()
+            )
+    options["connect_args"] = connect_args
+    return options
+
+
+def probe_engine_options(timeout_seconds: float) -> Dict[str, Any]:
+    """
+    create_engine() arguments for the health probe's own psycopg2 engine.
+
+    The probe must not borrow from the request pool: when that pool is
+    saturated it would wait out pool_timeout and report the database as
+    down. NullPool opens a fresh connection per check instead, and
+    connect_timeout bounds the wait for an unreachable server.
+
+    Args:
+        timeout_seconds: Connect timeout (libpq takes whole seconds)
+
+    Returns:
+        Dict[str, Any]: Pool and connect arguments
+    """
+    return {
+        "poolclass": NullPool,
+        "connect_args": {"connect_timeout": max(1, math.ceil(timeout_seconds))},
+    }
+
+
+class PoolManager:
+    """
+    Warms pools at startup and keeps them alive in the background.
+
+    Sync engines are warmed and pinged from a thread, async engines from
+    a task on the application's event loop.
+    """
+
+    def __init__(
+        self,
+        engines: List[Engine],
+        async_engines: List[AsyncEngine],
+        warmup_connections: int = 2,
+        liveness_interval_seconds: float = 30.0,
+    ):
+        """
+        Initialize pool manager.
+
+        Args:
+            engines: Sync engines
+            async_engines: Async engines
+            warmup_connections: Connections opened per engine at startup
+                (capped to its pool_size, 0 disables)
+            liveness_interval_seconds: Ping interval (0 disables)
+        """
+        self.engines = engines
+        self.async_engines = async_engines
+        self.warmup_connections = warmup_connections
+        self.liveness_interval_seconds = liveness_interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # ===== Warm-up =====
+
+    def _warmup_count(self, engine: Engine) -> int:
+        """Connections to open for an engine, never more than its pool keeps."""
+        size = getattr(engine.pool, "size", None)
+        return min(self.warmup_connections, size()) if size is not None else 0
+
+    def warm_up(self, engine: Engine) -> None:
+        """
+        Open connections of a sync engine and return them to its pool.
+
+        Args:
+            engine: Sync engine
+        """
+        connections = []
+        try:
+            for _ in range(self._warmup_count(engine)):
+                connections.append(engine.connect())
+        except Exception as e:
+            logger.warning(f"Pool warm-up of {engine.url.host} stopped: {e}")
+        finally:
+            for connection in connections:
+                connection.close()
+
+    async def warm_up_async(self, engine: AsyncEngine) -> None:
+        """
+        Open connections of an async engine and return them to its pool.
+
+        Args:
+            engine: Async engine
+        """
+        connections = []
+        try:
+            for _ in range(self._warmup_count(engine.sync_engine)):
+                connections.append(await engine.connect())
+        except Exception as e:
+            logger.warning(f"Pool warm-up of {engine.url.host} stopped: {e}")
+        finally:
+            for connection in connections:
+                await connection.close()
+
+    # ===== Liveness =====
+
+    def ping(self, engine: Engine) -> bool:
+        """
+        Run SELECT 1 on one idle connection of a sync engine.
+
+        A dead connection invalidates the engine's whole pool.
+
+        Returns:
+            bool: True if the server answered
+        """
+        try:
+            with engine.connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
+            return True
+        except Exception as e:
+            logger.warning(f"Liveness check of {engine.url.host} failed: {e}")
+            return False
+
+    async def ping_async(self, engine: AsyncEngine) -> bool:
+        """
+        Run SELECT 1 on one idle connection of an async engine.
+
+        Returns:
+            bool: True if the server answered
+        """
+        try:
+            async with engine.connect() as connection:
+                await connection.exec_driver_sql("SELECT 1")
+            return True
+        except Exception as e:
+            logger.warning(f"Liveness check of {engine.url.host} failed: {e}")
+            return False
+
+    def _run_sync_checks(self) -> None:
+        while not self._stop.wait(self.liveness_interval_seconds):
+            for engine in self.engines:
+                self.ping(engine)
+
+    async def _run_async_checks(self) -> None:
+        while True:
+            await asyncio.sleep(self.liveness_interval_seconds)
+            for engine in self.async_engines:
+                await self.ping_async(engine)
+
+    # ===== Lifecycle =====
+
+    async def start(self) -> None:
+        """Warm every pool, then start the liveness checks."""
+        if self.warmup_connections > 0:
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(loop.run_in_executor(None, self.warm_up, engine) for engine in self.engines),
+                *(self.warm_up_async(engine) for engine in self.async_engines),
+            )
+
+        if self.liveness_interval_seconds > 0:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run_sync_checks,
+                name="pool-liveness",
+                daemon=True
+            )
+            self._thread.start()
+            self._task = asyncio.create_task(self._run_async_checks())
+
+    async def shutdown(self) -> None:
+        """Stop the liveness checks and close all pooled connections."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        for engine in self.async_engines:
+            await engine.dispose()
+        for engine in self.engines:
+            engine.dispose()
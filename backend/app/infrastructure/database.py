@@ -5,45 +5,245 @@ Manages database connections and sessions using SQLAlchemy.
 Following Clean Code: Dependency Injection, Single Responsibility.
 """
 
-from typing import Generator
-from sqlalchemy import create_engine, event
+import threading
+from typing import AsyncGenerator, Generator, Optional
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import Pool
 
 from app.core.config import settings
+from app.infrastructure.connections import PoolManager, engine_options
+from app.infrastructure.metrics import install_pool_metrics
+from app.infrastructure.query_stats import install_round_trip_counter
+from app.infrastructure.replicas import Replica, ReplicaSet, RoutingSession
+from app.infrastructure.slow_queries import get_slow_query_log
+from app.infrastructure.tracing import install_sql_tracing
 
 
-# Database engine configuration
-# Using connection pooling for better performance
-engine = create_engine(
-    settings.database.get_connection_url(),
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_size=20,  # Number of connections to maintain
-    max_overflow=10,  # Additional connections if pool is exhausted
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    echo=settings.debug,  # Log SQL queries in debug mode
-)
+def instrument_engine(name: str, sync_engine: Engine, explain_engine: Engine) -> None:
+    """
+    Attach the per-engine instrumentation.
+
+    Round trips per request (query_stats.track_round_trips), pool gauges
+    (/metrics), the slow query log and, with TRACING_ENABLED, one span
+    per SQL statement.
+
+    Args:
+        name: Pool label, e.g. "sync" or "async"
+        sync_engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+        explain_engine: psycopg2 engine capturing slow query plans (the primary)
+    """
+    install_round_trip_counter(sync_engine)
+    install_pool_metrics(name, sync_engine)
+    if settings.database.slow_query_ms > 0:
+        get_slow_query_log().install(sync_engine, explain_engine=explain_engine)
+    install_sql_tracing(sync_engine)
+
+
+def create_replica_set(explain_engine: Engine) -> Optional[ReplicaSet]:
+    """
+    Engines for DATABASE_REPLICA_URLS.
+
+    Args:
+        explain_engine: psycopg2 engine capturing slow query plans (the primary)
+
+    Returns:
+        Optional[ReplicaSet]: Replicas, None when none are configured
+    """
+    database = settings.database
+    if not database.replica_urls:
+        return None
+
+    replicas = []
+    for index, url in enumerate(database.replica_urls, start=1):
+        replica = Replica(
+            name=f"replica{index}",
+            engine=create_engine(url, **engine_options()),
+            async_engine=create_async_engine(
+                make_url(url).set(drivername="postgresql+asyncpg"),
+                **engine_options(use_async=True)
+            ),
+        )
+        instrument_engine(f"{replica.name}_sync", replica.engine, explain_engine)
+        instrument_engine(f"{replica.name}_async", replica.async_engine.sync_engine, explain_engine)
+        replicas.append(replica)
+
+    return ReplicaSet(
+        replicas,
+        max_lag_seconds=database.replica_max_lag_seconds,
+        check_interval_seconds=database.replica_check_interval_seconds,
+        ejection_seconds=database.replica_ejection_seconds,
+    )
+
+
+class _LazySessionMaker(sessionmaker):
+    """sessionmaker that creates the engines on its first session."""
+
+    def __call__(self, **local_kw):
+        if _engine is None:
+            _create_engines()
+        return super().__call__(**local_kw)
 
 
-# Configure connection pool timeout
-@event.listens_for(Pool, "connect")
-def set_connection_timeout(dbapi_conn, connection_record):
-    """Set statement timeout for PostgreSQL connections."""
-    cursor = dbapi_conn.cursor()
-    cursor.execute("SET statement_timeout = 30000")  # 30 seconds
-    cursor.close()
+class _LazyAsyncSessionMaker(async_sessionmaker):
+    """async_sessionmaker that creates the engines on its first session."""
+
+    def __call__(self, **local_kw):
+        if _engine is None:
+            _create_engines()
+        return super().__call__(**local_kw)
 
 
 # Session factory
-# Using sessionmaker pattern for clean session management
-SessionLocal = sessionmaker(
+# Using sessionmaker pattern for clean session management.
+# expire_on_commit=False: values written by a unit of work are already
+# current (RETURNING fills server-side ones), so reading them after the
+# commit must not trigger a reload SELECT.
+# RoutingSession sends @read_only use cases to the replica set.
+# Bound to the engine when the engines are created.
+SessionLocal = _LazySessionMaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False,
+)
+
+
+# Async session factory
+# expire_on_commit=False so entities stay readable after commit without lazy IO
+AsyncSessionLocal = _LazyAsyncSessionMaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    use_async=True,
 )
 
 
+# Engines are created on first use, not at import: creating them loads the
+# PostgreSQL dialect and both drivers, which import app.main does not need
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_replica_set: Optional[ReplicaSet] = None
+_pool_manager: Optional[PoolManager] = None
+_engines_lock = threading.Lock()
+
+
+def _create_engines() -> None:
+    """Create, instrument and bind the engines once per process."""
+    global _engine, _async_engine, _replica_set, _pool_manager
+    with _engines_lock:
+        if _engine is not None:
+            return
+
+        # Pools sized per worker from DATABASE_CONNECTION_BUDGET, session
+        # settings in the startup packet (see connections.py)
+        engine = create_engine(settings.database.get_connection_url(), **engine_options())
+        # Async database engine (asyncpg)
+        # Lets async routers wait on PostgreSQL without holding a threadpool slot
+        async_engine = create_async_engine(
+            settings.database.get_async_connection_url(),
+            **engine_options(use_async=True)
+        )
+        instrument_engine("sync", engine, engine)
+        instrument_engine("async", async_engine.sync_engine, engine)
+
+        # Read replicas for @read_only use cases (NFR-004.2); None without replicas
+        replica_set = create_replica_set(engine)
+        replicas = replica_set.replicas if replica_set is not None else []
+
+        # Warm-up and background liveness of every pool, started with the app
+        _pool_manager = PoolManager(
+            engines=[engine] + [replica.engine for replica in replicas],
+            async_engines=[async_engine] + [replica.async_engine for replica in replicas],
+            warmup_connections=settings.database.pool_warmup_connections,
+            liveness_interval_seconds=settings.database.liveness_check_interval_seconds,
+        )
+        SessionLocal.configure(bind=engine, replicas=replica_set)
+        AsyncSessionLocal.configure(bind=async_engine, replicas=replica_set)
+
+        _async_engine = async_engine
+        _replica_set = replica_set
+        # Published last: a non-None _engine means everything above is set
+        _engine = engine
+
+
+def engines_created() -> bool:
+    """Whether the engines of this process exist yet."""
+    return _engine is not None
+
+
+def get_engine() -> Engine:
+    """
+    Get the primary psycopg2 engine, creating the engines on first use.
+
+    Returns:
+        Engine: Primary engine
+    """
+    if _engine is None:
+        _create_engines()
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the primary asyncpg engine, creating the engines on first use.
+
+    Returns:
+        AsyncEngine: Primary async engine
+    """
+    if _engine is None:
+        _create_engines()
+    return _async_engine
+
+
+def get_replica_set() -> Optional[ReplicaSet]:
+    """
+    Get the read replicas, creating the engines on first use.
+
+    Returns:
+        Optional[ReplicaSet]: Replicas, None when none are configured
+    """
+    if _engine is None:
+        _create_engines()
+    return _replica_set
+
+
+def get_pool_manager() -> PoolManager:
+    """
+    Get the pool manager, creating the engines on first use.
+
+    Returns:
+        PoolManager: Warm-up and liveness of every pool
+    """
+    if _engine is None:
+        _create_engines()
+    return _pool_manager
+
+
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "async_engine": get_async_engine,
+    "replica_set": get_replica_set,
+    "pool_manager": get_pool_manager,
+}
+
+
+def __getattr__(name: str):
+    """Keep `from app.infrastructure.database import engine` working, lazily."""
+    getter = _LAZY_ATTRIBUTES.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getter()
+
+
 # Base class for all database models
 Base = declarative_base()
 
@@ -70,6 +270,24 @@ def get_database_session() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_database_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency injection function for async database sessions.
+
+    Async counterpart of get_database_session for `async def` routers.
+
+    Usage in FastAPI:
+        @app.get("/endpoint")
+        async def endpoint(db: AsyncSession = Depends(get_async_database_session)):
+            # Use db here
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
 class DatabaseManager:
     """
     Manages database operations like initialization and health checks.
@@ -85,7 +303,7 @@ class DatabaseManager:
         Note: In production, use Alembic migrations instead.
         This is useful for development and testing.
         """
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
 
     @staticmethod
     def drop_all_tables() -> None:
@@ -98,7 +316,7 @@ class DatabaseManager:
             raise RuntimeError(
                 "Cannot drop tables in production environment!"
             )
-        Base.metadata.drop_all(bind=engine)
+        Base.metadata.drop_all(bind=get_engine())
 
     @staticmethod
     def check_database_connection() -> bool:
@@ -109,8 +327,8 @@ class DatabaseManager:
             bool: True if connection is successful, False otherwise
         """
         try:
-            with engine.connect() as connection:
-                connection.execute("SELECT 1")
+            with get_engine().connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
             return True
         except Exception:
             return False
@@ -128,6 +346,6 @@ class DatabaseManager:
             "port": settings.database.port,
             "database": settings.database.name,
             "user": settings.database.user,
-            "pool_size": engine.pool.size(),
-            "checked_out_connections": engine.pool.checkedout()
+            "pool_size": get_engine().pool.size(),
+            "checked_out_connections": get_engine().pool.checkedout()
         }
@@ -0,0 +1,411 @@
+"""
+Health Monitor
+
+Samples database reachability, pool saturation, replica lag and the
+staleness of mv_statistik_kurikulum in the background and keeps the last
+result, so health probes never touch the database.
+Following Clean Code: Single Responsibility, O(1) probes.
+
+- Liveness: the process is able to make progress, i.e. the background
+  check keeps running. A database outage does not fail liveness, so an
+  orchestrator does not restart every pod because PostgreSQL is down.
+- Readiness: the last check is fresh and the primary answered. Load
+  does not fail it: in a traffic spike every worker saturates at once,
+  and taking them all out of rotation would turn the spike into an outage.
+  For the same reason the probe runs on its own connection, bounded by
+  HEALTH_PROBE_TIMEOUT_SECONDS, never on one from the request pool.
+- Degraded (reported, still ready): a pool saturated beyond
+  HEALTH_MAX_POOL_SATURATION, replicas out of rotation or a statistics
+  refresh pending longer than HEALTH_MAX_VIEW_STALENESS_SECONDS.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.infrastructure.connections import probe_engine_options
+from app.infrastructure.database import get_async_engine, get_engine, get_replica_set
+from app.infrastructure.replicas import ReplicaSet
+from app.infrastructure.statistics import (
+    STATISTICS_VIEW_NAME,
+    MaterializedViewRefresher,
+    get_statistics_refresher,
+)
+
+logger = logging.getLogger(__name__)
+
+# Reachability probe that also reports whether the statistics view is populated
+VIEW_STATE_QUERY = text(
+    "SELECT (SELECT ispopulated FROM pg_matviews WHERE matviewname = :view_name)"
+)
+
+
+@dataclass
+class HealthSnapshot:
+    """
+    Result of one background health check.
+
+    Attributes:
+        checked_at: When the check finished (UTC)
+        checked_monotonic: time.monotonic() of checked_at, for age checks
+        database_ok: Whether the primary answered
+        database_latency_ms: Round trip of the probe
+        database_error: Probe error, if any
+        pools: Per pool size, checked_out, overflow, capacity and saturation
+        replicas: ReplicaSet.status() entries
+        statistics_view: populated, pending_refresh_seconds, last_refreshed_at, last_error
+    """
+
+    checked_at: datetime = field(default_factory=datetime.utcnow)
+    checked_monotonic: float = field(default_factory=time.monotonic)
+    database_ok: bool = False
+    database_latency_ms: Optional[float] = None
+    database_error: Optional[str] = None
+    pools: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    replicas: List[Dict[str, Any]] = field(default_factory=list)
+    statistics_view: Dict[str, Any] = field(default_factory=dict)
+
+    def age_seconds(self) -> float:
+        """Seconds since the check finished."""
+        return time.monotonic() - self.checked_monotonic
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Snapshot as JSON-ready dictionary.
+
+        Returns:
+            Dict[str, Any]: Check results
+        """
+        return {
+            "checked_at": self.checked_at.isoformat() + "Z",
+            "age_seconds": round(self.age_seconds(), 3),
+            "database": {
+                "ok": self.database_ok,
+                "latency_ms": self.database_latency_ms,
+                "error": self.database_error,
+            },
+            "pools": self.pools,
+            "replicas": self.replicas,
+            "statistics_view": self.statistics_view,
+        }
+
+
+def pool_state(engine: Engine) -> Optional[Dict[str, Any]]:
+    """
+    Counters of an engine's pool.
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+
+    Returns:
+        Optional[Dict]: size, checked_out, overflow, capacity, saturation;
+            None for pools without counters (NullPool, StaticPool)
+    """
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return None
+    checked_out = pool.checkedout()
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    return {
+        "size": pool.size(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+class HealthMonitor:
+    """
+    Background health check with cached result.
+
+    One probe per check_interval_seconds per worker, no matter how often
+    load balancers and orchestrators poll.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        pools: Dict[str, Engine],
+        replicas: Optional[ReplicaSet] = None,
+        refresher: Optional[MaterializedViewRefresher] = None,
+        check_interval_seconds: float = 5.0,
+        max_snapshot_age_seconds: float = 30.0,
+        max_pool_saturation: float = 0.95,
+        max_view_staleness_seconds: float = 300.0,
+        probe_timeout_seconds: float = 2.0,
+    ):
+        """
+        Initialize health monitor.
+
+        Args:
+            engine: Engine probing the primary; give it its own connections
+                (probe_engine_options), not the request pool
+            pools: Engines whose pools are reported, by label
+            replicas: Replica set (optional)
+            refresher: Statistics view refresher (optional)
+            check_interval_seconds: Interval between checks
+            max_snapshot_age_seconds: Liveness bound on the last check's age
+            max_pool_saturation: Checked-out share per pool reported as degraded
+            max_view_staleness_seconds: Pending refresh age reported as degraded
+            probe_timeout_seconds: Statement timeout of the probe query
+        """
+        self.engine = engine
+        self.pools = pools
+        self.replicas = replicas
+        self.refresher = refresher
+        self.check_interval_seconds = check_interval_seconds
+        self.max_snapshot_age_seconds = max_snapshot_age_seconds
+        self.max_pool_saturation = max_pool_saturation
+        self.max_view_staleness_seconds = max_view_staleness_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self._snapshot: Optional[HealthSnapshot] = None
+        self._started_monotonic: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> Optional[HealthSnapshot]:
+        """Last check result, None before the first check."""
+        return self._snapshot
+
+    def check(self) -> HealthSnapshot:
+        """
+        Run one check and keep its result.
+
+        Returns:
+            HealthSnapshot: Fresh result
+        """
+        snapshot = HealthSnapshot()
+        populated = None
+        started = time.perf_counter()
+        try:
+            with self.engine.begin() as connection:
+                if connection.dialect.name == "postgresql":
+                    # SET LOCAL also holds behind PgBouncer transaction pooling
+                    timeout_ms = int(self.probe_timeout_seconds * 1000)
+                    connection.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+                    populated = connection.execute(
+                        VIEW_STATE_QUERY, {"view_name": STATISTICS_VIEW_NAME}
+                    ).scalar()
+                else:
+                    connection.execute(text("SELECT 1"))
+            snapshot.database_ok = True
+        except Exception as e:
+            snapshot.database_error = str(e).splitlines()[0] if str(e) else type(e).__name__
+        snapshot.database_latency_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        for name, pool_engine in self.pools.items():
+            state = pool_state(pool_engine)
+            if state is not None:
+                snapshot.pools[name] = state
+
+        if self.replicas is not None:
+            snapshot.replicas = self.replicas.status()
+
+        if self.refresher is not None:
+            last_refreshed_at = self.refresher.last_refreshed_at
+            snapshot.statistics_view = {
+                "populated": populated,
+                "pending_refresh_seconds": round(self.refresher.pending_seconds(), 3),
+                "last_refreshed_at": (
+                    datetime.utcfromtimestamp(last_refreshed_at).isoformat() + "Z"
+                    if last_refreshed_at is not None else None
+                ),
+                "last_error": self.refresher.last_error,
+            }
+
+        snapshot.checked_at = datetime.utcnow()
+        snapshot.checked_monotonic = time.monotonic()
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None or previous.database_ok != snapshot.database_ok:
+            if snapshot.database_ok:
+                logger.info(
+                    f"✓ Database connection successful ({snapshot.database_latency_ms} ms)"
+                )
+            else:
+                logger.error(f"✗ Database connection failed: {snapshot.database_error}")
+        return snapshot
+
+    # ===== Verdicts =====
+
+    def liveness(self) -> Dict[str, Any]:
+        """
+        Whether the background check is still running.
+
+        Before the first check finishes, the time since start() counts
+        instead, so a slow first connect does not fail liveness.
+
+        Returns:
+            Dict: alive and the age of the last check
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            age = snapshot.age_seconds()
+        elif self._started_monotonic is not None:
+            age = time.monotonic() - self._started_monotonic
+        else:
+            age = None
+        return {
+            "alive": age is None or age <= self.max_snapshot_age_seconds,
+            "age_seconds": round(age, 3) if age is not None else None,
+        }
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Whether this worker should receive traffic.
+
+        Returns:
+            Dict: ready and the failed checks as reasons
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"ready": False, "reasons": ["no health check yet"]}
+
+        reasons = []
+        if snapshot.age_seconds() > self.max_snapshot_age_seconds:
+            reasons.append(f"last health check {snapshot.age_seconds():.0f}s ago")
+        if not snapshot.database_ok:
+            reasons.append(f"database unreachable: {snapshot.database_error}")
+        return {"ready": not reasons, "reasons": reasons}
+
+    def degradations(self) -> List[str]:
+        """
+        Problems that do not stop serving traffic.
+
+        Returns:
+            List[str]: Saturated pools, replicas out of rotation, stale
+                statistics view
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+
+        problems = [
+            f"pool {name} saturated ({state['checked_out']}/{state['capacity']})"
+            for name, state in snapshot.pools.items()
+            if state["saturation"] >= self.max_pool_saturation
+        ]
+        problems.extend(
+            f"replica {replica['name']} out of rotation"
+            for replica in snapshot.replicas
+            if not replica["available"]
+        )
+        view = snapshot.statistics_view
+        if view.get("populated") is False:
+            problems.append(f"{STATISTICS_VIEW_NAME} not populated")
+        if view.get("pending_refresh_seconds", 0) > self.max_view_staleness_seconds:
+            problems.append(
+                f"{STATISTICS_VIEW_NAME} refresh pending "
+                f"{view['pending_refresh_seconds']:.0f}s"
+            )
+        return problems
+
+    def status(self) -> str:
+        """
+        Overall status for /health.
+
+        Returns:
+            str: healthy, degraded or unhealthy
+        """
+        if not self.readiness()["ready"]:
+            return "unhealthy"
+        return "degraded" if self.degradations() else "healthy"
+
+    # ===== Lifecycle =====
+
+    def start(self) -> None:
+        """
+        Start checking in the background.
+
+        The first check runs on the monitor thread right away; until it
+        finishes readiness reports "no health check yet".
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._started_monotonic = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="health-monitor",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                # A failing check must not end the loop and fail liveness
+                logger.error(f"Health check failed: {e}")
+            if self._stop.wait(self.check_interval_seconds):
+                return
+
+    def shutdown(self) -> None:
+        """Stop the background check."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.check_interval_seconds)
+            self._thread = None
+
+
+_health_monitor: Optional[HealthMonitor] = None
+_health_monitor_lock = threading.Lock()
+
+
+def peek_health_monitor() -> Optional[HealthMonitor]:
+    """
+    Get the process-wide health monitor without creating it.
+
+    Probes use this so they never create the database engines themselves.
+
+    Returns:
+        Optional[HealthMonitor]: Monitor, None until the startup warm-up
+            created it
+    """
+    return _health_monitor
+
+
+def get_health_monitor() -> HealthMonitor:
+    """
+    Get the process-wide health monitor.
+
+    Returns:
+        HealthMonitor: Monitor of the primary, its pools, the replicas
+            and the statistics view, configured by HEALTH_* settings
+    """
+    global _health_monitor
+    with _health_monitor_lock:
+        if _health_monitor is None:
+            engine = get_engine()
+            replica_set = get_replica_set()
+            pools = {"sync": engine, "async": get_async_engine().sync_engine}
+            for replica in (replica_set.replicas if replica_set is not None else []):
+                pools[f"{replica.name}_sync"] = replica.engine
+                pools[f"{replica.name}_async"] = replica.async_engine.sync_engine
+
+            health = settings.health
+            probe_engine = create_engine(
+                settings.database.get_connection_url(),
+                **probe_engine_options(health.probe_timeout_seconds)
+            )
+            _health_monitor = HealthMonitor(
+                probe_engine,
+                pools,
+                replicas=replica_set,
+                refresher=get_statistics_refresher(),
+                check_interval_seconds=health.check_interval_seconds,
+                max_snapshot_age_seconds=health.max_snapshot_age_seconds,
+                max_pool_saturation=health.max_pool_saturation,
+                max_view_staleness_seconds=health.max_view_staleness_seconds,
+                probe_timeout_seconds=health.probe_timeout_seconds,
+            )
+        return _health_monitor
@@ -0,0 +1,24 @@
+"""
+Importing Package
+
+Streaming file readers and the COPY-based bulk loader used by the
+CPL and MataKuliah import use cases.
+"""
+
+from app.infrastructure.importing.readers import (
+    ImportRow,
+    SUPPORTED_EXTENSIONS,
+    chunked,
+    normalize_header,
+    read_rows,
+)
+from app.infrastructure.importing.copy_loader import CopyLoader
+
+__all__ = [
+    "ImportRow",
+    "SUPPORTED_EXTENSIONS",
+    "chunked",
+    "normalize_header",
+    "read_rows",
+    "CopyLoader",
+]
@@ -0,0 +1,173 @@
+"""
+COPY Loader
+
+Set-based bulk upsert: COPY a chunk into a temporary staging table, then
+move it into the target with one INSERT ... SELECT ... ON CONFLICT.
+Following Clean Code: Single Responsibility, Constant round trips per chunk.
+"""
+
+import csv
+import io
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import column, func, insert, select, table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Insert
+
+from app.infrastructure.database import Base
+
+
+class CopyLoader:
+    """
+    Bulk upsert of dictionaries into one table.
+
+    PostgreSQL: COPY ... FROM STDIN into a TEMP staging table (created once
+    per transaction with the target's column types, dropped on commit),
+    then INSERT ... SELECT ... ON CONFLICT ... RETURNING the keys written.
+    That is three statements per chunk whatever its size.
+
+    Other dialects (SQLite in development) use a single multi-row
+    INSERT ... ON CONFLICT with the same semantics.
+
+    Rows must already be validated: a constraint violation still fails the
+    whole chunk.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        model: Type[Base],
+        columns: Sequence[str],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] = (),
+    ):
+        """
+        Initialize loader.
+
+        Args:
+            session: Database session (the caller owns the transaction)
+            model: Target model class
+            columns: Columns present in every row dictionary
+            conflict_columns: Unique key used for ON CONFLICT
+            update_columns: Columns overwritten when the key exists;
+                empty keeps existing rows untouched (DO NOTHING)
+        """
+        self.session = session
+        self.table = model.__table__
+        self.columns = list(columns)
+        self.conflict_columns = list(conflict_columns)
+        self.update_columns = list(update_columns)
+        self.staging_name = f"_import_{self.table.name}"
+        self._staging_ready = False
+
+    def load(self, rows: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        """
+        Upsert one chunk of rows.
+
+        Args:
+            rows: Validated rows keyed by column name
+
+        Returns:
+            List[Tuple]: Conflict-key values of the rows inserted or updated;
+                rows skipped by DO NOTHING are absent
+        """
+        if not rows:
+            return []
+
+        connection = self.session.connection()
+        dialect = connection.dialect
+
+        if dialect.name == "postgresql":
+            self._copy_to_staging(rows)
+            staging = table(self.staging_name, *(column(name) for name in self.columns))
+            statement = postgresql.insert(self.table).from_select(
+                self.columns,
+                select(*(staging.c[name] for name in self.columns))
+            )
+        elif dialect.name == "sqlite":
+            statement = sqlite.insert(self.table).values(rows)
+        else:
+            return self._insert_new(rows)
+
+        result = self.session.execute(self._on_conflict(statement))
+        return [tuple(row) for row in result]
+
+    def _on_conflict(self, statement: Insert) -> Insert:
+        """Attach ON CONFLICT and RETURNING of the conflict key."""
+        if self.update_columns:
+            excluded = statement.excluded
+            values = {name: excluded[name] for name in self.update_columns}
+            if "updated_at" in self.table.c:
+                values["updated_at"] = func.now()
+            statement = statement.on_conflict_do_update(
+                index_elements=self.conflict_columns,
+                set_=values
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(
+                index_elements=self.conflict_columns
+            )
+        return statement.returning(*(self.table.c[name] for name in self.conflict_columns))
+
+    def _copy_to_staging(self, rows: List[Dict[str, Any]]) -> None:
+        """COPY rows into the (emptied) staging table on the session connection."""
+        cursor = self.session.connection().connection.cursor()
+        try:
+            if not self._staging_ready:
+                names = ", ".join(self.columns)
+                cursor.execute(
+                    f"CREATE TEMP TABLE IF NOT EXISTS {self.staging_name} "
+                    f"ON COMMIT DROP AS SELECT {names} FROM {self.table.name} WITH NO DATA"
+                )
+                self._staging_ready = True
+            cursor.execute(f"TRUNCATE {self.staging_name}")
+            cursor.copy_expert(
+                f"COPY {self.staging_name} ({', '.join(self.columns)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                self._to_csv(rows)
+            )
+        finally:
+            cursor.close()
+
+    def _to_csv(self, rows: List[Dict[str, Any]]) -> io.StringIO:
+        """
+        Serialize rows the way the ORM would bind them.
+
+        Column bind processors are applied so enums and booleans are
+        stored exactly as ORM writes store them; None becomes an unquoted
+        empty field, which COPY reads as NULL.
+        """
+        dialect = self.session.connection().dialect
+        processors: List[Optional[Any]] = [
+            self.table.c[name].type.bind_processor(dialect) for name in self.columns
+        ]
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for row in rows:
+            values = []
+            for name, process in zip(self.columns, processors):
+                value = row.get(name)
+                if value is not None and process is not None:
+                    value = process(value)
+                values.append(value)
+            writer.writerow(values)
+        buffer.seek(0)
+        return buffer
+
+    def _insert_new(self, rows: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+        """Portable fallback without ON CONFLICT: insert keys not present yet."""
+        key_columns = [self.table.c[name] for name in self.conflict_columns]
+        keys = [tuple(row[name] for name in self.conflict_columns) for row in rows]
+        existing = set(
+            tuple(row) for row in self.session.execute(
+                select(*key_columns).where(
+                    key_columns[0].in_({key[0] for key in keys})
+                )
+            )
+        )
+        new_rows = [row for row, key in zip(rows, keys) if key not in existing]
+        if new_rows:
+            self.session.execute(insert(self.table), new_rows)
+        return [key for key in keys if key not in existing]
@@ -0,0 +1,202 @@
+"""
+Metrics
+
+Prometheus metrics for HTTP latency, in-flight requests, connection
+pools and domain errors.
+Following Clean Code: Single Responsibility, Cheap recording in the hot path.
+
+With several uvicorn workers, start every worker with
+PROMETHEUS_MULTIPROC_DIR pointing at an empty, writable directory
+(wiped on each deploy): each process then writes its samples to
+memory-mapped files there and /metrics aggregates all of them.
+"""
+
+import os
+import threading
+from typing import Dict, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+MULTIPROCESS_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+http_request_duration_seconds = Histogram(
+    "obe_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+http_requests_in_progress = Gauge(
+    "obe_http_requests_in_progress",
+    "HTTP requests currently being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+db_pool_size = Gauge(
+    "obe_db_pool_size",
+    "Connections kept open by the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+db_pool_checked_out = Gauge(
+    "obe_db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+db_pool_overflow = Gauge(
+    "obe_db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is filling)",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+domain_exceptions_total = Counter(
+    "obe_domain_exceptions_total",
+    "DomainException responses by error code",
+    ["error_code"],
+)
+
+
+class _ChildCache:
+    """
+    Labelled metric children resolved once per label combination.
+
+    metric.labels() takes the metric's lock on every call; after the
+    first request of a route the child comes from a plain dict lookup,
+    leaving only the child's own uncontended value lock per observation.
+    """
+
+    def __init__(self, metric):
+        self.metric = metric
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def get(self, *labels: str):
+        child = self._children.get(labels)
+        if child is None:
+            child = self._children[labels] = self.metric.labels(*labels)
+        return child
+
+
+_request_duration = _ChildCache(http_request_duration_seconds)
+_in_progress = _ChildCache(http_requests_in_progress)
+_domain_exceptions = _ChildCache(domain_exceptions_total)
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    """
+    Record one finished HTTP request.
+
+    Args:
+        method: HTTP method
+        route: Route template, e.g. /api/v1/kurikulum/{id_kurikulum}
+        status: Response status code
+        seconds: Handling time
+    """
+    _request_duration.get(method, route, str(status)).observe(seconds)
+
+
+def in_progress(method: str) -> Gauge:
+    """
+    In-flight gauge of one HTTP method.
+
+    Args:
+        method: HTTP method
+
+    Returns:
+        Gauge: Child gauge to inc() / dec()
+    """
+    return _in_progress.get(method)
+
+
+def count_domain_exception(error_code: str) -> None:
+    """
+    Count a DomainException turned into an HTTP response.
+
+    Args:
+        error_code: DomainException.error_code
+    """
+    _domain_exceptions.get(error_code).inc()
+
+
+# ===== Connection pools =====
+
+def install_pool_metrics(name: str, engine: Engine) -> None:
+    """
+    Keep pool gauges current from checkout / checkin events.
+
+    Gauges are updated when a connection changes hands rather than on
+    scrape, so in multiprocess mode every worker's pool is reported,
+    not only the one that served the scrape.
+
+    Args:
+        name: Pool label, e.g. "sync" or "async"
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+    """
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        # NullPool / StaticPool keep no counters
+        return
+
+    size = db_pool_size.labels(name)
+    checked_out = db_pool_checked_out.labels(name)
+    overflow = db_pool_overflow.labels(name)
+
+    def update(*args) -> None:
+        size.set(pool.size())
+        checked_out.set(pool.checkedout())
+        overflow.set(pool.overflow())
+
+    for event_name in ("checkout", "checkin", "close"):
+        event.listen(pool, event_name, update)
+    update()
+
+
+# ===== Exposition =====
+
+_registry_lock = threading.Lock()
+_multiprocess_registry = None
+
+
+def is_multiprocess() -> bool:
+    """Whether samples are shared through PROMETHEUS_MULTIPROC_DIR."""
+    return bool(os.environ.get(MULTIPROCESS_DIR_ENV))
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Current metrics in the Prometheus text format.
+
+    Returns:
+        Tuple[bytes, str]: (body, content type)
+    """
+    if not is_multiprocess():
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    global _multiprocess_registry
+    with _registry_lock:
+        if _multiprocess_registry is None:
+            _multiprocess_registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(_multiprocess_registry)
+    return generate_latest(_multiprocess_registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """
+    Drop this worker's live gauges from the multiprocess directory.
+
+    Called on application shutdown; a no-op in single-process mode.
+    """
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
@@ -18,6 +18,17 @@ from app.infrastructure.models.kurikulum_models import (
     PrasyaratMK,
     PemetaanMKKurikulum
 )
+from app.infrastructure.models.penilaian_models import (
+    Kelas,
+    Enrollment,
+    CPMK,
+    RelasiCPMKCPL,
+    TemplatePenilaian,
+    KomponenPenilaian,
+    NilaiDetail,
+    KetercapaianCPMK,
+    AmbangBatas
+)
 
 __all__ = [
     # User models
@@ -35,4 +46,14 @@ __all__ = [
     "MataKuliah",
     "PrasyaratMK",
     "PemetaanMKKurikulum",
+    # Penilaian models
+    "Kelas",
+    "Enrollment",
+    "CPMK",
+    "RelasiCPMKCPL",
+    "TemplatePenilaian",
+    "KomponenPenilaian",
+    "NilaiDetail",
+    "KetercapaianCPMK",
+    "AmbangBatas",
 ]
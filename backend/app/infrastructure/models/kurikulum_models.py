@@ -18,9 +18,12 @@ from sqlalchemy import (
     Text,
     Numeric,
     Enum as SQLEnum,
+    Index,
     UniqueConstraint,
     CheckConstraint,
-    event
+    event,
+    func,
+    text
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -105,11 +108,11 @@ class Kurikulum(Base):
     is_primary = Column(Boolean, default=False, nullable=False)
     nomor_sk = Column(String(100), nullable=True)
     tanggal_sk = Column(Date, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
@@ -117,8 +120,22 @@ class Kurikulum(Base):
     __table_args__ = (
         UniqueConstraint('id_prodi', 'kode_kurikulum', name='uq_prodi_kode_kurikulum'),
         CheckConstraint('tahun_berlaku > 1900', name='chk_tahun_berlaku_valid'),
+        # BR-K08: at most one primary curriculum per prodi, enforced by the database
+        Index(
+            'idx_kurikulum_primary',
+            'id_prodi',
+            unique=True,
+            postgresql_where=text('is_primary = TRUE'),
+            sqlite_where=text('is_primary = TRUE')
+        ),
+        # Keyset pagination on (tahun_berlaku, id_kurikulum), optionally per prodi
+        Index('idx_kurikulum_keyset', 'tahun_berlaku', 'id_kurikulum'),
+        Index('idx_kurikulum_prodi_keyset', 'id_prodi', 'tahun_berlaku', 'id_kurikulum'),
     )
 
+    # Fetch SQL-side defaults (timestamps) via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     prodi = relationship("Prodi", back_populates="kurikulum_list")
     cpl_list = relationship("CPL", back_populates="kurikulum", cascade="all, delete-orphan")
@@ -167,11 +184,11 @@ class CPL(Base):
     kategori = Column(SQLEnum(CPLKategori), nullable=False)
     urutan = Column(Integer, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
@@ -180,6 +197,9 @@ class CPL(Base):
         UniqueConstraint('id_kurikulum', 'kode_cpl', name='uq_kurikulum_kode_cpl'),
     )
 
+    # Fetch SQL-side defaults (timestamps) via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     kurikulum = relationship("Kurikulum", back_populates="cpl_list")
 
@@ -212,11 +232,11 @@ class MataKuliah(Base):
     rumpun = Column(String(50), nullable=True)
     jenis_mk = Column(SQLEnum(JenisMK), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
 
@@ -226,6 +246,9 @@ class MataKuliah(Base):
         CheckConstraint('semester BETWEEN 1 AND 14', name='chk_semester_valid'),
     )
 
+    # Fetch SQL-side defaults (timestamps) via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     kurikulum = relationship("Kurikulum", back_populates="matakuliah_list")
     prasyarat_list = relationship(
@@ -0,0 +1,419 @@
+"""
+Assessment Models
+
+SQLAlchemy models for classes, enrollment and assessment (penilaian).
+Following Clean Code: Business rule enforcement, Clear relationships.
+
+RPS is not mapped yet, so id_rps columns are plain integers here; the
+foreign keys to rps are enforced by the database schema.
+"""
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    Date,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Text,
+    Numeric,
+    Enum as SQLEnum,
+    UniqueConstraint,
+    CheckConstraint,
+    func,
+)
+from sqlalchemy.orm import relationship
+import enum
+
+from app.infrastructure.database import Base
+
+
+# Default of ambang_batas.batas_kelulusan_cpmk in the database schema
+DEFAULT_BATAS_KELULUSAN_CPMK = 40.01
+
+
+class StatusKelas(str, enum.Enum):
+    """Class offering status."""
+
+    DRAFT = "draft"
+    OPEN = "open"
+    CLOSED = "closed"
+    COMPLETED = "completed"
+
+
+class StatusEnrollment(str, enum.Enum):
+    """Enrollment (KRS) status."""
+
+    AKTIF = "aktif"
+    MENGULANG = "mengulang"
+    DROP = "drop"
+    LULUS = "lulus"
+
+
+class Kelas(Base):
+    """
+    Class offering model.
+
+    One MataKuliah can have multiple classes (A, B, C) per curriculum.
+    """
+
+    __tablename__ = "kelas"
+
+    id_kelas = Column(Integer, primary_key=True, index=True)
+    kode_mk = Column(String(20), nullable=False)
+    id_kurikulum = Column(Integer, nullable=False)
+    id_rps = Column(Integer, nullable=True)
+    nama_kelas = Column(String(10), nullable=False)
+    semester = Column(String(10), nullable=False)
+    tahun_ajaran = Column(String(10), nullable=False)
+    kapasitas = Column(Integer, default=40)
+    kuota_terisi = Column(Integer, default=0)
+    status = Column(SQLEnum(StatusKelas), default=StatusKelas.DRAFT, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Constraints
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['kode_mk', 'id_kurikulum'],
+            ['matakuliah.kode_mk', 'matakuliah.id_kurikulum'],
+            ondelete='RESTRICT',
+            name='fk_kelas_mk'
+        ),
+        UniqueConstraint(
+            'kode_mk', 'id_kurikulum', 'nama_kelas', 'semester', 'tahun_ajaran',
+            name='uq_kelas'
+        ),
+    )
+
+    # Relationships
+    enrollment_list = relationship("Enrollment", back_populates="kelas")
+    komponen_list = relationship("KomponenPenilaian", back_populates="kelas")
+
+    def __repr__(self) -> str:
+        return (
+            f"<Kelas(mk='{self.kode_mk}', nama='{self.nama_kelas}', "
+            f"tahun_ajaran='{self.tahun_ajaran}')>"
+        )
+
+
+class Enrollment(Base):
+    """
+    Student enrollment (KRS) model.
+
+    Business Rule BR-K04: Student can only enroll in classes of their
+    curriculum (enforced by a database trigger).
+    """
+
+    __tablename__ = "enrollment"
+
+    id_enrollment = Column(Integer, primary_key=True, index=True)
+    nim = Column(
+        String(20),
+        ForeignKey("mahasiswa.nim", ondelete="CASCADE"),
+        nullable=False
+    )
+    id_kelas = Column(
+        Integer,
+        ForeignKey("kelas.id_kelas", ondelete="CASCADE"),
+        nullable=False
+    )
+    tanggal_daftar = Column(Date, default=func.current_date())
+    status = Column(
+        SQLEnum(StatusEnrollment),
+        default=StatusEnrollment.AKTIF,
+        nullable=False
+    )
+    nilai_akhir = Column(Numeric(5, 2), nullable=True)
+    nilai_huruf = Column(String(2), nullable=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('nim', 'id_kelas', name='uq_enrollment_nim_kelas'),
+    )
+
+    # Relationships
+    kelas = relationship("Kelas", back_populates="enrollment_list")
+
+    def __repr__(self) -> str:
+        return f"<Enrollment(nim='{self.nim}', kelas={self.id_kelas})>"
+
+
+class CPMK(Base):
+    """
+    Course Learning Outcome (Capaian Pembelajaran Mata Kuliah) model.
+
+    CPMK belongs to an RPS and contributes to one or more CPL.
+    """
+
+    __tablename__ = "cpmk"
+
+    id_cpmk = Column(Integer, primary_key=True, index=True)
+    id_rps = Column(Integer, nullable=True)
+    kode_cpmk = Column(String(20), nullable=False)
+    deskripsi = Column(Text, nullable=False)
+    urutan = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<CPMK(kode='{self.kode_cpmk}', rps={self.id_rps})>"
+
+
+class RelasiCPMKCPL(Base):
+    """
+    CPMK to CPL mapping with contribution weight.
+
+    CPMK and CPL must belong to the same curriculum (database trigger).
+    """
+
+    __tablename__ = "relasi_cpmk_cpl"
+
+    id_relasi = Column(Integer, primary_key=True, index=True)
+    id_cpmk = Column(
+        Integer,
+        ForeignKey("cpmk.id_cpmk", ondelete="CASCADE"),
+        nullable=False
+    )
+    id_cpl = Column(
+        Integer,
+        ForeignKey("cpl.id_cpl", ondelete="CASCADE"),
+        nullable=False
+    )
+    bobot_kontribusi = Column(Numeric(5, 2), default=100.00, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('id_cpmk', 'id_cpl', name='uq_relasi_cpmk_cpl'),
+        CheckConstraint(
+            'bobot_kontribusi > 0 AND bobot_kontribusi <= 100',
+            name='chk_bobot_kontribusi_valid'
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RelasiCPMKCPL(cpmk={self.id_cpmk}, cpl={self.id_cpl}, "
+            f"bobot={self.bobot_kontribusi})>"
+        )
+
+
+class TemplatePenilaian(Base):
+    """
+    Assessment weight template of an RPS (FR-008.1).
+
+    Maps an assessment type to a CPMK with its weight.
+    """
+
+    __tablename__ = "template_penilaian"
+
+    id_template = Column(Integer, primary_key=True, index=True)
+    id_rps = Column(Integer, nullable=True)
+    id_cpmk = Column(
+        Integer,
+        ForeignKey("cpmk.id_cpmk", ondelete="CASCADE"),
+        nullable=True
+    )
+    id_jenis = Column(Integer, nullable=True)
+    bobot = Column(Numeric(5, 2), nullable=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Constraints
+    __table_args__ = (
+        CheckConstraint('bobot >= 0 AND bobot <= 100', name='chk_bobot_template_valid'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TemplatePenilaian(cpmk={self.id_cpmk}, bobot={self.bobot})>"
+
+
+class KomponenPenilaian(Base):
+    """
+    Actual assessment component of a class (FR-008.2).
+
+    bobot_realisasi overrides the template weight when set.
+    """
+
+    __tablename__ = "komponen_penilaian"
+
+    id_komponen = Column(Integer, primary_key=True, index=True)
+    id_kelas = Column(
+        Integer,
+        ForeignKey("kelas.id_kelas", ondelete="CASCADE"),
+        nullable=False
+    )
+    id_template = Column(
+        Integer,
+        ForeignKey("template_penilaian.id_template"),
+        nullable=True
+    )
+    nama_komponen = Column(String(100), nullable=False)
+    deskripsi = Column(Text, nullable=True)
+    tanggal_pelaksanaan = Column(Date, nullable=True)
+    deadline = Column(Date, nullable=True)
+    bobot_realisasi = Column(Numeric(5, 2), nullable=True)
+    nilai_maksimal = Column(Numeric(5, 2), default=100, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Relationships
+    kelas = relationship("Kelas", back_populates="komponen_list")
+    template = relationship("TemplatePenilaian")
+
+    def __repr__(self) -> str:
+        return f"<KomponenPenilaian(nama='{self.nama_komponen}', kelas={self.id_kelas})>"
+
+
+class NilaiDetail(Base):
+    """
+    Student score on one assessment component (FR-008.3).
+
+    nilai_tertimbang is filled by the calculate_nilai_tertimbang trigger.
+    """
+
+    __tablename__ = "nilai_detail"
+
+    id_nilai_detail = Column(Integer, primary_key=True, index=True)
+    id_enrollment = Column(
+        Integer,
+        ForeignKey("enrollment.id_enrollment", ondelete="CASCADE"),
+        nullable=False
+    )
+    id_komponen = Column(
+        Integer,
+        ForeignKey("komponen_penilaian.id_komponen", ondelete="CASCADE"),
+        nullable=False
+    )
+    nilai_mentah = Column(Numeric(5, 2), nullable=True)
+    nilai_tertimbang = Column(Numeric(5, 2), nullable=True)
+    catatan = Column(Text, nullable=True)
+    dinilai_oleh = Column(
+        String(20),
+        ForeignKey("dosen.id_dosen"),
+        nullable=True
+    )
+    tanggal_input = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('id_enrollment', 'id_komponen', name='uq_nilai_enrollment_komponen'),
+        CheckConstraint('nilai_mentah >= 0', name='chk_nilai_mentah_valid'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<NilaiDetail(enrollment={self.id_enrollment}, "
+            f"komponen={self.id_komponen}, nilai={self.nilai_mentah})>"
+        )
+
+
+class KetercapaianCPMK(Base):
+    """
+    CPMK achievement of one enrollment (FR-008.4).
+
+    Written in bulk by the achievement engine.
+    """
+
+    __tablename__ = "ketercapaian_cpmk"
+
+    id_ketercapaian = Column(Integer, primary_key=True, index=True)
+    id_enrollment = Column(
+        Integer,
+        ForeignKey("enrollment.id_enrollment", ondelete="CASCADE"),
+        nullable=False
+    )
+    id_cpmk = Column(
+        Integer,
+        ForeignKey("cpmk.id_cpmk", ondelete="CASCADE"),
+        nullable=False
+    )
+    nilai_cpmk = Column(Numeric(5, 2), nullable=True)
+    status_tercapai = Column(Boolean, nullable=True)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('id_enrollment', 'id_cpmk', name='uq_ketercapaian_enrollment_cpmk'),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<KetercapaianCPMK(enrollment={self.id_enrollment}, "
+            f"cpmk={self.id_cpmk}, nilai={self.nilai_cpmk})>"
+        )
+
+
+class AmbangBatas(Base):
+    """
+    Passing thresholds of an RPS.
+
+    A CPMK is achieved when nilai_cpmk >= batas_kelulusan_cpmk.
+    """
+
+    __tablename__ = "ambang_batas"
+
+    id_ambang = Column(Integer, primary_key=True, index=True)
+    id_rps = Column(Integer, nullable=True)
+    batas_kelulusan_cpmk = Column(
+        Numeric(5, 2),
+        default=DEFAULT_BATAS_KELULUSAN_CPMK,
+        nullable=False
+    )
+    batas_kelulusan_mk = Column(Numeric(5, 2), default=50.00, nullable=False)
+    persentase_mahasiswa_lulus = Column(Numeric(5, 2), default=75.00, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AmbangBatas(rps={self.id_rps}, "
+            f"batas_cpmk={self.batas_kelulusan_cpmk})>"
+        )
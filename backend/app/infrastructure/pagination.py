@@ -0,0 +1,308 @@
+"""
+Keyset Pagination
+
+Cursor-based pagination, column projection and count strategies shared
+by the sync and async repositories.
+Following Clean Code: Single Responsibility, No OFFSET scans.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from sqlalchemy import and_, func, inspect, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from app.domain.exceptions import ValidationException
+
+T = TypeVar("T")
+
+
+class CountStrategy(str, Enum):
+    """How a page reports the total number of matching rows."""
+
+    NONE = "none"          # No count query at all
+    EXACT = "exact"        # SELECT count(*) over the filtered set
+    ESTIMATE = "estimate"  # Planner row estimate via EXPLAIN (PostgreSQL)
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+        items: Entities, or dictionaries when a projection was requested
+        next_cursor: Opaque cursor for the next page, None on the last page
+        total: Total matching rows (None with CountStrategy.NONE)
+        total_is_estimate: Whether total is a planner estimate
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode keyset values of the last row into an opaque cursor.
+
+    Args:
+        values: Keyset column values, in keyset order
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        size: Expected number of keyset values
+
+    Returns:
+        List[Any]: Keyset values
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise ValidationException("cursor", "Cursor tidak valid")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationException("cursor", "Cursor tidak valid")
+    return values
+
+
+def resolve_columns(model: Type[Any], names: Sequence[str], field_name: str) -> List[Any]:
+    """
+    Map column names to mapped columns of a model.
+
+    Args:
+        model: SQLAlchemy model class
+        names: Column attribute names
+        field_name: Request field reported on error
+
+    Returns:
+        List: Mapped column attributes
+
+    Raises:
+        ValidationException: If a name is not a column of the model
+    """
+    column_names = inspect(model).columns.keys()
+    unknown = [name for name in names if name not in column_names]
+    if unknown:
+        raise ValidationException(
+            field_name,
+            f"Kolom tidak dikenal: {', '.join(unknown)}"
+        )
+    return [getattr(model, name) for name in names]
+
+
+def default_keyset(model: Type[Any]) -> Tuple[str, ...]:
+    """
+    Primary-key columns of a model, the default keyset.
+
+    Args:
+        model: SQLAlchemy model class
+
+    Returns:
+        Tuple[str, ...]: Primary-key attribute names
+    """
+    mapper = inspect(model)
+    return tuple(mapper.get_property_by_column(col).key for col in mapper.primary_key)
+
+
+def build_keyset_query(
+    model: Type[Any],
+    keyset: Sequence[str],
+    limit: int,
+    after: Optional[str] = None,
+    descending: bool = False,
+    fields: Optional[Sequence[str]] = None,
+    criteria: Optional[Dict[str, Any]] = None,
+) -> Select:
+    """
+    Build the SELECT for one keyset page.
+
+    Seeks past the cursor with a row-value comparison, so the database
+    walks the (filter, keyset) index instead of counting off skipped rows.
+    Fetches limit + 1 rows; the extra row only signals that a next page exists.
+
+    Args:
+        model: SQLAlchemy model class
+        keyset: Unique ordering columns (last one should be the primary key)
+        limit: Page size
+        after: Cursor of the previous page (optional)
+        descending: Order newest-first
+        fields: Columns to select; None selects the full entity
+        criteria: Equality filters
+
+    Returns:
+        Select: Page query
+    """
+    keyset_columns = resolve_columns(model, keyset, "keyset")
+
+    if fields:
+        # Keyset columns are always fetched so the next cursor can be built
+        names = list(dict.fromkeys([*fields, *keyset]))
+        query = select(*resolve_columns(model, names, "fields"))
+    else:
+        query = select(model)
+
+    if criteria:
+        query = query.where(
+            and_(*(getattr(model, key) == value for key, value in criteria.items()))
+        )
+
+    if after:
+        values = decode_cursor(after, len(keyset_columns))
+        row, bound = tuple_(*keyset_columns), tuple_(*values)
+        query = query.where(row < bound if descending else row > bound)
+
+    order = [col.desc() if descending else col.asc() for col in keyset_columns]
+    return query.order_by(*order).limit(limit + 1)
+
+
+def build_page(
+    rows: Sequence[Any],
+    keyset: Sequence[str],
+    limit: int,
+    fields: Optional[Sequence[str]] = None,
+) -> Page:
+    """
+    Turn fetched rows (limit + 1 at most) into a Page.
+
+    Args:
+        rows: Entities, or Row objects for projected queries
+        keyset: Keyset column names
+        limit: Page size
+        fields: Requested projection (None for entities)
+
+    Returns:
+        Page: Page without total; the caller applies the count strategy
+    """
+    has_more = len(rows) > limit
+    rows = list(rows[:limit])
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        values = (
+            [last._mapping[name] for name in keyset] if fields
+            else [getattr(last, name) for name in keyset]
+        )
+        next_cursor = encode_cursor(values)
+
+    if fields:
+        # Requested fields lead the select list (build_keyset_query), so
+        # zipping the row tuples skips the per-value mapping lookups
+        names = list(dict.fromkeys(fields))
+        items = [dict(zip(names, row)) for row in rows]
+    else:
+        items = rows
+
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def build_count_query(model: Type[Any], criteria: Optional[Dict[str, Any]] = None) -> Select:
+    """
+    Build SELECT count(*) over the filtered set.
+
+    Args:
+        model: SQLAlchemy model class
+        criteria: Equality filters
+
+    Returns:
+        Select: Count query
+    """
+    query = select(func.count()).select_from(model)
+    if criteria:
+        query = query.filter_by(**criteria)
+    return query
+
+
+class ExplainJSON(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) of a query, as an executable construct.
+
+    Compiling the query as part of the statement lets each driver bind
+    the parameters in its own paramstyle (named for psycopg2, positional
+    $n for asyncpg) with the column types' bind processors applied.
+    """
+
+    _traverse_internals = [("query", InternalTraversal.dp_clauseelement)]
+    inherit_cache = True
+
+    def __init__(self, query: Select):
+        """
+        Initialize EXPLAIN construct.
+
+        Args:
+            query: Query to explain
+        """
+        self.query = query
+
+
+@compiles(ExplainJSON)
+def _compile_explain_json(element: ExplainJSON, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.query, **kw)
+
+
+def estimate_count(session: Session, query: Select) -> Optional[int]:
+    """
+    Planner row estimate for a query (PostgreSQL EXPLAIN, no execution).
+
+    Args:
+        session: Database session
+        query: Filtered query to estimate (without LIMIT)
+
+    Returns:
+        Optional[int]: Estimated rows, None if the dialect has no estimate
+    """
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+
+    plan = connection.execute(ExplainJSON(query)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def build_estimate_query(model: Type[Any], criteria: Optional[Dict[str, Any]] = None) -> Select:
+    """
+    Build the filtered SELECT whose row count is estimated.
+
+    Args:
+        model: SQLAlchemy model class
+        criteria: Equality filters
+
+    Returns:
+        Select: Query to pass to EXPLAIN
+    """
+    query = select(*inspect(model).primary_key)
+    if criteria:
+        query = query.filter_by(**criteria)
+    return query
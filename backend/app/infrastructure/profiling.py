@@ -0,0 +1,339 @@
+"""
+Request Profiling
+
+Sampling profiler for a single request, with speedscope and
+collapsed-stack exports and a per-layer time breakdown.
+Following Clean Code: Single Responsibility, No cost unless asked for.
+
+A background thread reads sys._current_frames() every interval. On the
+event loop thread a sample belongs to the profiled request only while
+the request's own middleware frame is on the stack; on threadpool
+threads (sync endpoints such as kurikulum.py) any stack running app code
+is taken, so profile on an otherwise quiet instance.
+"""
+
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Innermost matching frame decides the layer a sample's time goes to
+LAYER_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("database", ("sqlalchemy.", "psycopg2", "asyncpg")),
+    ("serialization", (
+        "pydantic.", "pydantic_core", "fastapi.encoders", "json.", "app.presentation.schemas",
+        "app.presentation.api.serialization",
+    )),
+    ("repository", ("app.infrastructure.repositories",)),
+    ("use_case", ("app.application",)),
+    ("router", ("app.presentation.api",)),
+)
+OTHER_LAYER = "other"
+THREADPOOL_ROOT = "[threadpool]"
+
+
+def frame_layer(module: str, function: str) -> Optional[str]:
+    """
+    Layer of one stack frame.
+
+    Args:
+        module: Module name of the frame
+        function: Function name of the frame
+
+    Returns:
+        Optional[str]: Layer name, None for framework / middleware frames
+    """
+    if module == "fastapi.routing" and function == "serialize_response":
+        return "serialization"
+    for layer, prefixes in LAYER_RULES:
+        if module.startswith(prefixes):
+            return layer
+    return None
+
+
+@dataclass
+class Profile:
+    """
+    Samples of one profiled request.
+
+    Attributes:
+        id: Profile ID (X-Profile-Id response header)
+        method: HTTP method
+        path: Request path
+        interval_ms: Sampling interval
+        started_at: Request start (UTC)
+        frames: (name, file, line, layer) per distinct frame
+        samples: Stacks as frame indices, root first
+        weights: Milliseconds per sample
+        status: Response status code
+        duration_ms: Wall time of the request
+    """
+
+    id: str
+    method: str
+    path: str
+    interval_ms: float
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    frames: List[Tuple[str, str, int, Optional[str]]] = field(default_factory=list)
+    samples: List[Tuple[int, ...]] = field(default_factory=list)
+    weights: List[float] = field(default_factory=list)
+    status: Optional[int] = None
+    duration_ms: Optional[float] = None
+
+    def layers(self) -> Dict[str, float]:
+        """
+        Sampled milliseconds per layer.
+
+        Returns:
+            Dict[str, float]: router / use_case / repository / database /
+                serialization / other
+        """
+        totals: Dict[str, float] = {}
+        for stack, weight in zip(self.samples, self.weights):
+            layer = next(
+                (self.frames[index][3] for index in reversed(stack) if self.frames[index][3]),
+                OTHER_LAYER
+            )
+            totals[layer] = totals.get(layer, 0.0) + weight
+        return {layer: round(ms, 3) for layer, ms in totals.items()}
+
+    def to_speedscope(self) -> dict:
+        """
+        Profile in the speedscope file format (https://www.speedscope.app).
+
+        Returns:
+            dict: Speedscope JSON document
+        """
+        name = f"{self.method} {self.path}"
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "obe-backend",
+            "shared": {
+                "frames": [
+                    {"name": frame_name, "file": file, "line": line}
+                    for frame_name, file, line, _ in self.frames
+                ]
+            },
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(self.weights), 3),
+                "samples": [list(stack) for stack in self.samples],
+                "weights": [round(weight, 3) for weight in self.weights],
+            }],
+        }
+
+    def to_collapsed(self) -> str:
+        """
+        Profile as collapsed stacks (flamegraph.pl / speedscope input).
+
+        Returns:
+            str: One "root;...;leaf microseconds" line per distinct stack
+        """
+        totals: Dict[Tuple[int, ...], float] = {}
+        for stack, weight in zip(self.samples, self.weights):
+            totals[stack] = totals.get(stack, 0.0) + weight
+        return "\n".join(
+            ";".join(self.frames[index][0] for index in stack) + f" {round(ms * 1000)}"
+            for stack, ms in totals.items()
+        )
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of one request until stopped.
+
+    Only created for requests carrying a valid profiling token.
+    """
+
+    def __init__(
+        self,
+        profile: Profile,
+        root_frame: FrameType,
+        max_seconds: float = 30.0,
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            profile: Profile to fill
+            root_frame: Frame of the profiling middleware for this request
+            max_seconds: Sampling stops after this long
+        """
+        self.profile = profile
+        self.root_frame = root_frame
+        self.loop_thread_id = threading.get_ident()
+        self.max_seconds = max_seconds
+        self._frame_index: Dict[Tuple[str, str, int], int] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="request-profiler",
+            daemon=True
+        )
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        """
+        Stop sampling.
+
+        Returns:
+            Profile: Filled profile
+        """
+        self._stop.set()
+        self._thread.join()
+        return self.profile
+
+    def _run(self) -> None:
+        interval = self.profile.interval_ms / 1000
+        own_id = threading.get_ident()
+        previous = started = time.perf_counter()
+        while not self._stop.wait(interval):
+            now = time.perf_counter()
+            if now - started > self.max_seconds:
+                break
+            weight = (now - previous) * 1000
+            previous = now
+            stacks = [
+                self._request_stack(thread_id, frame)
+                for thread_id, frame in sys._current_frames().items()
+                if thread_id != own_id
+            ]
+            if self._stop.is_set():
+                # The request finished; the loop thread is waiting in stop()
+                break
+            for stack in stacks:
+                if stack:
+                    self.profile.samples.append(stack)
+                    self.profile.weights.append(weight)
+
+    def _request_stack(self, thread_id: int, frame: FrameType) -> Optional[Tuple[int, ...]]:
+        """Frame indices of the request's part of a stack, root first."""
+        frames: List[FrameType] = []
+        if thread_id == self.loop_thread_id:
+            while frame is not None and frame is not self.root_frame:
+                frames.append(frame)
+                frame = frame.f_back
+            if frame is None:
+                # Another request or the idle event loop
+                return None
+            frames.append(frame)
+            prefix: Tuple[int, ...] = ()
+        else:
+            outermost_app = None
+            while frame is not None:
+                frames.append(frame)
+                if frame.f_globals.get("__name__", "").startswith("app."):
+                    outermost_app = len(frames)
+                frame = frame.f_back
+            if outermost_app is None:
+                return None
+            del frames[outermost_app:]
+            prefix = (self._intern(THREADPOOL_ROOT, "", 0, None),)
+
+        return prefix + tuple(
+            self._intern_frame(frame) for frame in reversed(frames)
+        )
+
+    def _intern_frame(self, frame: FrameType) -> int:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "")
+        name = getattr(code, "co_qualname", code.co_name)
+        return self._intern(
+            f"{module}.{name}" if module else name,
+            code.co_filename,
+            code.co_firstlineno,
+            frame_layer(module, code.co_name)
+        )
+
+    def _intern(self, name: str, file: str, line: int, layer: Optional[str]) -> int:
+        key = (name, file, line)
+        index = self._frame_index.get(key)
+        if index is None:
+            index = self._frame_index[key] = len(self.profile.frames)
+            self.profile.frames.append((name, file, line, layer))
+        return index
+
+
+def new_profile(method: str, path: str, interval_ms: float) -> Profile:
+    """
+    Create an empty profile with a fresh ID.
+
+    Args:
+        method: HTTP method
+        path: Request path
+        interval_ms: Sampling interval
+
+    Returns:
+        Profile: Empty profile
+    """
+    return Profile(id=uuid.uuid4().hex, method=method, path=path, interval_ms=interval_ms)
+
+
+class ProfileStore:
+    """
+    Most recent profiles of this worker.
+
+    Per process: fetch a profile from the worker that served the
+    profiled request (X-Profile-Id is only known there).
+    """
+
+    def __init__(self, capacity: int = 20):
+        """
+        Initialize profile store.
+
+        Args:
+            capacity: Profiles kept; the oldest are dropped first
+        """
+        self.capacity = capacity
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: Profile) -> None:
+        """Keep a finished profile."""
+        with self._lock:
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self.capacity:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        """Profile by ID, None if unknown or already dropped."""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Profile]:
+        """Kept profiles, newest first."""
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+
+_profile_store: Optional[ProfileStore] = None
+_profile_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore:
+    """
+    Get the process-wide profile store.
+
+    Returns:
+        ProfileStore: Store sized by PROFILING_STORE_SIZE
+    """
+    global _profile_store
+    if _profile_store is None:
+        with _profile_store_lock:
+            if _profile_store is None:
+                _profile_store = ProfileStore(settings.profiling.store_size)
+    return _profile_store
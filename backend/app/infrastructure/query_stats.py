@@ -0,0 +1,269 @@
+"""
+Query Statistics
+
+Per-request database round-trip counting, statement timing and N+1
+detection via SQLAlchemy engine events.
+Following Clean Code: Single Responsibility, No global mutable state across requests.
+
+Lazy relationships (Kurikulum.cpl_list, MataKuliah.prasyarat_list, ...)
+issue one SELECT per parent object when a serializer walks them. Each of
+those SELECTs is the same compiled statement, so counting statements by
+fingerprint exposes the N+1 pattern without parsing every query.
+"""
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a SQL statement so executions differing only in values match.
+
+    Literals and bind placeholders (psycopg2, asyncpg and named styles)
+    become ?, and IN lists of any length collapse to (?...).
+
+    Args:
+        statement: SQL text as sent to the DBAPI cursor
+
+    Returns:
+        str: Statement fingerprint
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    return _PLACEHOLDER_LIST.sub("(?...)", normalized)
+
+
+@dataclass
+class RoundTripStats:
+    """
+    Database round trips observed within one scope (usually one request).
+
+    Attributes:
+        statements: Statements sent through a DBAPI cursor
+        commits: COMMITs issued
+        rollbacks: ROLLBACKs issued
+        db_time_ns: Time spent inside cursor executions
+        statement_counts: Executions per distinct SQL text
+    """
+
+    statements: int = 0
+    commits: int = 0
+    rollbacks: int = 0
+    db_time_ns: int = 0
+    statement_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Total round trips to the database server."""
+        return self.statements + self.commits + self.rollbacks
+
+    @property
+    def db_time_ms(self) -> float:
+        """Time spent inside cursor executions, in milliseconds."""
+        return self.db_time_ns / 1e6
+
+    def add_statement(self, statement: str) -> None:
+        """
+        Record one cursor execution.
+
+        Keyed by the raw SQL text: compiled statements are cached by
+        SQLAlchemy, so repeats hit the same (already hashed) string and
+        fingerprinting is deferred until a report is asked for.
+
+        Args:
+            statement: SQL text
+        """
+        self.statements += 1
+        self.statement_counts[statement] = self.statement_counts.get(statement, 0) + 1
+
+    def repeated_statements(self, threshold: int = 2) -> List[Tuple[str, int]]:
+        """
+        Statement fingerprints executed at least threshold times.
+
+        Args:
+            threshold: Minimum executions per fingerprint
+
+        Returns:
+            List[Tuple[str, int]]: (fingerprint, executions), most repeated first
+        """
+        if self.statements < threshold:
+            return []
+        merged: Dict[str, int] = {}
+        for statement, count in self.statement_counts.items():
+            key = fingerprint(statement)
+            merged[key] = merged.get(key, 0) + count
+        repeated = [(key, count) for key, count in merged.items() if count >= threshold]
+        return sorted(repeated, key=lambda item: item[1], reverse=True)
+
+
+# Stats object of the active scope. The object itself is mutable, so
+# threadpool workers (which run on a copy of the context) update the
+# same instance as the request that spawned them.
+_current_stats: ContextVar[Optional[RoundTripStats]] = ContextVar(
+    "round_trip_stats",
+    default=None
+)
+
+
+@contextmanager
+def track_round_trips() -> Iterator[RoundTripStats]:
+    """
+    Count database round trips made inside the block.
+
+    Usage:
+        with track_round_trips() as stats:
+            use_cases.approve_kurikulum(1)
+        assert stats.total <= 3
+
+    Yields:
+        RoundTripStats: Live counters for the block
+    """
+    stats = RoundTripStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block issues more statements than its query budget."""
+
+
+# Budgets open in this process. Unlike the ContextVar above they see every
+# thread, so statements of requests served by TestClient (which runs the
+# app on its own event loop thread) are counted too.
+_budgets: List[RoundTripStats] = []
+_budgets_lock = threading.Lock()
+
+
+@contextmanager
+def query_budget(max_statements: int, threshold: int = 2) -> Iterator[RoundTripStats]:
+    """
+    Fail if the block issues more than max_statements statements.
+
+    Meant for tests; a pytest fixture can hand it out as is:
+
+        @pytest.fixture
+        def query_budget():
+            return query_stats.query_budget
+
+        def test_list_kurikulum(client, query_budget):
+            with query_budget(3):
+                client.get("/api/v1/kurikulum")
+
+    Counts every statement issued in this process while the block is
+    open, whichever thread or task issues it.
+
+    Args:
+        max_statements: Statements allowed
+        threshold: Repetitions listed in the failure message as likely N+1
+
+    Yields:
+        RoundTripStats: Live counters for the block
+
+    Raises:
+        QueryBudgetExceeded: If the budget is exceeded
+    """
+    stats = RoundTripStats()
+    with _budgets_lock:
+        _budgets.append(stats)
+    try:
+        yield stats
+    finally:
+        with _budgets_lock:
+            _budgets.remove(stats)
+
+    if stats.statements > max_statements:
+        repeated = "".join(
+            f"\n  {count}x {statement}"
+            for statement, count in stats.repeated_statements(threshold)
+        )
+        raise QueryBudgetExceeded(
+            f"{stats.statements} statements issued, budget is {max_statements}"
+            + (f"; repeated statements:{repeated}" if repeated else "")
+        )
+
+
+def current_round_trips() -> Optional[RoundTripStats]:
+    """
+    Get counters of the active scope.
+
+    Returns:
+        Optional[RoundTripStats]: Active stats, None outside a tracked scope
+    """
+    return _current_stats.get()
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add_statement(statement)
+        conn.info.setdefault("query_started_ns", []).append(time.perf_counter_ns())
+    if _budgets:
+        # Snapshot under the lock: a budget closing on another thread
+        # must not make this loop skip one that is still open
+        with _budgets_lock:
+            budgets = tuple(_budgets)
+        for budget in budgets:
+            budget.add_statement(statement)
+
+
+def _time_statement(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started_ns")
+    if started:
+        stats = _current_stats.get()
+        elapsed = time.perf_counter_ns() - started.pop()
+        if stats is not None:
+            stats.db_time_ns += elapsed
+
+
+def _discard_timing(exception_context):
+    # A failed execution never reaches after_cursor_execute
+    conn = exception_context.connection
+    started = conn.info.get("query_started_ns") if conn is not None else None
+    if started:
+        started.pop()
+
+
+def _count_commit(conn):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.commits += 1
+
+
+def _count_rollback(conn):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.rollbacks += 1
+
+
+def install_round_trip_counter(engine: Engine) -> None:
+    """
+    Attach round-trip counting and statement timing listeners to an engine.
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+    """
+    if event.contains(engine, "before_cursor_execute", _count_statement):
+        return
+    event.listen(engine, "before_cursor_execute", _count_statement)
+    event.listen(engine, "after_cursor_execute", _time_statement)
+    event.listen(engine, "handle_error", _discard_timing)
+    event.listen(engine, "commit", _count_commit)
+    event.listen(engine, "rollback", _count_rollback)
@@ -0,0 +1,326 @@
+"""
+Read Replicas
+
+Routes statements of read-only use cases to streaming replicas (NFR-004.2).
+Following Clean Code: Single Responsibility, Primary unless proven safe.
+
+A use case method opts in with @read_only. Its statements go to one
+replica (round robin, pinned for the rest of the session so related
+reads see the same snapshot). Everything else stays on the primary:
+flushes, DML, any statement after the session has written (read after
+write within a request, whether the write was flushed or executed as a
+set-based statement), and all statements when no replica is healthy
+and within DATABASE_REPLICA_MAX_LAG_SECONDS.
+"""
+
+import functools
+import inspect
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+
+logger = logging.getLogger(__name__)
+
+# session.info keys
+_WROTE_KEY = "routing_wrote"
+_REPLICA_KEY = "routing_replica"
+
+# 0 while the replica has replayed everything it received, so an idle
+# primary does not look like replication lag
+REPLICATION_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+
+
+def read_only(func: Callable) -> Callable:
+    """
+    Declare a use case method safe to serve from a read replica.
+
+    Only for methods that never write and are not called from write
+    use cases (a write use case must read its own rows from the primary).
+
+    Usage:
+        @read_only
+        def list_kurikulum(self, ...):
+            ...
+
+    Args:
+        func: Sync or async use case method
+
+    Returns:
+        Callable: Method whose statements may be routed to a replica
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            token = _read_only.set(True)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _read_only.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper
+
+
+@dataclass
+class Replica:
+    """
+    One streaming replica.
+
+    Attributes:
+        name: Label for logs and health output
+        engine: psycopg2 engine
+        async_engine: asyncpg engine (optional)
+        ejected_until: time.monotonic() until which it gets no reads
+        lag_seconds: Replication lag at the last check, None if unchecked
+        last_error: Reason of the last ejection
+    """
+
+    name: str
+    engine: Engine
+    async_engine: Optional[AsyncEngine] = None
+    ejected_until: float = 0.0
+    lag_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def available(self) -> bool:
+        """Whether the replica may serve reads now."""
+        return time.monotonic() >= self.ejected_until
+
+
+class ReplicaSet:
+    """
+    Healthy-replica selection with ejection and lag checks.
+
+    A replica is ejected for ejection_seconds when a connection to it
+    fails, and until its next check when its lag exceeds max_lag_seconds;
+    a successful check within the lag bound returns it to rotation.
+    """
+
+    def __init__(
+        self,
+        replicas: List[Replica],
+        max_lag_seconds: float = 10.0,
+        check_interval_seconds: float = 5.0,
+        ejection_seconds: float = 30.0,
+    ):
+        """
+        Initialize replica set.
+
+        Args:
+            replicas: Replicas to balance over
+            max_lag_seconds: Lag beyond which a replica gets no reads
+            check_interval_seconds: Interval of the background lag check
+            ejection_seconds: How long a failing replica gets no reads
+        """
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.ejection_seconds = ejection_seconds
+        self._next = itertools.count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        for replica in replicas:
+            self._watch_errors(replica)
+
+    def _watch_errors(self, replica: Replica) -> None:
+        """Eject a replica as soon as a connection to it fails."""
+
+        def on_error(exception_context) -> None:
+            if exception_context.is_disconnect or exception_context.connection is None:
+                self.eject(replica, str(exception_context.original_exception))
+
+        event.listen(replica.engine, "handle_error", on_error)
+        if replica.async_engine is not None:
+            event.listen(replica.async_engine.sync_engine, "handle_error", on_error)
+
+    def choose(self) -> Optional[Replica]:
+        """
+        Next available replica, round robin.
+
+        Returns:
+            Optional[Replica]: Replica, None if all are ejected
+        """
+        count = len(self.replicas)
+        start = next(self._next)
+        for offset in range(count):
+            replica = self.replicas[(start + offset) % count]
+            if replica.available():
+                return replica
+        return None
+
+    def eject(self, replica: Replica, reason: str, seconds: Optional[float] = None) -> None:
+        """
+        Stop sending reads to a replica for a while.
+
+        Args:
+            replica: Replica to eject
+            reason: Logged and kept as last_error
+            seconds: Ejection time (optional, ejection_seconds if not provided)
+        """
+        if replica.available():
+            logger.warning(f"Replica {replica.name} ejected: {reason}")
+        replica.last_error = reason
+        replica.ejected_until = time.monotonic() + (
+            seconds if seconds is not None else self.ejection_seconds
+        )
+
+    def check(self) -> None:
+        """Measure every replica's lag and eject the ones out of bounds."""
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    replica.lag_seconds = float(conn.execute(REPLICATION_LAG_QUERY).scalar())
+            except Exception as e:
+                replica.lag_seconds = None
+                self.eject(replica, f"lag check failed: {e}")
+                continue
+
+            if replica.lag_seconds > self.max_lag_seconds:
+                self.eject(
+                    replica,
+                    f"replication lag {replica.lag_seconds:.1f}s > {self.max_lag_seconds}s",
+                    seconds=self.check_interval_seconds
+                )
+            elif not replica.available():
+                # Reachable and caught up: no need to wait out the ejection
+                replica.ejected_until = 0.0
+                logger.info(f"Replica {replica.name} back in rotation")
+
+    def start(self) -> None:
+        """Start the background lag check thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="replica-lag-check",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.check()
+            self._stop.wait(self.check_interval_seconds)
+
+    async def shutdown(self) -> None:
+        """Stop the lag check thread and close replica connections of both drivers."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.check_interval_seconds)
+            self._thread = None
+        for replica in self.replicas:
+            replica.engine.dispose()
+            if replica.async_engine is not None:
+                await replica.async_engine.dispose()
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Health of every replica.
+
+        Returns:
+            List[Dict]: name, available, lag_seconds, last_error
+        """
+        return [
+            {
+                "name": replica.name,
+                "available": replica.available(),
+                "lag_seconds": replica.lag_seconds,
+                "last_error": replica.last_error,
+            }
+            for replica in self.replicas
+        ]
+
+
+class RoutingSession(Session):
+    """
+    Session sending @read_only statements to a replica.
+
+    Used as class_ of SessionLocal and sync_session_class of
+    AsyncSessionLocal (use_async=True picks the replicas' asyncpg engines).
+    """
+
+    def __init__(
+        self,
+        replicas: Optional[ReplicaSet] = None,
+        use_async: bool = False,
+        **kwargs
+    ):
+        """
+        Initialize routing session.
+
+        Args:
+            replicas: Replica set (optional, primary only if None)
+            use_async: Route to the replicas' async engines
+            **kwargs: Session arguments
+        """
+        super().__init__(**kwargs)
+        self.replicas = replicas
+        self.use_async = use_async
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self.replicas is None or not _read_only.get():
+            return primary
+        if self._flushing or self.info.get(_WROTE_KEY):
+            return primary
+        if getattr(clause, "is_dml", False):
+            self.info[_WROTE_KEY] = True
+            return primary
+
+        replica = self.info.get(_REPLICA_KEY)
+        if replica is None or not replica.available():
+            replica = self.replicas.choose()
+            if replica is None:
+                return primary
+            self.info[_REPLICA_KEY] = replica
+        if self.use_async:
+            return replica.async_engine.sync_engine
+        return replica.engine
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_written(session: Session, flush_context) -> None:
+    """Keep the rest of the session on the primary once it has written."""
+    session.info[_WROTE_KEY] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_executed_write(orm_execute_state) -> None:
+    """
+    Same for statements that bypass the flush.
+
+    Set-based session.execute(update(...)) / delete(...) (e.g.
+    KurikulumRepository.unset_primary) and raw SQL never reach
+    after_flush; anything but a SELECT counts as a write.
+    """
+    if orm_execute_state.is_select:
+        return
+    statement = orm_execute_state.statement
+    if isinstance(statement, TextClause) and statement.text.lstrip()[:6].upper() == "SELECT":
+        return
+    orm_execute_state.session.info[_WROTE_KEY] = True
@@ -10,6 +10,13 @@ from app.infrastructure.repositories.kurikulum_repository import KurikulumReposi
 from app.infrastructure.repositories.cpl_repository import CPLRepository
 from app.infrastructure.repositories.matakuliah_repository import MataKuliahRepository
 from app.infrastructure.repositories.user_repository import UserRepository
+from app.infrastructure.repositories.ketercapaian_repository import (
+    KetercapaianRepository,
+    PenilaianSnapshot,
+)
+from app.infrastructure.repositories.async_base_repository import AsyncBaseRepository
+from app.infrastructure.repositories.async_kurikulum_repository import AsyncKurikulumRepository
+from app.infrastructure.repositories.async_user_repository import AsyncUserRepository
 
 __all__ = [
     "BaseRepository",
@@ -17,4 +24,9 @@ __all__ = [
     "CPLRepository",
     "MataKuliahRepository",
     "UserRepository",
+    "KetercapaianRepository",
+    "PenilaianSnapshot",
+    "AsyncBaseRepository",
+    "AsyncKurikulumRepository",
+    "AsyncUserRepository",
 ]
@@ -0,0 +1,418 @@
+"""
+Async Base Repository
+
+Generic async repository mirroring BaseRepository for AsyncSession.
+Following Clean Code: DRY, Generic programming, Type safety.
+"""
+
+from typing import TypeVar, Generic, Type, List, Optional, Any, Dict, Sequence
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database import Base
+from app.infrastructure.pagination import (
+    CountStrategy,
+    Page,
+    build_count_query,
+    build_estimate_query,
+    build_keyset_query,
+    build_page,
+    default_keyset,
+    estimate_count,
+)
+from app.infrastructure.unit_of_work import in_unit_of_work
+from app.domain.exceptions import EntityNotFoundException
+
+# Generic type for database models
+ModelType = TypeVar("ModelType", bound=Base)
+
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """
+    Generic async base repository for CRUD operations.
+
+    Exposes the same API as BaseRepository, but every method that
+    touches the database is a coroutine. Writes inside an AsyncUnitOfWork
+    only flush.
+
+    Type Parameters:
+        ModelType: The SQLAlchemy model class
+    """
+
+    def __init__(self, model: Type[ModelType], session: AsyncSession):
+        """
+        Initialize repository with model and async session.
+
+        Args:
+            model: SQLAlchemy model class
+            session: Async database session
+        """
+        self.model = model
+        self.session = session
+
+    async def create(self, **kwargs) -> ModelType:
+        """
+        Create a new entity.
+
+        Args:
+            **kwargs: Entity attributes
+
+        Returns:
+            ModelType: Created entity instance
+        """
+        entity = self.model(**kwargs)
+        self.session.add(entity)
+        await self._save(entity)
+        return entity
+
+    async def get_by_id(self, entity_id: Any) -> Optional[ModelType]:
+        """
+        Get entity by primary key.
+
+        Args:
+            entity_id: Primary key value
+
+        Returns:
+            Optional[ModelType]: Entity if found, None otherwise
+        """
+        return await self.session.get(self.model, entity_id)
+
+    async def get_by_id_or_fail(self, entity_id: Any) -> ModelType:
+        """
+        Get entity by ID or raise exception if not found.
+
+        Args:
+            entity_id: Primary key value
+
+        Returns:
+            ModelType: Entity instance
+
+        Raises:
+            EntityNotFoundException: If entity not found
+        """
+        entity = await self.get_by_id(entity_id)
+        if not entity:
+            raise EntityNotFoundException(
+                self.model.__name__,
+                str(entity_id)
+            )
+        return entity
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        keyset: Optional[Sequence[str]] = None,
+        descending: bool = False
+    ) -> List[ModelType]:
+        """
+        Get all entities with pagination.
+
+        Passing after or keyset switches from OFFSET to keyset pagination
+        (see get_page); skip and order_by are then ignored.
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            order_by: Column name to order by
+            after: Cursor of the previous page (keyset pagination)
+            keyset: Unique ordering columns (default: primary key)
+            descending: Keyset order direction
+
+        Returns:
+            List[ModelType]: List of entities
+        """
+        if after is not None or keyset is not None:
+            page = await self.get_page(
+                limit=limit,
+                after=after,
+                keyset=keyset,
+                descending=descending
+            )
+            return page.items
+
+        query = select(self.model)
+
+        if order_by:
+            query = query.order_by(getattr(self.model, order_by))
+
+        result = await self.session.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_page(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        keyset: Optional[Sequence[str]] = None,
+        descending: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        count: CountStrategy = CountStrategy.NONE,
+        **criteria
+    ) -> Page:
+        """
+        Get one page of entities using keyset (cursor) pagination.
+
+        Args:
+            limit: Page size
+            after: Cursor returned as next_cursor by the previous page
+            keyset: Unique ordering columns (default: primary key)
+            descending: Order by keyset descending
+            fields: Columns to select; items are then dictionaries
+            count: How to compute Page.total
+            **criteria: Equality filters
+
+        Returns:
+            Page: Items, next cursor and (optionally) total
+
+        Raises:
+            ValidationException: If the cursor or a column name is invalid
+        """
+        keyset = tuple(keyset or default_keyset(self.model))
+        query = build_keyset_query(
+            self.model,
+            keyset,
+            limit,
+            after=after,
+            descending=descending,
+            fields=fields,
+            criteria=criteria
+        )
+        result = await self.session.execute(query)
+        rows = result.all() if fields else result.scalars().all()
+
+        page = build_page(rows, keyset, limit, fields)
+        await self._apply_count(page, count, criteria)
+        return page
+
+    async def get_by_criteria(self, **criteria) -> List[ModelType]:
+        """
+        Get entities matching criteria.
+
+        Args:
+            **criteria: Filter criteria as key-value pairs
+
+        Returns:
+            List[ModelType]: List of matching entities
+        """
+        result = await self.session.execute(
+            select(self.model).filter_by(**criteria)
+        )
+        return list(result.scalars().all())
+
+    async def get_one_by_criteria(self, **criteria) -> Optional[ModelType]:
+        """
+        Get single entity matching criteria.
+
+        Args:
+            **criteria: Filter criteria as key-value pairs
+
+        Returns:
+            Optional[ModelType]: Entity if found, None otherwise
+        """
+        result = await self.session.execute(
+            select(self.model).filter_by(**criteria).limit(1)
+        )
+        return result.scalars().first()
+
+    async def exists(self, **criteria) -> bool:
+        """
+        Check if entity exists with given criteria.
+
+        Args:
+            **criteria: Filter criteria as key-value pairs
+
+        Returns:
+            bool: True if entity exists, False otherwise
+        """
+        result = await self.session.execute(
+            select(select(self.model).filter_by(**criteria).exists())
+        )
+        return bool(result.scalar())
+
+    async def update(self, entity: ModelType, **update_data) -> ModelType:
+        """
+        Update entity with new data.
+
+        Args:
+            entity: Entity to update
+            **update_data: Fields to update
+
+        Returns:
+            ModelType: Updated entity
+        """
+        for key, value in update_data.items():
+            if hasattr(entity, key):
+                setattr(entity, key, value)
+
+        await self._save(entity)
+        return entity
+
+    async def update_by_id(self, entity_id: Any, **update_data) -> ModelType:
+        """
+        Update entity by ID.
+
+        Args:
+            entity_id: Primary key value
+            **update_data: Fields to update
+
+        Returns:
+            ModelType: Updated entity
+
+        Raises:
+            EntityNotFoundException: If entity not found
+        """
+        entity = await self.get_by_id_or_fail(entity_id)
+        return await self.update(entity, **update_data)
+
+    async def delete(self, entity: ModelType) -> None:
+        """
+        Delete entity (hard delete).
+
+        Args:
+            entity: Entity to delete
+        """
+        await self.session.delete(entity)
+        await self._save()
+
+    async def delete_by_id(self, entity_id: Any) -> None:
+        """
+        Delete entity by ID (hard delete).
+
+        Args:
+            entity_id: Primary key value
+
+        Raises:
+            EntityNotFoundException: If entity not found
+        """
+        entity = await self.get_by_id_or_fail(entity_id)
+        await self.delete(entity)
+
+    async def soft_delete(self, entity: ModelType) -> ModelType:
+        """
+        Soft delete entity by setting is_active = False.
+
+        Args:
+            entity: Entity to soft delete
+
+        Returns:
+            ModelType: Updated entity with is_active = False
+
+        Note:
+            Entity must have is_active field
+        """
+        if not hasattr(entity, 'is_active'):
+            raise AttributeError(
+                f"{self.model.__name__} does not support soft delete "
+                "(missing is_active field)"
+            )
+
+        return await self.update(entity, is_active=False)
+
+    async def count(self, **criteria) -> int:
+        """
+        Count entities matching criteria.
+
+        Args:
+            **criteria: Filter criteria as key-value pairs
+
+        Returns:
+            int: Number of matching entities
+        """
+        query = select(func.count()).select_from(self.model)
+        if criteria:
+            query = query.filter_by(**criteria)
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    async def bulk_create(self, entities: List[Dict[str, Any]]) -> List[ModelType]:
+        """
+        Create multiple entities in one transaction.
+
+        ORM bulk INSERT ... RETURNING: rows are sent as batched multi-row
+        INSERTs instead of one INSERT per entity.
+
+        Args:
+            entities: List of entity data dictionaries
+
+        Returns:
+            List[ModelType]: List of created entities
+        """
+        if not entities:
+            return []
+        result = await self.session.scalars(
+            insert(self.model).returning(self.model),
+            entities
+        )
+        instances = list(result)
+        await self._save()
+        return instances
+
+    async def refresh(self, entity: ModelType) -> ModelType:
+        """
+        Refresh entity from database.
+
+        Args:
+            entity: Entity to refresh
+
+        Returns:
+            ModelType: Refreshed entity
+        """
+        await self.session.refresh(entity)
+        return entity
+
+    async def _apply_count(
+        self,
+        page: Page,
+        count: CountStrategy,
+        criteria: Dict[str, Any]
+    ) -> None:
+        """
+        Fill Page.total according to the count strategy (internal helper).
+
+        Args:
+            page: Page to update
+            count: Count strategy
+            criteria: Filters of the page query
+        """
+        if count == CountStrategy.NONE:
+            return
+
+        if count == CountStrategy.ESTIMATE:
+            estimate_query = build_estimate_query(self.model, criteria)
+            estimate = await self.session.run_sync(
+                lambda session: estimate_count(session, estimate_query)
+            )
+            if estimate is not None:
+                page.total = estimate
+                page.total_is_estimate = True
+                return
+
+        result = await self.session.execute(build_count_query(self.model, criteria))
+        page.total = result.scalar_one()
+
+    async def _save(self, entity: Optional[ModelType] = None) -> None:
+        """
+        Persist pending changes (internal helper).
+
+        Flush-only inside a unit of work, commit and refresh otherwise.
+
+        Args:
+            entity: Entity to refresh after commit (optional)
+        """
+        if in_unit_of_work(self.session):
+            await self.session.flush()
+            return
+
+        await self.session.commit()
+        if entity is not None:
+            await self.session.refresh(entity)
+
+    async def commit(self) -> None:
+        """Commit current transaction."""
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        """Rollback current transaction."""
+        await self.session.rollback()
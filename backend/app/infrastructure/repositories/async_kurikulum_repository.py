@@ -0,0 +1,258 @@
+"""
+Async Kurikulum Repository
+
+Async data access layer for Kurikulum entity.
+Mirrors KurikulumRepository query-for-query on AsyncSession.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import and_, lambda_stmt, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.repositories.async_base_repository import AsyncBaseRepository
+from app.infrastructure.repositories.kurikulum_repository import (
+    LIST_KEYSET,
+    build_list_version_query,
+)
+from app.infrastructure.pagination import CountStrategy, Page
+from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.infrastructure.statistics import (
+    build_aggregate_statistics_query,
+    to_statistics,
+)
+from app.domain.exceptions import EntityNotFoundException
+from app.infrastructure.tracing import trace_methods
+
+
+@trace_methods("repository")
+class AsyncKurikulumRepository(AsyncBaseRepository[Kurikulum]):
+    """
+    Async repository for Kurikulum operations.
+
+    Extends AsyncBaseRepository with Kurikulum-specific queries.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize async Kurikulum repository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(Kurikulum, session)
+
+    async def get_by_kode(self, id_prodi: str, kode_kurikulum: str) -> Optional[Kurikulum]:
+        """
+        Get curriculum by program and code.
+
+        Args:
+            id_prodi: Program study ID
+            kode_kurikulum: Curriculum code
+
+        Returns:
+            Optional[Kurikulum]: Curriculum if found, None otherwise
+        """
+        result = await self.session.execute(lambda_stmt(
+            lambda: select(Kurikulum).where(
+                Kurikulum.id_prodi == id_prodi,
+                Kurikulum.kode_kurikulum == kode_kurikulum
+            ).limit(1)
+        ))
+        return result.scalars().first()
+
+    async def get_active_curricula(self, id_prodi: str) -> List[Kurikulum]:
+        """
+        Get all active curricula for a program.
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            List[Kurikulum]: List of active curricula
+        """
+        result = await self.session.execute(
+            select(Kurikulum).where(
+                and_(
+                    Kurikulum.id_prodi == id_prodi,
+                    Kurikulum.status == KurikulumStatus.AKTIF
+                )
+            )
+        )
+        return list(result.scalars().all())
+
+    async def get_primary_curriculum(self, id_prodi: str) -> Optional[Kurikulum]:
+        """
+        Get primary curriculum for a program.
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            Optional[Kurikulum]: Primary curriculum if exists
+        """
+        return await self.get_one_by_criteria(
+            id_prodi=id_prodi,
+            is_primary=True,
+            status=KurikulumStatus.AKTIF
+        )
+
+    async def unset_primary(self, id_prodi: str) -> List[int]:
+        """
+        Clear the primary flag of every curriculum in a program.
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            List[int]: IDs of the curricula that were primary
+        """
+        result = await self.session.execute(
+            update(Kurikulum)
+            .where(
+                Kurikulum.id_prodi == id_prodi,
+                Kurikulum.is_primary == True
+            )
+            .values(is_primary=False)
+            .returning(Kurikulum.id_kurikulum)
+        )
+        return list(result.scalars().all())
+
+    async def get_newest_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        count: CountStrategy = CountStrategy.NONE,
+        **criteria
+    ) -> Page:
+        """
+        Get one page of curricula, newest first.
+
+        Keyset pagination on (tahun_berlaku, id_kurikulum), served by
+        idx_kurikulum_keyset / idx_kurikulum_prodi_keyset.
+
+        Args:
+            limit: Page size
+            after: Cursor of the previous page (optional)
+            fields: Columns to select; items are dictionaries when given
+            count: How to compute the page total
+            **criteria: Equality filters (e.g. id_prodi, status)
+
+        Returns:
+            Page: Curricula page
+        """
+        return await self.get_page(
+            limit=limit,
+            after=after,
+            keyset=LIST_KEYSET,
+            descending=True,
+            fields=fields,
+            count=count,
+            **criteria
+        )
+
+    async def get_by_status(self, status: KurikulumStatus) -> List[Kurikulum]:
+        """
+        Get curricula by status.
+
+        Args:
+            status: Curriculum status
+
+        Returns:
+            List[Kurikulum]: List of curricula with given status
+        """
+        return await self.get_by_criteria(status=status)
+
+    async def check_duplicate_code(self, id_prodi: str, kode_kurikulum: str) -> bool:
+        """
+        Check if curriculum code already exists for program.
+
+        Args:
+            id_prodi: Program study ID
+            kode_kurikulum: Curriculum code to check
+
+        Returns:
+            bool: True if code exists, False otherwise
+        """
+        return await self.exists(id_prodi=id_prodi, kode_kurikulum=kode_kurikulum)
+
+    async def get_curricula_by_year_range(
+        self,
+        id_prodi: str,
+        year_from: int,
+        year_to: int
+    ) -> List[Kurikulum]:
+        """
+        Get curricula within a year range.
+
+        Args:
+            id_prodi: Program study ID
+            year_from: Start year
+            year_to: End year
+
+        Returns:
+            List[Kurikulum]: Curricula within the year range
+        """
+        result = await self.session.execute(
+            select(Kurikulum).where(
+                and_(
+                    Kurikulum.id_prodi == id_prodi,
+                    Kurikulum.tahun_berlaku >= year_from,
+                    Kurikulum.tahun_berlaku <= year_to
+                )
+            ).order_by(Kurikulum.tahun_berlaku.desc())
+        )
+        return list(result.scalars().all())
+
+    async def get_updated_at(self, id_kurikulum: int) -> Optional[datetime]:
+        """
+        Get only the last-modified timestamp of a curriculum.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Optional[datetime]: updated_at, None if curriculum not found
+        """
+        result = await self.session.execute(
+            select(Kurikulum.updated_at).where(Kurikulum.id_kurikulum == id_kurikulum)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_list_version(self, **criteria) -> Tuple[Optional[datetime], int]:
+        """
+        Get (max(updated_at), count) of the filtered curricula.
+
+        Args:
+            **criteria: Equality filters
+
+        Returns:
+            Tuple[Optional[datetime], int]: Latest change and row count
+        """
+        result = await self.session.execute(build_list_version_query(**criteria))
+        latest, total = result.one()
+        return latest, total
+
+    async def get_with_statistics(self, id_kurikulum: int) -> dict:
+        """
+        Get curriculum with statistics (CPL count, MK count, student count).
+
+        One aggregated query with scalar subqueries.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            dict: Curriculum data with statistics
+
+        Raises:
+            EntityNotFoundException: If curriculum not found
+        """
+        result = await self.session.execute(
+            build_aggregate_statistics_query(id_kurikulum)
+        )
+        row = result.first()
+        if row is None:
+            raise EntityNotFoundException("Kurikulum", str(id_kurikulum))
+        return {"kurikulum": row[0], "statistics": to_statistics(row)}
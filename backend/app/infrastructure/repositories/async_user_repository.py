@@ -0,0 +1,57 @@
+"""
+Async User Repository
+
+Async data access layer for User, used by the login flow.
+Mirrors UserRepository query-for-query on AsyncSession.
+"""
+
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.repositories.async_base_repository import AsyncBaseRepository
+from app.infrastructure.repositories.user_repository import build_role_names_query
+from app.infrastructure.models.user_models import User
+from app.infrastructure.tracing import trace_methods
+
+
+@trace_methods("repository")
+class AsyncUserRepository(AsyncBaseRepository[User]):
+    """
+    Async repository for User operations.
+
+    Extends AsyncBaseRepository with User-specific queries.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize async User repository.
+
+        Args:
+            session: Async database session
+        """
+        super().__init__(User, session)
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """
+        Get user by username.
+
+        Args:
+            username: Username to search for
+
+        Returns:
+            Optional[User]: User if found, None otherwise
+        """
+        return await self.get_one_by_criteria(username=username)
+
+    async def get_role_names(self, user_id: int) -> List[str]:
+        """
+        Get the role names of a user in one single-column query.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List[str]: Role names
+        """
+        result = await self.session.execute(build_role_names_query(user_id))
+        return list(result.scalars())
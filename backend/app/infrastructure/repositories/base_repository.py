@@ -3,13 +3,29 @@ Base Repository
 
 Generic repository implementation following Repository pattern.
 Following Clean Code: DRY, Generic programming, Type safety.
+
+Queries are SQLAlchemy 2.0 select() constructs: their compiled SQL is
+cached per engine, so a repeated call only builds the statement and its
+cache key. Hot lookups in subclasses use lambda_stmt(), which also caches
+the construction itself per call site.
 """
 
-from typing import TypeVar, Generic, Type, List, Optional, Any, Dict
+from typing import TypeVar, Generic, Type, List, Optional, Any, Dict, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import insert, select
 
 from app.infrastructure.database import Base
+from app.infrastructure.pagination import (
+    CountStrategy,
+    Page,
+    build_count_query,
+    build_estimate_query,
+    build_keyset_query,
+    build_page,
+    default_keyset,
+    estimate_count,
+)
+from app.infrastructure.unit_of_work import in_unit_of_work
 from app.domain.exceptions import EntityNotFoundException
 
 # Generic type for database models
@@ -23,6 +39,9 @@ class BaseRepository(Generic[ModelType]):
     Provides common database operations for all entities.
     Following Single Responsibility and DRY principles.
 
+    Writes inside a UnitOfWork only flush; the unit of work commits once
+    at the use-case boundary. Outside one, every write commits.
+
     Type Parameters:
         ModelType: The SQLAlchemy model class
     """
@@ -50,8 +69,7 @@ class BaseRepository(Generic[ModelType]):
         """
         entity = self.model(**kwargs)
         self.session.add(entity)
-        self.session.commit()
-        self.session.refresh(entity)
+        self._save(entity)
         return entity
 
     def get_by_id(self, entity_id: Any) -> Optional[ModelType]:
@@ -64,7 +82,8 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Optional[ModelType]: Entity if found, None otherwise
         """
-        return self.session.query(self.model).get(entity_id)
+        # Identity map first: no SELECT for an entity already in the session
+        return self.session.get(self.model, entity_id)
 
     def get_by_id_or_fail(self, entity_id: Any) -> ModelType:
         """
@@ -91,25 +110,90 @@ class BaseRepository(Generic[ModelType]):
         self,
         skip: int = 0,
         limit: int = 100,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        after: Optional[str] = None,
+        keyset: Optional[Sequence[str]] = None,
+        descending: bool = False
     ) -> List[ModelType]:
         """
         Get all entities with pagination.
 
+        Passing after or keyset switches from OFFSET to keyset pagination
+        (see get_page); skip and order_by are then ignored.
+
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
             order_by: Column name to order by
+            after: Cursor of the previous page (keyset pagination)
+            keyset: Unique ordering columns (default: primary key)
+            descending: Keyset order direction
 
         Returns:
             List[ModelType]: List of entities
         """
-        query = self.session.query(self.model)
+        if after is not None or keyset is not None:
+            return self.get_page(
+                limit=limit,
+                after=after,
+                keyset=keyset,
+                descending=descending
+            ).items
+
+        query = select(self.model)
 
         if order_by:
-            query = query.order_by(order_by)
+            query = query.order_by(getattr(self.model, order_by))
+
+        return list(self.session.scalars(query.offset(skip).limit(limit)).all())
+
+    def get_page(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        keyset: Optional[Sequence[str]] = None,
+        descending: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        count: CountStrategy = CountStrategy.NONE,
+        **criteria
+    ) -> Page:
+        """
+        Get one page of entities using keyset (cursor) pagination.
+
+        Cost of a page does not grow with its position: the query seeks
+        past the cursor on the keyset columns instead of using OFFSET.
+
+        Args:
+            limit: Page size
+            after: Cursor returned as next_cursor by the previous page
+            keyset: Unique ordering columns (default: primary key)
+            descending: Order by keyset descending
+            fields: Columns to select; items are then dictionaries
+            count: How to compute Page.total
+            **criteria: Equality filters
+
+        Returns:
+            Page: Items, next cursor and (optionally) total
 
-        return query.offset(skip).limit(limit).all()
+        Raises:
+            ValidationException: If the cursor or a column name is invalid
+        """
+        keyset = tuple(keyset or default_keyset(self.model))
+        query = build_keyset_query(
+            self.model,
+            keyset,
+            limit,
+            after=after,
+            descending=descending,
+            fields=fields,
+            criteria=criteria
+        )
+        result = self.session.execute(query)
+        rows = result.all() if fields else result.scalars().all()
+
+        page = build_page(rows, keyset, limit, fields)
+        self._apply_count(page, count, criteria)
+        return page
 
     def get_by_criteria(self, **criteria) -> List[ModelType]:
         """
@@ -121,7 +205,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             List[ModelType]: List of matching entities
         """
-        return self.session.query(self.model).filter_by(**criteria).all()
+        return list(self.session.scalars(select(self.model).filter_by(**criteria)).all())
 
     def get_one_by_criteria(self, **criteria) -> Optional[ModelType]:
         """
@@ -133,7 +217,9 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Optional[ModelType]: Entity if found, None otherwise
         """
-        return self.session.query(self.model).filter_by(**criteria).first()
+        return self.session.scalars(
+            select(self.model).filter_by(**criteria).limit(1)
+        ).first()
 
     def exists(self, **criteria) -> bool:
         """
@@ -145,9 +231,9 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             bool: True if entity exists, False otherwise
         """
-        return self.session.query(
-            self.session.query(self.model).filter_by(**criteria).exists()
-        ).scalar()
+        return bool(self.session.scalar(
+            select(select(self.model).filter_by(**criteria).exists())
+        ))
 
     def update(self, entity: ModelType, **update_data) -> ModelType:
         """
@@ -164,8 +250,7 @@ class BaseRepository(Generic[ModelType]):
             if hasattr(entity, key):
                 setattr(entity, key, value)
 
-        self.session.commit()
-        self.session.refresh(entity)
+        self._save(entity)
         return entity
 
     def update_by_id(self, entity_id: Any, **update_data) -> ModelType:
@@ -193,7 +278,7 @@ class BaseRepository(Generic[ModelType]):
             entity: Entity to delete
         """
         self.session.delete(entity)
-        self.session.commit()
+        self._save()
 
     def delete_by_id(self, entity_id: Any) -> None:
         """
@@ -239,24 +324,29 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             int: Number of matching entities
         """
-        query = self.session.query(self.model)
-        if criteria:
-            query = query.filter_by(**criteria)
-        return query.count()
+        return self.session.execute(
+            build_count_query(self.model, criteria)
+        ).scalar_one()
 
     def bulk_create(self, entities: List[Dict[str, Any]]) -> List[ModelType]:
         """
         Create multiple entities in one transaction.
 
+        ORM bulk INSERT ... RETURNING: rows are sent as batched multi-row
+        INSERTs instead of one INSERT per entity.
+
         Args:
             entities: List of entity data dictionaries
 
         Returns:
             List[ModelType]: List of created entities
         """
-        instances = [self.model(**data) for data in entities]
-        self.session.bulk_save_objects(instances, return_defaults=True)
-        self.session.commit()
+        if not entities:
+            return []
+        instances = list(
+            self.session.scalars(insert(self.model).returning(self.model), entities)
+        )
+        self._save()
         return instances
 
     def refresh(self, entity: ModelType) -> ModelType:
@@ -272,6 +362,59 @@ class BaseRepository(Generic[ModelType]):
         self.session.refresh(entity)
         return entity
 
+    def _apply_count(
+        self,
+        page: Page,
+        count: CountStrategy,
+        criteria: Dict[str, Any]
+    ) -> None:
+        """
+        Fill Page.total according to the count strategy (internal helper).
+
+        ESTIMATE falls back to an exact count where the database has no
+        planner estimate.
+
+        Args:
+            page: Page to update
+            count: Count strategy
+            criteria: Filters of the page query
+        """
+        if count == CountStrategy.NONE:
+            return
+
+        if count == CountStrategy.ESTIMATE:
+            estimate = estimate_count(
+                self.session,
+                build_estimate_query(self.model, criteria)
+            )
+            if estimate is not None:
+                page.total = estimate
+                page.total_is_estimate = True
+                return
+
+        page.total = self.session.execute(
+            build_count_query(self.model, criteria)
+        ).scalar_one()
+
+    def _save(self, entity: Optional[ModelType] = None) -> None:
+        """
+        Persist pending changes (internal helper).
+
+        Inside a unit of work this is a flush: server-generated values come
+        back through INSERT/UPDATE ... RETURNING, so no re-SELECT is needed.
+        Outside one, commits and refreshes as before.
+
+        Args:
+            entity: Entity to refresh after commit (optional)
+        """
+        if in_unit_of_work(self.session):
+            self.session.flush()
+            return
+
+        self.session.commit()
+        if entity is not None:
+            self.session.refresh(entity)
+
     def commit(self) -> None:
         """Commit current transaction."""
         self.session.commit()
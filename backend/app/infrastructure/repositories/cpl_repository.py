@@ -5,13 +5,16 @@ Data access layer for CPL (Capaian Pembelajaran Lulusan) entity.
 Following Clean Code: Single Responsibility, Clear naming.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Set
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.infrastructure.repositories.base_repository import BaseRepository
 from app.infrastructure.models.kurikulum_models import CPL, CPLKategori
+from app.infrastructure.tracing import trace_methods
 
 
+@trace_methods("repository")
 class CPLRepository(BaseRepository[CPL]):
     """
     Repository for CPL operations.
@@ -43,14 +46,12 @@ class CPLRepository(BaseRepository[CPL]):
         Returns:
             List[CPL]: List of CPL
         """
-        criteria = {"id_kurikulum": id_kurikulum}
+        query = lambda_stmt(lambda: select(CPL).where(CPL.id_kurikulum == id_kurikulum))
         if active_only:
-            criteria["is_active"] = True
+            query += lambda q: q.where(CPL.is_active == True)
+        query += lambda q: q.order_by(CPL.urutan, CPL.kode_cpl)
 
-        return self.session.query(CPL).filter_by(**criteria).order_by(
-            CPL.urutan,
-            CPL.kode_cpl
-        ).all()
+        return list(self.session.scalars(query).all())
 
     def get_by_kode(
         self,
@@ -67,10 +68,12 @@ class CPLRepository(BaseRepository[CPL]):
         Returns:
             Optional[CPL]: CPL if found, None otherwise
         """
-        return self.get_one_by_criteria(
-            id_kurikulum=id_kurikulum,
-            kode_cpl=kode_cpl
-        )
+        return self.session.scalars(lambda_stmt(
+            lambda: select(CPL).where(
+                CPL.id_kurikulum == id_kurikulum,
+                CPL.kode_cpl == kode_cpl
+            ).limit(1)
+        )).first()
 
     def get_by_kategori(
         self,
@@ -110,6 +113,24 @@ class CPLRepository(BaseRepository[CPL]):
         """
         return self.exists(id_kurikulum=id_kurikulum, kode_cpl=kode_cpl)
 
+    def get_codes(self, id_kurikulum: int) -> Set[str]:
+        """
+        Get every CPL code of a curriculum in one query.
+
+        Lets bulk imports check duplicates in memory instead of calling
+        check_duplicate_code once per row.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Set[str]: Existing CPL codes (active and inactive)
+        """
+        rows = self.session.query(CPL.kode_cpl).filter(
+            CPL.id_kurikulum == id_kurikulum
+        )
+        return {kode_cpl for (kode_cpl,) in rows}
+
     def get_next_urutan(self, id_kurikulum: int) -> int:
         """
         Get next urutan number for CPL in curriculum.
@@ -0,0 +1,374 @@
+"""
+Ketercapaian Repository
+
+Data access layer for CPMK/CPL achievement (FR-008.4).
+Following Clean Code: Single Responsibility, Constant round trips per snapshot.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.infrastructure.importing import CopyLoader
+from app.infrastructure.models.kurikulum_models import CPL
+from app.infrastructure.models.master_models import Mahasiswa
+from app.infrastructure.models.penilaian_models import (
+    DEFAULT_BATAS_KELULUSAN_CPMK,
+    AmbangBatas,
+    CPMK,
+    Enrollment,
+    Kelas,
+    KetercapaianCPMK,
+    KomponenPenilaian,
+    NilaiDetail,
+    RelasiCPMKCPL,
+    StatusEnrollment,
+    TemplatePenilaian,
+)
+from app.infrastructure.repositories.base_repository import BaseRepository
+from app.infrastructure.tracing import trace_methods
+
+# numpy is imported on first use rather than at import time, keeping it out
+# of the worker cold start (IMPORT_TIME_BUDGET_MS)
+if TYPE_CHECKING:
+    import numpy as np
+
+
+KETERCAPAIAN_COLUMNS = ("id_enrollment", "id_cpmk", "nilai_cpmk", "status_tercapai")
+
+
+@dataclass
+class PenilaianSnapshot:
+    """
+    Grades of a class or cohort as flat NumPy columns.
+
+    Loaded with a fixed number of queries whatever the number of students;
+    KetercapaianEngine turns it into dense per-class matrices.
+
+    Attributes:
+        enrollment_ids: (E,) enrollments, dropped ones excluded
+        enrollment_kelas: (E,) class of each enrollment
+        enrollment_student: (E,) index into nims
+        enrollment_current: (E,) False for an earlier attempt at a course
+            the student retook; only used for the CPL roll-up
+        nims: (S,) students, sorted
+        komponen_ids: (K,) assessment components mapped to a CPMK
+        komponen_kelas: (K,) class of each component
+        komponen_cpmk: (K,) CPMK assessed by each component
+        komponen_bobot: (K,) component weight (bobot_realisasi, else template bobot)
+        nilai_enrollment: (N,) enrollment of each score
+        nilai_komponen: (N,) component of each score
+        nilai_persen: (N,) nilai_mentah / nilai_maksimal * 100
+        cpmk_ids: (C,) CPMK assessed by the components, sorted
+        cpmk_batas: (C,) passing threshold of each CPMK
+        cpl_ids: (L,) active CPL the CPMK contribute to, sorted
+        relasi_cpmk: (R,) CPMK of each CPMK → CPL contribution
+        relasi_cpl: (R,) CPL of each contribution
+        relasi_bobot: (R,) bobot_kontribusi of each contribution
+    """
+
+    enrollment_ids: "np.ndarray"
+    enrollment_kelas: "np.ndarray"
+    enrollment_student: "np.ndarray"
+    enrollment_current: "np.ndarray"
+    nims: "np.ndarray"
+    komponen_ids: "np.ndarray"
+    komponen_kelas: "np.ndarray"
+    komponen_cpmk: "np.ndarray"
+    komponen_bobot: "np.ndarray"
+    nilai_enrollment: "np.ndarray"
+    nilai_komponen: "np.ndarray"
+    nilai_persen: "np.ndarray"
+    cpmk_ids: "np.ndarray"
+    cpmk_batas: "np.ndarray"
+    cpl_ids: "np.ndarray"
+    relasi_cpmk: "np.ndarray"
+    relasi_cpl: "np.ndarray"
+    relasi_bobot: "np.ndarray"
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the scope has no enrollments."""
+        return len(self.enrollment_ids) == 0
+
+
+def kelas_criteria(id_kelas: int) -> List[ColumnElement]:
+    """
+    Enrollment criteria selecting one class.
+
+    Args:
+        id_kelas: Class ID
+
+    Returns:
+        List[ColumnElement]: WHERE criteria on enrollment
+    """
+    return [Enrollment.id_kelas == id_kelas]
+
+
+def angkatan_criteria(id_kurikulum: int, angkatan: str) -> List[ColumnElement]:
+    """
+    Enrollment criteria selecting every enrollment of a cohort.
+
+    Args:
+        id_kurikulum: Curriculum ID of the students
+        angkatan: Cohort year, e.g. "2024"
+
+    Returns:
+        List[ColumnElement]: WHERE criteria on enrollment
+    """
+    cohort = select(Mahasiswa.nim).where(
+        Mahasiswa.id_kurikulum == id_kurikulum,
+        Mahasiswa.angkatan == angkatan
+    )
+    return [Enrollment.nim.in_(cohort)]
+
+
+def build_enrollment_query(criteria: Sequence[ColumnElement]) -> Select:
+    """
+    Enrollments in scope with the course they belong to.
+
+    Returns:
+        Select: (id_enrollment, id_kelas, nim, kode_mk) ordered by id_enrollment
+    """
+    return (
+        select(Enrollment.id_enrollment, Enrollment.id_kelas, Enrollment.nim, Kelas.kode_mk)
+        .join(Kelas, Kelas.id_kelas == Enrollment.id_kelas)
+        .where(Enrollment.status != StatusEnrollment.DROP, *criteria)
+        .order_by(Enrollment.id_enrollment)
+    )
+
+
+def build_komponen_query(criteria: Sequence[ColumnElement]) -> Select:
+    """
+    Weighted components of the classes in scope, each mapped to one CPMK.
+
+    Returns:
+        Select: (id_komponen, id_kelas, id_cpmk, bobot)
+    """
+    kelas_in_scope = select(Enrollment.id_kelas).where(*criteria)
+    bobot = func.coalesce(KomponenPenilaian.bobot_realisasi, TemplatePenilaian.bobot)
+    return (
+        select(
+            KomponenPenilaian.id_komponen,
+            KomponenPenilaian.id_kelas,
+            TemplatePenilaian.id_cpmk,
+            cast(bobot, Float),
+        )
+        .join(TemplatePenilaian, TemplatePenilaian.id_template == KomponenPenilaian.id_template)
+        .where(
+            KomponenPenilaian.id_kelas.in_(kelas_in_scope),
+            TemplatePenilaian.id_cpmk.isnot(None),
+            bobot > 0,
+        )
+    )
+
+
+def build_nilai_query(criteria: Sequence[ColumnElement]) -> Select:
+    """
+    Scores in scope as a percentage of the component maximum.
+
+    Returns:
+        Select: (id_enrollment, id_komponen, persen)
+    """
+    persen = cast(
+        NilaiDetail.nilai_mentah * 100 / KomponenPenilaian.nilai_maksimal,
+        Float
+    )
+    return (
+        select(NilaiDetail.id_enrollment, NilaiDetail.id_komponen, persen)
+        .join(Enrollment, Enrollment.id_enrollment == NilaiDetail.id_enrollment)
+        .join(KomponenPenilaian, KomponenPenilaian.id_komponen == NilaiDetail.id_komponen)
+        .where(
+            Enrollment.status != StatusEnrollment.DROP,
+            NilaiDetail.nilai_mentah.isnot(None),
+            KomponenPenilaian.nilai_maksimal > 0,
+            *criteria
+        )
+    )
+
+
+def build_cpmk_query(criteria: Sequence[ColumnElement]) -> Select:
+    """
+    CPMK assessed in scope with their passing threshold.
+
+    An RPS without ambang_batas uses the schema default; if it has
+    several, the strictest one applies.
+
+    Returns:
+        Select: (id_cpmk, batas_kelulusan_cpmk) ordered by id_cpmk
+    """
+    batas = func.coalesce(
+        func.max(AmbangBatas.batas_kelulusan_cpmk),
+        DEFAULT_BATAS_KELULUSAN_CPMK
+    )
+    return (
+        select(CPMK.id_cpmk, cast(batas, Float))
+        .outerjoin(AmbangBatas, AmbangBatas.id_rps == CPMK.id_rps)
+        .where(CPMK.id_cpmk.in_(_assessed_cpmk(criteria)))
+        .group_by(CPMK.id_cpmk)
+        .order_by(CPMK.id_cpmk)
+    )
+
+
+def build_relasi_query(criteria: Sequence[ColumnElement]) -> Select:
+    """
+    Contributions of the CPMK in scope to active CPL.
+
+    Returns:
+        Select: (id_cpmk, id_cpl, bobot_kontribusi)
+    """
+    return (
+        select(
+            RelasiCPMKCPL.id_cpmk,
+            RelasiCPMKCPL.id_cpl,
+            cast(RelasiCPMKCPL.bobot_kontribusi, Float),
+        )
+        .join(CPL, CPL.id_cpl == RelasiCPMKCPL.id_cpl)
+        .where(
+            CPL.is_active == True,
+            RelasiCPMKCPL.id_cpmk.in_(_assessed_cpmk(criteria))
+        )
+    )
+
+
+def _assessed_cpmk(criteria: Sequence[ColumnElement]) -> Select:
+    """CPMK that some component of a class in scope assesses."""
+    kelas_in_scope = select(Enrollment.id_kelas).where(*criteria)
+    return (
+        select(TemplatePenilaian.id_cpmk)
+        .join(KomponenPenilaian, KomponenPenilaian.id_template == TemplatePenilaian.id_template)
+        .where(KomponenPenilaian.id_kelas.in_(kelas_in_scope))
+    )
+
+
+def _column(rows: Sequence[Sequence[Any]], index: int, dtype: Any) -> "np.ndarray":
+    """One result column as a NumPy array."""
+    import numpy as np
+
+    return np.fromiter((row[index] for row in rows), dtype=dtype, count=len(rows))
+
+
+@trace_methods("repository")
+class KetercapaianRepository(BaseRepository[KetercapaianCPMK]):
+    """
+    Repository for CPMK achievement.
+
+    Reads grades as a PenilaianSnapshot (five queries per class or cohort)
+    and writes achievements back with one COPY + INSERT ... ON CONFLICT.
+    """
+
+    def __init__(self, session: Session):
+        """
+        Initialize Ketercapaian repository.
+
+        Args:
+            session: Database session
+        """
+        super().__init__(KetercapaianCPMK, session)
+
+    def get_kelas(self, id_kelas: int) -> Optional[Kelas]:
+        """
+        Get class by ID.
+
+        Args:
+            id_kelas: Class ID
+
+        Returns:
+            Optional[Kelas]: Class if found
+        """
+        return self.session.get(Kelas, id_kelas)
+
+    def load_kelas(self, id_kelas: int) -> PenilaianSnapshot:
+        """
+        Load the grades of one class.
+
+        Args:
+            id_kelas: Class ID
+
+        Returns:
+            PenilaianSnapshot: Grades of the class
+        """
+        return self._load(kelas_criteria(id_kelas))
+
+    def load_angkatan(self, id_kurikulum: int, angkatan: str) -> PenilaianSnapshot:
+        """
+        Load the grades of every class taken by a cohort.
+
+        Args:
+            id_kurikulum: Curriculum ID of the students
+            angkatan: Cohort year
+
+        Returns:
+            PenilaianSnapshot: Grades of the cohort
+        """
+        return self._load(angkatan_criteria(id_kurikulum, angkatan))
+
+    def upsert(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Write achievements in one bulk upsert.
+
+        Args:
+            rows: Dictionaries with KETERCAPAIAN_COLUMNS
+
+        Returns:
+            int: Rows inserted or updated
+        """
+        loader = CopyLoader(
+            self.session,
+            KetercapaianCPMK,
+            KETERCAPAIAN_COLUMNS,
+            conflict_columns=("id_enrollment", "id_cpmk"),
+            update_columns=("nilai_cpmk", "status_tercapai"),
+        )
+        written = len(loader.load(rows))
+        self._save()
+        return written
+
+    def _load(self, criteria: Sequence[ColumnElement]) -> PenilaianSnapshot:
+        """Run the snapshot queries for the given enrollment criteria (internal helper)."""
+        import numpy as np
+
+        execute = self.session.execute
+        enrollments = execute(build_enrollment_query(criteria)).all()
+        komponen = execute(build_komponen_query(criteria)).all()
+        nilai = execute(build_nilai_query(criteria)).all()
+        cpmk = execute(build_cpmk_query(criteria)).all()
+        relasi = execute(build_relasi_query(criteria)).all()
+
+        nims, student = np.unique(
+            np.array([row[2] for row in enrollments], dtype=object).astype(str),
+            return_inverse=True
+        )
+
+        # Latest attempt per (student, course); rows come ordered by id_enrollment
+        latest: Dict[Any, int] = {}
+        for index, (_, _, nim, kode_mk) in enumerate(enrollments):
+            latest[(nim, kode_mk)] = index
+        current = np.zeros(len(enrollments), dtype=bool)
+        current[list(latest.values())] = True
+
+        relasi_cpl = _column(relasi, 1, np.int64)
+        return PenilaianSnapshot(
+            enrollment_ids=_column(enrollments, 0, np.int64),
+            enrollment_kelas=_column(enrollments, 1, np.int64),
+            enrollment_student=student.astype(np.int64),
+            enrollment_current=current,
+            nims=nims,
+            komponen_ids=_column(komponen, 0, np.int64),
+            komponen_kelas=_column(komponen, 1, np.int64),
+            komponen_cpmk=_column(komponen, 2, np.int64),
+            komponen_bobot=_column(komponen, 3, np.float64),
+            nilai_enrollment=_column(nilai, 0, np.int64),
+            nilai_komponen=_column(nilai, 1, np.int64),
+            nilai_persen=_column(nilai, 2, np.float64),
+            cpmk_ids=_column(cpmk, 0, np.int64),
+            cpmk_batas=_column(cpmk, 1, np.float64),
+            cpl_ids=np.unique(relasi_cpl),
+            relasi_cpmk=_column(relasi, 0, np.int64),
+            relasi_cpl=relasi_cpl,
+            relasi_bobot=_column(relasi, 2, np.float64),
+        )
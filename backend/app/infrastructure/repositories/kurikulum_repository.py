@@ -5,14 +5,61 @@ Data access layer for Kurikulum entity.
 Following Clean Code: Single Responsibility, Clear intent.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import func, lambda_stmt, select, update
+from sqlalchemy.sql import Select
+from sqlalchemy.exc import IntegrityError
 
 from app.infrastructure.repositories.base_repository import BaseRepository
+from app.infrastructure.pagination import CountStrategy, Page
 from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.infrastructure.statistics import KurikulumStatisticsProvider
+from app.domain.exceptions import EntityNotFoundException
+from app.infrastructure.tracing import trace_methods
 
 
+# Partial unique index enforcing one primary curriculum per prodi (BR-K08)
+PRIMARY_INDEX_NAME = "idx_kurikulum_primary"
+
+# Ordering of curriculum listings; id_kurikulum makes it unique
+LIST_KEYSET = ("tahun_berlaku", "id_kurikulum")
+
+
+def is_primary_conflict(error: IntegrityError) -> bool:
+    """
+    Check whether an IntegrityError comes from the one-primary-per-prodi index.
+
+    Args:
+        error: Error raised on flush/commit
+
+    Returns:
+        bool: True if idx_kurikulum_primary was violated
+    """
+    return PRIMARY_INDEX_NAME in str(error.orig)
+
+
+def build_list_version_query(**criteria) -> Select:
+    """
+    Build SELECT max(updated_at), count(*) over the filtered curricula.
+
+    Any insert, update or delete in the filtered set changes the result,
+    which makes it a cheap version stamp for list responses.
+
+    Args:
+        **criteria: Equality filters (e.g. id_prodi, status)
+
+    Returns:
+        Select: Version query
+    """
+    query = select(func.max(Kurikulum.updated_at), func.count()).select_from(Kurikulum)
+    if criteria:
+        query = query.filter_by(**criteria)
+    return query
+
+
+@trace_methods("repository")
 class KurikulumRepository(BaseRepository[Kurikulum]):
     """
     Repository for Kurikulum operations.
@@ -40,10 +87,12 @@ class KurikulumRepository(BaseRepository[Kurikulum]):
         Returns:
             Optional[Kurikulum]: Curriculum if found, None otherwise
         """
-        return self.get_one_by_criteria(
-            id_prodi=id_prodi,
-            kode_kurikulum=kode_kurikulum
-        )
+        return self.session.scalars(lambda_stmt(
+            lambda: select(Kurikulum).where(
+                Kurikulum.id_prodi == id_prodi,
+                Kurikulum.kode_kurikulum == kode_kurikulum
+            ).limit(1)
+        )).first()
 
     def get_active_curricula(self, id_prodi: str) -> List[Kurikulum]:
         """
@@ -55,12 +104,12 @@ class KurikulumRepository(BaseRepository[Kurikulum]):
         Returns:
             List[Kurikulum]: List of active curricula
         """
-        return self.session.query(Kurikulum).filter(
-            and_(
+        return list(self.session.scalars(lambda_stmt(
+            lambda: select(Kurikulum).where(
                 Kurikulum.id_prodi == id_prodi,
                 Kurikulum.status == KurikulumStatus.AKTIF
             )
-        ).all()
+        )).all())
 
     def get_primary_curriculum(self, id_prodi: str) -> Optional[Kurikulum]:
         """
@@ -78,6 +127,91 @@ class KurikulumRepository(BaseRepository[Kurikulum]):
             status=KurikulumStatus.AKTIF
         )
 
+    def lock_for_update(self, id_kurikulum: int) -> Kurikulum:
+        """
+        Lock a curriculum row for the rest of the transaction.
+
+        SELECT ... FOR UPDATE serializes writers that validate against
+        data of the whole curriculum (e.g. the prerequisite graph); the
+        row is reloaded so the caller sees its committed state.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Kurikulum: Locked curriculum
+
+        Raises:
+            EntityNotFoundException: If curriculum not found
+        """
+        kurikulum = self.session.scalars(
+            select(Kurikulum)
+            .where(Kurikulum.id_kurikulum == id_kurikulum)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).first()
+        if kurikulum is None:
+            raise EntityNotFoundException("Kurikulum", str(id_kurikulum))
+        return kurikulum
+
+    def unset_primary(self, id_prodi: str) -> List[int]:
+        """
+        Clear the primary flag of every curriculum in a program.
+
+        Runs as one set-based UPDATE in the current transaction, so the
+        switch to a new primary curriculum is atomic (BR-K08).
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            List[int]: IDs of the curricula that were primary
+        """
+        result = self.session.execute(
+            update(Kurikulum)
+            .where(
+                Kurikulum.id_prodi == id_prodi,
+                Kurikulum.is_primary == True
+            )
+            .values(is_primary=False)
+            .returning(Kurikulum.id_kurikulum)
+        )
+        return list(result.scalars().all())
+
+    def get_newest_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        count: CountStrategy = CountStrategy.NONE,
+        **criteria
+    ) -> Page:
+        """
+        Get one page of curricula, newest first.
+
+        Keyset pagination on (tahun_berlaku, id_kurikulum), served by
+        idx_kurikulum_keyset / idx_kurikulum_prodi_keyset.
+
+        Args:
+            limit: Page size
+            after: Cursor of the previous page (optional)
+            fields: Columns to select; items are dictionaries when given
+            count: How to compute the page total
+            **criteria: Equality filters (e.g. id_prodi, status)
+
+        Returns:
+            Page: Curricula page
+        """
+        return self.get_page(
+            limit=limit,
+            after=after,
+            keyset=LIST_KEYSET,
+            descending=True,
+            fields=fields,
+            count=count,
+            **criteria
+        )
+
     def get_by_status(self, status: KurikulumStatus) -> List[Kurikulum]:
         """
         Get curricula by status.
@@ -120,49 +254,83 @@ class KurikulumRepository(BaseRepository[Kurikulum]):
         Returns:
             List[Kurikulum]: Curricula within the year range
         """
-        return self.session.query(Kurikulum).filter(
-            and_(
+        return list(self.session.scalars(
+            select(Kurikulum)
+            .where(
                 Kurikulum.id_prodi == id_prodi,
                 Kurikulum.tahun_berlaku >= year_from,
                 Kurikulum.tahun_berlaku <= year_to
             )
-        ).order_by(Kurikulum.tahun_berlaku.desc()).all()
+            .order_by(Kurikulum.tahun_berlaku.desc())
+        ).all())
+
+    def get_updated_at(self, id_kurikulum: int) -> Optional[datetime]:
+        """
+        Get only the last-modified timestamp of a curriculum.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Optional[datetime]: updated_at, None if curriculum not found
+        """
+        return self.session.execute(
+            select(Kurikulum.updated_at).where(Kurikulum.id_kurikulum == id_kurikulum)
+        ).scalar_one_or_none()
+
+    def get_primary_version(self, id_prodi: str) -> Tuple[Optional[int], Optional[datetime]]:
+        """
+        Get (id_kurikulum, updated_at) of the primary curriculum of a program.
+
+        Args:
+            id_prodi: Program study ID
+
+        Returns:
+            Tuple[Optional[int], Optional[datetime]]: (None, None) without one
+        """
+        row = self.session.execute(
+            select(Kurikulum.id_kurikulum, Kurikulum.updated_at)
+            .where(
+                Kurikulum.id_prodi == id_prodi,
+                Kurikulum.is_primary == True,
+                Kurikulum.status == KurikulumStatus.AKTIF
+            )
+            .limit(1)
+        ).first()
+        return (row.id_kurikulum, row.updated_at) if row is not None else (None, None)
+
+    def get_list_version(self, **criteria) -> Tuple[Optional[datetime], int]:
+        """
+        Get (max(updated_at), count) of the filtered curricula.
+
+        Args:
+            **criteria: Equality filters
+
+        Returns:
+            Tuple[Optional[datetime], int]: Latest change and row count
+        """
+        latest, total = self.session.execute(build_list_version_query(**criteria)).one()
+        return latest, total
 
     def get_with_statistics(self, id_kurikulum: int) -> dict:
         """
         Get curriculum with statistics (CPL count, MK count, student count).
 
+        One round trip: reads mv_statistik_kurikulum, or a single
+        aggregated query when the view has no row for the curriculum.
+
         Args:
             id_kurikulum: Curriculum ID
 
         Returns:
             dict: Curriculum data with statistics
+
+        Raises:
+            EntityNotFoundException: If curriculum not found
         """
-        from app.infrastructure.models.kurikulum_models import CPL, MataKuliah
-        from app.infrastructure.models.master_models import Mahasiswa
-
-        kurikulum = self.get_by_id_or_fail(id_kurikulum)
-
-        # Count related entities
-        cpl_count = self.session.query(CPL).filter(
-            CPL.id_kurikulum == id_kurikulum,
-            CPL.is_active == True
-        ).count()
-
-        mk_count = self.session.query(MataKuliah).filter(
-            MataKuliah.id_kurikulum == id_kurikulum,
-            MataKuliah.is_active == True
-        ).count()
-
-        student_count = self.session.query(Mahasiswa).filter(
-            Mahasiswa.id_kurikulum == id_kurikulum
-        ).count()
-
-        return {
-            "kurikulum": kurikulum,
-            "statistics": {
-                "total_cpl": cpl_count,
-                "total_matakuliah": mk_count,
-                "total_mahasiswa": student_count
-            }
-        }
+        result = KurikulumStatisticsProvider(self.session).get_with_statistics(
+            id_kurikulum
+        )
+        if result is None:
+            raise EntityNotFoundException("Kurikulum", str(id_kurikulum))
+        return result
@@ -5,14 +5,99 @@ Data access layer for MataKuliah (Course) entity.
 Following Clean Code: Single Responsibility, Type safety.
 """
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import Select
 
 from app.infrastructure.repositories.base_repository import BaseRepository
-from app.infrastructure.models.kurikulum_models import MataKuliah, JenisMK
+from app.infrastructure.models.kurikulum_models import (
+    MataKuliah,
+    JenisMK,
+    PrasyaratMK,
+    TipePrasyarat,
+)
+from app.domain.entities import PrerequisiteGraph, TipePrasyarat as TipePrasyaratEntity
+from app.infrastructure.tracing import trace_methods
 
 
+# Unique constraint on (kode_mk, id_kurikulum, kode_mk_prasyarat)
+PREREQUISITE_UNIQUE_NAME = "uq_mk_prasyarat"
+
+
+def is_prerequisite_conflict(error: IntegrityError) -> bool:
+    """
+    Check whether an IntegrityError comes from a duplicate prerequisite edge.
+
+    PostgreSQL names the violated constraint; SQLite lists its columns.
+
+    Args:
+        error: Error raised on flush/commit
+
+    Returns:
+        bool: True if uq_mk_prasyarat was violated
+    """
+    message = str(error.orig)
+    return (
+        PREREQUISITE_UNIQUE_NAME in message
+        or "prasyarat_mk.kode_mk_prasyarat" in message
+    )
+
+
+def build_prerequisite_graph_query(id_kurikulum: int) -> Select:
+    """
+    Active courses of a curriculum outer-joined with their prerequisites.
+
+    Args:
+        id_kurikulum: Curriculum ID
+
+    Returns:
+        Select: (kode_mk, semester, kode_mk_prasyarat, tipe_prasyarat);
+            the prerequisite columns are NULL for courses without any
+    """
+    return (
+        select(
+            MataKuliah.kode_mk,
+            MataKuliah.semester,
+            PrasyaratMK.kode_mk_prasyarat,
+            PrasyaratMK.tipe_prasyarat,
+        )
+        .outerjoin(
+            PrasyaratMK,
+            and_(
+                PrasyaratMK.kode_mk == MataKuliah.kode_mk,
+                PrasyaratMK.id_kurikulum == MataKuliah.id_kurikulum
+            )
+        )
+        .where(
+            MataKuliah.id_kurikulum == id_kurikulum,
+            MataKuliah.is_active == True
+        )
+    )
+
+
+def to_prerequisite_graph(id_kurikulum: int, rows) -> PrerequisiteGraph:
+    """
+    Build the domain graph from build_prerequisite_graph_query rows.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        rows: Query result rows
+
+    Returns:
+        PrerequisiteGraph: Graph of active courses
+    """
+    semesters = {}
+    edges = []
+    for kode_mk, semester, kode_prasyarat, tipe in rows:
+        semesters[kode_mk] = semester
+        if kode_prasyarat is not None:
+            edges.append((kode_mk, kode_prasyarat, TipePrasyaratEntity(tipe.value)))
+    return PrerequisiteGraph(id_kurikulum, semesters, edges)
+
+
+@trace_methods("repository")
 class MataKuliahRepository(BaseRepository[MataKuliah]):
     """
     Repository for MataKuliah operations.
@@ -44,12 +129,12 @@ class MataKuliahRepository(BaseRepository[MataKuliah]):
         Returns:
             Optional[MataKuliah]: MataKuliah if found, None otherwise
         """
-        return self.session.query(MataKuliah).filter(
-            and_(
+        return self.session.scalars(lambda_stmt(
+            lambda: select(MataKuliah).where(
                 MataKuliah.kode_mk == kode_mk,
                 MataKuliah.id_kurikulum == id_kurikulum
             )
-        ).first()
+        )).first()
 
     def get_by_kurikulum(
         self,
@@ -66,14 +151,14 @@ class MataKuliahRepository(BaseRepository[MataKuliah]):
         Returns:
             List[MataKuliah]: List of courses
         """
-        criteria = {"id_kurikulum": id_kurikulum}
+        query = lambda_stmt(
+            lambda: select(MataKuliah).where(MataKuliah.id_kurikulum == id_kurikulum)
+        )
         if active_only:
-            criteria["is_active"] = True
+            query += lambda q: q.where(MataKuliah.is_active == True)
+        query += lambda q: q.order_by(MataKuliah.semester, MataKuliah.kode_mk)
 
-        return self.session.query(MataKuliah).filter_by(**criteria).order_by(
-            MataKuliah.semester,
-            MataKuliah.kode_mk
-        ).all()
+        return list(self.session.scalars(query).all())
 
     def get_by_semester(
         self,
@@ -136,6 +221,24 @@ class MataKuliahRepository(BaseRepository[MataKuliah]):
         """
         return self.get_by_composite_key(kode_mk, id_kurikulum) is not None
 
+    def get_codes(self, id_kurikulum: int) -> Set[str]:
+        """
+        Get every course code of a curriculum in one query.
+
+        Lets bulk imports check duplicates in memory instead of calling
+        check_duplicate_code once per row.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Set[str]: Existing course codes (active and inactive)
+        """
+        rows = self.session.query(MataKuliah.kode_mk).filter(
+            MataKuliah.id_kurikulum == id_kurikulum
+        )
+        return {kode_mk for (kode_mk,) in rows}
+
     def calculate_total_sks(self, id_kurikulum: int) -> int:
         """
         Calculate total SKS in a curriculum.
@@ -213,3 +316,103 @@ class MataKuliahRepository(BaseRepository[MataKuliah]):
             )
 
         return self.soft_delete(mk)
+
+    def get_prerequisite_graph(self, id_kurikulum: int) -> PrerequisiteGraph:
+        """
+        Load the prerequisite graph of a curriculum in one query.
+
+        Only active courses are vertices; prerequisites pointing at a
+        deactivated course are left out.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            PrerequisiteGraph: In-memory graph
+        """
+        rows = self.session.execute(build_prerequisite_graph_query(id_kurikulum))
+        return to_prerequisite_graph(id_kurikulum, rows)
+
+    def get_prerequisite(
+        self,
+        kode_mk: str,
+        id_kurikulum: int,
+        kode_mk_prasyarat: str
+    ) -> Optional[PrasyaratMK]:
+        """
+        Get one prerequisite edge.
+
+        Args:
+            kode_mk: Course code
+            id_kurikulum: Curriculum ID
+            kode_mk_prasyarat: Prerequisite course code
+
+        Returns:
+            Optional[PrasyaratMK]: Edge if it exists
+        """
+        return self.session.query(PrasyaratMK).filter(
+            and_(
+                PrasyaratMK.kode_mk == kode_mk,
+                PrasyaratMK.id_kurikulum == id_kurikulum,
+                PrasyaratMK.kode_mk_prasyarat == kode_mk_prasyarat
+            )
+        ).first()
+
+    def add_prerequisite(
+        self,
+        kode_mk: str,
+        id_kurikulum: int,
+        kode_mk_prasyarat: str,
+        tipe_prasyarat: TipePrasyarat = TipePrasyarat.WAJIB
+    ) -> PrasyaratMK:
+        """
+        Store a prerequisite edge.
+
+        Callers validate the edge against a graph loaded in the same
+        transaction first (PrerequisiteGraph.check_new_prerequisite).
+
+        Args:
+            kode_mk: Course code
+            id_kurikulum: Curriculum ID
+            kode_mk_prasyarat: Prerequisite course code
+            tipe_prasyarat: Prerequisite type
+
+        Returns:
+            PrasyaratMK: Created edge
+        """
+        prasyarat = PrasyaratMK(
+            kode_mk=kode_mk,
+            id_kurikulum=id_kurikulum,
+            kode_mk_prasyarat=kode_mk_prasyarat,
+            tipe_prasyarat=tipe_prasyarat,
+        )
+        self.session.add(prasyarat)
+        self._save(prasyarat)
+        return prasyarat
+
+    def remove_prerequisite(
+        self,
+        kode_mk: str,
+        id_kurikulum: int,
+        kode_mk_prasyarat: str
+    ) -> bool:
+        """
+        Delete a prerequisite edge.
+
+        Args:
+            kode_mk: Course code
+            id_kurikulum: Curriculum ID
+            kode_mk_prasyarat: Prerequisite course code
+
+        Returns:
+            bool: True if the edge existed
+        """
+        result = self.session.execute(
+            delete(PrasyaratMK).where(
+                PrasyaratMK.kode_mk == kode_mk,
+                PrasyaratMK.id_kurikulum == id_kurikulum,
+                PrasyaratMK.kode_mk_prasyarat == kode_mk_prasyarat
+            )
+        )
+        self._save()
+        return result.rowcount > 0
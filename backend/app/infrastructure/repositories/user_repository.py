@@ -6,12 +6,33 @@ Following Clean Code: Security best practices, Clear separation.
 """
 
 from typing import Optional, List
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import Select
 
 from app.infrastructure.repositories.base_repository import BaseRepository
 from app.infrastructure.models.user_models import User, Role, UserRole, UserType
+from app.infrastructure.tracing import trace_methods
 
 
+def build_role_names_query(user_id: int) -> Select:
+    """
+    Role names of a user, without loading User or UserRole rows.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Select: One role_name per row
+    """
+    return (
+        select(Role.role_name)
+        .join(UserRole, UserRole.id_role == Role.id_role)
+        .where(UserRole.id_user == user_id)
+    )
+
+
+@trace_methods("repository")
 class UserRepository(BaseRepository[User]):
     """
     Repository for User operations.
@@ -66,6 +87,21 @@ class UserRepository(BaseRepository[User]):
             joinedload(User.roles).joinedload(UserRole.role)
         ).filter(User.id_user == user_id).first()
 
+    def get_role_names(self, user_id: int) -> List[str]:
+        """
+        Get the role names of a user in one single-column query.
+
+        Used to compile permissions; cheaper than get_with_roles when
+        only the names are needed.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List[str]: Role names
+        """
+        return list(self.session.execute(build_role_names_query(user_id)).scalars())
+
     def check_username_exists(self, username: str) -> bool:
         """
         Check if username already exists.
@@ -139,6 +175,7 @@ class UserRepository(BaseRepository[User]):
         return self.update_by_id(user_id, is_active=False)
 
 
+@trace_methods("repository")
 class RoleRepository(BaseRepository[Role]):
     """
     Repository for Role operations.
@@ -0,0 +1,317 @@
+"""
+Slow Query Log
+
+Statements slower than a threshold, kept in a ring buffer with the
+calling repository method and a sampled EXPLAIN (ANALYZE, BUFFERS) plan.
+Following Clean Code: Single Responsibility, Nothing slow on the request path.
+
+Timing costs two perf_counter_ns calls per statement. Everything else
+(caller lookup, parameter shape, EXPLAIN) only happens for statements
+over the threshold, and EXPLAIN runs on a separate pooled connection in
+a background thread.
+"""
+
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.infrastructure.query_stats import fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Execution option that keeps the EXPLAIN connection out of the log
+_EXPLAIN_OPTION = "slow_query_explain"
+# Frames of these modules are never reported as the caller
+_INTERNAL_MODULES = ("app.infrastructure.slow_queries", "app.infrastructure.query_stats")
+# EXPLAIN ANALYZE executes the statement; only plain reads are explained
+_READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_WRITES = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+SHARE)\b", re.IGNORECASE)
+_ASYNCPG_PLACEHOLDER = re.compile(r"\$(\d+)")
+
+
+@dataclass
+class SlowQuery:
+    """
+    One statement that crossed the slow-query threshold.
+
+    Attributes:
+        statement: Normalized SQL (see query_stats.fingerprint)
+        parameters: Bound-parameter shape, names and types only, never values
+        duration_ms: Execution time
+        caller: Repository / use case method that issued the statement
+        recorded_at: When the statement finished (UTC)
+        executemany: Whether the statement ran once per parameter set
+        plan: EXPLAIN (ANALYZE, BUFFERS) output, if sampled and captured
+    """
+
+    statement: str
+    parameters: Any
+    duration_ms: float
+    caller: Optional[str]
+    recorded_at: datetime = field(default_factory=datetime.utcnow)
+    executemany: bool = False
+    plan: Optional[str] = None
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """
+    Names and types of bound parameters, without their values.
+
+    Args:
+        parameters: DBAPI parameters (dict, sequence or list of either)
+
+    Returns:
+        Any: {name: type}, [type, ...] or {"rows": n, "shape": ...}
+    """
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return {"rows": len(parameters), "shape": parameter_shape(parameters[0])}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def find_caller() -> Optional[str]:
+    """
+    Application method that issued the current statement.
+
+    Repository frames win over any other app frame. Statements of async
+    sessions run in a greenlet whose stack ends at SQLAlchemy, so they
+    may report None.
+
+    Returns:
+        Optional[str]: "Class.method" or "module.function", None if not found
+    """
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("app.") and not module.startswith(_INTERNAL_MODULES):
+            owner = frame.f_locals.get("self")
+            name = (
+                f"{type(owner).__name__}.{frame.f_code.co_name}"
+                if owner is not None
+                else f"{module}.{frame.f_code.co_name}"
+            )
+            if module.startswith("app.infrastructure.repositories"):
+                return name
+            fallback = fallback or name
+        frame = frame.f_back
+    return fallback
+
+
+def to_pyformat(statement: str, parameters: Any) -> Tuple[str, Any]:
+    """
+    Rewrite an asyncpg ($1) statement for psycopg2 (%s).
+
+    Args:
+        statement: SQL with $n placeholders
+        parameters: Positional parameters
+
+    Returns:
+        Tuple[str, Any]: (SQL with %s placeholders, parameters in order)
+    """
+    ordered: List[Any] = []
+
+    def replace(match: re.Match) -> str:
+        ordered.append(parameters[int(match.group(1)) - 1])
+        return "%s"
+
+    converted = _ASYNCPG_PLACEHOLDER.sub(replace, statement.replace("%", "%%"))
+    return converted, tuple(ordered)
+
+
+class SlowQueryLog:
+    """
+    Ring buffer of slow statements with sampled plans.
+
+    Per process: with several workers each keeps its own buffer.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 500.0,
+        capacity: int = 200,
+        explain_sample_rate: float = 0.1,
+        explain_cooldown_seconds: float = 300.0,
+    ):
+        """
+        Initialize slow query log.
+
+        Args:
+            threshold_ms: Statements at least this slow are recorded
+            capacity: Entries kept; the oldest are dropped first
+            explain_sample_rate: Fraction of slow reads explained (0 disables)
+            explain_cooldown_seconds: Minimum interval between plans of one statement
+        """
+        self.threshold_ms = threshold_ms
+        self.threshold_ns = int(threshold_ms * 1_000_000)
+        self.capacity = capacity
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_cooldown_seconds = explain_cooldown_seconds
+        self._entries: Deque[SlowQuery] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._last_explained: Dict[str, float] = {}
+        self._explain_engine: Optional[Engine] = None
+        self._explainer: Optional[ThreadPoolExecutor] = None
+        self._explain_pending = 0
+
+    # ===== Recording =====
+
+    def install(self, engine: Engine, explain_engine: Optional[Engine] = None) -> None:
+        """
+        Time every statement of an engine.
+
+        Args:
+            engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+            explain_engine: psycopg2 engine plans are captured on (optional,
+                no plans if not provided)
+        """
+        if explain_engine is not None:
+            self._explain_engine = explain_engine
+        if event.contains(engine, "before_cursor_execute", self._start):
+            return
+        event.listen(engine, "before_cursor_execute", self._start)
+        event.listen(engine, "after_cursor_execute", self._finish)
+
+    def _start(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            context._slow_query_started_ns = time.perf_counter_ns()
+
+    def _finish(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = getattr(context, "_slow_query_started_ns", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter_ns() - started
+        if elapsed < self.threshold_ns or context.execution_options.get(_EXPLAIN_OPTION):
+            return
+
+        entry = SlowQuery(
+            statement=fingerprint(statement),
+            parameters=parameter_shape(parameters),
+            duration_ms=round(elapsed / 1e6, 3),
+            caller=find_caller(),
+            executemany=executemany,
+        )
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            f"Slow query ({entry.duration_ms} ms) from {entry.caller}: {entry.statement[:200]}"
+        )
+
+        if not executemany and self._should_explain(entry.statement, statement):
+            if conn.dialect.driver == "asyncpg":
+                statement, parameters = to_pyformat(statement, parameters)
+            self._submit_explain(entry, statement, parameters)
+
+    # ===== EXPLAIN =====
+
+    def _should_explain(self, key: str, statement: str) -> bool:
+        """Sampled, read-only, and not explained within the cooldown."""
+        if self._explain_engine is None or random.random() >= self.explain_sample_rate:
+            return False
+        if not _READ_ONLY.match(statement) or _WRITES.search(statement):
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_explained.get(key, -self.explain_cooldown_seconds) < (
+                self.explain_cooldown_seconds
+            ):
+                return False
+            if self._explain_pending >= 2:
+                # A slow database makes EXPLAINs slow too; do not pile them up
+                return False
+            self._last_explained[key] = now
+            self._explain_pending += 1
+            if self._explainer is None:
+                self._explainer = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="slow-query-explain"
+                )
+        return True
+
+    def _submit_explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        self._explainer.submit(self._explain, entry, statement, parameters)
+
+    def _explain(self, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        """Capture the plan on its own connection, rolled back afterwards."""
+        try:
+            with self._explain_engine.connect() as conn:
+                conn = conn.execution_options(**{_EXPLAIN_OPTION: True})
+                rows = conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}",
+                    parameters
+                ).fetchall()
+                conn.rollback()
+            entry.plan = "\n".join(row[0] for row in rows)
+        except Exception as e:
+            logger.warning(f"EXPLAIN of slow query failed: {e}")
+        finally:
+            with self._lock:
+                self._explain_pending -= 1
+
+    # ===== Reading =====
+
+    def entries(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """
+        Recorded slow queries, newest first.
+
+        Args:
+            limit: Maximum entries (optional, all if not provided)
+
+        Returns:
+            List[SlowQuery]: Entries
+        """
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit is not None else entries
+
+    def clear(self) -> None:
+        """Drop all recorded entries."""
+        with self._lock:
+            self._entries.clear()
+            self._last_explained.clear()
+
+    def shutdown(self) -> None:
+        """Stop the EXPLAIN thread without waiting for pending plans."""
+        if self._explainer is not None:
+            self._explainer.shutdown(wait=False, cancel_futures=True)
+            self._explainer = None
+
+
+_slow_query_log: Optional[SlowQueryLog] = None
+_slow_query_log_lock = threading.Lock()
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """
+    Get the process-wide slow query log.
+
+    Returns:
+        SlowQueryLog: Log configured from DATABASE_SLOW_QUERY_* settings
+    """
+    global _slow_query_log
+    if _slow_query_log is None:
+        with _slow_query_log_lock:
+            if _slow_query_log is None:
+                database = settings.database
+                _slow_query_log = SlowQueryLog(
+                    threshold_ms=database.slow_query_ms,
+                    capacity=database.slow_query_log_size,
+                    explain_sample_rate=database.slow_query_explain_sample_rate,
+                    explain_cooldown_seconds=database.slow_query_explain_cooldown_seconds,
+                )
+    return _slow_query_log
@@ -0,0 +1,310 @@
+"""
+Curriculum Statistics
+
+Reads curriculum statistics from the mv_statistik_kurikulum materialized
+view and keeps that view fresh after curriculum writes.
+Following Clean Code: Single Responsibility, One round trip per lookup.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.config import settings
+from app.infrastructure.database import get_engine
+from app.infrastructure.models.kurikulum_models import CPL, Kurikulum, MataKuliah
+from app.infrastructure.models.master_models import Mahasiswa
+
+logger = logging.getLogger(__name__)
+
+
+STATISTICS_VIEW_NAME = "mv_statistik_kurikulum"
+
+# Read-only mapping of the materialized view. Kept on its own MetaData so
+# Base.metadata.create_all() never tries to create it as a table.
+mv_statistik_kurikulum = Table(
+    STATISTICS_VIEW_NAME,
+    MetaData(),
+    Column("id_kurikulum", Integer, primary_key=True),
+    Column("jumlah_cpl_aktif", Integer),
+    Column("jumlah_mk", Integer),
+    Column("jumlah_mahasiswa", Integer),
+)
+
+
+def build_view_statistics_query(id_kurikulum: int) -> Select:
+    """
+    Curriculum row joined with its precomputed statistics.
+
+    Args:
+        id_kurikulum: Curriculum ID
+
+    Returns:
+        Select: (Kurikulum, total_cpl, total_matakuliah, total_mahasiswa);
+            the counts are NULL when the view has no row yet
+    """
+    view = mv_statistik_kurikulum
+    return (
+        select(
+            Kurikulum,
+            view.c.jumlah_cpl_aktif,
+            view.c.jumlah_mk,
+            view.c.jumlah_mahasiswa,
+        )
+        .outerjoin(view, view.c.id_kurikulum == Kurikulum.id_kurikulum)
+        .where(Kurikulum.id_kurikulum == id_kurikulum)
+    )
+
+
+def build_aggregate_statistics_query(id_kurikulum: int) -> Select:
+    """
+    Curriculum row with live counts computed by scalar subqueries.
+
+    Args:
+        id_kurikulum: Curriculum ID
+
+    Returns:
+        Select: (Kurikulum, total_cpl, total_matakuliah, total_mahasiswa)
+    """
+    cpl_count = (
+        select(func.count(CPL.id_cpl))
+        .where(CPL.id_kurikulum == id_kurikulum, CPL.is_active == True)
+        .scalar_subquery()
+    )
+    mk_count = (
+        select(func.count(MataKuliah.kode_mk))
+        .where(
+            MataKuliah.id_kurikulum == id_kurikulum,
+            MataKuliah.is_active == True
+        )
+        .scalar_subquery()
+    )
+    student_count = (
+        select(func.count(Mahasiswa.nim))
+        .where(Mahasiswa.id_kurikulum == id_kurikulum)
+        .scalar_subquery()
+    )
+    return (
+        select(Kurikulum, cpl_count, mk_count, student_count)
+        .where(Kurikulum.id_kurikulum == id_kurikulum)
+    )
+
+
+def to_statistics(row: Tuple[Any, ...]) -> Dict[str, int]:
+    """
+    Convert the count columns of a statistics row into the API shape.
+
+    Args:
+        row: (Kurikulum, total_cpl, total_matakuliah, total_mahasiswa)
+
+    Returns:
+        Dict[str, int]: Statistics dictionary
+    """
+    _, total_cpl, total_matakuliah, total_mahasiswa = row
+    return {
+        "total_cpl": total_cpl or 0,
+        "total_matakuliah": total_matakuliah or 0,
+        "total_mahasiswa": total_mahasiswa or 0,
+    }
+
+
+class KurikulumStatisticsProvider:
+    """
+    Provides curriculum statistics in a single round trip.
+
+    Reads mv_statistik_kurikulum when it exists with the expected columns.
+    Falls back to one aggregated query when the view is missing or has no
+    row for the curriculum yet (created after the last refresh).
+    """
+
+    # Whether the view exists with the expected columns; probed once per process
+    _view_available: Optional[bool] = None
+
+    def __init__(self, session: Session):
+        """
+        Initialize statistics provider.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    def get_with_statistics(self, id_kurikulum: int) -> Optional[Dict[str, Any]]:
+        """
+        Get curriculum together with its statistics.
+
+        Args:
+            id_kurikulum: Curriculum ID
+
+        Returns:
+            Optional[Dict]: {"kurikulum": ..., "statistics": {...}},
+                None if the curriculum does not exist
+        """
+        if self._is_view_available():
+            row = self.session.execute(
+                build_view_statistics_query(id_kurikulum)
+            ).first()
+            if row is None:
+                return None
+            if row[1] is not None:
+                return {"kurikulum": row[0], "statistics": to_statistics(row)}
+
+        row = self.session.execute(
+            build_aggregate_statistics_query(id_kurikulum)
+        ).first()
+        if row is None:
+            return None
+        return {"kurikulum": row[0], "statistics": to_statistics(row)}
+
+    def _is_view_available(self) -> bool:
+        """Check (once per process) that the view has the columns we read."""
+        cls = KurikulumStatisticsProvider
+        if cls._view_available is None:
+            found = self.session.execute(
+                text(
+                    "SELECT count(*) FROM pg_attribute "
+                    "WHERE attrelid = to_regclass(:view) "
+                    "AND attname IN ('jumlah_cpl_aktif', 'jumlah_mahasiswa') "
+                    "AND NOT attisdropped"
+                ),
+                {"view": STATISTICS_VIEW_NAME}
+            ).scalar()
+            cls._view_available = found == 2
+            if not cls._view_available:
+                logger.warning(
+                    f"{STATISTICS_VIEW_NAME} not available, "
+                    "using aggregated statistics query"
+                )
+        return cls._view_available
+
+
+class MaterializedViewRefresher:
+    """
+    Debounced REFRESH MATERIALIZED VIEW CONCURRENTLY.
+
+    Writes call schedule(); a burst of writes results in one refresh,
+    run on its own connection once writes have been quiet for
+    debounce_seconds (and at most max_wait_seconds after the first one).
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        view_name: str,
+        debounce_seconds: float,
+        max_wait_seconds: float
+    ):
+        """
+        Initialize refresher.
+
+        Args:
+            engine: Engine used to open the refresh connection
+            view_name: Materialized view to refresh
+            debounce_seconds: Quiet period before refreshing
+            max_wait_seconds: Upper bound on delay after the first write
+        """
+        self.engine = engine
+        self.view_name = view_name
+        self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.last_refreshed_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._first_request_at: Optional[float] = None
+
+    def schedule(self) -> None:
+        """Request a refresh; coalesces with other pending requests."""
+        with self._lock:
+            now = time.monotonic()
+            if self._first_request_at is None:
+                self._first_request_at = now
+
+            deadline = self._first_request_at + self.max_wait_seconds
+            delay = max(0.0, min(self.debounce_seconds, deadline - now))
+
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, self._run)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def refresh_now(self) -> None:
+        """Refresh the view synchronously on a dedicated connection."""
+        with self.engine.connect() as connection:
+            connection.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {self.view_name}")
+            )
+        self.last_refreshed_at = time.time()
+        self.last_error = None
+
+    def pending_seconds(self) -> float:
+        """
+        How long the oldest unrefreshed write of this worker has waited.
+
+        Returns:
+            float: Seconds since the first pending schedule(), 0 if none
+        """
+        first_request_at = self._first_request_at
+        if first_request_at is None:
+            return 0.0
+        return time.monotonic() - first_request_at
+
+    def shutdown(self) -> None:
+        """Cancel any pending refresh."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = None
+            self._first_request_at = None
+
+    def _run(self) -> None:
+        with self._lock:
+            self._timer = None
+            first_request_at, self._first_request_at = self._first_request_at, None
+        try:
+            self.refresh_now()
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Failed to refresh {self.view_name}: {e}")
+            with self._lock:
+                # Still stale: keep counting from the original write
+                if self._first_request_at is None:
+                    self._first_request_at = first_request_at
+
+
+_statistics_refresher: Optional[MaterializedViewRefresher] = None
+_statistics_refresher_lock = threading.Lock()
+
+
+def get_statistics_refresher() -> MaterializedViewRefresher:
+    """
+    Get the process-wide refresher for mv_statistik_kurikulum.
+
+    Returns:
+        MaterializedViewRefresher: Shared refresher instance
+    """
+    global _statistics_refresher
+    with _statistics_refresher_lock:
+        if _statistics_refresher is None:
+            _statistics_refresher = MaterializedViewRefresher(
+                get_engine(),
+                STATISTICS_VIEW_NAME,
+                debounce_seconds=settings.database.statistics_refresh_debounce_seconds,
+                max_wait_seconds=settings.database.statistics_refresh_max_wait_seconds,
+            )
+        return _statistics_refresher
@@ -0,0 +1,275 @@
+"""
+Tracing
+
+OpenTelemetry spans per request, use case method, repository call and
+SQL statement.
+Following Clean Code: Single Responsibility, No cost when disabled.
+
+The span context lives in contextvars, so it follows a request through
+FastAPI dependencies, the threadpool running sync endpoints and the
+greenlet SQLAlchemy uses for asyncpg without being passed explicitly.
+
+opentelemetry-api / -sdk are optional: with TRACING_ENABLED off, or the
+packages missing, trace_methods() returns classes unchanged and no
+engine listener is installed.
+"""
+
+import functools
+import inspect
+import logging
+import sys
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # optional dependency
+    propagate = trace = SpanKind = Status = StatusCode = None
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "app"
+# Attribute holding the span of a running SQL statement on its execution context
+_SQL_SPAN_ATTRIBUTE = "_tracing_span"
+# Longest db.statement recorded
+_MAX_STATEMENT_LENGTH = 2000
+
+
+def tracing_enabled() -> bool:
+    """Whether TRACING_ENABLED is on and OpenTelemetry is installed."""
+    return settings.tracing.enabled and trace is not None
+
+
+# A proxy until configure_tracing() installs the provider, then delegates to it
+_tracer = trace.get_tracer(TRACER_NAME) if trace is not None else None
+
+
+def get_tracer():
+    """
+    Tracer of the application.
+
+    Returns:
+        Tracer: OpenTelemetry tracer (no-op until configure_tracing runs)
+    """
+    return _tracer
+
+
+# ===== Setup =====
+
+def create_span_exporter(exporter: str):
+    """
+    Build the exporter selected by TRACING_EXPORTER.
+
+    Args:
+        exporter: otlp, file, memory or console
+
+    Returns:
+        SpanExporter: New exporter
+
+    Raises:
+        ValueError: If the exporter name is unknown
+    """
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    tracing_settings = settings.tracing
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter(endpoint=tracing_settings.otlp_endpoint)
+    if exporter == "file":
+        # One JSON span per line, for air-gapped runs
+        return ConsoleSpanExporter(
+            service_name=tracing_settings.service_name,
+            out=open(tracing_settings.file_path, "a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    if exporter == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        return InMemorySpanExporter()
+    if exporter == "console":
+        return ConsoleSpanExporter(service_name=tracing_settings.service_name, out=sys.stdout)
+    raise ValueError(f"Unknown tracing exporter: {exporter}")
+
+
+def configure_tracing():
+    """
+    Install the global tracer provider from TRACING_* settings.
+
+    Returns:
+        Optional[TracerProvider]: Installed provider (shut it down on exit),
+            None when tracing is disabled
+    """
+    if not settings.tracing.enabled:
+        return None
+    if trace is None:
+        logger.warning("opentelemetry packages not installed, tracing disabled")
+        return None
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    tracing_settings = settings.tracing
+    provider = TracerProvider(
+        resource=Resource.create({
+            "service.name": tracing_settings.service_name,
+            "service.version": settings.app_version,
+            "deployment.environment": settings.environment,
+        }),
+        sampler=ParentBased(TraceIdRatioBased(tracing_settings.sample_ratio)),
+    )
+    exporter = create_span_exporter(tracing_settings.exporter)
+    # The in-memory exporter is read by tests right after the request
+    processor = (
+        SimpleSpanProcessor(exporter)
+        if tracing_settings.exporter == "memory"
+        else BatchSpanProcessor(exporter)
+    )
+    provider.add_span_processor(processor)
+    trace.set_tracer_provider(provider)
+    logger.info(
+        f"Tracing to {tracing_settings.exporter} "
+        f"(sample ratio {tracing_settings.sample_ratio})"
+    )
+    return provider
+
+
+# ===== Use case / repository spans =====
+
+def _traced(func: Callable, span_name: str, layer: str) -> Callable:
+    """Wrap one function in a span."""
+    attributes = {
+        "code.namespace": func.__module__,
+        "code.function": func.__qualname__,
+        "app.layer": layer,
+    }
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with get_tracer().start_as_current_span(span_name, attributes=attributes):
+                return await func(*args, **kwargs)
+
+        async_wrapper.__traced__ = func
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with get_tracer().start_as_current_span(span_name, attributes=attributes):
+            return func(*args, **kwargs)
+
+    wrapper.__traced__ = func
+    return wrapper
+
+
+def trace_methods(layer: str) -> Callable[[type], type]:
+    """
+    Class decorator giving every public method its own span.
+
+    Inherited methods are wrapped too and named after the decorated
+    class (KurikulumRepository.get_by_id, not BaseRepository.get_by_id).
+
+    Usage:
+        @trace_methods("repository")
+        class KurikulumRepository(BaseRepository[Kurikulum]):
+            ...
+
+    Args:
+        layer: app.layer span attribute (use_case, repository)
+
+    Returns:
+        Callable: Decorator returning the class, unchanged if tracing is off
+    """
+
+    def decorate(cls: type) -> type:
+        if not tracing_enabled():
+            return cls
+        for name in dir(cls):
+            if name.startswith("_"):
+                continue
+            member = inspect.getattr_static(cls, name)
+            if not inspect.isfunction(member):
+                # staticmethod, classmethod, property, class attributes
+                continue
+            func = getattr(member, "__traced__", member)
+            setattr(cls, name, _traced(func, f"{cls.__name__}.{name}", layer))
+        return cls
+
+    return decorate
+
+
+# ===== SQL statement spans =====
+
+def _start_sql_span(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is None or not trace.get_current_span().get_span_context().is_valid:
+        # Only statements issued inside a traced request / operation
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = get_tracer().start_span(
+        operation,
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": "postgresql",
+            "db.name": conn.engine.url.database or "",
+            "db.operation": operation,
+            "db.statement": statement[:_MAX_STATEMENT_LENGTH],
+        },
+    )
+    setattr(context, _SQL_SPAN_ATTRIBUTE, span)
+
+
+def _end_sql_span(conn, cursor, statement, parameters, context, executemany) -> None:
+    span = getattr(context, _SQL_SPAN_ATTRIBUTE, None)
+    if span is not None:
+        if cursor is not None and cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        span.end()
+
+
+def _fail_sql_span(exception_context) -> None:
+    span = getattr(exception_context.execution_context, _SQL_SPAN_ATTRIBUTE, None)
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+
+def install_sql_tracing(engine: Engine) -> None:
+    """
+    Give every SQL statement of an engine a client span.
+
+    Args:
+        engine: Sync engine (use AsyncEngine.sync_engine for async engines)
+    """
+    if not tracing_enabled() or event.contains(engine, "before_cursor_execute", _start_sql_span):
+        return
+    event.listen(engine, "before_cursor_execute", _start_sql_span)
+    event.listen(engine, "after_cursor_execute", _end_sql_span)
+    event.listen(engine, "handle_error", _fail_sql_span)
+
+
+# ===== Propagation =====
+
+def extract_context(headers: Any) -> Optional[Any]:
+    """
+    Incoming trace context (W3C traceparent) of an ASGI request.
+
+    Args:
+        headers: ASGI header list of (name, value) byte pairs
+
+    Returns:
+        Optional[Context]: Parent context, None if the request carries none
+    """
+    carrier = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in headers
+        if name in (b"traceparent", b"tracestate", b"baggage")
+    }
+    return propagate.extract(carrier) if carrier else None
@@ -0,0 +1,119 @@
+"""
+Unit of Work
+
+Groups repository writes into a single transaction per use case.
+Following Clean Code: Single Responsibility, Explicit transaction boundaries.
+"""
+
+from typing import Union
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# Key in Session.info holding the current unit-of-work nesting depth
+_DEPTH_KEY = "unit_of_work_depth"
+
+
+def in_unit_of_work(session: Union[Session, AsyncSession]) -> bool:
+    """
+    Check whether a session is inside a unit of work.
+
+    Repositories use this to decide between flush-only writes
+    and the original commit-per-call behaviour.
+
+    Args:
+        session: Sync or async database session
+
+    Returns:
+        bool: True if a unit of work is open on the session
+    """
+    return session.info.get(_DEPTH_KEY, 0) > 0
+
+
+class UnitOfWork:
+    """
+    Transaction boundary for a use case.
+
+    While open, repository writes only flush; the outermost unit of work
+    commits once on success and rolls back on error. Nested units join
+    the outer transaction.
+
+    Usage:
+        with UnitOfWork(session):
+            repo.update(entity, status=...)
+    """
+
+    def __init__(self, session: Session):
+        """
+        Initialize unit of work.
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    def __enter__(self) -> "UnitOfWork":
+        self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        depth = self.session.info[_DEPTH_KEY] - 1
+        self.session.info[_DEPTH_KEY] = depth
+
+        # Nested unit: the outermost one owns commit/rollback
+        if depth > 0:
+            return False
+
+        if exc_type is not None:
+            self.session.rollback()
+            return False
+
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return False
+
+
+class AsyncUnitOfWork:
+    """
+    Async transaction boundary for a use case.
+
+    Same semantics as UnitOfWork for AsyncSession.
+
+    Usage:
+        async with AsyncUnitOfWork(session):
+            await repo.update(entity, status=...)
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize async unit of work.
+
+        Args:
+            session: Async database session
+        """
+        self.session = session
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        self.session.info[_DEPTH_KEY] = self.session.info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        depth = self.session.info[_DEPTH_KEY] - 1
+        self.session.info[_DEPTH_KEY] = depth
+
+        if depth > 0:
+            return False
+
+        if exc_type is not None:
+            await self.session.rollback()
+            return False
+
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+        return False
@@ -5,16 +5,42 @@ Entry point for the OBE System API.
 Following Clean Code: Clear structure, Dependency Injection, CORS configuration.
 """
 
+import asyncio
+from typing import Any, Dict
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
-import time
 import logging
 
 from app.core.config import settings
-from app.infrastructure.database import DatabaseManager
-from app.domain.exceptions import DomainException
+from app.infrastructure.database import (
+    DatabaseManager,
+    engines_created,
+    get_pool_manager,
+    get_replica_set,
+)
+from app.infrastructure.statistics import get_statistics_refresher
+from app.infrastructure.health import get_health_monitor, peek_health_monitor
+from app.infrastructure.cache import get_cache_backend
+from app.core.password_hashing import get_password_hashing_service
+from app.infrastructure.slow_queries import get_slow_query_log
+from app.infrastructure.tracing import configure_tracing
+from app.infrastructure.metrics import count_domain_exception, mark_process_dead, render_metrics
+from app.presentation.middlewares import (
+    AccessLogMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    TracingMiddleware,
+    configure_access_logger,
+)
+from app.domain.exceptions import (
+    AuthenticationException,
+    AuthorizationException,
+    DomainException,
+    ServiceOverloadedException,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +49,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Backoff between attempts to create the engines at startup
+WARM_UP_RETRY_INITIAL_SECONDS = 1.0
+WARM_UP_RETRY_MAX_SECONDS = 30.0
+
 
 def create_application() -> FastAPI:
     """
@@ -75,6 +105,8 @@ def configure_cors(app: FastAPI) -> None:
         allow_credentials=settings.cors.allow_credentials,
         allow_methods=settings.cors.allow_methods,
         allow_headers=settings.cors.allow_headers,
+        # Browser clients need ETag to send If-None-Match on polls
+        expose_headers=["ETag"],
     )
     logger.info(f"CORS configured with origins: {settings.cors.origins}")
 
@@ -83,26 +115,77 @@ def add_middlewares(app: FastAPI) -> None:
     """
     Add custom middlewares to the application.
 
+    Pure ASGI middlewares only: one times every request (X-Process-Time,
+    X-DB-* query stats outside production), flags likely N+1 requests
+    and writes one JSON access record per request through a queue, off
+    the event loop; the other records Prometheus latency histograms and
+    in-flight gauges. With PROFILING_ENABLED, the innermost one samples
+    requests that carry a profiling token; with TRACING_ENABLED, the
+    outermost one opens each request's root span.
+
     Args:
         app: FastAPI application instance
     """
+    profiling = settings.profiling
+    if profiling.enabled:
+        # Added first so it is innermost: profiles start at the router
+        app.add_middleware(
+            ProfilingMiddleware,
+            header_name=profiling.header_name,
+            interval_ms=profiling.interval_ms,
+            max_seconds=profiling.max_seconds,
+        )
 
-    @app.middleware("http")
-    async def add_process_time_header(request: Request, call_next):
-        """Middleware to add response time header."""
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
+    access_log = settings.access_log
+    app.state.access_log_listener = None
+    if access_log.enabled:
+        app.state.access_log_listener = configure_access_logger(
+            max_queue_size=access_log.queue_size
+        )
+    else:
+        logging.getLogger("app.access").disabled = True
 
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        """Middleware to log all requests."""
-        logger.info(f"{request.method} {request.url.path}")
-        response = await call_next(request)
-        logger.info(f"Status: {response.status_code}")
-        return response
+    app.add_middleware(
+        AccessLogMiddleware,
+        sample_rate_2xx=access_log.sample_rate_2xx,
+        slow_request_ms=access_log.slow_request_ms,
+        expose_round_trips=not settings.is_production(),
+        repeated_statement_threshold=access_log.repeated_statement_threshold,
+    )
+    app.add_middleware(MetricsMiddleware)
+
+    # Added last so it is outermost: the request span covers everything
+    app.state.tracer_provider = configure_tracing()
+    if app.state.tracer_provider is not None:
+        app.add_middleware(TracingMiddleware)
+
+
+def domain_error_response(
+    exc: DomainException,
+    status_code: int,
+    headers: dict = None
+) -> JSONResponse:
+    """
+    Error response of a DomainException, counted by error_code.
+
+    Args:
+        exc: Domain exception
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        JSONResponse: Standard error body
+    """
+    count_domain_exception(exc.error_code)
+    return JSONResponse(
+        status_code=status_code,
+        headers=headers,
+        content={
+            "success": False,
+            "error_code": exc.error_code,
+            "message": exc.message
+        }
+    )
 
 
 def add_exception_handlers(app: FastAPI) -> None:
@@ -113,18 +196,46 @@ def add_exception_handlers(app: FastAPI) -> None:
         app: FastAPI application instance
     """
 
+    @app.exception_handler(ServiceOverloadedException)
+    async def overloaded_exception_handler(
+        request: Request,
+        exc: ServiceOverloadedException
+    ):
+        """Shed load with 429 and a Retry-After hint."""
+        logger.warning(f"Load shed: {request.method} {request.url.path}")
+        return domain_error_response(
+            exc,
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": str(exc.retry_after)}
+        )
+
+    @app.exception_handler(AuthenticationException)
+    async def authentication_exception_handler(
+        request: Request,
+        exc: AuthenticationException
+    ):
+        """Handle failed authentication."""
+        logger.warning(f"Authentication failed: {exc.message}")
+        return domain_error_response(
+            exc,
+            status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    @app.exception_handler(AuthorizationException)
+    async def authorization_exception_handler(
+        request: Request,
+        exc: AuthorizationException
+    ):
+        """Handle missing permissions."""
+        logger.warning(f"Authorization failed: {request.method} {request.url.path}")
+        return domain_error_response(exc, status.HTTP_403_FORBIDDEN)
+
     @app.exception_handler(DomainException)
     async def domain_exception_handler(request: Request, exc: DomainException):
         """Handle domain-level exceptions."""
         logger.warning(f"Domain exception: {exc.message}")
-        return JSONResponse(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "success": False,
-                "error_code": exc.error_code,
-                "message": exc.message
-            }
-        )
+        return domain_error_response(exc, status.HTTP_400_BAD_REQUEST)
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
@@ -165,18 +276,37 @@ def include_routers(app: FastAPI) -> None:
         app: FastAPI application instance
     """
     # Import routers here to avoid circular imports
-    from app.presentation.api.v1 import kurikulum
+    from app.presentation.api.v1 import admin, auth, kurikulum, prasyarat, ketercapaian
 
     # Include routers
+    app.include_router(
+        auth.router,
+        prefix=f"{settings.api_v1_prefix}/auth",
+        tags=["Authentication"]
+    )
     app.include_router(
         kurikulum.router,
         prefix=f"{settings.api_v1_prefix}/kurikulum",
         tags=["Kurikulum Management"]
     )
+    app.include_router(
+        prasyarat.router,
+        prefix=f"{settings.api_v1_prefix}/kurikulum",
+        tags=["Prasyarat Mata Kuliah"]
+    )
+    app.include_router(
+        ketercapaian.router,
+        prefix=f"{settings.api_v1_prefix}/analytics",
+        tags=["Ketercapaian CPMK & CPL"]
+    )
+    app.include_router(
+        admin.router,
+        prefix=f"{settings.api_v1_prefix}/admin",
+        tags=["Admin"]
+    )
 
     logger.info("✓ API routers registered")
     # TODO: Add more routers as implemented
-    # app.include_router(auth.router, prefix=f"{settings.api_v1_prefix}/auth", tags=["Authentication"])
     # app.include_router(cpl.router, prefix=f"{settings.api_v1_prefix}/cpl", tags=["CPL"])
     # app.include_router(matakuliah.router, prefix=f"{settings.api_v1_prefix}/matakuliah", tags=["Mata Kuliah"])
 
@@ -198,18 +328,75 @@ def add_event_handlers(app: FastAPI) -> None:
         logger.info(f"Debug mode: {settings.debug}")
         logger.info("="*50)
 
-        # Check database connection
-        if DatabaseManager.check_database_connection():
-            logger.info("✓ Database connection successful")
-            db_info = DatabaseManager.get_connection_info()
-            logger.info(f"  Database: {db_info['database']} @ {db_info['host']}:{db_info['port']}")
-        else:
-            logger.error("✗ Database connection failed!")
+        # Off the critical path: the worker accepts requests right away and
+        # /health/ready reports ready once the first health check passed
+        app.state.database_warm_up_error = None
+        app.state.database_warm_up = asyncio.create_task(warm_up_database())
+
+    async def start_database_checks():
+        """Create the engines and start the replica and health checks."""
+        # Creating the engines imports the dialect and drivers; keep that off the loop
+        pool_manager = await asyncio.get_running_loop().run_in_executor(
+            None, get_pool_manager
+        )
+        db_info = DatabaseManager.get_connection_info()
+        logger.info(f"  Database: {db_info['database']} @ {db_info['host']}:{db_info['port']}")
+
+        replica_set = get_replica_set()
+        if replica_set is not None:
+            replica_set.start()
+            logger.info(f"✓ Read replicas: {len(replica_set.replicas)}")
+
+        # Logs the database state; probes read its cached result
+        get_health_monitor().start()
+        return pool_manager
+
+    async def warm_up_database():
+        """
+        Start the database checks, retrying with backoff, then warm the pools.
+
+        Until the health monitor runs, readiness reports the last failure
+        (database_warm_up_error) instead of a warm-up that never ends.
+        """
+        delay = WARM_UP_RETRY_INITIAL_SECONDS
+        while True:
+            try:
+                pool_manager = await start_database_checks()
+                break
+            except Exception as e:
+                app.state.database_warm_up_error = str(e).splitlines()[0] if str(e) else type(e).__name__
+                logger.error(f"Database warm-up failed, retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, WARM_UP_RETRY_MAX_SECONDS)
+        app.state.database_warm_up_error = None
+
+        try:
+            # Pre-opens connections and starts the background liveness check
+            await pool_manager.start()
+        except Exception as e:
+            logger.error(f"Database pool warm-up failed: {e}")
 
     @app.on_event("shutdown")
     async def shutdown_event():
         """Execute on application shutdown."""
         logger.info("Shutting down application...")
+        app.state.database_warm_up.cancel()
+        get_password_hashing_service().shutdown()
+        get_slow_query_log().shutdown()
+        if engines_created():
+            get_health_monitor().shutdown()
+            get_statistics_refresher().shutdown()
+            replica_set = get_replica_set()
+            if replica_set is not None:
+                await replica_set.shutdown()
+            await get_pool_manager().shutdown()
+        if app.state.access_log_listener is not None:
+            # Flushes queued access records
+            app.state.access_log_listener.stop()
+        mark_process_dead()
+        if app.state.tracer_provider is not None:
+            # Flushes batched spans
+            app.state.tracer_provider.shutdown()
 
 
 # Create application instance
@@ -229,25 +416,106 @@ async def root():
     }
 
 
-# Health check endpoint
+# Prometheus metrics endpoint
+@app.get("/metrics", tags=["Health"], include_in_schema=False)
+def metrics():
+    """
+    Prometheus metrics.
+
+    Aggregates every worker when PROMETHEUS_MULTIPROC_DIR is set.
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, headers={"Content-Type": content_type})
+
+
+# Health check endpoints
+# All read the background monitor's last result; none touches the database.
+# Until the startup warm-up created the monitor the worker is alive, not ready.
+STARTING_READINESS = {"ready": False, "reasons": ["database warm-up in progress"]}
+
+
+def starting_readiness() -> Dict[str, Any]:
+    """
+    Readiness before the health monitor exists.
+
+    Returns:
+        Dict: Warm-up in progress, or the error of its last failed attempt
+    """
+    error = getattr(app.state, "database_warm_up_error", None)
+    if error is None:
+        return STARTING_READINESS
+    return {"ready": False, "reasons": [f"database warm-up failed: {error}"]}
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
     Health check endpoint.
 
-    Returns application and database status.
+    Returns application and database status with the last background
+    check (pools, replicas, statistics view).
     """
-    db_healthy = DatabaseManager.check_database_connection()
+    health_monitor = peek_health_monitor()
+    snapshot = health_monitor.snapshot if health_monitor is not None else None
+    db_healthy = snapshot is not None and snapshot.database_ok
+    readiness = health_monitor.readiness() if health_monitor is not None else starting_readiness()
+    cache_backend = get_cache_backend()
 
     return {
-        "status": "healthy" if db_healthy else "unhealthy",
+        "status": health_monitor.status() if health_monitor is not None else (
+            "starting" if readiness is STARTING_READINESS else "unhealthy"
+        ),
         "app_name": settings.app_name,
         "version": settings.app_version,
         "database": "connected" if db_healthy else "disconnected",
-        "environment": settings.environment
+        "environment": settings.environment,
+        "cache": {
+            "backend": cache_backend.name,
+            **cache_backend.stats().to_dict()
+        },
+        "readiness": readiness,
+        "degraded": health_monitor.degradations() if health_monitor is not None else [],
+        "checks": snapshot.to_dict() if snapshot is not None else None,
     }
 
 
+@app.get("/health/live", tags=["Health"])
+async def liveness_check():
+    """
+    Liveness probe.
+
+    503 when the background health check has stalled for longer than
+    HEALTH_MAX_SNAPSHOT_AGE_SECONDS. Database outages do not fail it.
+    """
+    health_monitor = peek_health_monitor()
+    liveness = (
+        health_monitor.liveness() if health_monitor is not None
+        else {"alive": True, "age_seconds": None}
+    )
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if liveness["alive"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=liveness
+    )
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness_check():
+    """
+    Readiness probe.
+
+    503 while the database is unreachable or the last check is stale, and
+    during the startup warm-up. Pool saturation only marks /health degraded.
+    """
+    health_monitor = peek_health_monitor()
+    readiness = (
+        health_monitor.readiness() if health_monitor is not None else starting_readiness()
+    )
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if readiness["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=readiness
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,79 @@
+"""
+Conditional Requests
+
+ETag / If-None-Match helpers for read endpoints.
+Following Clean Code: Small focused functions, HTTP semantics (RFC 9110).
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def build_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values that determine a representation.
+
+    Args:
+        *parts: Version inputs, e.g. (id_kurikulum, updated_at)
+
+    Returns:
+        str: Weak entity tag, e.g. W/"3f2a..."
+    """
+    digest = hashlib.sha1(
+        "|".join("" if part is None else str(part) for part in parts).encode()
+    ).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check If-None-Match against the current ETag (weak comparison).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Build an empty 304 Not Modified response.
+
+    Args:
+        etag: Current ETag of the resource
+
+    Returns:
+        Response: 304 response carrying the ETag
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """
+    Attach ETag and revalidation headers to a 200 response.
+
+    Args:
+        response: Response being built by the route
+        etag: Current ETag of the resource
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
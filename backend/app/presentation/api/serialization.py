@@ -0,0 +1,58 @@
+"""
+JSON Serialization Fast Path
+
+Pre-encoded JSON responses for large listings.
+Following Clean Code: Small focused functions, One validation pass.
+
+Returning a pydantic model from a route with response_model costs two
+validation passes (building the model, then FastAPI validating it again
+against response_model) plus jsonable_encoder walking every value before
+json.dumps. For list pages the rows are validated once in bulk with a
+TypeAdapter instead and encoded straight to bytes with orjson; FastAPI
+passes a returned Response through untouched, so response_model only
+documents the shape in OpenAPI.
+"""
+
+from typing import Any, Sequence
+
+import orjson
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# Aware datetimes as "...Z" like pydantic; naive ones stay without offset
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+class PreEncodedJSONResponse(Response):
+    """JSON response whose body is already encoded bytes."""
+
+    media_type = "application/json"
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    Encode content to JSON bytes.
+
+    Handles datetime, date and Enum values natively.
+
+    Args:
+        content: Dictionaries, lists and scalars
+
+    Returns:
+        bytes: JSON document
+    """
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def validated_items(adapter: TypeAdapter, items: Sequence[Any]) -> Any:
+    """
+    Validate a whole list of items in one call.
+
+    Args:
+        adapter: TypeAdapter of the list type, e.g. KURIKULUM_LIST_ADAPTER
+        items: Dictionaries built from the fetched row tuples
+
+    Returns:
+        Any: Validated items
+    """
+    return adapter.validate_python(items)
@@ -2,8 +2,12 @@
 API Version 1 Endpoints
 """
 
-from app.presentation.api.v1 import kurikulum
+from app.presentation.api.v1 import admin, auth, kurikulum, prasyarat, ketercapaian
 
 __all__ = [
+    "admin",
+    "auth",
     "kurikulum",
+    "prasyarat",
+    "ketercapaian",
 ]
@@ -0,0 +1,206 @@
+"""
+Admin API Router
+
+REST API endpoints for operational diagnostics.
+Following Clean Code: Clear naming, single responsibility, proper HTTP methods.
+"""
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.security import TokenManager
+from app.domain.entities import Permission, PermissionSet
+from app.domain.exceptions import EntityNotFoundException
+from app.infrastructure.profiling import Profile, ProfileStore, get_profile_store
+from app.infrastructure.slow_queries import SlowQueryLog, get_slow_query_log
+from app.presentation.api.dependencies import get_permissions, require_permissions
+from app.presentation.schemas import (
+    ErrorResponse,
+    MessageResponse,
+    ProfileListResponse,
+    ProfileSummaryResponse,
+    ProfilingTokenRequest,
+    ProfilingTokenResponse,
+    SlowQueryListResponse,
+    SlowQueryResponse,
+)
+
+# Every endpoint here requires the diagnostics permission
+router = APIRouter(
+    dependencies=[Depends(require_permissions(Permission.VIEW_DIAGNOSTICS))],
+    responses={
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+    }
+)
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryListResponse,
+    summary="List slow queries",
+    description=(
+        "Statements over DATABASE_SLOW_QUERY_MS recorded by the worker serving "
+        "this request, newest first, with the calling method and sampled "
+        "EXPLAIN (ANALYZE, BUFFERS) plans"
+    )
+)
+def list_slow_queries(
+    limit: int = Query(50, ge=1, le=1000, description="Maximum entries"),
+    slow_query_log: SlowQueryLog = Depends(get_slow_query_log)
+) -> SlowQueryListResponse:
+    """
+    List slow queries.
+
+    Args:
+        limit: Maximum entries
+        slow_query_log: Slow query log of this worker
+
+    Returns:
+        SlowQueryListResponse: Threshold, capacity and entries
+    """
+    return SlowQueryListResponse(
+        threshold_ms=slow_query_log.threshold_ms,
+        capacity=slow_query_log.capacity,
+        data=[
+            SlowQueryResponse.model_validate(entry)
+            for entry in slow_query_log.entries(limit)
+        ]
+    )
+
+
+@router.delete(
+    "/slow-queries",
+    response_model=MessageResponse,
+    summary="Clear slow queries",
+    description="Empty the slow query log of the worker serving this request"
+)
+def clear_slow_queries(
+    slow_query_log: SlowQueryLog = Depends(get_slow_query_log)
+) -> MessageResponse:
+    """
+    Clear slow queries.
+
+    Args:
+        slow_query_log: Slow query log of this worker
+
+    Returns:
+        MessageResponse: Success message
+    """
+    slow_query_log.clear()
+
+    return MessageResponse(
+        success=True,
+        message="Log query lambat berhasil dikosongkan"
+    )
+
+
+def _profile_summary(profile: Profile) -> ProfileSummaryResponse:
+    """Summary of a kept profile."""
+    return ProfileSummaryResponse(
+        id=profile.id,
+        method=profile.method,
+        path=profile.path,
+        status=profile.status,
+        started_at=profile.started_at,
+        duration_ms=profile.duration_ms,
+        interval_ms=profile.interval_ms,
+        sample_count=len(profile.samples),
+        layers=profile.layers()
+    )
+
+
+@router.post(
+    "/profiling-token",
+    response_model=ProfilingTokenResponse,
+    summary="Issue profiling token",
+    description=(
+        "Short-lived token; requests sending it in the profiling header are "
+        "sampled (requires PROFILING_ENABLED)"
+    )
+)
+def create_profiling_token(
+    request: ProfilingTokenRequest,
+    permissions: PermissionSet = Depends(get_permissions)
+) -> ProfilingTokenResponse:
+    """
+    Issue a profiling token.
+
+    Args:
+        request: Path prefix to profile
+        permissions: Permissions of the requesting admin
+
+    Returns:
+        ProfilingTokenResponse: Token and the header to send it in
+    """
+    return ProfilingTokenResponse(
+        token=TokenManager.create_profiling_token(
+            str(permissions.id_user),
+            request.path_prefix
+        ),
+        header_name=settings.profiling.header_name,
+        expires_in=settings.profiling.token_ttl_seconds
+    )
+
+
+@router.get(
+    "/profiles",
+    response_model=ProfileListResponse,
+    summary="List request profiles",
+    description="Profiles kept by the worker serving this request, newest first"
+)
+def list_profiles(
+    store: ProfileStore = Depends(get_profile_store)
+) -> ProfileListResponse:
+    """
+    List request profiles.
+
+    Args:
+        store: Profile store of this worker
+
+    Returns:
+        ProfileListResponse: Profile summaries
+    """
+    return ProfileListResponse(data=[_profile_summary(profile) for profile in store.list()])
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    summary="Download request profile",
+    description=(
+        "speedscope JSON (open in https://www.speedscope.app) or collapsed "
+        "stacks (flamegraph.pl, speedscope)"
+    ),
+    responses={400: {"model": ErrorResponse}}
+)
+def get_profile(
+    profile_id: str,
+    format: str = Query(
+        "speedscope",
+        pattern="^(speedscope|collapsed)$",
+        description="speedscope or collapsed"
+    ),
+    store: ProfileStore = Depends(get_profile_store)
+):
+    """
+    Download a request profile.
+
+    Args:
+        profile_id: X-Profile-Id of the profiled response
+        format: speedscope or collapsed
+        store: Profile store of this worker
+
+    Returns:
+        Speedscope document or collapsed-stack text
+
+    Raises:
+        EntityNotFoundException: If this worker does not hold the profile
+    """
+    profile = store.get(profile_id)
+    if profile is None:
+        raise EntityNotFoundException("Profile", profile_id)
+
+    if format == "collapsed":
+        return PlainTextResponse(profile.to_collapsed())
+    return profile.to_speedscope()
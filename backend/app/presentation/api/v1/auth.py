@@ -0,0 +1,109 @@
+"""
+Auth API Router
+
+REST API endpoints for authentication.
+Following Clean Code: Clear naming, single responsibility, proper HTTP methods.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.use_cases import AuthUseCases
+from app.core.config import settings
+from app.core.security import AuthContext
+from app.domain.entities import PermissionSet
+from app.infrastructure.database import get_async_database_session
+from app.presentation.api.dependencies import get_auth_context, get_permissions
+from app.presentation.schemas import (
+    ErrorResponse,
+    LoginRequest,
+    ProfileResponse,
+    TokenResponse,
+)
+
+# Create router
+router = APIRouter()
+
+
+def get_auth_use_cases(
+    db: AsyncSession = Depends(get_async_database_session)
+) -> AuthUseCases:
+    """
+    Dependency for Auth use cases.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        AuthUseCases: Use cases instance
+    """
+    return AuthUseCases(db)
+
+
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    summary="Login",
+    description=(
+        "Verify username and password and issue access and refresh tokens. "
+        "Returns 429 with Retry-After when password hashing is saturated."
+    ),
+    responses={
+        401: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+    }
+)
+async def login(
+    request: LoginRequest,
+    use_cases: AuthUseCases = Depends(get_auth_use_cases)
+) -> TokenResponse:
+    """
+    Login with username and password.
+
+    Args:
+        request: Credentials
+        use_cases: Auth use cases
+
+    Returns:
+        TokenResponse: Issued tokens
+    """
+    result = await use_cases.login(request.username, request.password)
+
+    return TokenResponse(
+        access_token=result.access_token,
+        refresh_token=result.refresh_token,
+        expires_in=settings.security.access_token_expire_minutes * 60
+    )
+
+
+@router.get(
+    "/profile",
+    response_model=ProfileResponse,
+    summary="Get current user",
+    description=(
+        "Identity of the bearer access token and its compiled permissions "
+        "(no database round trip while the permissions are cached)"
+    ),
+    responses={401: {"model": ErrorResponse}}
+)
+def get_profile(
+    auth: AuthContext = Depends(get_auth_context),
+    permissions: PermissionSet = Depends(get_permissions)
+) -> ProfileResponse:
+    """
+    Get the authenticated user.
+
+    Args:
+        auth: Verified token claims
+        permissions: Compiled permissions
+
+    Returns:
+        ProfileResponse: User identity and permissions
+    """
+    return ProfileResponse(
+        id_user=int(auth.user_id),
+        username=auth.username,
+        user_type=auth.user_type,
+        roles=list(permissions.roles),
+        permissions=permissions.names()
+    )
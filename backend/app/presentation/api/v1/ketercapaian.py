@@ -0,0 +1,114 @@
+"""
+Ketercapaian API Router
+
+REST API endpoints for CPMK and CPL achievement calculation.
+Following Clean Code: Clear naming, single responsibility, proper HTTP methods.
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.application.use_cases import KetercapaianUseCases
+from app.presentation.api.v1.kurikulum import get_db
+from app.presentation.schemas import (
+    KetercapaianCPMKResponse,
+    KetercapaianCPLResponse,
+    KetercapaianKelasResponse,
+    KetercapaianAngkatanResponse,
+)
+
+# Create router
+router = APIRouter()
+
+
+def get_ketercapaian_use_cases(
+    db: Session = Depends(get_db)
+) -> KetercapaianUseCases:
+    """
+    Dependency for Ketercapaian use cases.
+
+    Args:
+        db: Database session
+
+    Returns:
+        KetercapaianUseCases: Use cases instance
+    """
+    return KetercapaianUseCases(db)
+
+
+@router.post(
+    "/ketercapaian-cpmk/{id_kelas}/hitung",
+    response_model=KetercapaianKelasResponse,
+    summary="Calculate CPMK achievement of a class",
+    description=(
+        "Recalculate ketercapaian_cpmk of every student in a class "
+        "from the current nilai_detail"
+    )
+)
+def hitung_ketercapaian_kelas(
+    id_kelas: int,
+    use_cases: KetercapaianUseCases = Depends(get_ketercapaian_use_cases)
+) -> KetercapaianKelasResponse:
+    """
+    Calculate CPMK achievement of a class.
+
+    Args:
+        id_kelas: Class ID
+        use_cases: Ketercapaian use cases
+
+    Returns:
+        KetercapaianKelasResponse: Per-CPMK statistics
+    """
+    result = use_cases.hitung_kelas(id_kelas)
+
+    return KetercapaianKelasResponse(
+        id_kelas=id_kelas,
+        total_ketercapaian=len(result),
+        cpmk=[
+            KetercapaianCPMKResponse(id_cpmk=id_cpmk, **statistics)
+            for id_cpmk, statistics in result.summary().items()
+        ]
+    )
+
+
+@router.post(
+    "/ketercapaian-cpl/{id_kurikulum}/hitung",
+    response_model=KetercapaianAngkatanResponse,
+    summary="Calculate CPMK and CPL achievement of a cohort",
+    description=(
+        "Recalculate ketercapaian_cpmk for every class taken by a cohort "
+        "and roll it up to CPL through bobot_kontribusi"
+    )
+)
+def hitung_ketercapaian_angkatan(
+    id_kurikulum: int,
+    angkatan: str,
+    use_cases: KetercapaianUseCases = Depends(get_ketercapaian_use_cases)
+) -> KetercapaianAngkatanResponse:
+    """
+    Calculate CPMK and CPL achievement of a cohort.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        angkatan: Cohort year
+        use_cases: Ketercapaian use cases
+
+    Returns:
+        KetercapaianAngkatanResponse: Per-CPMK and per-CPL statistics
+    """
+    result = use_cases.hitung_angkatan(id_kurikulum, angkatan)
+
+    return KetercapaianAngkatanResponse(
+        id_kurikulum=id_kurikulum,
+        angkatan=angkatan,
+        total_mahasiswa=len(result.cpl.nims),
+        total_ketercapaian=len(result.cpmk),
+        cpmk=[
+            KetercapaianCPMKResponse(id_cpmk=id_cpmk, **statistics)
+            for id_cpmk, statistics in result.cpmk.summary().items()
+        ],
+        cpl=[
+            KetercapaianCPLResponse(id_cpl=id_cpl, **statistics)
+            for id_cpl, statistics in result.cpl.summary().items()
+        ]
+    )
@@ -5,35 +5,56 @@ REST API endpoints for curriculum management.
 Following Clean Code: Clear naming, single responsibility, proper HTTP methods.
 """
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, File, status, Query, Request, Response, UploadFile
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Generator, List, Optional
 
-from app.infrastructure.database import DatabaseManager
-from app.application.use_cases import KurikulumUseCases
+from app.infrastructure.database import get_database_session
+from app.application.use_cases import ImportUseCases, KurikulumUseCases
 from app.presentation.schemas import (
     KurikulumCreateRequest,
     KurikulumUpdateRequest,
     KurikulumActivateRequest,
     KurikulumResponse,
     KurikulumListResponse,
+    KurikulumPageResponse,
+    KurikulumStatisticsResponse,
     MessageResponse,
+    ImportResultResponse,
     KurikulumStatusEnum,
+    KURIKULUM_LIST_FIELDS,
+    KURIKULUM_LIST_ADAPTER,
+)
+from app.infrastructure.cache import list_version, primary_version
+from app.infrastructure.pagination import CountStrategy
+from app.presentation.api.conditional import (
+    build_etag,
+    is_not_modified,
+    not_modified,
+    set_etag,
+)
+from app.presentation.api.serialization import (
+    PreEncodedJSONResponse,
+    encode_json,
+    validated_items,
 )
 from app.domain.entities import KurikulumStatus
+from app.domain.exceptions import ValidationException
 
 # Create router
 router = APIRouter()
 
 
-def get_db() -> Session:
+def get_db() -> Generator[Session, None, None]:
     """
     Dependency for database session.
 
+    One session per request, closed after the response is sent.
+
     Yields:
         Session: Database session
     """
-    return DatabaseManager.get_session()
+    yield from get_database_session()
 
 
 def get_kurikulum_use_cases(
@@ -51,6 +72,21 @@ def get_kurikulum_use_cases(
     return KurikulumUseCases(db)
 
 
+def get_import_use_cases(
+    db: Session = Depends(get_db)
+) -> ImportUseCases:
+    """
+    Dependency for CPL / mata kuliah import use cases.
+
+    Args:
+        db: Database session
+
+    Returns:
+        ImportUseCases: Use cases instance
+    """
+    return ImportUseCases(db)
+
+
 @router.post(
     "/",
     response_model=KurikulumResponse,
@@ -85,42 +121,103 @@ def create_kurikulum(
     return KurikulumResponse.model_validate(kurikulum)
 
 
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """
+    Parse the comma-separated fields query parameter.
+
+    Args:
+        fields: Requested fields, e.g. "id_kurikulum,kode_kurikulum"
+
+    Returns:
+        List[str]: Requested fields, all list fields when not given
+
+    Raises:
+        ValidationException: If a field is not selectable
+    """
+    if not fields:
+        return list(KURIKULUM_LIST_FIELDS)
+
+    names = list(dict.fromkeys(
+        name.strip() for name in fields.split(",") if name.strip()
+    ))
+    unknown = [name for name in names if name not in KURIKULUM_LIST_FIELDS]
+    if unknown or not names:
+        raise ValidationException(
+            "fields",
+            f"Field tidak dikenal: {', '.join(unknown)}. "
+            f"Pilihan: {', '.join(KURIKULUM_LIST_FIELDS)}"
+        )
+    return names
+
+
 @router.get(
     "/",
-    response_model=KurikulumListResponse,
+    response_model=KurikulumPageResponse,
     summary="List curricula",
-    description="Get list of curricula with optional filters"
+    description=(
+        "Get one page of curricula (newest first) with optional filters. "
+        "Pass next_cursor back as cursor to fetch the following page."
+    )
 )
 def list_kurikulum(
+    request: Request,
     id_prodi: Optional[str] = Query(None, description="Filter by program study ID"),
     status_filter: Optional[KurikulumStatusEnum] = Query(None, alias="status", description="Filter by status"),
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    count: CountStrategy = Query(CountStrategy.EXACT, description="Total count: exact, estimate or none"),
     use_cases: KurikulumUseCases = Depends(get_kurikulum_use_cases)
-) -> KurikulumListResponse:
+) -> PreEncodedJSONResponse:
     """
     List curricula with optional filters.
 
+    The ETag is derived from max(updated_at) and count of the filtered
+    set plus the query string; a matching If-None-Match gets 304.
+
+    The page is validated once in bulk and returned as pre-encoded JSON;
+    response_model only documents it (see api/serialization.py).
+
     Args:
+        request: Incoming request (for If-None-Match)
         id_prodi: Optional program study ID filter
         status_filter: Optional status filter
+        limit: Page size
+        cursor: Cursor of the previous page
+        fields: Comma-separated projection
+        count: Total count strategy
         use_cases: Kurikulum use cases
 
     Returns:
-        KurikulumListResponse: List of curricula
+        PreEncodedJSONResponse: One page of curricula (KurikulumPageResponse)
     """
     # Convert enum to domain status if provided
     domain_status = None
     if status_filter:
         domain_status = KurikulumStatus(status_filter.value)
 
-    curricula = use_cases.list_kurikulum(
+    latest, total = use_cases.get_list_version(id_prodi=id_prodi, status=domain_status)
+    etag = build_etag("kurikulum-list", latest, total, request.url.query)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    page = use_cases.list_kurikulum(
         id_prodi=id_prodi,
-        status=domain_status
+        status=domain_status,
+        limit=limit,
+        cursor=cursor,
+        fields=parse_fields(fields),
+        count=count,
     )
 
-    return KurikulumListResponse(
-        total=len(curricula),
-        data=[KurikulumResponse.model_validate(k) for k in curricula]
-    )
+    response = PreEncodedJSONResponse(encode_json({
+        "total": page.total,
+        "total_is_estimate": page.total_is_estimate,
+        "next_cursor": page.next_cursor,
+        "data": validated_items(KURIKULUM_LIST_ADAPTER, page.items),
+    }))
+    set_etag(response, etag)
+    return response
 
 
 @router.get(
@@ -131,14 +228,24 @@ def list_kurikulum(
 )
 def get_kurikulum(
     id_kurikulum: int,
+    request: Request,
+    response: Response,
     include_statistics: bool = Query(False, description="Include statistics (CPL, MK, student counts)"),
     use_cases: KurikulumUseCases = Depends(get_kurikulum_use_cases)
 ) -> KurikulumResponse:
     """
     Get curriculum by ID.
 
+    Without statistics the ETag comes from (id_kurikulum, updated_at),
+    checked with a single-column query before the entity is loaded.
+    Statistics change without touching updated_at, so that variant is
+    tagged after loading. The ETag of a 200 always describes the body
+    actually served, which may come from the read-through cache.
+
     Args:
         id_kurikulum: Curriculum ID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         include_statistics: Whether to include statistics
         use_cases: Kurikulum use cases
 
@@ -148,12 +255,30 @@ def get_kurikulum(
     if include_statistics:
         result = use_cases.get_kurikulum_with_statistics(id_kurikulum)
         kurikulum = result["kurikulum"]
-        response = KurikulumResponse.model_validate(kurikulum)
-        response.statistics = result["statistics"]
-        return response
-    else:
-        kurikulum = use_cases.get_kurikulum_by_id(id_kurikulum)
-        return KurikulumResponse.model_validate(kurikulum)
+        statistics = result["statistics"]
+        etag = build_etag(
+            "kurikulum",
+            id_kurikulum,
+            kurikulum.updated_at,
+            *sorted(statistics.items())
+        )
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+
+        body = KurikulumResponse.model_validate(kurikulum)
+        body.statistics = KurikulumStatisticsResponse(**statistics)
+        return body
+
+    version = use_cases.get_kurikulum_version(id_kurikulum)
+    etag = build_etag("kurikulum", id_kurikulum, version)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    # A cached copy of another version is reloaded
+    kurikulum = use_cases.get_kurikulum_by_id(id_kurikulum, version=version)
+    set_etag(response, build_etag("kurikulum", id_kurikulum, kurikulum.updated_at))
+    return KurikulumResponse.model_validate(kurikulum)
 
 
 @router.put(
@@ -322,6 +447,78 @@ def deactivate_kurikulum(
     return KurikulumResponse.model_validate(kurikulum)
 
 
+@router.post(
+    "/{id_kurikulum}/cpl/import",
+    response_model=ImportResultResponse,
+    summary="Import CPL from file",
+    description=(
+        "Bulk import CPL from CSV/XLSX (columns: kode_cpl, deskripsi, kategori, urutan). "
+        "Invalid rows are reported and skipped"
+    )
+)
+def import_cpl(
+    id_kurikulum: int,
+    file: UploadFile = File(..., description="CSV or XLSX file"),
+    update_existing: bool = Query(False, description="Overwrite CPL whose code already exists"),
+    use_cases: ImportUseCases = Depends(get_import_use_cases)
+) -> ImportResultResponse:
+    """
+    Import CPL into a curriculum.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        file: Uploaded CSV or XLSX file
+        update_existing: Overwrite existing codes instead of rejecting them
+        use_cases: Import use cases
+
+    Returns:
+        ImportResultResponse: Counts and per-row errors
+    """
+    result = use_cases.import_cpl(
+        id_kurikulum=id_kurikulum,
+        stream=file.file,
+        filename=file.filename or "",
+        update_existing=update_existing,
+    )
+    return ImportResultResponse.model_validate(result)
+
+
+@router.post(
+    "/{id_kurikulum}/matakuliah/import",
+    response_model=ImportResultResponse,
+    summary="Import mata kuliah from file",
+    description=(
+        "Bulk import courses from CSV/XLSX (columns: kode_mk, nama_mk, sks, semester, "
+        "jenis_mk, nama_mk_eng, rumpun). Invalid rows are reported and skipped"
+    )
+)
+def import_matakuliah(
+    id_kurikulum: int,
+    file: UploadFile = File(..., description="CSV or XLSX file"),
+    update_existing: bool = Query(False, description="Overwrite courses whose code already exists"),
+    use_cases: ImportUseCases = Depends(get_import_use_cases)
+) -> ImportResultResponse:
+    """
+    Import courses into a curriculum.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        file: Uploaded CSV or XLSX file
+        update_existing: Overwrite existing codes instead of rejecting them
+        use_cases: Import use cases
+
+    Returns:
+        ImportResultResponse: Counts and per-row errors
+    """
+    result = use_cases.import_matakuliah(
+        id_kurikulum=id_kurikulum,
+        stream=file.file,
+        filename=file.filename or "",
+        update_existing=update_existing,
+    )
+    return ImportResultResponse.model_validate(result)
+
+
 @router.get(
     "/prodi/{id_prodi}/active",
     response_model=KurikulumListResponse,
@@ -330,6 +527,8 @@ def deactivate_kurikulum(
 )
 def get_active_curricula(
     id_prodi: str,
+    request: Request,
+    response: Response,
     use_cases: KurikulumUseCases = Depends(get_kurikulum_use_cases)
 ) -> KurikulumListResponse:
     """
@@ -337,12 +536,24 @@ def get_active_curricula(
 
     Args:
         id_prodi: Program study ID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         use_cases: Kurikulum use cases
 
     Returns:
         KurikulumListResponse: List of active curricula
     """
-    curricula = use_cases.get_active_curricula(id_prodi)
+    version = use_cases.get_list_version(
+        id_prodi=id_prodi,
+        status=KurikulumStatus.AKTIF
+    )
+    etag = build_etag("kurikulum-active", id_prodi, *version)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    # Tagged with the version of the list actually served
+    curricula = use_cases.get_active_curricula(id_prodi, version=version)
+    set_etag(response, build_etag("kurikulum-active", id_prodi, *list_version(curricula)))
 
     return KurikulumListResponse(
         total=len(curricula),
@@ -358,6 +569,8 @@ def get_active_curricula(
 )
 def get_primary_curriculum(
     id_prodi: str,
+    request: Request,
+    response: Response,
     use_cases: KurikulumUseCases = Depends(get_kurikulum_use_cases)
 ) -> KurikulumResponse:
     """
@@ -365,6 +578,8 @@ def get_primary_curriculum(
 
     Args:
         id_prodi: Program study ID
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for ETag)
         use_cases: Kurikulum use cases
 
     Returns:
@@ -372,11 +587,18 @@ def get_primary_curriculum(
     """
     from app.domain.exceptions import NotFoundException
 
-    kurikulum = use_cases.get_primary_curriculum(id_prodi)
+    version = use_cases.get_primary_version(id_prodi)
+    etag = build_etag("kurikulum-primary", id_prodi, *version)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    kurikulum = use_cases.get_primary_curriculum(id_prodi, version=version)
 
     if not kurikulum:
         raise NotFoundException(
             f"Tidak ada kurikulum primary untuk prodi '{id_prodi}'"
         )
 
+    # Tagged with the version of the curriculum actually served
+    set_etag(response, build_etag("kurikulum-primary", id_prodi, *primary_version(kurikulum)))
     return KurikulumResponse.model_validate(kurikulum)
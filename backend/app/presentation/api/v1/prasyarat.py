@@ -0,0 +1,249 @@
+"""
+Prasyarat API Router
+
+REST API endpoints for course prerequisites and study plans.
+Following Clean Code: Clear naming, single responsibility, proper HTTP methods.
+"""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+
+from app.application.use_cases import PrasyaratUseCases
+from app.domain.entities import TipePrasyarat
+from app.presentation.api.v1.kurikulum import get_db
+from app.presentation.schemas import (
+    PrasyaratCreateRequest,
+    PrasyaratResponse,
+    PrasyaratEdgeResponse,
+    PrasyaratGraphResponse,
+    PrasyaratListResponse,
+    RencanaStudiTahapResponse,
+    RencanaStudiResponse,
+    MataKuliahTersediaRequest,
+    MataKuliahTersediaResponse,
+    MessageResponse,
+)
+
+# Create router
+router = APIRouter()
+
+
+def get_prasyarat_use_cases(
+    db: Session = Depends(get_db)
+) -> PrasyaratUseCases:
+    """
+    Dependency for Prasyarat use cases.
+
+    Args:
+        db: Database session
+
+    Returns:
+        PrasyaratUseCases: Use cases instance
+    """
+    return PrasyaratUseCases(db)
+
+
+@router.get(
+    "/{id_kurikulum}/prasyarat",
+    response_model=PrasyaratGraphResponse,
+    summary="Get prerequisite graph",
+    description="Get every prerequisite between the active courses of a curriculum"
+)
+def get_prasyarat_graph(
+    id_kurikulum: int,
+    use_cases: PrasyaratUseCases = Depends(get_prasyarat_use_cases)
+) -> PrasyaratGraphResponse:
+    """
+    Get prerequisite graph of a curriculum.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        use_cases: Prasyarat use cases
+
+    Returns:
+        PrasyaratGraphResponse: Graph edges
+    """
+    graph = use_cases.get_graph(id_kurikulum)
+    edges = graph.edges()
+
+    return PrasyaratGraphResponse(
+        id_kurikulum=id_kurikulum,
+        total_matakuliah=len(graph.semesters),
+        total_prasyarat=len(edges),
+        data=[
+            PrasyaratEdgeResponse(
+                kode_mk=kode_mk,
+                kode_mk_prasyarat=kode_mk_prasyarat,
+                tipe_prasyarat=tipe.value
+            )
+            for kode_mk, kode_mk_prasyarat, tipe in edges
+        ]
+    )
+
+
+@router.post(
+    "/{id_kurikulum}/prasyarat",
+    response_model=PrasyaratResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Add prerequisite",
+    description="Add a prerequisite to a course; rejected if it would create a cycle"
+)
+def add_prasyarat(
+    id_kurikulum: int,
+    request: PrasyaratCreateRequest,
+    use_cases: PrasyaratUseCases = Depends(get_prasyarat_use_cases)
+) -> PrasyaratResponse:
+    """
+    Add prerequisite.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        request: Prerequisite data
+        use_cases: Prasyarat use cases
+
+    Returns:
+        PrasyaratResponse: Created prerequisite
+    """
+    prasyarat = use_cases.add_prerequisite(
+        id_kurikulum=id_kurikulum,
+        kode_mk=request.kode_mk,
+        kode_mk_prasyarat=request.kode_mk_prasyarat,
+        tipe_prasyarat=TipePrasyarat(request.tipe_prasyarat.value),
+    )
+
+    return PrasyaratResponse.model_validate(prasyarat)
+
+
+@router.delete(
+    "/{id_kurikulum}/prasyarat/{kode_mk}/{kode_mk_prasyarat}",
+    response_model=MessageResponse,
+    summary="Remove prerequisite",
+    description="Remove a prerequisite from a course"
+)
+def remove_prasyarat(
+    id_kurikulum: int,
+    kode_mk: str,
+    kode_mk_prasyarat: str,
+    use_cases: PrasyaratUseCases = Depends(get_prasyarat_use_cases)
+) -> MessageResponse:
+    """
+    Remove prerequisite.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        kode_mk: Course code
+        kode_mk_prasyarat: Prerequisite course code
+        use_cases: Prasyarat use cases
+
+    Returns:
+        MessageResponse: Success message
+    """
+    use_cases.remove_prerequisite(id_kurikulum, kode_mk, kode_mk_prasyarat)
+
+    return MessageResponse(
+        success=True,
+        message=f"Prasyarat {kode_mk_prasyarat} untuk {kode_mk} berhasil dihapus"
+    )
+
+
+@router.get(
+    "/{id_kurikulum}/matakuliah/{kode_mk}/prasyarat",
+    response_model=PrasyaratListResponse,
+    summary="Get prerequisites of a course",
+    description="Get direct or transitive prerequisites of a course"
+)
+def get_prasyarat_matakuliah(
+    id_kurikulum: int,
+    kode_mk: str,
+    transitive: bool = Query(False, description="Include indirect prerequisites"),
+    use_cases: PrasyaratUseCases = Depends(get_prasyarat_use_cases)
+) -> PrasyaratListResponse:
+    """
+    Get prerequisites of a course.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        kode_mk: Course code
+        transitive: Include indirect prerequisites
+        use_cases: Prasyarat use cases
+
+    Returns:
+        PrasyaratListResponse: Prerequisite codes
+    """
+    codes = use_cases.get_prerequisites(id_kurikulum, kode_mk, transitive=transitive)
+
+    return PrasyaratListResponse(
+        kode_mk=kode_mk,
+        transitive=transitive,
+        total=len(codes),
+        data=codes
+    )
+
+
+@router.get(
+    "/{id_kurikulum}/rencana-studi",
+    response_model=RencanaStudiResponse,
+    summary="Get layered study plan",
+    description=(
+        "Group courses by the earliest term they can be taken given their "
+        "prerequisites, and list prerequisites the planned semesters violate"
+    )
+)
+def get_rencana_studi(
+    id_kurikulum: int,
+    use_cases: PrasyaratUseCases = Depends(get_prasyarat_use_cases)
+) -> RencanaStudiResponse:
+    """
+    Get semester-layered study plan.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        use_cases: Prasyarat use cases
+
+    Returns:
+        RencanaStudiResponse: Layers and semester conflicts
+    """
+    graph = use_cases.get_study_plan(id_kurikulum)
+
+    return RencanaStudiResponse(
+        id_kurikulum=id_kurikulum,
+        tahap=[
+            RencanaStudiTahapResponse(tahap=index, matakuliah=layer)
+            for index, layer in enumerate(graph.semester_layers(), start=1)
+        ],
+        konflik_semester=[
+            PrasyaratEdgeResponse(
+                kode_mk=kode_mk,
+                kode_mk_prasyarat=kode_mk_prasyarat,
+                tipe_prasyarat=tipe.value
+            )
+            for kode_mk, kode_mk_prasyarat, tipe in graph.semester_conflicts()
+        ]
+    )
+
+
+@router.post(
+    "/{id_kurikulum}/matakuliah/tersedia",
+    response_model=MataKuliahTersediaResponse,
+    summary="Get courses available next",
+    description="Get courses whose prerequisites are satisfied by the passed courses"
+)
+def get_matakuliah_tersedia(
+    id_kurikulum: int,
+    request: MataKuliahTersediaRequest,
+    use_cases: PrasyaratUseCases = Depends(get_prasyarat_use_cases)
+) -> MataKuliahTersediaResponse:
+    """
+    Get courses a student can take next.
+
+    Args:
+        id_kurikulum: Curriculum ID
+        request: Passed courses
+        use_cases: Prasyarat use cases
+
+    Returns:
+        MataKuliahTersediaResponse: Available course codes
+    """
+    codes = use_cases.get_available_courses(id_kurikulum, request.lulus)
+
+    return MataKuliahTersediaResponse(total=len(codes), data=codes)
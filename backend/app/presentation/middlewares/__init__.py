@@ -1,3 +1,19 @@
 """
 Custom Middlewares
 """
+
+from app.presentation.middlewares.access_log import (
+    AccessLogMiddleware,
+    configure_access_logger,
+)
+from app.presentation.middlewares.metrics import MetricsMiddleware
+from app.presentation.middlewares.profiling import ProfilingMiddleware
+from app.presentation.middlewares.tracing import TracingMiddleware
+
+__all__ = [
+    "AccessLogMiddleware",
+    "configure_access_logger",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "TracingMiddleware",
+]
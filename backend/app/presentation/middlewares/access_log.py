@@ -0,0 +1,231 @@
+"""
+Access Log Middleware
+
+Request timing and structured access logging as one pure ASGI middleware.
+Following Clean Code: Single Responsibility, No I/O on the event loop.
+
+Starlette's BaseHTTPMiddleware (what @app.middleware("http") builds) runs
+each request through an extra task and a memory stream, per middleware.
+This middleware only wraps `send` to stamp headers and observe the
+status, and hands the access record to a QueueHandler; formatting and
+writing happen on the QueueListener thread.
+"""
+
+import json
+import logging
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.query_stats import RoundTripStats, track_round_trips
+
+ACCESS_LOGGER_NAME = "app.access"
+
+
+class JsonAccessFormatter(logging.Formatter):
+    """Formats access records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            **getattr(record, "access", {"message": record.getMessage()}),
+        }
+        return json.dumps(payload, separators=(",", ":"), default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler over a bounded queue that drops records when full.
+
+    A stalled log sink must never block or fail requests.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Access records carry their data in record.access; skip the
+        # message formatting and record copy the base class does here
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_access_logger(
+    stream: Any = None,
+    max_queue_size: int = 10000
+) -> QueueListener:
+    """
+    Route the access logger through a queue to a JSON stream handler.
+
+    Args:
+        stream: Output stream (optional, stdout if not provided)
+        max_queue_size: Records buffered before new ones are dropped
+
+    Returns:
+        QueueListener: Started listener; stop() it on shutdown to flush
+    """
+    log_queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+    stream_handler = logging.StreamHandler(stream or sys.stdout)
+    stream_handler.setFormatter(JsonAccessFormatter())
+
+    access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+    for handler in list(access_logger.handlers):
+        access_logger.removeHandler(handler)
+    access_logger.addHandler(DroppingQueueHandler(log_queue))
+    access_logger.setLevel(logging.INFO)
+    access_logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+class AccessLogMiddleware:
+    """
+    Pure ASGI middleware: timing headers and one access record per request.
+
+    Adds X-Process-Time (seconds) and, outside production, the database
+    headers X-DB-Round-Trips, X-DB-Time (milliseconds) and, for likely
+    N+1 requests, X-DB-Repeated-Statement ("<count>x <fingerprint>") to
+    every HTTP response. Successful (2xx) requests are logged with
+    probability sample_rate_2xx; everything else, any request slower
+    than slow_request_ms and any request repeating one statement
+    fingerprint repeated_statement_threshold times or more (logged at
+    WARNING with the fingerprints) is always logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate_2xx: float = 1.0,
+        slow_request_ms: Optional[float] = None,
+        expose_round_trips: bool = True,
+        repeated_statement_threshold: Optional[int] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            sample_rate_2xx: Fraction of 2xx requests logged (0.0 - 1.0)
+            slow_request_ms: Always log requests slower than this (optional)
+            expose_round_trips: Add the X-DB-* headers
+            repeated_statement_threshold: Executions of one statement
+                fingerprint flagged as N+1 (optional, no detection if None)
+            logger: Access logger (optional, "app.access" if not provided)
+        """
+        self.app = app
+        self.sample_rate_2xx = sample_rate_2xx
+        self.slow_request_ns = (
+            int(slow_request_ms * 1_000_000) if slow_request_ms is not None else None
+        )
+        self.expose_round_trips = expose_round_trips
+        self.repeated_statement_threshold = repeated_statement_threshold
+        self.logger = logger or logging.getLogger(ACCESS_LOGGER_NAME)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter_ns()
+        status_code = 500
+
+        with track_round_trips() as round_trips:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    elapsed = time.perf_counter_ns() - started
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-Process-Time", f"{elapsed / 1e9:.6f}")
+                    if self.expose_round_trips:
+                        self._add_db_headers(headers, round_trips)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status_code, time.perf_counter_ns() - started, round_trips)
+
+    def _repeated(self, round_trips: RoundTripStats) -> list:
+        """Statement fingerprints at or above the N+1 threshold."""
+        if self.repeated_statement_threshold is None:
+            return []
+        return round_trips.repeated_statements(self.repeated_statement_threshold)
+
+    def _add_db_headers(self, headers: MutableHeaders, round_trips: RoundTripStats) -> None:
+        """Stamp the database round-trip headers."""
+        headers.append("X-DB-Round-Trips", str(round_trips.total))
+        headers.append("X-DB-Time", f"{round_trips.db_time_ms:.3f}")
+        repeated = self._repeated(round_trips)
+        if repeated:
+            statement, count = repeated[0]
+            value = f"{count}x {statement[:200]}"
+            headers.append("X-DB-Repeated-Statement", value.encode("latin-1", "replace").decode("latin-1"))
+
+    def _log(
+        self,
+        scope: Scope,
+        status_code: int,
+        elapsed_ns: int,
+        round_trips: RoundTripStats
+    ) -> None:
+        """Emit the access record unless sampled out."""
+        repeated = self._repeated(round_trips)
+        sampled = (
+            200 <= status_code < 300
+            and not repeated
+            and self.sample_rate_2xx < 1.0
+            and (self.slow_request_ns is None or elapsed_ns < self.slow_request_ns)
+        )
+        if sampled and random.random() >= self.sample_rate_2xx:
+            return
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        client = scope.get("client")
+        access: Dict[str, Any] = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round(elapsed_ns / 1e6, 3),
+            "db_round_trips": round_trips.total,
+            "db_time_ms": round(round_trips.db_time_ms, 3),
+            "client": client[0] if client else None,
+        }
+        if scope.get("query_string"):
+            access["query"] = scope["query_string"].decode("latin-1")
+        if sampled:
+            # Lets log consumers scale counts back up
+            access["sample_rate"] = self.sample_rate_2xx
+        if repeated:
+            access["repeated_statements"] = [
+                {"statement": statement, "count": count} for statement, count in repeated
+            ]
+
+        self.logger.log(
+            logging.WARNING if repeated else logging.INFO,
+            "%(method)s %(path)s %(status)s",
+            access,
+            extra={"access": access}
+        )
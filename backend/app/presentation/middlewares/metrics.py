@@ -0,0 +1,82 @@
+"""
+Metrics Middleware
+
+Per-route latency histograms and in-flight gauges as pure ASGI middleware.
+Following Clean Code: Single Responsibility, Bounded label cardinality.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics import in_progress, observe_request
+
+# Label of requests no route matched (404s, scanners); raw paths would
+# create one time series per probed URL
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Route template of a handled request.
+
+    FastAPI stores the matched APIRoute in the (shared) scope while
+    routing, so it is available once the app returns.
+
+    Args:
+        scope: ASGI scope after the request was handled
+
+    Returns:
+        str: e.g. /api/v1/kurikulum/{id_kurikulum}
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if "endpoint" in scope:
+        # Plain Starlette routes (/docs, /openapi.json) have fixed paths
+        return scope["path"]
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Records latency by (method, route template, status) and in-flight
+    requests by method for every HTTP request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        gauge = in_progress(method)
+        gauge.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            gauge.dec()
+            observe_request(
+                method,
+                route_template(scope),
+                status_code,
+                time.perf_counter() - started
+            )
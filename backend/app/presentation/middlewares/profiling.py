@@ -0,0 +1,103 @@
+"""
+Profiling Middleware
+
+Samples one request when it carries a profiling token minted by an admin.
+Following Clean Code: Single Responsibility, No cost unless asked for.
+
+Requests without the header cost one scan of the header list; with
+PROFILING_ENABLED off the middleware is not installed at all.
+"""
+
+import logging
+import sys
+import time
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.security import AuthContext
+from app.infrastructure.profiling import (
+    ProfileStore,
+    SamplingProfiler,
+    get_profile_store,
+    new_profile,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware running a sampling profiler for flagged requests.
+
+    A request is profiled when its header_name header holds a valid
+    profile token (TokenManager.create_profiling_token) whose path claim
+    prefixes the request path. The response gets an X-Profile-Id header;
+    the profile is fetched from /api/v1/admin/profiles/{id}.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Profile-Token",
+        interval_ms: float = 1.0,
+        max_seconds: float = 30.0,
+        store: Optional[ProfileStore] = None,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            header_name: Request header carrying the profiling token
+            interval_ms: Sampling interval
+            max_seconds: Sampling stops after this long
+            store: Where finished profiles go (optional, process-wide store)
+        """
+        self.app = app
+        self.header_name = header_name.lower().encode("latin-1")
+        self.interval_ms = interval_ms
+        self.max_seconds = max_seconds
+        self.store = store or get_profile_store()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == self.header_name:
+                    if self._authorized(scope, value):
+                        await self._profile(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+    def _authorized(self, scope: Scope, value: bytes) -> bool:
+        """Whether the header holds a valid profile token for this path."""
+        auth = AuthContext.from_token(value.decode("latin-1"))
+        if auth is None or not auth.is_type("profile"):
+            logger.warning(f"Invalid profiling token for {scope['path']}")
+            return False
+        return scope["path"].startswith(auth.claims.get("path", "/"))
+
+    async def _profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profile = new_profile(scope["method"], scope["path"], self.interval_ms)
+        profiler = SamplingProfiler(profile, sys._getframe(), self.max_seconds)
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile.id)
+            await send(message)
+
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            profile.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+            self.store.add(profile)
+            logger.info(
+                f"Profiled {profile.method} {profile.path}: "
+                f"{len(profile.samples)} samples, id {profile.id}"
+            )
@@ -0,0 +1,76 @@
+"""
+Tracing Middleware
+
+One OpenTelemetry server span per HTTP request as pure ASGI middleware.
+Following Clean Code: Single Responsibility, Bounded span names.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.tracing import (
+    SpanKind,
+    Status,
+    StatusCode,
+    extract_context,
+    get_tracer,
+)
+from app.presentation.middlewares.metrics import route_template
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware starting the root span of each request.
+
+    Continues the caller's trace when a traceparent header is present.
+    The span is named after the route template (GET
+    /api/v1/kurikulum/{id_kurikulum}) once routing is done, and the
+    response carries the trace ID in X-Trace-Id.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with get_tracer().start_as_current_span(
+            method,
+            context=extract_context(scope["headers"]),
+            kind=SpanKind.SERVER,
+            attributes={
+                "http.method": method,
+                "http.target": scope["path"],
+                "http.scheme": scope.get("scheme", "http"),
+            },
+        ) as span:
+            span_context = span.get_span_context()
+
+            async def send_with_trace_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    span.set_attribute("http.status_code", status_code)
+                    if status_code >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                    if span_context.is_valid:
+                        MutableHeaders(scope=message).append(
+                            "X-Trace-Id",
+                            format(span_context.trace_id, "032x")
+                        )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                route = route_template(scope)
+                span.update_name(f"{method} {route}")
+                span.set_attribute("http.route", route)
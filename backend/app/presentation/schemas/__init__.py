@@ -11,7 +11,11 @@ from app.presentation.schemas.kurikulum_schemas import (
     KurikulumActivateRequest,
     KurikulumResponse,
     KurikulumListResponse,
+    KurikulumPageResponse,
     KurikulumStatisticsResponse,
+    KurikulumListItem,
+    KURIKULUM_LIST_FIELDS,
+    KURIKULUM_LIST_ADAPTER,
     # CPL schemas
     CPLCreateRequest,
     CPLUpdateRequest,
@@ -22,6 +26,24 @@ from app.presentation.schemas.kurikulum_schemas import (
     MataKuliahUpdateRequest,
     MataKuliahResponse,
     MataKuliahListResponse,
+    # Prasyarat schemas
+    PrasyaratCreateRequest,
+    PrasyaratResponse,
+    PrasyaratEdgeResponse,
+    PrasyaratGraphResponse,
+    PrasyaratListResponse,
+    RencanaStudiTahapResponse,
+    RencanaStudiResponse,
+    MataKuliahTersediaRequest,
+    MataKuliahTersediaResponse,
+    # Import schemas
+    ImportRowErrorResponse,
+    ImportResultResponse,
+    # Ketercapaian schemas
+    KetercapaianCPMKResponse,
+    KetercapaianCPLResponse,
+    KetercapaianKelasResponse,
+    KetercapaianAngkatanResponse,
     # Common schemas
     MessageResponse,
     ErrorResponse,
@@ -29,6 +51,20 @@ from app.presentation.schemas.kurikulum_schemas import (
     KurikulumStatusEnum,
     CPLKategoriEnum,
     JenisMKEnum,
+    TipePrasyaratEnum,
+)
+from app.presentation.schemas.auth_schemas import (
+    LoginRequest,
+    TokenResponse,
+    ProfileResponse,
+)
+from app.presentation.schemas.admin_schemas import (
+    SlowQueryResponse,
+    SlowQueryListResponse,
+    ProfilingTokenRequest,
+    ProfilingTokenResponse,
+    ProfileSummaryResponse,
+    ProfileListResponse,
 )
 
 __all__ = [
@@ -38,7 +74,11 @@ __all__ = [
     "KurikulumActivateRequest",
     "KurikulumResponse",
     "KurikulumListResponse",
+    "KurikulumPageResponse",
     "KurikulumStatisticsResponse",
+    "KurikulumListItem",
+    "KURIKULUM_LIST_FIELDS",
+    "KURIKULUM_LIST_ADAPTER",
     # CPL
     "CPLCreateRequest",
     "CPLUpdateRequest",
@@ -49,6 +89,35 @@ __all__ = [
     "MataKuliahUpdateRequest",
     "MataKuliahResponse",
     "MataKuliahListResponse",
+    # Prasyarat
+    "PrasyaratCreateRequest",
+    "PrasyaratResponse",
+    "PrasyaratEdgeResponse",
+    "PrasyaratGraphResponse",
+    "PrasyaratListResponse",
+    "RencanaStudiTahapResponse",
+    "RencanaStudiResponse",
+    "MataKuliahTersediaRequest",
+    "MataKuliahTersediaResponse",
+    # Import
+    "ImportRowErrorResponse",
+    "ImportResultResponse",
+    # Ketercapaian
+    "KetercapaianCPMKResponse",
+    "KetercapaianCPLResponse",
+    "KetercapaianKelasResponse",
+    "KetercapaianAngkatanResponse",
+    # Auth
+    "LoginRequest",
+    "TokenResponse",
+    "ProfileResponse",
+    # Admin
+    "SlowQueryResponse",
+    "SlowQueryListResponse",
+    "ProfilingTokenRequest",
+    "ProfilingTokenResponse",
+    "ProfileSummaryResponse",
+    "ProfileListResponse",
     # Common
     "MessageResponse",
     "ErrorResponse",
@@ -56,4 +125,5 @@ __all__ = [
     "KurikulumStatusEnum",
     "CPLKategoriEnum",
     "JenisMKEnum",
+    "TipePrasyaratEnum",
 ]
@@ -0,0 +1,83 @@
+"""
+Admin Schemas
+
+Pydantic models for operational / diagnostics endpoints.
+Following Clean Code: Clear naming, Documentation.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class SlowQueryResponse(BaseModel):
+    """Schema for one slow query log entry."""
+
+    statement: str = Field(..., description="Normalized SQL, literals replaced by ?")
+    parameters: Any = Field(None, description="Bound-parameter names and types (no values)")
+    duration_ms: float = Field(..., description="Execution time in milliseconds")
+    caller: Optional[str] = Field(None, description="Method that issued the statement")
+    recorded_at: datetime = Field(..., description="When the statement finished (UTC)")
+    executemany: bool = Field(False, description="Executed once per parameter set")
+    plan: Optional[str] = Field(None, description="EXPLAIN (ANALYZE, BUFFERS) output, if sampled")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SlowQueryListResponse(BaseModel):
+    """Schema for the slow query log of the serving worker."""
+
+    threshold_ms: float = Field(..., description="Slow-query threshold")
+    capacity: int = Field(..., description="Entries kept per worker")
+    data: List[SlowQueryResponse] = Field(..., description="Slow queries, newest first")
+
+
+class ProfilingTokenRequest(BaseModel):
+    """Schema for requesting a profiling token."""
+
+    path_prefix: str = Field(
+        "/",
+        description="Only requests under this path are profiled",
+        pattern=r"^/"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "path_prefix": "/api/v1/kurikulum"
+            }
+        }
+    )
+
+
+class ProfilingTokenResponse(BaseModel):
+    """Schema for an issued profiling token."""
+
+    token: str = Field(..., description="Profiling token")
+    header_name: str = Field(..., description="Request header to send it in")
+    expires_in: int = Field(..., description="Token lifetime in seconds")
+
+
+class ProfileSummaryResponse(BaseModel):
+    """Schema for a kept request profile."""
+
+    id: str = Field(..., description="Profile ID (X-Profile-Id)")
+    method: str = Field(..., description="HTTP method")
+    path: str = Field(..., description="Request path")
+    status: Optional[int] = Field(None, description="Response status code")
+    started_at: datetime = Field(..., description="Request start (UTC)")
+    duration_ms: Optional[float] = Field(None, description="Wall time of the request")
+    interval_ms: float = Field(..., description="Sampling interval")
+    sample_count: int = Field(..., description="Samples taken")
+    layers: Dict[str, float] = Field(
+        ...,
+        description="Sampled milliseconds per layer (router, use_case, repository, "
+                    "database, serialization, other)"
+    )
+
+
+class ProfileListResponse(BaseModel):
+    """Schema for the profiles kept by the serving worker."""
+
+    data: List[ProfileSummaryResponse] = Field(..., description="Profiles, newest first")
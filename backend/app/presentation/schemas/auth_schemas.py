@@ -0,0 +1,45 @@
+"""
+Auth Schemas
+
+Pydantic models for authentication request/response validation.
+Following Clean Code: Clear naming, Validation rules, Documentation.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class LoginRequest(BaseModel):
+    """Schema for login."""
+
+    username: str = Field(..., description="Username", min_length=1, max_length=50)
+    password: str = Field(..., description="Password", min_length=1, max_length=128)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "username": "dosen01",
+                "password": "rahasia123"
+            }
+        }
+    )
+
+
+class TokenResponse(BaseModel):
+    """Schema for issued tokens."""
+
+    access_token: str = Field(..., description="JWT access token")
+    refresh_token: str = Field(..., description="JWT refresh token")
+    token_type: str = Field("bearer", description="Token type")
+    expires_in: int = Field(..., description="Access token lifetime in seconds")
+
+
+class ProfileResponse(BaseModel):
+    """Schema for the authenticated user."""
+
+    id_user: int = Field(..., description="User ID")
+    username: str = Field(..., description="Username")
+    user_type: str = Field(..., description="User type")
+    roles: List[str] = Field(default_factory=list, description="Assigned roles")
+    permissions: List[str] = Field(default_factory=list, description="Granted permissions")
@@ -5,8 +5,9 @@ Pydantic models for request/response validation and serialization.
 Following Clean Code: Clear naming, type safety, comprehensive validation.
 """
 
-from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter, validator, ConfigDict
 from typing import Optional, List
+from typing_extensions import TypedDict
 from datetime import date, datetime
 from enum import Enum
 
@@ -40,6 +41,13 @@ class JenisMKEnum(str, Enum):
     MKWU = "MKWU"
 
 
+class TipePrasyaratEnum(str, Enum):
+    """Prerequisite type enumeration."""
+
+    WAJIB = "wajib"
+    ALTERNATIF = "alternatif"
+
+
 # ===== Kurikulum Schemas =====
 
 class KurikulumCreateRequest(BaseModel):
@@ -171,6 +179,56 @@ class KurikulumListResponse(BaseModel):
     data: List[KurikulumResponse] = Field(..., description="List of curricula")
 
 
+# Columns selectable through GET /kurikulum?fields=...
+KURIKULUM_LIST_FIELDS = tuple(
+    name for name in KurikulumResponse.model_fields if name != "statistics"
+)
+
+# One curriculum of a list page; only the requested fields are present
+KurikulumListItem = TypedDict(
+    "KurikulumListItem",
+    {name: KurikulumResponse.model_fields[name].annotation for name in KURIKULUM_LIST_FIELDS},
+    total=False
+)
+
+# Validates a whole page of items in one call (see api/serialization.py)
+KURIKULUM_LIST_ADAPTER = TypeAdapter(List[KurikulumListItem])
+
+
+class KurikulumPageResponse(BaseModel):
+    """Schema for one keyset page of curricula."""
+
+    total: Optional[int] = Field(
+        None,
+        description="Total number of records (omitted when count=none)"
+    )
+    total_is_estimate: bool = Field(
+        False,
+        description="Whether total is a planner estimate (count=estimate)"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page, null on the last page"
+    )
+    data: List[KurikulumListItem] = Field(
+        ...,
+        description="Curricula, restricted to the requested fields"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "total": 42,
+                "total_is_estimate": False,
+                "next_cursor": "WzIwMjAsMTdd",
+                "data": [
+                    {"id_kurikulum": 18, "kode_kurikulum": "K2024", "tahun_berlaku": 2024}
+                ]
+            }
+        }
+    )
+
+
 # ===== CPL Schemas =====
 
 class CPLCreateRequest(BaseModel):
@@ -288,6 +346,191 @@ class MataKuliahListResponse(BaseModel):
     data: List[MataKuliahResponse]
 
 
+# ===== Prasyarat Schemas =====
+
+class PrasyaratCreateRequest(BaseModel):
+    """Schema for adding a course prerequisite."""
+
+    kode_mk: str = Field(..., description="Course code", min_length=1, max_length=20)
+    kode_mk_prasyarat: str = Field(
+        ...,
+        description="Prerequisite course code (same curriculum)",
+        min_length=1,
+        max_length=20
+    )
+    tipe_prasyarat: TipePrasyaratEnum = Field(
+        TipePrasyaratEnum.WAJIB,
+        description="wajib: must be passed; alternatif: any one alternative is enough"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "kode_mk": "TIF201",
+                "kode_mk_prasyarat": "TIF101",
+                "tipe_prasyarat": "wajib"
+            }
+        }
+    )
+
+
+class PrasyaratResponse(BaseModel):
+    """Schema for prerequisite response."""
+
+    id_prasyarat: int
+    kode_mk: str
+    id_kurikulum: int
+    kode_mk_prasyarat: str
+    tipe_prasyarat: TipePrasyaratEnum
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PrasyaratEdgeResponse(BaseModel):
+    """Schema for one edge of the prerequisite graph."""
+
+    kode_mk: str
+    kode_mk_prasyarat: str
+    tipe_prasyarat: TipePrasyaratEnum
+
+
+class PrasyaratGraphResponse(BaseModel):
+    """Schema for the prerequisite graph of a curriculum."""
+
+    id_kurikulum: int
+    total_matakuliah: int = Field(..., description="Active courses (graph vertices)")
+    total_prasyarat: int = Field(..., description="Prerequisite edges")
+    data: List[PrasyaratEdgeResponse]
+
+
+class PrasyaratListResponse(BaseModel):
+    """Schema for the prerequisites of one course."""
+
+    kode_mk: str
+    transitive: bool = Field(..., description="Whether indirect prerequisites are included")
+    total: int
+    data: List[str]
+
+
+class RencanaStudiTahapResponse(BaseModel):
+    """Schema for one layer of a study plan."""
+
+    tahap: int = Field(..., description="Earliest term the courses can be taken (1-based)")
+    matakuliah: List[str]
+
+
+class RencanaStudiResponse(BaseModel):
+    """Schema for the semester-layered study plan of a curriculum."""
+
+    id_kurikulum: int
+    tahap: List[RencanaStudiTahapResponse]
+    konflik_semester: List[PrasyaratEdgeResponse] = Field(
+        ...,
+        description="Prerequisites not planned in an earlier semester than their course"
+    )
+
+
+class MataKuliahTersediaRequest(BaseModel):
+    """Schema for asking which courses a student can take next."""
+
+    lulus: List[str] = Field(
+        default_factory=list,
+        description="Codes of courses the student has passed"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"lulus": ["TIF101", "TIF102"]}}
+    )
+
+
+class MataKuliahTersediaResponse(BaseModel):
+    """Schema for courses a student can take next."""
+
+    total: int
+    data: List[str]
+
+
+# ===== Import Schemas =====
+
+class ImportRowErrorResponse(BaseModel):
+    """Schema for a rejected import row."""
+
+    row: int = Field(..., description="Row number in the uploaded file (header is row 1)")
+    kode: Optional[str] = Field(None, description="Code of the rejected row, if readable")
+    message: str = Field(..., description="Reason the row was rejected")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ImportResultResponse(BaseModel):
+    """Schema for CPL / mata kuliah import result."""
+
+    total_rows: int = Field(..., description="Data rows read")
+    inserted: int = Field(..., description="New records inserted")
+    updated: int = Field(..., description="Existing records overwritten")
+    failed: int = Field(..., description="Rows rejected")
+    errors: List[ImportRowErrorResponse]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "total_rows": 3,
+                "inserted": 2,
+                "updated": 0,
+                "failed": 1,
+                "errors": [
+                    {
+                        "row": 4,
+                        "kode": "CPL-01",
+                        "message": "Kode 'CPL-01' muncul lebih dari sekali dalam berkas"
+                    }
+                ]
+            }
+        }
+    )
+
+
+# ===== Ketercapaian Schemas =====
+
+class KetercapaianCPMKResponse(BaseModel):
+    """Schema for CPMK achievement statistics of a class or cohort."""
+
+    id_cpmk: int
+    jumlah_mahasiswa: int = Field(..., description="Enrollments with at least one graded component")
+    rata_rata: float = Field(..., description="Average nilai_cpmk (0-100)")
+    jumlah_tercapai: int = Field(..., description="Enrollments reaching batas_kelulusan_cpmk")
+    persentase_tercapai: float
+
+
+class KetercapaianCPLResponse(BaseModel):
+    """Schema for CPL achievement statistics of a cohort."""
+
+    id_cpl: int
+    jumlah_mahasiswa: int = Field(..., description="Students with a contributing graded CPMK")
+    rata_rata: Optional[float] = Field(None, description="Average CPL achievement (0-100)")
+
+
+class KetercapaianKelasResponse(BaseModel):
+    """Schema for the CPMK achievement calculation of a class."""
+
+    id_kelas: int
+    total_ketercapaian: int = Field(..., description="ketercapaian_cpmk rows written")
+    cpmk: List[KetercapaianCPMKResponse]
+
+
+class KetercapaianAngkatanResponse(BaseModel):
+    """Schema for the CPMK and CPL achievement calculation of a cohort."""
+
+    id_kurikulum: int
+    angkatan: str
+    total_mahasiswa: int
+    total_ketercapaian: int = Field(..., description="ketercapaian_cpmk rows written")
+    cpmk: List[KetercapaianCPMKResponse]
+    cpl: List[KetercapaianCPLResponse]
+
+
 # ===== Common Schemas =====
 
 class MessageResponse(BaseModel):
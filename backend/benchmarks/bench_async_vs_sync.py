@@ -0,0 +1,120 @@
+"""
+Sync vs Async Database Path Benchmark
+
+Compares requests/sec of the psycopg2 (threadpool) path against the
+asyncpg (event loop) path for the same curriculum lookup.
+
+The sync use cases serve get_kurikulum_by_id from the read-through
+cache; the sync route runs them with NullCacheBackend so both sides
+query the database on every request.
+
+Requires a local PostgreSQL loaded with the OBE schema, configured via .env.
+
+Usage:
+    python -m benchmarks.bench_async_vs_sync --requests 5000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.application.use_cases import AsyncKurikulumUseCases, KurikulumUseCases
+from app.core.config import settings
+from app.infrastructure.cache import CachedKurikulumRepository, NullCacheBackend
+from app.infrastructure.database import (
+    async_engine,
+    get_async_database_session,
+    get_database_session,
+)
+from app.infrastructure.repositories import KurikulumRepository
+from app.presentation.schemas import KurikulumResponse
+
+
+def build_app() -> FastAPI:
+    """
+    Build a minimal app exposing one sync and one async route.
+
+    Returns:
+        FastAPI: Benchmark application
+    """
+    app = FastAPI()
+
+    @app.get("/sync/{id_kurikulum}")
+    def get_sync(id_kurikulum: int, db: Session = Depends(get_database_session)):
+        # No cache, like the async path: compare database round trips only
+        kurikulum_repo = KurikulumRepository(db)
+        use_cases = KurikulumUseCases(
+            db,
+            kurikulum_repo=kurikulum_repo,
+            kurikulum_cache=CachedKurikulumRepository(
+                kurikulum_repo,
+                NullCacheBackend(),
+                settings.cache.ttl_seconds
+            )
+        )
+        kurikulum = use_cases.get_kurikulum_by_id(id_kurikulum)
+        return KurikulumResponse.model_validate(kurikulum)
+
+    @app.get("/async/{id_kurikulum}")
+    async def get_async(
+        id_kurikulum: int,
+        db: AsyncSession = Depends(get_async_database_session)
+    ):
+        kurikulum = await AsyncKurikulumUseCases(db).get_kurikulum_by_id(id_kurikulum)
+        return KurikulumResponse.model_validate(kurikulum)
+
+    return app
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    path: str,
+    total_requests: int,
+    concurrency: int
+) -> float:
+    """
+    Fire total_requests GETs at path with bounded concurrency.
+
+    Returns:
+        float: Requests per second
+    """
+    remaining = iter(range(total_requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            response = await client.get(path)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return total_requests / elapsed
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label in ("sync", "async"):
+            path = f"/{label}/{args.id_kurikulum}"
+            # Warm up pools before measuring
+            await run_load(client, path, args.concurrency, args.concurrency)
+            rps = await run_load(client, path, args.requests, args.concurrency)
+            print(f"{label:>5}: {rps:10.1f} req/s "
+                  f"({args.requests} requests, concurrency {args.concurrency})")
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--id-kurikulum", type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
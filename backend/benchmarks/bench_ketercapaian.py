@@ -0,0 +1,266 @@
+"""
+Ketercapaian Engine vs SQL Path Benchmark
+
+Compares CPMK/CPL achievement for one cohort computed by
+KetercapaianEngine (snapshot queries + NumPy + one COPY upsert) against
+the set-based SQL path (INSERT ... SELECT ... GROUP BY ... ON CONFLICT
+for CPMK, then a GROUP BY roll-up for CPL).
+
+Without --database only the in-memory engine is timed on synthetic data.
+With --database a synthetic cohort is seeded into the PostgreSQL from .env
+(loaded with the OBE schema) inside one transaction that is rolled back at
+the end; seeding fires the per-row calculate_nilai_tertimbang trigger and
+is not timed.
+
+Usage:
+    python -m benchmarks.bench_ketercapaian --students 10000
+    python -m benchmarks.bench_ketercapaian --students 10000 --database
+"""
+
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.application.services import KetercapaianEngine
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.repositories import KetercapaianRepository, PenilaianSnapshot
+from app.infrastructure.unit_of_work import UnitOfWork
+
+
+ANGKATAN = "2024"
+CPMK_PER_COURSE = 3
+
+SEED_STATEMENTS = (
+    "INSERT INTO fakultas (id_fakultas, nama) VALUES ('BENCH', 'Benchmark')",
+    "INSERT INTO prodi (id_prodi, id_fakultas, nama, jenjang) "
+    "VALUES ('BENCH', 'BENCH', 'Benchmark', 'S1')",
+    "INSERT INTO cpl (id_kurikulum, kode_cpl, deskripsi, kategori) "
+    "SELECT :k, 'CPL-' || i, 'CPL ' || i, 'pengetahuan' FROM generate_series(1, :cpl) i",
+    "INSERT INTO matakuliah (kode_mk, id_kurikulum, nama_mk, sks, semester, jenis_mk) "
+    "SELECT 'MK' || i, :k, 'MK ' || i, 3, 1, 'wajib' FROM generate_series(1, :courses) i",
+    "INSERT INTO rps (kode_mk, id_kurikulum, semester_berlaku, tahun_ajaran) "
+    "SELECT kode_mk, :k, 'Ganjil', '2024/2025' FROM matakuliah WHERE id_kurikulum = :k",
+    "INSERT INTO cpmk (id_rps, kode_cpmk, deskripsi) "
+    "SELECT r.id_rps, 'CPMK-' || j, 'CPMK ' || j FROM rps r, generate_series(1, :cpmk) j "
+    "WHERE r.id_kurikulum = :k",
+    "INSERT INTO relasi_cpmk_cpl (id_cpmk, id_cpl, bobot_kontribusi) "
+    "SELECT c.id_cpmk, cpl.id_cpl, 25 + (c.id_cpmk + cpl.id_cpl) % 4 * 25 "
+    "FROM cpmk c JOIN rps r ON r.id_rps = c.id_rps "
+    "JOIN cpl ON cpl.id_kurikulum = r.id_kurikulum AND (c.id_cpmk + cpl.id_cpl) % 3 = 0 "
+    "WHERE r.id_kurikulum = :k",
+    "INSERT INTO template_penilaian (id_rps, id_cpmk, bobot) "
+    "SELECT c.id_rps, c.id_cpmk, round(100.0 / :cpmk, 2) "
+    "FROM cpmk c JOIN rps r ON r.id_rps = c.id_rps WHERE r.id_kurikulum = :k",
+    "INSERT INTO kelas (kode_mk, id_kurikulum, id_rps, nama_kelas, semester, tahun_ajaran, status) "
+    "SELECT kode_mk, :k, id_rps, 'A', 'Ganjil', '2024/2025', 'open' FROM rps WHERE id_kurikulum = :k",
+    "INSERT INTO komponen_penilaian (id_kelas, id_template, nama_komponen, bobot_realisasi, nilai_maksimal) "
+    "SELECT kl.id_kelas, t.id_template, 'Komponen ' || j, round(100.0 / :komponen, 2), 100 "
+    "FROM kelas kl CROSS JOIN generate_series(1, :komponen) j "
+    "JOIN cpmk c ON c.id_rps = kl.id_rps AND c.kode_cpmk = 'CPMK-' || ((j - 1) % :cpmk + 1) "
+    "JOIN template_penilaian t ON t.id_cpmk = c.id_cpmk "
+    "WHERE kl.id_kurikulum = :k",
+    "INSERT INTO mahasiswa (nim, nama, email, id_prodi, id_kurikulum, angkatan) "
+    "SELECT 'B' || lpad(i::text, 9, '0'), 'Mahasiswa ' || i, 'b' || i || '@bench.local', "
+    "'BENCH', :k, :angkatan FROM generate_series(1, :students) i",
+    "INSERT INTO enrollment (nim, id_kelas) "
+    "SELECT m.nim, kl.id_kelas FROM mahasiswa m CROSS JOIN kelas kl "
+    "WHERE m.id_kurikulum = :k AND kl.id_kurikulum = :k",
+    "INSERT INTO nilai_detail (id_enrollment, id_komponen, nilai_mentah) "
+    "SELECT e.id_enrollment, kp.id_komponen, round((random() * 100)::numeric, 2) "
+    "FROM enrollment e JOIN kelas kl ON kl.id_kelas = e.id_kelas "
+    "JOIN komponen_penilaian kp ON kp.id_kelas = e.id_kelas "
+    "WHERE kl.id_kurikulum = :k",
+)
+
+SQL_CPMK_UPSERT = text("""
+    INSERT INTO ketercapaian_cpmk (id_enrollment, id_cpmk, nilai_cpmk, status_tercapai)
+    SELECT s.id_enrollment, s.id_cpmk, s.nilai,
+           s.nilai >= COALESCE(
+               (SELECT MAX(ab.batas_kelulusan_cpmk) FROM ambang_batas ab
+                JOIN cpmk c ON c.id_rps = ab.id_rps WHERE c.id_cpmk = s.id_cpmk),
+               40.01)
+    FROM (
+        SELECT nd.id_enrollment, tp.id_cpmk,
+               ROUND(SUM(nd.nilai_mentah * 100 / kp.nilai_maksimal
+                         * COALESCE(kp.bobot_realisasi, tp.bobot))
+                     / SUM(COALESCE(kp.bobot_realisasi, tp.bobot)), 2) AS nilai
+        FROM nilai_detail nd
+        JOIN enrollment e ON e.id_enrollment = nd.id_enrollment
+        JOIN mahasiswa m ON m.nim = e.nim
+        JOIN komponen_penilaian kp ON kp.id_komponen = nd.id_komponen
+        JOIN template_penilaian tp ON tp.id_template = kp.id_template
+        WHERE m.id_kurikulum = :k AND m.angkatan = :angkatan
+          AND e.status <> 'drop' AND nd.nilai_mentah IS NOT NULL
+          AND tp.id_cpmk IS NOT NULL AND kp.nilai_maksimal > 0
+          AND COALESCE(kp.bobot_realisasi, tp.bobot) > 0
+        GROUP BY nd.id_enrollment, tp.id_cpmk
+    ) s
+    ON CONFLICT (id_enrollment, id_cpmk) DO UPDATE
+    SET nilai_cpmk = EXCLUDED.nilai_cpmk,
+        status_tercapai = EXCLUDED.status_tercapai,
+        updated_at = NOW()
+""")
+
+SQL_CPL_ROLLUP = text("""
+    SELECT e.nim, rcl.id_cpl,
+           ROUND(SUM(kc.nilai_cpmk * rcl.bobot_kontribusi) / SUM(rcl.bobot_kontribusi), 2)
+    FROM ketercapaian_cpmk kc
+    JOIN enrollment e ON e.id_enrollment = kc.id_enrollment
+    JOIN mahasiswa m ON m.nim = e.nim
+    JOIN relasi_cpmk_cpl rcl ON rcl.id_cpmk = kc.id_cpmk
+    JOIN cpl ON cpl.id_cpl = rcl.id_cpl AND cpl.is_active
+    WHERE m.id_kurikulum = :k AND m.angkatan = :angkatan
+    GROUP BY e.nim, rcl.id_cpl
+""")
+
+
+class _Rollback(Exception):
+    """Raised to roll the benchmark unit of work back."""
+
+
+def synthetic_snapshot(args: argparse.Namespace) -> PenilaianSnapshot:
+    """
+    Build a cohort snapshot in memory: every student in one class per course.
+
+    Returns:
+        PenilaianSnapshot: Synthetic grades
+    """
+    rng = np.random.default_rng(0)
+    students, courses, komponen = args.students, args.courses, args.komponen
+    cpmk_count = courses * CPMK_PER_COURSE
+
+    enrollment_kelas = np.repeat(np.arange(courses), students)
+    komponen_kelas = np.repeat(np.arange(courses), komponen)
+    komponen_cpmk = komponen_kelas * CPMK_PER_COURSE + np.tile(
+        np.arange(komponen) % CPMK_PER_COURSE, courses
+    )
+    nilai_enrollment = np.repeat(np.arange(students * courses), komponen)
+    nilai_komponen = (
+        enrollment_kelas[nilai_enrollment] * komponen + np.tile(np.arange(komponen), students * courses)
+    )
+    relasi_cpmk, relasi_cpl = np.nonzero(
+        (np.arange(cpmk_count)[:, None] + np.arange(args.cpl)[None, :]) % 3 == 0
+    )
+
+    return PenilaianSnapshot(
+        enrollment_ids=np.arange(students * courses),
+        enrollment_kelas=enrollment_kelas,
+        enrollment_student=np.tile(np.arange(students), courses),
+        enrollment_current=np.ones(students * courses, dtype=bool),
+        nims=np.array([f"B{i:09d}" for i in range(students)]),
+        komponen_ids=np.arange(courses * komponen),
+        komponen_kelas=komponen_kelas,
+        komponen_cpmk=komponen_cpmk,
+        komponen_bobot=np.full(courses * komponen, 100.0 / komponen),
+        nilai_enrollment=nilai_enrollment,
+        nilai_komponen=nilai_komponen,
+        nilai_persen=np.round(rng.uniform(0, 100, len(nilai_enrollment)), 2),
+        cpmk_ids=np.arange(cpmk_count),
+        cpmk_batas=np.full(cpmk_count, 40.01),
+        cpl_ids=np.arange(args.cpl),
+        relasi_cpmk=relasi_cpmk,
+        relasi_cpl=relasi_cpl,
+        relasi_bobot=np.full(len(relasi_cpmk), 50.0),
+    )
+
+
+def timed(label: str, repeat: int, run: Callable[[], int]) -> None:
+    """Run a path repeat times and print the best wall time."""
+    best, rows = float("inf"), 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = run()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:>16}: {best * 1000:10.1f} ms  ({rows} ketercapaian_cpmk rows)")
+
+
+def bench_memory(args: argparse.Namespace) -> None:
+    """Time the engine alone on a synthetic snapshot."""
+    snapshot = synthetic_snapshot(args)
+    engine = KetercapaianEngine()
+
+    def run() -> int:
+        cpmk = engine.hitung_cpmk(snapshot)
+        engine.hitung_cpl(snapshot, cpmk)
+        return len(cpmk.to_rows())
+
+    timed("engine (memory)", args.repeat, run)
+
+
+def bench_database(args: argparse.Namespace, session: Session) -> None:
+    """Seed a cohort and time both paths, each in a rolled-back savepoint."""
+    params = {
+        "students": args.students,
+        "courses": args.courses,
+        "komponen": args.komponen,
+        "cpl": args.cpl,
+        "cpmk": CPMK_PER_COURSE,
+        "angkatan": ANGKATAN,
+    }
+    session.execute(text(SEED_STATEMENTS[0]))
+    session.execute(text(SEED_STATEMENTS[1]))
+    params["k"] = session.execute(text(
+        "INSERT INTO kurikulum (id_prodi, kode_kurikulum, nama_kurikulum, tahun_berlaku, status) "
+        "VALUES ('BENCH', 'BENCH', 'Benchmark', 2024, 'aktif') RETURNING id_kurikulum"
+    )).scalar()
+    for statement in SEED_STATEMENTS[2:]:
+        session.execute(text(statement), params)
+    session.execute(text("ANALYZE"))
+
+    def sql_path() -> int:
+        savepoint = session.begin_nested()
+        try:
+            written = session.execute(SQL_CPMK_UPSERT, params).rowcount
+            session.execute(SQL_CPL_ROLLUP, params).all()
+            return written
+        finally:
+            savepoint.rollback()
+
+    def engine_path() -> int:
+        savepoint = session.begin_nested()
+        try:
+            repo = KetercapaianRepository(session)
+            engine = KetercapaianEngine()
+            snapshot = repo.load_angkatan(params["k"], ANGKATAN)
+            cpmk = engine.hitung_cpmk(snapshot)
+            engine.hitung_cpl(snapshot, cpmk)
+            return repo.upsert(cpmk.to_rows())
+        finally:
+            savepoint.rollback()
+
+    timed("sql", args.repeat, sql_path)
+    timed("engine (db)", args.repeat, engine_path)
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"{args.students} students × {args.courses} courses × {args.komponen} komponen, "
+          f"{args.cpl} CPL")
+    bench_memory(args)
+    if not args.database:
+        return
+
+    session = SessionLocal()
+    try:
+        with UnitOfWork(session):
+            bench_database(args, session)
+            raise _Rollback()
+    except _Rollback:
+        pass
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=10000)
+    parser.add_argument("--courses", type=int, default=8)
+    parser.add_argument("--komponen", type=int, default=6)
+    parser.add_argument("--cpl", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--database", action="store_true",
+                        help="Also compare against the SQL path on the configured database")
+    main(parser.parse_args())
@@ -0,0 +1,132 @@
+"""
+List Serialization Benchmark
+
+Time to turn fetched curricula into the JSON body of a list response:
+
+- model_validate  KurikulumResponse.model_validate() per ORM row, then
+                  FastAPI validating KurikulumListResponse again and
+                  jsonable_encoder + json.dumps (JSONResponse)
+- page model      row dictionaries in KurikulumPageResponse through the
+                  same response_model pass
+- fast path       row dictionaries validated once with
+                  KURIKULUM_LIST_ADAPTER and encoded by orjson, as
+                  GET /kurikulum does now
+
+Rows are built in memory, so no database is needed and only
+serialization is measured. Page sizes above the endpoint's limit (500)
+show how the cost scales per row.
+
+Usage:
+    python -m benchmarks.bench_list_serialization --rows 1000 10000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.presentation.api.serialization import encode_json, validated_items
+from app.presentation.schemas import (
+    KURIKULUM_LIST_ADAPTER,
+    KURIKULUM_LIST_FIELDS,
+    KurikulumListResponse,
+    KurikulumPageResponse,
+    KurikulumResponse,
+)
+
+STATUSES = list(KurikulumStatus)
+
+
+def build_rows(count: int) -> List[tuple]:
+    """Row tuples in KURIKULUM_LIST_FIELDS order, as a projected SELECT returns them."""
+    created = datetime(2020, 1, 1, 8, 30, 15, 123456)
+    return [
+        (
+            index,
+            f"P{index % 40:02d}",
+            f"K{2000 + index % 25}-{index}",
+            f"Kurikulum OBE {index}",
+            2000 + index % 25,
+            None if index % 3 else 2030,
+            "Kurikulum berbasis OBE" if index % 2 else None,
+            STATUSES[index % len(STATUSES)],
+            index % 40 == 0,
+            f"SK/{index}/2024" if index % 4 == 0 else None,
+            date(2024, 1, 1) + timedelta(days=index % 365),
+            created + timedelta(minutes=index),
+            created + timedelta(minutes=index, seconds=30),
+        )
+        for index in range(1, count + 1)
+    ]
+
+
+def run_response_model(field: Any, content: Any) -> bytes:
+    """FastAPI's response_model pass followed by JSONResponse rendering."""
+    encoded = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(encoded).body
+
+
+def variants(rows: List[tuple]) -> Dict[str, Callable[[], bytes]]:
+    """Each variant turns the same fetched rows into a response body."""
+    entities = [Kurikulum(**dict(zip(KURIKULUM_LIST_FIELDS, row))) for row in rows]
+    list_field = create_response_field("list_response", KurikulumListResponse)
+    page_field = create_response_field("page_response", KurikulumPageResponse)
+
+    def model_validate() -> bytes:
+        data = [KurikulumResponse.model_validate(entity) for entity in entities]
+        return run_response_model(list_field, KurikulumListResponse(total=len(data), data=data))
+
+    def page_model() -> bytes:
+        items = [dict(zip(KURIKULUM_LIST_FIELDS, row)) for row in rows]
+        return run_response_model(page_field, KurikulumPageResponse(total=len(items), data=items))
+
+    def fast_path() -> bytes:
+        items = [dict(zip(KURIKULUM_LIST_FIELDS, row)) for row in rows]
+        return encode_json({
+            "total": len(items),
+            "total_is_estimate": False,
+            "next_cursor": None,
+            "data": validated_items(KURIKULUM_LIST_ADAPTER, items),
+        })
+
+    return {
+        "model_validate": model_validate,
+        "page model": page_model,
+        "fast path": fast_path,
+    }
+
+
+def best_ms(run: Callable[[], bytes], repeat: int) -> float:
+    """Best of `repeat` runs in milliseconds, after one warm-up run."""
+    run()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(args: argparse.Namespace) -> None:
+    for count in args.rows:
+        print(f"{count} rows")
+        baseline = None
+        for label, run in variants(build_rows(count)).items():
+            elapsed = best_ms(run, args.repeat)
+            baseline = baseline or elapsed
+            print(f"{label:>15}: {elapsed:9.2f} ms  {elapsed / count * 1000:7.2f} µs/row  "
+                  f"({baseline / elapsed:5.1f}x)")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
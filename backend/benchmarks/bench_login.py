@@ -0,0 +1,164 @@
+"""
+Login Throughput Benchmark
+
+Measures logins/sec and the latency of a cheap concurrent endpoint while
+a login storm is running, for three ways of verifying bcrypt:
+
+    inline  CryptContext.verify inside an `async def` route (blocks the loop)
+    thread  PasswordHasher.verify_password inside a sync `def` route
+    pool    PasswordHashingService (process pool, 429 when saturated)
+
+No database is needed: each route verifies against one precomputed hash
+at the configured BCRYPT_ROUNDS, which is the part of a login that costs.
+
+Usage:
+    python -m benchmarks.bench_login --logins 400 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.core.password_hashing import PasswordHashingService
+from app.core.security import PasswordHasher, get_password_context
+from app.domain.exceptions import ServiceOverloadedException
+
+PASSWORD = "benchmark-password"
+
+
+def build_app(service: PasswordHashingService, hashed: str) -> FastAPI:
+    """
+    Build a minimal app exposing one login route per strategy and /ping.
+
+    Returns:
+        FastAPI: Benchmark application
+    """
+    app = FastAPI()
+
+    @app.exception_handler(ServiceOverloadedException)
+    async def overloaded(request, exc: ServiceOverloadedException):
+        return JSONResponse(
+            status_code=429,
+            headers={"Retry-After": str(exc.retry_after)},
+            content={"error_code": exc.error_code}
+        )
+
+    @app.post("/inline/login")
+    async def login_inline():
+        return {"valid": get_password_context().verify(PASSWORD, hashed)}
+
+    @app.post("/thread/login")
+    def login_thread():
+        return {"valid": PasswordHasher.verify_password(PASSWORD, hashed)}
+
+    @app.post("/pool/login")
+    async def login_pool():
+        valid, _ = await service.verify_and_update(PASSWORD, hashed)
+        return {"valid": valid}
+
+    @app.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    return app
+
+
+async def run_storm(
+    client: httpx.AsyncClient,
+    path: str,
+    total_logins: int,
+    concurrency: int
+) -> dict:
+    """
+    Fire total_logins logins at path while pinging every 10 ms.
+
+    Returns:
+        dict: logins/s, 429 count and ping latency percentiles
+    """
+    remaining = iter(range(total_logins))
+    accepted, shed = 0, 0
+    ping_latencies: List[float] = []
+    done = asyncio.Event()
+
+    async def login_worker() -> None:
+        nonlocal accepted, shed
+        for _ in remaining:
+            response = await client.post(path)
+            if response.status_code == 429:
+                shed += 1
+                # Honour Retry-After at benchmark scale
+                await asyncio.sleep(0.05)
+            else:
+                response.raise_for_status()
+                accepted += 1
+
+    async def pinger() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            (await client.get("/ping")).raise_for_status()
+            ping_latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.01)
+
+    ping_task = asyncio.create_task(pinger())
+    started = time.perf_counter()
+    await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ping_task
+
+    ping_latencies.sort()
+    return {
+        "logins_per_second": accepted / elapsed,
+        "shed": shed,
+        "ping_p50": statistics.median(ping_latencies),
+        "ping_p99": ping_latencies[int(len(ping_latencies) * 0.99) - 1],
+        "pings": len(ping_latencies),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    service = PasswordHashingService(workers=args.workers or None)
+    hashed = get_password_context().hash(PASSWORD)
+    print(
+        f"bcrypt rounds {get_password_context().to_dict()['bcrypt__rounds']}, "
+        f"{service.workers} hashing workers, {service.max_pending} pending max\n"
+    )
+
+    app = build_app(service, hashed)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=None
+    ) as client:
+        # Start the pool processes before measuring
+        await client.post("/pool/login")
+
+        for label in args.strategies:
+            result = await run_storm(
+                client, f"/{label}/login", args.logins, args.concurrency
+            )
+            print(
+                f"{label:>6}: {result['logins_per_second']:7.1f} logins/s  "
+                f"429s {result['shed']:>5}  "
+                f"ping p50 {result['ping_p50']:7.1f} ms  "
+                f"p99 {result['ping_p99']:7.1f} ms  ({result['pings']} pings)"
+            )
+
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--strategies", nargs="+", default=["inline", "thread", "pool"],
+        choices=["inline", "thread", "pool"]
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,116 @@
+"""
+Request Middleware Benchmark
+
+Requests/sec of a trivial route behind the previous middleware stack
+(two @app.middleware("http") functions, i.e. two BaseHTTPMiddleware
+layers, with two synchronous logger.info calls per request) against
+AccessLogMiddleware (pure ASGI, one queued JSON record per request).
+
+Both variants write their logs to /dev/null so only the per-request
+overhead on the event loop is compared. No database is needed.
+
+Usage:
+    python -m benchmarks.bench_middleware --requests 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+
+from app.infrastructure.query_stats import track_round_trips
+from app.presentation.middlewares import AccessLogMiddleware, configure_access_logger
+
+
+def build_before_app(logger: logging.Logger) -> FastAPI:
+    """The middleware stack as it was: two BaseHTTPMiddleware layers."""
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def add_process_time_header(request: Request, call_next):
+        start_time = time.time()
+        with track_round_trips() as round_trips:
+            response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        response.headers["X-DB-Round-Trips"] = str(round_trips.total)
+        return response
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        logger.info(f"{request.method} {request.url.path}")
+        response = await call_next(request)
+        logger.info(f"Status: {response.status_code}")
+        return response
+
+    @app.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    return app
+
+
+def build_after_app(sample_rate_2xx: float) -> FastAPI:
+    """The same route behind AccessLogMiddleware."""
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware, sample_rate_2xx=sample_rate_2xx)
+
+    @app.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    return app
+
+
+async def run_load(app: FastAPI, total_requests: int, concurrency: int) -> float:
+    """
+    Fire total_requests GETs with bounded concurrency.
+
+    Returns:
+        float: Requests per second
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        remaining = iter(range(total_requests))
+
+        async def worker() -> None:
+            for _ in remaining:
+                (await client.get("/ping")).raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total_requests / (time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    devnull = open(os.devnull, "w")
+
+    before_logger = logging.getLogger("bench.before")
+    before_logger.addHandler(logging.StreamHandler(devnull))
+    before_logger.setLevel(logging.INFO)
+    before_logger.propagate = False
+    listener = configure_access_logger(stream=devnull)
+
+    variants = [("before", build_before_app(before_logger))]
+    variants += [
+        (f"after (2xx sampled {rate:g})", build_after_app(rate))
+        for rate in args.sample_rates
+    ]
+    for label, app in variants:
+        await run_load(app, args.concurrency, args.concurrency)  # warm up
+        rps = await run_load(app, args.requests, args.concurrency)
+        print(f"{label:>26}: {rps:9.1f} req/s")
+
+    listener.stop()
+    devnull.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--sample-rates", type=float, nargs="+", default=[1.0, 0.1])
+    asyncio.run(main(parser.parse_args()))
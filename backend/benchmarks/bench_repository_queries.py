@@ -0,0 +1,219 @@
+"""
+Repository Query Overhead Benchmark
+
+Per-call time of the repository hot paths against the legacy
+session.query(...) chains they replaced:
+
+- KurikulumRepository.get_by_kode
+- MataKuliahRepository.get_by_composite_key
+- CPLRepository.get_by_kurikulum / MataKuliahRepository.get_by_kurikulum
+
+all of which now run lambda_stmt() statements.
+
+The session is emptied before every call so each variant really runs its
+SELECT; what differs is the Python-side statement construction, cache key
+and (legacy Query) ORM compile work around the same round trip.
+
+Without --database the tables are created in an in-memory SQLite
+database, which keeps the round trip negligible and shows the overhead
+alone. With --database a small curriculum is seeded into the PostgreSQL
+from .env inside one transaction that is rolled back at the end.
+
+Usage:
+    python -m benchmarks.bench_repository_queries --calls 5000
+    python -m benchmarks.bench_repository_queries --calls 5000 --database
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from sqlalchemy import and_, create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.database import Base, SessionLocal
+from app.infrastructure.models.kurikulum_models import CPL, Kurikulum, MataKuliah
+from app.infrastructure.repositories import (
+    CPLRepository,
+    KurikulumRepository,
+    MataKuliahRepository,
+)
+
+
+PRODI = "BENCH"
+KODE_KURIKULUM = "BENCH-2024"
+
+SEED_STATEMENTS = (
+    "INSERT INTO cpl (id_kurikulum, kode_cpl, deskripsi, kategori, urutan, is_active) "
+    "SELECT :k, 'CPL-' || i, 'CPL ' || i, 'pengetahuan', i, TRUE FROM generate_series(1, :cpl) i",
+    "INSERT INTO matakuliah (kode_mk, id_kurikulum, nama_mk, sks, semester, jenis_mk, is_active) "
+    "SELECT 'MK' || i, :k, 'MK ' || i, 3, 1 + i % 8, 'wajib', TRUE FROM generate_series(1, :courses) i",
+)
+
+
+# ===== Legacy queries (as before the select() migration) =====
+
+def legacy_get_by_kode(session: Session, id_prodi: str, kode_kurikulum: str):
+    return session.query(Kurikulum).filter_by(
+        id_prodi=id_prodi,
+        kode_kurikulum=kode_kurikulum
+    ).first()
+
+
+def legacy_get_by_composite_key(session: Session, kode_mk: str, id_kurikulum: int):
+    return session.query(MataKuliah).filter(
+        and_(
+            MataKuliah.kode_mk == kode_mk,
+            MataKuliah.id_kurikulum == id_kurikulum
+        )
+    ).first()
+
+
+def legacy_get_cpl_by_kurikulum(session: Session, id_kurikulum: int):
+    return session.query(CPL).filter_by(id_kurikulum=id_kurikulum, is_active=True).order_by(
+        CPL.urutan,
+        CPL.kode_cpl
+    ).all()
+
+
+def legacy_get_mk_by_kurikulum(session: Session, id_kurikulum: int):
+    return session.query(MataKuliah).filter_by(id_kurikulum=id_kurikulum, is_active=True).order_by(
+        MataKuliah.semester,
+        MataKuliah.kode_mk
+    ).all()
+
+
+# ===== Setup =====
+
+def seed_sqlite(args: argparse.Namespace) -> Session:
+    """Create the three tables in memory and seed one curriculum."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[Kurikulum.__table__, CPL.__table__, MataKuliah.__table__]
+    )
+    session = Session(engine)
+    session.execute(text(
+        "INSERT INTO kurikulum (id_kurikulum, id_prodi, kode_kurikulum, nama_kurikulum, "
+        "tahun_berlaku, status, is_primary, created_at, updated_at) "
+        "VALUES (1, :prodi, :kode, 'Benchmark', 2024, 'AKTIF', 0, "
+        "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+    ), {"prodi": PRODI, "kode": KODE_KURIKULUM})
+    session.execute(text(
+        "INSERT INTO cpl (id_kurikulum, kode_cpl, deskripsi, kategori, urutan, is_active, "
+        "created_at, updated_at) VALUES (1, :kode, 'CPL', 'PENGETAHUAN', :urutan, 1, "
+        "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+    ), [{"kode": f"CPL-{i}", "urutan": i} for i in range(1, args.cpl + 1)])
+    session.execute(text(
+        "INSERT INTO matakuliah (kode_mk, id_kurikulum, nama_mk, sks, semester, jenis_mk, "
+        "is_active, created_at, updated_at) VALUES (:kode, 1, 'MK', 3, :semester, 'WAJIB', 1, "
+        "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+    ), [{"kode": f"MK{i}", "semester": 1 + i % 8} for i in range(1, args.courses + 1)])
+    session.commit()
+    return session
+
+
+def seed_database(args: argparse.Namespace, session: Session) -> int:
+    """Seed a curriculum in the open transaction; returns its ID."""
+    session.execute(text(
+        "INSERT INTO fakultas (id_fakultas, nama) VALUES ('BENCH', 'Benchmark')"
+    ))
+    session.execute(text(
+        "INSERT INTO prodi (id_prodi, id_fakultas, nama, jenjang) "
+        "VALUES (:prodi, 'BENCH', 'Benchmark', 'S1')"
+    ), {"prodi": PRODI})
+    id_kurikulum = session.execute(text(
+        "INSERT INTO kurikulum (id_prodi, kode_kurikulum, nama_kurikulum, tahun_berlaku, status) "
+        "VALUES (:prodi, :kode, 'Benchmark', 2024, 'aktif') RETURNING id_kurikulum"
+    ), {"prodi": PRODI, "kode": KODE_KURIKULUM}).scalar()
+    params = {"k": id_kurikulum, "cpl": args.cpl, "courses": args.courses}
+    for statement in SEED_STATEMENTS:
+        session.execute(text(statement), params)
+    return id_kurikulum
+
+
+# ===== Timing =====
+
+def per_call_us(session: Session, calls: int, run: Callable[[], object]) -> float:
+    """Best-of-three mean microseconds per call, identity map emptied each call."""
+    run()  # warm the compiled cache
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(calls):
+            session.expunge_all()
+            run()
+        best = min(best, time.perf_counter() - started)
+    return best / calls * 1_000_000
+
+
+def bench(args: argparse.Namespace, session: Session, id_kurikulum: int) -> None:
+    """Time every hot path, legacy query against the repository method."""
+    kurikulum_repo = KurikulumRepository(session)
+    matakuliah_repo = MataKuliahRepository(session)
+    cpl_repo = CPLRepository(session)
+
+    cases: Dict[str, tuple] = {
+        "get_by_kode": (
+            lambda: legacy_get_by_kode(session, PRODI, KODE_KURIKULUM),
+            lambda: kurikulum_repo.get_by_kode(PRODI, KODE_KURIKULUM),
+        ),
+        "get_by_composite_key": (
+            lambda: legacy_get_by_composite_key(session, "MK1", id_kurikulum),
+            lambda: matakuliah_repo.get_by_composite_key("MK1", id_kurikulum),
+        ),
+        "cpl.get_by_kurikulum": (
+            lambda: legacy_get_cpl_by_kurikulum(session, id_kurikulum),
+            lambda: cpl_repo.get_by_kurikulum(id_kurikulum),
+        ),
+        "mk.get_by_kurikulum": (
+            lambda: legacy_get_mk_by_kurikulum(session, id_kurikulum),
+            lambda: matakuliah_repo.get_by_kurikulum(id_kurikulum),
+        ),
+    }
+
+    print(f"{'':>22}  {'legacy':>10}  {'current':>10}")
+    for name, (legacy, current) in cases.items():
+        before = per_call_us(session, args.calls, legacy)
+        after = per_call_us(session, args.calls, current)
+        print(f"{name:>22}: {before:8.1f} µs  {after:8.1f} µs  ({before / after:.2f}x)")
+
+
+class _Rollback(Exception):
+    """Raised to roll the benchmark transaction back."""
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"{args.calls} calls per variant, {args.cpl} CPL, {args.courses} courses")
+    if not args.database:
+        session = seed_sqlite(args)
+        try:
+            bench(args, session, 1)
+        finally:
+            session.close()
+        return
+
+    session = SessionLocal()
+    try:
+        with session.begin():
+            bench(args, session, seed_database(args, session))
+            raise _Rollback()
+    except _Rollback:
+        pass
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--cpl", type=int, default=10)
+    parser.add_argument("--courses", type=int, default=40)
+    parser.add_argument("--database", action="store_true",
+                        help="Run against the configured PostgreSQL instead of in-memory SQLite")
+    main(parser.parse_args())
@@ -0,0 +1,101 @@
+"""
+Shared test fixtures.
+
+Tests run without PostgreSQL: database fixtures create the curriculum
+tables in an in-memory SQLite database.
+"""
+
+import os
+
+# Settings are read at import time; keep tests independent of a local .env
+os.environ.setdefault("SECRET_KEY", "test-secret-key-with-at-least-32-characters")
+os.environ.setdefault("ENVIRONMENT", "testing")
+
+from typing import Callable, ContextManager, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.application.use_cases import KurikulumUseCases
+from app.infrastructure.cache import CachedKurikulumRepository, InMemoryCacheBackend
+from app.infrastructure.database import Base
+from app.infrastructure.models.kurikulum_models import CPL, Kurikulum, MataKuliah, PrasyaratMK
+from app.infrastructure.query_stats import RoundTripStats, install_round_trip_counter
+from app.infrastructure.query_stats import query_budget as _query_budget
+from app.infrastructure.repositories import KurikulumRepository
+from app.infrastructure.statistics import STATISTICS_VIEW_NAME, MaterializedViewRefresher
+
+# Tables that do not depend on PostgreSQL-only types
+SQLITE_TABLES = [Kurikulum.__table__, CPL.__table__, MataKuliah.__table__, PrasyaratMK.__table__]
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """In-memory SQLite engine with the curriculum tables and round-trip counting."""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    install_round_trip_counter(engine)
+    Base.metadata.create_all(engine, tables=SQLITE_TABLES)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine: Engine) -> Iterator[Session]:
+    """Session on the in-memory database."""
+    session = Session(engine, expire_on_commit=False)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[RoundTripStats]]:
+    """
+    Statement budget for a block, e.g. one API call.
+
+    Usage:
+        with query_budget(3):
+            client.get("/api/v1/kurikulum/?id_prodi=TI")
+
+    Fails with QueryBudgetExceeded listing repeated statements (likely N+1).
+    """
+    return _query_budget
+
+
+@pytest.fixture
+def cache_backend() -> InMemoryCacheBackend:
+    """Fresh in-process cache, standing in for one worker's cache."""
+    return InMemoryCacheBackend()
+
+
+@pytest.fixture
+def client(engine: Engine, session: Session, cache_backend: InMemoryCacheBackend) -> Iterator[TestClient]:
+    """
+    API client whose curriculum routes use the in-memory database.
+
+    Startup events do not run, so no PostgreSQL engine is created.
+    """
+    from app.main import app
+    from app.presentation.api.v1.kurikulum import get_kurikulum_use_cases
+
+    def kurikulum_use_cases() -> KurikulumUseCases:
+        repository = KurikulumRepository(session)
+        return KurikulumUseCases(
+            session,
+            kurikulum_repo=repository,
+            statistics_refresher=MaterializedViewRefresher(
+                engine, STATISTICS_VIEW_NAME, debounce_seconds=0, max_wait_seconds=0
+            ),
+            kurikulum_cache=CachedKurikulumRepository(repository, cache_backend, 60),
+        )
+
+    app.dependency_overrides[get_kurikulum_use_cases] = kurikulum_use_cases
+    yield TestClient(app)
+    app.dependency_overrides.clear()
@@ -0,0 +1,155 @@
+"""Tests for the read-through curriculum cache."""
+
+import threading
+import time
+
+import pytest
+
+from app.domain.exceptions import EntityNotFoundException
+from app.infrastructure.cache import (
+    CachedKurikulumRepository,
+    InMemoryCacheBackend,
+    SingleFlight,
+    invalidate_kurikulum,
+)
+from app.infrastructure.cache.kurikulum_cache import by_id_key, read_through
+from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.infrastructure.repositories import KurikulumRepository
+
+
+@pytest.fixture
+def backend():
+    return InMemoryCacheBackend(max_entries=16)
+
+
+@pytest.fixture
+def kurikulum(session):
+    kurikulum = Kurikulum(
+        id_kurikulum=1,
+        id_prodi="TI",
+        kode_kurikulum="K2024",
+        nama_kurikulum="Kurikulum 2024",
+        tahun_berlaku=2024,
+        status=KurikulumStatus.AKTIF,
+        is_primary=True,
+    )
+    session.add(kurikulum)
+    session.commit()
+    return kurikulum
+
+
+# ===== SingleFlight =====
+
+def test_single_flight_runs_one_load_for_concurrent_callers():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", load)))
+    leader.start()
+    started.wait(1)
+    followers = [
+        threading.Thread(target=lambda: results.append(flight.do("k", load)))
+        for _ in range(4)
+    ]
+    for follower in followers:
+        follower.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(1)
+
+    assert calls == [1]
+    assert results == ["value"] * 5
+
+
+def test_single_flight_propagates_errors_and_releases_key():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("gagal")
+
+    with pytest.raises(ValueError):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 42) == 42
+
+
+# ===== In-memory backend =====
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = InMemoryCacheBackend(max_entries=2)
+    backend.set("a", 1, 60)
+    backend.set("b", 2, 60)
+    backend.get("a")
+    backend.set("c", 3, 60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == 1
+    assert backend.stats().evictions == 1
+
+
+def test_memory_backend_expires_entries():
+    backend = InMemoryCacheBackend()
+    backend.set("a", 1, 0)
+    assert backend.get("a") is None
+
+
+# ===== Read-through =====
+
+def test_read_through_caches_missing_values(backend):
+    loads = []
+
+    def load():
+        loads.append(1)
+        return None
+
+    assert read_through(backend, "k", 60, load) is None
+    assert read_through(backend, "k", 60, load) is None
+    assert loads == [1]
+    assert backend.stats().hits == 1
+
+
+def test_load_racing_an_invalidation_is_not_stored(backend):
+    def stale_load():
+        # A write commits and invalidates while this load is running
+        invalidate_kurikulum(backend, id_kurikulum=1)
+        return {"nama_kurikulum": "lama"}
+
+    assert read_through(backend, by_id_key(1), 60, stale_load) == {"nama_kurikulum": "lama"}
+    assert backend.get(by_id_key(1)) is None
+
+    assert read_through(backend, by_id_key(1), 60, lambda: {"nama_kurikulum": "baru"})
+    assert backend.get(by_id_key(1)) == {"v": {"nama_kurikulum": "baru"}}
+
+
+def test_cached_repository_serves_detached_copy_until_invalidated(session, backend, kurikulum):
+    cached = CachedKurikulumRepository(KurikulumRepository(session), backend, 60)
+
+    first = cached.get_by_id_or_fail(1)
+    assert first.nama_kurikulum == "Kurikulum 2024"
+    assert first.status == KurikulumStatus.AKTIF
+    assert first.updated_at == kurikulum.updated_at
+
+    kurikulum.nama_kurikulum = "Kurikulum Baru"
+    session.commit()
+    assert cached.get_by_id_or_fail(1).nama_kurikulum == "Kurikulum 2024"
+
+    cached.invalidate(id_kurikulum=1, id_prodi="TI")
+    assert cached.get_by_id_or_fail(1).nama_kurikulum == "Kurikulum Baru"
+
+
+def test_cached_repository_lookups_by_prodi(session, backend, kurikulum):
+    cached = CachedKurikulumRepository(KurikulumRepository(session), backend, 60)
+
+    assert cached.get_primary_curriculum("TI").id_kurikulum == 1
+    assert [k.id_kurikulum for k in cached.get_active_curricula("TI")] == [1]
+    assert cached.get_primary_curriculum("SI") is None
+    with pytest.raises(EntityNotFoundException):
+        cached.get_by_id_or_fail(99)
@@ -0,0 +1,106 @@
+"""Tests for ETag / If-None-Match handling."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+from starlette.requests import Request
+
+from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.presentation.api.conditional import build_etag, is_not_modified, not_modified
+
+UPDATED_AT = datetime(2024, 1, 1, 8, 0, 0)
+
+
+def request_with(if_none_match=None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_build_etag_is_weak_and_stable():
+    etag = build_etag("kurikulum", 1, UPDATED_AT)
+    assert etag.startswith('W/"')
+    assert etag == build_etag("kurikulum", 1, UPDATED_AT)
+    assert etag != build_etag("kurikulum", 1, UPDATED_AT + timedelta(seconds=1))
+    assert build_etag("a", None) == build_etag("a", "")
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("*", True),
+    ('W/"abc"', True),
+    ('"abc"', True),
+    ('"other", W/"abc"', True),
+    ('"other"', False),
+])
+def test_is_not_modified_uses_weak_comparison(header, expected):
+    assert is_not_modified(request_with(header), 'W/"abc"') is expected
+
+
+def test_not_modified_response():
+    response = not_modified('W/"abc"')
+    assert response.status_code == 304
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.body == b""
+
+
+# ===== Curriculum endpoints =====
+
+@pytest.fixture
+def kurikulum(session):
+    kurikulum = Kurikulum(
+        id_kurikulum=1,
+        id_prodi="TI",
+        kode_kurikulum="K2024",
+        nama_kurikulum="Kurikulum 2024",
+        tahun_berlaku=2024,
+        status=KurikulumStatus.AKTIF,
+        is_primary=True,
+        updated_at=UPDATED_AT,
+    )
+    session.add(kurikulum)
+    session.commit()
+    return kurikulum
+
+
+def write_from_other_worker(session):
+    """Change the row without invalidating this worker's cache."""
+    session.execute(
+        update(Kurikulum)
+        .where(Kurikulum.id_kurikulum == 1)
+        .values(nama_kurikulum="Kurikulum Revisi", updated_at=UPDATED_AT + timedelta(minutes=1))
+    )
+    session.commit()
+
+
+@pytest.mark.parametrize("path, etag_parts", [
+    ("/api/v1/kurikulum/1", lambda at: ("kurikulum", 1, at)),
+    ("/api/v1/kurikulum/prodi/TI/primary", lambda at: ("kurikulum-primary", "TI", 1, at)),
+])
+def test_etag_matches_served_body_after_write_elsewhere(client, session, kurikulum, path, etag_parts):
+    first = client.get(path)
+    assert first.headers["etag"] == build_etag(*etag_parts(UPDATED_AT))
+
+    write_from_other_worker(session)
+
+    second = client.get(path)
+    assert second.json()["nama_kurikulum"] == "Kurikulum Revisi"
+    assert second.headers["etag"] == build_etag(*etag_parts(UPDATED_AT + timedelta(minutes=1)))
+
+    assert client.get(path, headers={"If-None-Match": second.headers["etag"]}).status_code == 304
+    assert client.get(path, headers={"If-None-Match": first.headers["etag"]}).status_code == 200
+
+
+def test_active_list_etag_matches_served_list(client, session, kurikulum):
+    path = "/api/v1/kurikulum/prodi/TI/active"
+    first = client.get(path)
+
+    write_from_other_worker(session)
+
+    second = client.get(path)
+    assert [k["nama_kurikulum"] for k in second.json()["data"]] == ["Kurikulum Revisi"]
+    assert second.headers["etag"] == build_etag(
+        "kurikulum-active", "TI", UPDATED_AT + timedelta(minutes=1), 1
+    )
+    assert second.headers["etag"] != first.headers["etag"]
+    assert client.get(path, headers={"If-None-Match": second.headers["etag"]}).status_code == 304
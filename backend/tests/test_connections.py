@@ -0,0 +1,63 @@
+"""Tests for engine options and pool sizing."""
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.infrastructure.connections import (
+    engine_options,
+    pool_sizes,
+    probe_engine_options,
+    unique_statement_name,
+)
+
+
+@pytest.fixture
+def pgbouncer(monkeypatch):
+    monkeypatch.setattr(settings.database, "pgbouncer", True)
+
+
+def test_pool_sizes_split_budget_between_workers_and_engines():
+    assert pool_sizes(40, workers=4, engines=2, overflow_ratio=0.25) == (4, 1)
+    assert pool_sizes(1, workers=8) == (1, 0)
+
+
+def test_async_options_behind_pgbouncer(pgbouncer):
+    connect_args = engine_options(use_async=True)["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert "server_settings" not in connect_args
+
+    name_func = connect_args["prepared_statement_name_func"]
+    names = {name_func() for _ in range(100)}
+    assert len(names) == 100
+    assert all(name.startswith("__asyncpg_") for name in names)
+
+
+def test_sync_options_behind_pgbouncer_send_no_startup_options(pgbouncer):
+    assert engine_options()["connect_args"] == {}
+
+
+def test_direct_connection_keeps_statement_cache_and_session_settings(monkeypatch):
+    monkeypatch.setattr(settings.database, "pgbouncer", False)
+
+    connect_args = engine_options(use_async=True)["connect_args"]
+
+    assert "prepared_statement_name_func" not in connect_args
+    assert connect_args["prepared_statement_cache_size"] == settings.database.prepared_statement_cache_size
+    assert connect_args["server_settings"]["statement_timeout"] == str(
+        settings.database.statement_timeout_ms
+    )
+    assert "-c statement_timeout=" in engine_options()["connect_args"]["options"]
+
+
+def test_unique_statement_name():
+    assert unique_statement_name() != unique_statement_name()
+
+
+def test_probe_engine_opens_own_connections_with_connect_timeout():
+    options = probe_engine_options(1.5)
+
+    assert options["poolclass"] is NullPool
+    assert options["connect_args"] == {"connect_timeout": 2}
@@ -0,0 +1,149 @@
+"""Tests for the health monitor verdicts."""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, QueuePool
+
+from app.infrastructure.health import HealthMonitor, HealthSnapshot, pool_state
+
+
+def pool(checked_out, capacity=10):
+    return {
+        "size": capacity,
+        "checked_out": checked_out,
+        "overflow": 0,
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3),
+    }
+
+
+@pytest.fixture
+def monitor(engine):
+    return HealthMonitor(
+        engine,
+        {"sync": engine},
+        max_snapshot_age_seconds=30,
+        max_pool_saturation=0.9,
+    )
+
+
+def observe(monitor, **values):
+    monitor._snapshot = HealthSnapshot(**values)
+
+
+def test_not_ready_before_first_check(monitor):
+    assert monitor.readiness() == {"ready": False, "reasons": ["no health check yet"]}
+    assert monitor.liveness()["alive"] is True
+
+
+def test_ready_when_database_answered(monitor):
+    observe(monitor, database_ok=True, pools={"sync": pool(1)})
+
+    assert monitor.readiness() == {"ready": True, "reasons": []}
+    assert monitor.status() == "healthy"
+
+
+def test_saturated_pool_degrades_without_failing_readiness(monitor):
+    observe(monitor, database_ok=True, pools={"sync": pool(10), "async": pool(2)})
+
+    assert monitor.readiness()["ready"] is True
+    assert monitor.degradations() == ["pool sync saturated (10/10)"]
+    assert monitor.status() == "degraded"
+
+
+def test_unreachable_database_fails_readiness_not_liveness(monitor):
+    observe(monitor, database_ok=False, database_error="connection refused")
+
+    readiness = monitor.readiness()
+    assert readiness["ready"] is False
+    assert readiness["reasons"] == ["database unreachable: connection refused"]
+    assert monitor.liveness()["alive"] is True
+    assert monitor.status() == "unhealthy"
+
+
+def test_stale_snapshot_fails_readiness_and_liveness(monitor):
+    observe(monitor, database_ok=True, checked_monotonic=time.monotonic() - 60)
+
+    assert monitor.readiness()["ready"] is False
+    assert monitor.liveness()["alive"] is False
+
+
+def test_replicas_and_statistics_view_degrade(monitor):
+    observe(
+        monitor,
+        database_ok=True,
+        replicas=[{"name": "replica1", "available": False}],
+        statistics_view={"populated": False, "pending_refresh_seconds": 600},
+    )
+
+    assert monitor.readiness()["ready"] is True
+    assert monitor.degradations() == [
+        "replica replica1 out of rotation",
+        "mv_statistik_kurikulum not populated",
+        "mv_statistik_kurikulum refresh pending 600s",
+    ]
+
+
+def test_pool_state_counts_checked_out_connections():
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=2)
+    connection = engine.connect()
+    try:
+        state = pool_state(engine)
+    finally:
+        connection.close()
+        engine.dispose()
+
+    assert state["checked_out"] == 1
+    assert state["capacity"] == 4
+    assert state["saturation"] == 0.25
+
+
+def test_saturated_request_pool_does_not_fail_the_probe():
+    request_engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=2
+    )
+    probe_engine = create_engine("sqlite://", poolclass=NullPool)
+    monitor = HealthMonitor(probe_engine, {"sync": request_engine}, max_pool_saturation=0.9)
+    held = request_engine.connect()
+    try:
+        snapshot = monitor.check()
+    finally:
+        held.close()
+        request_engine.dispose()
+
+    assert snapshot.database_ok is True
+    # Answered on its own connection instead of waiting out pool_timeout
+    assert snapshot.database_latency_ms < 1000
+    assert monitor.readiness() == {"ready": True, "reasons": []}
+    assert monitor.degradations() == ["pool sync saturated (1/1)"]
+    assert monitor.status() == "degraded"
+
+
+def test_failed_warm_up_is_reported_by_readiness(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app import main
+
+    attempts = []
+
+    def get_pool_manager():
+        attempts.append(1)
+        raise RuntimeError("could not load dialect")
+
+    monkeypatch.setattr(main, "get_pool_manager", get_pool_manager)
+    monkeypatch.setattr(main, "peek_health_monitor", lambda: None)
+    monkeypatch.setattr(main, "WARM_UP_RETRY_INITIAL_SECONDS", 0.01)
+
+    with TestClient(main.app) as client:
+        deadline = time.monotonic() + 5
+        while len(attempts) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        response = client.get("/health/ready")
+        health = client.get("/health").json()
+
+    assert len(attempts) >= 2  # retried with backoff
+    assert response.status_code == 503
+    assert response.json()["reasons"] == ["database warm-up failed: could not load dialect"]
+    assert health["status"] == "unhealthy"
@@ -0,0 +1,214 @@
+"""Tests for CSV/XLSX import: readers, validation and the bulk loader."""
+
+import io
+
+import pytest
+from sqlalchemy import select
+
+from app.application.use_cases.import_use_cases import ImportUseCases
+from app.domain.exceptions import ValidationException
+from app.infrastructure.importing import CopyLoader, chunked, normalize_header, read_rows
+from app.infrastructure.models.kurikulum_models import (
+    CPL,
+    CPLKategori,
+    Kurikulum,
+    KurikulumStatus,
+    MataKuliah,
+)
+from app.infrastructure.statistics import STATISTICS_VIEW_NAME, MaterializedViewRefresher
+
+
+def csv_file(text, encoding="utf-8"):
+    return io.BytesIO(text.encode(encoding))
+
+
+# ===== Readers =====
+
+def test_normalize_header():
+    assert normalize_header(" Kode  CPL ") == "kode_cpl"
+    assert normalize_header(None) == ""
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_read_csv_rows_with_bom_semicolons_and_blank_rows():
+    stream = csv_file("﻿Kode CPL;Deskripsi;Kategori\nCPL-01;Jujur;sikap\n;;\nCPL-02;Teliti;sikap\n")
+
+    rows = list(read_rows(stream, "cpl.CSV", ("kode_cpl", "kategori")))
+
+    assert rows == [
+        (2, {"kode_cpl": "CPL-01", "deskripsi": "Jujur", "kategori": "sikap"}),
+        (4, {"kode_cpl": "CPL-02", "deskripsi": "Teliti", "kategori": "sikap"}),
+    ]
+
+
+def test_read_rows_rejects_bad_format_header_and_empty_file():
+    with pytest.raises(ValidationException, match="tidak didukung"):
+        read_rows(csv_file("a,b\n"), "cpl.txt")
+    with pytest.raises(ValidationException, match="kosong"):
+        read_rows(csv_file(""), "cpl.csv")
+    with pytest.raises(ValidationException, match="kategori"):
+        read_rows(csv_file("kode_cpl,deskripsi\n"), "cpl.csv", ("kode_cpl", "kategori"))
+
+
+def test_read_rows_rejects_non_utf8_csv_before_reading_rows():
+    stream = csv_file("kode_cpl,deskripsi,kategori\nCPL-01,Café,sikap\n", encoding="cp1252")
+
+    with pytest.raises(ValidationException, match="UTF-8"):
+        read_rows(stream, "cpl.csv")
+
+
+def test_read_xlsx_rows():
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Kode MK", "SKS"])
+    sheet.append(["MK01", 3])
+    sheet.append([None, None])
+    sheet.append(["MK02", 2])
+    stream = io.BytesIO()
+    workbook.save(stream)
+    stream.seek(0)
+
+    rows = list(read_rows(stream, "mk.xlsx", ("kode_mk",)))
+
+    assert rows == [(2, {"kode_mk": "MK01", "sks": 3}), (4, {"kode_mk": "MK02", "sks": 2})]
+
+
+@pytest.mark.parametrize("content", [b"kode_mk,sks\nMK01,3\n", b"PK\x03\x04truncated"])
+def test_read_rows_rejects_corrupt_xlsx(content):
+    pytest.importorskip("openpyxl")
+
+    with pytest.raises(ValidationException, match="XLSX"):
+        read_rows(io.BytesIO(content), "mk.xlsx")
+
+
+# ===== ImportUseCases on SQLite =====
+
+@pytest.fixture
+def kurikulum(session):
+    kurikulum = Kurikulum(
+        id_kurikulum=1,
+        id_prodi="TI",
+        kode_kurikulum="K2024",
+        nama_kurikulum="Kurikulum 2024",
+        tahun_berlaku=2024,
+        status=KurikulumStatus.DRAFT,
+    )
+    session.add(kurikulum)
+    session.add(CPL(id_kurikulum=1, kode_cpl="CPL-01", deskripsi="Lama", kategori=CPLKategori.SIKAP))
+    session.commit()
+    return kurikulum
+
+
+@pytest.fixture
+def use_cases(engine, session):
+    refresher = MaterializedViewRefresher(
+        engine, STATISTICS_VIEW_NAME, debounce_seconds=3600, max_wait_seconds=3600
+    )
+    yield ImportUseCases(session, statistics_refresher=refresher, chunk_size=2)
+    refresher.shutdown()
+
+
+def cpl_rows(session):
+    return {
+        cpl.kode_cpl: cpl.deskripsi
+        for cpl in session.scalars(select(CPL).order_by(CPL.kode_cpl))
+    }
+
+
+CPL_FILE = (
+    "kode_cpl,deskripsi,kategori\n"
+    "CPL-01,Baru,sikap\n"
+    "CPL-02,Mandiri,sikap\n"
+    "CPL-02,Ganda,sikap\n"
+    "CPL-03,Analitis,bukan_kategori\n"
+    "CPL-04,Kolaboratif,Keterampilan Umum\n"
+)
+
+
+def test_import_cpl_reports_duplicates_and_invalid_rows(use_cases, session, kurikulum):
+    result = use_cases.import_cpl(1, csv_file(CPL_FILE), "cpl.csv")
+
+    assert (result.total_rows, result.inserted, result.updated) == (5, 2, 0)
+    assert [(error.row, error.kode) for error in result.errors] == [
+        (2, "CPL-01"),  # already in the curriculum
+        (4, "CPL-02"),  # repeated in the file
+        (5, "CPL-03"),  # invalid kategori
+    ]
+    assert cpl_rows(session) == {
+        "CPL-01": "Lama", "CPL-02": "Mandiri", "CPL-04": "Kolaboratif",
+    }
+
+
+def test_import_cpl_update_existing(use_cases, session, kurikulum):
+    result = use_cases.import_cpl(1, csv_file(CPL_FILE), "cpl.csv", update_existing=True)
+
+    assert (result.inserted, result.updated, result.failed) == (2, 1, 2)
+    assert cpl_rows(session)["CPL-01"] == "Baru"
+
+
+def test_import_matakuliah_validates_rows(use_cases, session, kurikulum):
+    content = (
+        "kode_mk;nama_mk;sks;semester;jenis_mk\n"
+        "MK01;Algoritma;3;1;wajib\n"
+        "MK02;Basis Data;3.0;2;Pilihan\n"
+        "MK03;Skripsi;8;8;wajib\n"
+        "MK04;Etika;2;1;lainnya\n"
+    )
+
+    result = use_cases.import_matakuliah(1, csv_file(content), "mk.csv")
+
+    assert (result.inserted, result.failed) == (2, 2)
+    assert sorted(session.scalars(select(MataKuliah.kode_mk))) == ["MK01", "MK02"]
+
+
+def test_bad_encoding_fails_before_any_row_is_written(use_cases, session, kurikulum):
+    content = "kode_cpl,deskripsi,kategori\nCPL-05,Ok,sikap\nCPL-06,Café,sikap\n"
+
+    with pytest.raises(ValidationException):
+        use_cases.import_cpl(1, csv_file(content, "cp1252"), "cpl.csv")
+    assert set(cpl_rows(session)) == {"CPL-01"}
+
+
+# ===== CopyLoader =====
+
+def cpl_values(kode, deskripsi):
+    return {
+        "id_kurikulum": 1,
+        "kode_cpl": kode,
+        "deskripsi": deskripsi,
+        "kategori": CPLKategori.SIKAP,
+        "urutan": None,
+        "is_active": True,
+    }
+
+
+def make_loader(session, update_columns=()):
+    return CopyLoader(
+        session,
+        CPL,
+        ("id_kurikulum", "kode_cpl", "deskripsi", "kategori", "urutan", "is_active"),
+        conflict_columns=("id_kurikulum", "kode_cpl"),
+        update_columns=update_columns,
+    )
+
+
+def test_loader_on_conflict_returns_keys_written(session, kurikulum):
+    rows = [cpl_values("CPL-01", "Baru"), cpl_values("CPL-02", "Mandiri")]
+
+    assert make_loader(session).load(rows) == [(1, "CPL-02")]
+    assert sorted(make_loader(session, ("deskripsi",)).load(rows)) == [(1, "CPL-01"), (1, "CPL-02")]
+    assert cpl_rows(session)["CPL-01"] == "Baru"
+
+
+def test_loader_portable_fallback_inserts_new_keys_only(session, kurikulum):
+    rows = [cpl_values("CPL-01", "Baru"), cpl_values("CPL-02", "Mandiri")]
+
+    written = make_loader(session)._insert_new(rows)
+
+    assert written == [(1, "CPL-02")]
+    assert cpl_rows(session) == {"CPL-01": "Lama", "CPL-02": "Mandiri"}
@@ -0,0 +1,56 @@
+"""Tests for the import-time budget of app.main."""
+
+import pytest
+
+from app.core.config import settings
+from app.core.import_budget import median_import_profile, parse_import_times
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 |     encodings
+import time:       400 |       1300 |   site
+import time:      2000 |       2000 |       pydantic.fields
+import time:      1000 |       3000 |     pydantic
+import time:       500 |       3500 |   app.core.config
+import time:      1500 |       5000 | app.main
+"""
+
+
+def test_parse_import_times():
+    profile = parse_import_times(REPORT, "app.main")
+
+    assert profile.total_ms == 5.0
+    assert ("pydantic.fields", 2.0, 3) in profile.modules
+    assert [module for module, _, _ in profile.slowest(2)] == ["app.main", "app.core.config"]
+    assert [module for module, _, _ in profile.slowest(10, max_depth=0)] == ["app.main"]
+
+
+def test_parse_import_times_requires_target_module():
+    with pytest.raises(ValueError):
+        parse_import_times(REPORT, "app.other")
+
+
+@pytest.fixture(scope="module")
+def app_main_profile():
+    return median_import_profile(samples=3)
+
+
+def test_import_app_main_within_budget(app_main_profile):
+    profile, totals = app_main_profile
+
+    slowest = ", ".join(
+        f"{module} {cumulative_ms:.0f} ms"
+        for module, cumulative_ms, _ in profile.slowest(5, max_depth=2)
+    )
+    assert profile.total_ms <= settings.import_time_budget_ms, (
+        f"import app.main took {profile.total_ms:.0f} ms "
+        f"(samples: {', '.join(f'{total:.0f}' for total in totals)} ms), "
+        f"budget is {settings.import_time_budget_ms:.0f} ms; slowest: {slowest}"
+    )
+
+
+def test_import_app_main_does_not_load_numpy(app_main_profile):
+    profile, _ = app_main_profile
+
+    assert "numpy" not in {module for module, _, _ in profile.modules}
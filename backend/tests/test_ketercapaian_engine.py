@@ -0,0 +1,120 @@
+"""Tests for the vectorized CPMK and CPL achievement engine."""
+
+import numpy as np
+import pytest
+
+from app.application.services.ketercapaian_engine import KetercapaianEngine, weighted_average
+from app.infrastructure.repositories.ketercapaian_repository import PenilaianSnapshot
+
+
+def ints(*values):
+    return np.array(values, dtype=np.int64)
+
+
+def floats(*values):
+    return np.array(values, dtype=np.float64)
+
+
+@pytest.fixture
+def snapshot():
+    """
+    Two classes of students A and B.
+
+    Class 10 has components 1 and 2 (CPMK 7) and 3 (CPMK 8); B has no
+    score for components 2 and 3 yet. Class 20 is A's earlier attempt at
+    a course assessing CPMK 8 (component 4).
+    """
+    return PenilaianSnapshot(
+        enrollment_ids=ints(100, 101, 200),
+        enrollment_kelas=ints(10, 10, 20),
+        enrollment_student=ints(0, 1, 0),
+        enrollment_current=np.array([True, True, False]),
+        nims=np.array(["A", "B"]),
+        komponen_ids=ints(1, 2, 3, 4),
+        komponen_kelas=ints(10, 10, 10, 20),
+        komponen_cpmk=ints(7, 7, 8, 8),
+        komponen_bobot=floats(40, 60, 100, 100),
+        # The last two scores are out of scope: a component of another
+        # class and an unknown enrollment
+        nilai_enrollment=ints(100, 100, 100, 101, 200, 100, 999),
+        nilai_komponen=ints(1, 2, 3, 1, 4, 4, 1),
+        nilai_persen=floats(80, 90, 50, 50, 90, 10, 10),
+        cpmk_ids=ints(7, 8),
+        cpmk_batas=floats(60, 55),
+        cpl_ids=ints(1, 2),
+        relasi_cpmk=ints(7, 8, 8),
+        relasi_cpl=ints(1, 1, 2),
+        relasi_bobot=floats(30, 70, 100),
+    )
+
+
+def by_key(result):
+    return {
+        (row["id_enrollment"], row["id_cpmk"]): (row["nilai_cpmk"], row["status_tercapai"])
+        for row in result.to_rows()
+    }
+
+
+def test_weighted_average_skips_ungraded_columns():
+    scores = np.array([[80.0, np.nan], [np.nan, np.nan]])
+    weights = np.array([[1.0], [3.0]])
+
+    result = weighted_average(scores, weights)
+
+    assert result[0, 0] == 80.0
+    assert np.isnan(result[1, 0])
+
+
+def test_hitung_cpmk_weights_graded_components(snapshot):
+    result = KetercapaianEngine().hitung_cpmk(snapshot)
+
+    assert len(result) == 4
+    assert by_key(result) == {
+        (100, 7): (86.0, True),   # (80 * 40 + 90 * 60) / 100
+        (100, 8): (50.0, False),
+        (101, 7): (50.0, False),  # only component 1 graded so far
+        (200, 8): (90.0, True),
+    }
+
+
+def test_cpmk_summary(snapshot):
+    summary = KetercapaianEngine().hitung_cpmk(snapshot).summary()
+
+    assert summary[7] == {
+        "jumlah_mahasiswa": 2,
+        "rata_rata": 68.0,
+        "jumlah_tercapai": 1,
+        "persentase_tercapai": 50.0,
+    }
+    assert summary[8]["rata_rata"] == 70.0
+
+
+def test_hitung_cpl_uses_latest_attempt_and_contribution_weights(snapshot):
+    engine = KetercapaianEngine()
+
+    result = engine.hitung_cpl(snapshot, engine.hitung_cpmk(snapshot))
+
+    # A: CPMK 7 = 86, CPMK 8 = 50 (the retake, not the earlier 90)
+    assert result.nilai[0].tolist() == [60.8, 50.0]
+    # B: only CPMK 7 graded, so CPL 2 has no value yet
+    assert result.nilai[1, 0] == 50.0
+    assert np.isnan(result.nilai[1, 1])
+    assert result.summary() == {
+        1: {"jumlah_mahasiswa": 2, "rata_rata": 55.4},
+        2: {"jumlah_mahasiswa": 1, "rata_rata": 50.0},
+    }
+
+
+def test_snapshot_without_scores_gives_empty_result(snapshot):
+    snapshot.nilai_enrollment = ints()
+    snapshot.nilai_komponen = ints()
+    snapshot.nilai_persen = floats()
+    engine = KetercapaianEngine()
+
+    cpmk = engine.hitung_cpmk(snapshot)
+    cpl = engine.hitung_cpl(snapshot, cpmk)
+
+    assert len(cpmk) == 0
+    assert cpmk.to_rows() == []
+    assert np.isnan(cpl.nilai).all()
+    assert cpl.summary()[1] == {"jumlah_mahasiswa": 0, "rata_rata": None}
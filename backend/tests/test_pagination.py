@@ -0,0 +1,101 @@
+"""Tests for keyset pagination, cursors and count strategies."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg, psycopg2
+
+from app.domain.exceptions import ValidationException
+from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.infrastructure.pagination import (
+    CountStrategy,
+    ExplainJSON,
+    build_estimate_query,
+    decode_cursor,
+    encode_cursor,
+    estimate_count,
+)
+from app.infrastructure.repositories import KurikulumRepository
+
+
+@pytest.fixture
+def curricula(session):
+    session.add_all([
+        Kurikulum(
+            id_kurikulum=index,
+            id_prodi="TI" if index % 2 else "SI",
+            kode_kurikulum=f"K{index}",
+            nama_kurikulum=f"Kurikulum {index}",
+            tahun_berlaku=2010 + index // 2,
+            status=KurikulumStatus.AKTIF,
+        )
+        for index in range(1, 11)
+    ])
+    session.commit()
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor([2024, datetime(2024, 5, 1, 8, 30), "K-1"])
+    assert decode_cursor(cursor, 3) == [2024, "2024-05-01T08:30:00", "K-1"]
+    assert "=" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor([1]), "eyJhIjogMX0"])
+def test_invalid_cursor_rejected(cursor):
+    with pytest.raises(ValidationException):
+        decode_cursor(cursor, 2)
+
+
+def test_pages_cover_all_rows_newest_first(session, curricula):
+    repo = KurikulumRepository(session)
+    seen, cursor = [], None
+    while True:
+        page = repo.get_newest_page(limit=3, after=cursor, fields=["id_kurikulum", "tahun_berlaku"])
+        seen.extend(item["id_kurikulum"] for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
+
+
+def test_projection_and_exact_count(session, curricula):
+    page = KurikulumRepository(session).get_newest_page(
+        limit=2,
+        fields=["kode_kurikulum"],
+        count=CountStrategy.EXACT,
+        id_prodi="TI"
+    )
+
+    assert page.items == [{"kode_kurikulum": "K9"}, {"kode_kurikulum": "K7"}]
+    assert page.total == 5
+    assert not page.total_is_estimate
+
+
+def test_estimate_falls_back_to_exact_count_without_postgresql(session, curricula):
+    assert estimate_count(session, build_estimate_query(Kurikulum)) is None
+
+    page = KurikulumRepository(session).get_newest_page(limit=1, count=CountStrategy.ESTIMATE)
+    assert page.total == 10
+    assert not page.total_is_estimate
+
+
+@pytest.mark.parametrize("dialect, placeholders", [
+    (psycopg2.dialect(), ["%(id_prodi_1)s", "%(status_1)s"]),
+    (asyncpg.dialect(), ["$1", "$2"]),
+])
+def test_explain_binds_in_driver_paramstyle(dialect, placeholders):
+    query = build_estimate_query(Kurikulum, {"id_prodi": "TI", "status": KurikulumStatus.AKTIF})
+    compiled = ExplainJSON(query).compile(dialect=dialect)
+
+    assert compiled.string.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    for placeholder in placeholders:
+        assert placeholder in compiled.string
+
+    params = compiled.construct_params()
+    if compiled.positiontup is not None:
+        # asyncpg receives values in $n order, never the bind names
+        values = [params[name] for name in compiled.positiontup]
+        assert values == ["TI", KurikulumStatus.AKTIF]
+    else:
+        assert params == {"id_prodi_1": "TI", "status_1": KurikulumStatus.AKTIF}
@@ -0,0 +1,133 @@
+"""Tests for the two-level permission cache and its commit-time invalidation."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.permissions import Permission, compile_permissions
+from app.infrastructure import cache as cache_module
+from app.infrastructure.cache import InMemoryCacheBackend, PermissionCache, permission_key
+from app.infrastructure.database import Base
+from app.infrastructure.models.user_models import Role, User, UserRole, UserType
+
+
+def test_get_compiles_once_then_serves_local_level():
+    cache = PermissionCache()
+    loads = []
+
+    def load_roles():
+        loads.append(1)
+        return ["dosen"]
+
+    first = cache.get(1, load_roles)
+    second = cache.get(1, load_roles)
+
+    assert second is first
+    assert len(loads) == 1
+    assert first.has(Permission.INPUT_NILAI)
+    assert not first.has(Permission.MANAGE_KURIKULUM)
+
+
+def test_version_mismatch_is_a_miss():
+    cache = PermissionCache()
+    stored = cache.store(1, ["dosen"])
+
+    assert cache.lookup(1, stored.version) is stored
+    assert cache.lookup(1, compile_permissions(1, ["admin"]).version) is None
+
+
+def test_shared_level_serves_other_workers():
+    shared = InMemoryCacheBackend()
+    PermissionCache(shared=shared).store(1, ["kaprodi"])
+    other_worker = PermissionCache(shared=shared)
+
+    permissions = other_worker.lookup(1)
+
+    assert permissions.roles == ("kaprodi",)
+    assert permissions.has(Permission.APPROVE_RPS)
+    # Promoted to the local level of the other worker
+    assert other_worker.local.get(permission_key(1)) == permissions
+
+
+def test_invalidate_drops_both_levels():
+    shared = InMemoryCacheBackend()
+    cache = PermissionCache(shared=shared)
+    cache.store(1, ["dosen"])
+    cache.store(2, ["dosen"])
+
+    cache.invalidate([1])
+
+    assert cache.lookup(1) is None
+    assert cache.lookup(2) is not None
+    assert shared.get(permission_key(1)) is None
+
+
+# ===== Invalidation on user_roles changes =====
+
+@pytest.fixture
+def user_session():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[User.__table__, Role.__table__, UserRole.__table__]
+    )
+    session = Session(engine, expire_on_commit=False)
+    session.add_all([
+        User(id_user=1, username="dosen1", email="dosen1@example.ac.id",
+             password_hash="x", user_type=UserType.DOSEN),
+        Role(id_role=1, role_name="dosen"),
+        Role(id_role=2, role_name="kaprodi"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def process_cache(monkeypatch):
+    cache = PermissionCache()
+    monkeypatch.setattr(cache_module, "_permission_cache", cache)
+    return cache
+
+
+def test_role_assignment_invalidates_user_on_commit(user_session, process_cache):
+    process_cache.store(1, [])
+    process_cache.store(2, ["dosen"])
+
+    user_session.add(UserRole(id_user=1, id_role=2))
+    user_session.flush()
+    assert process_cache.lookup(1) is not None
+
+    user_session.commit()
+
+    assert process_cache.lookup(1) is None
+    assert process_cache.lookup(2) is not None
+
+
+def test_rolled_back_role_change_keeps_cache(user_session, process_cache):
+    process_cache.store(1, [])
+
+    user_session.add(UserRole(id_user=1, id_role=2))
+    user_session.flush()
+    user_session.rollback()
+    user_session.commit()
+
+    assert process_cache.lookup(1) is not None
+
+
+def test_role_change_invalidates_everyone(user_session, process_cache):
+    process_cache.store(1, ["dosen"])
+    process_cache.store(2, ["kaprodi"])
+
+    role = user_session.get(Role, 1)
+    role.description = "Dosen pengampu"
+    user_session.commit()
+
+    assert process_cache.lookup(1) is None
+    assert process_cache.lookup(2) is None
@@ -0,0 +1,211 @@
+"""Tests for the prerequisite graph and the add-prerequisite write path."""
+
+import pytest
+
+from app.application.use_cases.prasyarat_use_cases import PrasyaratUseCases
+from app.domain.entities import PrerequisiteGraph, TipePrasyarat
+from app.domain.exceptions import (
+    DuplicateException,
+    InvalidOperationException,
+    NotFoundException,
+    PrerequisiteCycleException,
+)
+from app.infrastructure.cache import CachedPrerequisiteGraphs, InMemoryCacheBackend
+from app.infrastructure.models.kurikulum_models import (
+    JenisMK,
+    Kurikulum,
+    KurikulumStatus,
+    MataKuliah,
+    PrasyaratMK,
+)
+from app.infrastructure.repositories import KurikulumRepository
+from app.infrastructure.repositories.matakuliah_repository import MataKuliahRepository
+
+WAJIB = TipePrasyarat.WAJIB
+ALTERNATIF = TipePrasyarat.ALTERNATIF
+
+
+def make_graph(edges=()):
+    semesters = {"MK1": 1, "MK2": 2, "MK3": 3, "MK4": 3, "MK5": 4}
+    return PrerequisiteGraph(1, semesters, edges)
+
+
+# ===== PrerequisiteGraph =====
+
+def test_edges_to_unknown_courses_are_ignored():
+    graph = make_graph([("MK2", "MK1", WAJIB), ("MK2", "MKX", WAJIB)])
+
+    assert graph.edge_count == 1
+    assert graph.prerequisites_of("MK2") == {"MK1": WAJIB}
+    assert graph.dependents_of("MK1") == {"MK2"}
+
+
+def test_check_new_prerequisite_rejects_cycles():
+    graph = make_graph([("MK2", "MK1", WAJIB), ("MK3", "MK2", WAJIB)])
+
+    with pytest.raises(PrerequisiteCycleException) as error:
+        graph.check_new_prerequisite("MK1", "MK3")
+    assert error.value.cycle == ["MK1", "MK3", "MK2", "MK1"]
+
+    with pytest.raises(PrerequisiteCycleException):
+        graph.check_new_prerequisite("MK1", "MK1")
+
+    graph.check_new_prerequisite("MK5", "MK3")
+
+
+def test_find_cycle_and_topological_order():
+    graph = make_graph([("MK3", "MK2", WAJIB), ("MK2", "MK1", WAJIB)])
+
+    assert graph.find_cycle() is None
+    order = graph.topological_order()
+    assert order.index("MK1") < order.index("MK2") < order.index("MK3")
+
+    cyclic = make_graph([("MK1", "MK2", WAJIB), ("MK2", "MK1", WAJIB)])
+    assert set(cyclic.find_cycle()) == {"MK1", "MK2"}
+    with pytest.raises(PrerequisiteCycleException):
+        cyclic.topological_order()
+
+
+def test_transitive_prerequisites_and_dependents():
+    graph = make_graph([("MK3", "MK2", WAJIB), ("MK2", "MK1", WAJIB), ("MK5", "MK3", WAJIB)])
+
+    assert graph.transitive_prerequisites("MK5") == {"MK1", "MK2", "MK3"}
+    assert graph.transitive_dependents("MK1") == {"MK2", "MK3", "MK5"}
+
+
+def test_semester_layers_respect_wajib_and_alternatif():
+    graph = make_graph([
+        ("MK3", "MK2", WAJIB),
+        ("MK2", "MK1", WAJIB),
+        ("MK5", "MK1", ALTERNATIF),
+        ("MK5", "MK3", ALTERNATIF),
+    ])
+
+    assert graph.semester_layers() == [["MK1", "MK4"], ["MK2", "MK5"], ["MK3"]]
+
+
+def test_semester_conflicts():
+    graph = make_graph([("MK2", "MK1", WAJIB), ("MK3", "MK4", WAJIB)])
+
+    assert graph.semester_conflicts() == [("MK3", "MK4", WAJIB)]
+
+
+def test_eligibility_with_alternatif_prerequisites():
+    graph = make_graph([
+        ("MK5", "MK1", WAJIB),
+        ("MK5", "MK3", ALTERNATIF),
+        ("MK5", "MK4", ALTERNATIF),
+    ])
+
+    assert graph.missing_prerequisites("MK5", set()) == (["MK1"], ["MK3", "MK4"])
+    assert not graph.can_take("MK5", {"MK1"})
+    assert graph.can_take("MK5", {"MK1", "MK4"})
+    assert graph.available_courses({"MK1", "MK3"}) == ["MK2", "MK4", "MK5"]
+
+
+def test_dict_round_trip():
+    graph = make_graph([("MK2", "MK1", WAJIB), ("MK5", "MK3", ALTERNATIF)])
+
+    restored = PrerequisiteGraph.from_dict(graph.to_dict())
+
+    assert restored.semesters == graph.semesters
+    assert restored.edges() == graph.edges()
+
+
+# ===== PrasyaratUseCases.add_prerequisite =====
+
+@pytest.fixture
+def kurikulum(session):
+    kurikulum = Kurikulum(
+        id_kurikulum=1,
+        id_prodi="TI",
+        kode_kurikulum="K2024",
+        nama_kurikulum="Kurikulum 2024",
+        tahun_berlaku=2024,
+        status=KurikulumStatus.DRAFT,
+    )
+    session.add(kurikulum)
+    session.add_all(
+        MataKuliah(
+            kode_mk=kode,
+            id_kurikulum=1,
+            nama_mk=f"Mata Kuliah {kode}",
+            sks=3,
+            semester=semester,
+            jenis_mk=JenisMK.WAJIB,
+        )
+        for kode, semester in [("MK1", 1), ("MK2", 2), ("MK3", 3)]
+    )
+    session.commit()
+    return kurikulum
+
+
+@pytest.fixture
+def use_cases(session):
+    mk_repo = MataKuliahRepository(session)
+    return PrasyaratUseCases(
+        session,
+        kurikulum_repo=KurikulumRepository(session),
+        mk_repo=mk_repo,
+        prerequisite_graphs=CachedPrerequisiteGraphs(mk_repo, InMemoryCacheBackend(), 60),
+    )
+
+
+def stored_edges(session):
+    return sorted(
+        (edge.kode_mk, edge.kode_mk_prasyarat)
+        for edge in session.query(PrasyaratMK).all()
+    )
+
+
+def test_add_prerequisite_stores_edge_and_refreshes_cached_graph(use_cases, session, kurikulum):
+    assert use_cases.get_prerequisites(1, "MK2") == []
+
+    use_cases.add_prerequisite(1, "MK2", "MK1")
+
+    assert stored_edges(session) == [("MK2", "MK1")]
+    assert use_cases.get_prerequisites(1, "MK2") == ["MK1"]
+
+
+def test_add_prerequisite_validates_against_database_not_cached_graph(use_cases, session, kurikulum):
+    # Cache the empty graph, then let another worker add edges behind it
+    use_cases.get_graph(1)
+    session.add_all([
+        PrasyaratMK(kode_mk="MK2", id_kurikulum=1, kode_mk_prasyarat="MK1"),
+        PrasyaratMK(kode_mk="MK3", id_kurikulum=1, kode_mk_prasyarat="MK2"),
+    ])
+    session.commit()
+
+    with pytest.raises(DuplicateException):
+        use_cases.add_prerequisite(1, "MK2", "MK1")
+    with pytest.raises(PrerequisiteCycleException):
+        use_cases.add_prerequisite(1, "MK1", "MK3")
+    assert stored_edges(session) == [("MK2", "MK1"), ("MK3", "MK2")]
+
+
+def test_concurrent_duplicate_insert_maps_to_duplicate(use_cases, session, kurikulum, monkeypatch):
+    session.add(PrasyaratMK(kode_mk="MK2", id_kurikulum=1, kode_mk_prasyarat="MK1"))
+    session.commit()
+    # The graph was read before the other writer's edge became visible
+    monkeypatch.setattr(
+        use_cases.mk_repo,
+        "get_prerequisite_graph",
+        lambda id_kurikulum: PrerequisiteGraph(id_kurikulum, {"MK1": 1, "MK2": 2, "MK3": 3}),
+    )
+
+    with pytest.raises(DuplicateException):
+        use_cases.add_prerequisite(1, "MK2", "MK1")
+    assert stored_edges(session) == [("MK2", "MK1")]
+
+
+def test_add_prerequisite_rejects_unknown_course_and_locked_curriculum(use_cases, session, kurikulum):
+    with pytest.raises(NotFoundException):
+        use_cases.add_prerequisite(1, "MK2", "MKX")
+    with pytest.raises(NotFoundException):
+        use_cases.add_prerequisite(99, "MK2", "MK1")
+
+    kurikulum.status = KurikulumStatus.AKTIF
+    session.commit()
+    with pytest.raises(InvalidOperationException):
+        use_cases.add_prerequisite(1, "MK2", "MK1")
+    assert stored_edges(session) == []
@@ -0,0 +1,114 @@
+"""Tests for per-request round-trip counting."""
+
+import pytest
+from sqlalchemy import select, text
+
+from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.infrastructure.query_stats import (
+    QueryBudgetExceeded,
+    current_round_trips,
+    fingerprint,
+    track_round_trips,
+)
+
+
+def test_counts_statements_and_commits(session):
+    with track_round_trips() as stats:
+        session.execute(text("SELECT 1"))
+        session.execute(text("SELECT 2"))
+        session.commit()
+
+    assert stats.statements == 2
+    assert stats.commits == 1
+    assert stats.total == 3
+    assert stats.db_time_ns > 0
+
+
+def test_scope_ends_with_block(session):
+    with track_round_trips() as stats:
+        assert current_round_trips() is stats
+    assert current_round_trips() is None
+
+    session.execute(text("SELECT 1"))
+    assert stats.statements == 0
+
+
+def test_nested_scopes_count_separately(session):
+    with track_round_trips() as outer:
+        session.execute(text("SELECT 1"))
+        with track_round_trips() as inner:
+            session.execute(text("SELECT 2"))
+
+    assert outer.statements == 1
+    assert inner.statements == 1
+
+
+def test_fingerprint_ignores_values():
+    assert fingerprint("SELECT * FROM cpl WHERE id_cpl = 5") == fingerprint(
+        "SELECT *  FROM cpl\nWHERE id_cpl = %(id_cpl_1)s"
+    )
+    assert fingerprint("SELECT 1 WHERE x IN (?, ?, ?)") == "SELECT ? WHERE x IN (?...)"
+
+
+def test_repeated_statements(session):
+    with track_round_trips() as stats:
+        for value in range(3):
+            session.execute(text("SELECT :value"), {"value": value})
+        session.execute(text("SELECT 'once', 1"))
+
+    repeated = stats.repeated_statements(threshold=3)
+    assert repeated == [(fingerprint("SELECT ?"), 3)]
+
+
+# ===== Query budget =====
+
+def add_curricula(session, count):
+    session.add_all(
+        Kurikulum(
+            id_kurikulum=index,
+            id_prodi="TI",
+            kode_kurikulum=f"K{index}",
+            nama_kurikulum=f"Kurikulum {index}",
+            tahun_berlaku=2000 + index,
+            status=KurikulumStatus.AKTIF,
+        )
+        for index in range(1, count + 1)
+    )
+    session.commit()
+
+
+@pytest.mark.parametrize("count", [5, 40])
+def test_list_kurikulum_stays_within_budget(client, session, query_budget, count):
+    add_curricula(session, count)
+
+    with query_budget(3) as stats:
+        response = client.get("/api/v1/kurikulum/?id_prodi=TI")
+
+    assert response.status_code == 200
+    assert len(response.json()["data"]) == count
+    assert stats.repeated_statements() == []
+
+
+def test_cached_kurikulum_detail_stays_within_budget(client, session, query_budget):
+    add_curricula(session, 1)
+    client.get("/api/v1/kurikulum/1")
+
+    # Cached entity: only the version check for the ETag reaches the database
+    with query_budget(1):
+        assert client.get("/api/v1/kurikulum/1").status_code == 200
+
+
+def test_query_budget_reports_n_plus_one(session, query_budget):
+    add_curricula(session, 4)
+    session.expire_all()
+
+    with pytest.raises(QueryBudgetExceeded) as error:
+        with query_budget(2):
+            curricula = session.scalars(select(Kurikulum)).all()
+            # Lazy loading the relationship per row: one SELECT per curriculum
+            for kurikulum in curricula:
+                list(kurikulum.cpl_list)
+
+    message = str(error.value)
+    assert message.startswith("5 statements issued, budget is 2; repeated statements:")
+    assert "4x SELECT cpl." in message
@@ -0,0 +1,103 @@
+"""Tests for read-replica routing."""
+
+import pytest
+from sqlalchemy import create_engine, select, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.database import Base
+from app.infrastructure.models.kurikulum_models import Kurikulum, KurikulumStatus
+from app.infrastructure.replicas import Replica, ReplicaSet, RoutingSession, read_only
+
+
+def sqlite_engine(nama_kurikulum):
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine, tables=[Kurikulum.__table__])
+    with engine.begin() as conn:
+        conn.execute(Kurikulum.__table__.insert().values(
+            id_kurikulum=1,
+            id_prodi="TI",
+            kode_kurikulum="K2024",
+            nama_kurikulum=nama_kurikulum,
+            tahun_berlaku=2024,
+            status=KurikulumStatus.AKTIF,
+        ))
+    return engine
+
+
+@pytest.fixture
+def replica_set():
+    return ReplicaSet([Replica(name="replica1", engine=sqlite_engine("replica"))])
+
+
+@pytest.fixture
+def routing_session(replica_set):
+    primary = sqlite_engine("primary")
+    session = RoutingSession(replicas=replica_set, bind=primary)
+    yield session
+    session.close()
+    primary.dispose()
+
+
+@read_only
+def read_name(session):
+    return session.scalar(
+        select(Kurikulum.nama_kurikulum).where(Kurikulum.id_kurikulum == 1)
+    )
+
+
+def test_read_only_reads_go_to_replica(routing_session):
+    assert read_name(routing_session) == "replica"
+    # Outside @read_only the primary is used
+    assert routing_session.scalar(select(Kurikulum.nama_kurikulum)) == "primary"
+
+
+def test_flushed_write_keeps_session_on_primary(routing_session):
+    kurikulum = routing_session.get(Kurikulum, 1)
+    kurikulum.deskripsi = "Revisi"
+    routing_session.flush()
+
+    assert read_name(routing_session) == "primary"
+
+
+def test_set_based_write_keeps_session_on_primary(routing_session):
+    routing_session.execute(
+        update(Kurikulum).where(Kurikulum.id_kurikulum == 1).values(is_primary=False)
+    )
+
+    assert read_name(routing_session) == "primary"
+
+
+def test_raw_select_does_not_count_as_write(routing_session):
+    routing_session.execute(text("SELECT 1"))
+
+    assert read_name(routing_session) == "replica"
+
+
+def test_ejected_replica_falls_back_to_primary(routing_session, replica_set):
+    replica_set.eject(replica_set.replicas[0], "connection refused")
+
+    assert read_name(routing_session) == "primary"
+    assert replica_set.status()[0]["available"] is False
+
+
+async def test_shutdown_disposes_sync_and_async_engines(monkeypatch):
+    pytest.importorskip("asyncpg")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    disposed = []
+
+    async def dispose(self, close=True):
+        disposed.append(self)
+
+    monkeypatch.setattr(AsyncEngine, "dispose", dispose)
+    async_engine = create_async_engine("postgresql+asyncpg://obe@localhost/obe")
+    replica = Replica(name="replica1", engine=sqlite_engine("replica"), async_engine=async_engine)
+
+    await ReplicaSet([replica]).shutdown()
+
+    assert disposed == [async_engine]
@@ -0,0 +1,114 @@
+"""Tests for the verified JWT claims cache."""
+
+import time
+
+import pytest
+
+from app.core import security
+from app.core.config import settings
+from app.core.security import TokenManager
+from app.core.token_cache import VerifiedClaimsCache, token_digest
+
+
+def claims(ttl: float = 60, **extra):
+    return {"sub": "user-1", "exp": time.time() + ttl, **extra}
+
+
+# ===== VerifiedClaimsCache =====
+
+def test_get_returns_copy_of_cached_claims():
+    cache = VerifiedClaimsCache()
+    digest = token_digest("token")
+    cache.set(digest, "k1", claims())
+
+    cached = cache.get(digest, {"k1"})
+    cached["sub"] = "changed"
+
+    assert cache.get(digest, {"k1"})["sub"] == "user-1"
+    assert (cache.hits, cache.misses) == (2, 0)
+
+
+def test_expired_entries_are_dropped():
+    cache = VerifiedClaimsCache()
+    digest = token_digest("token")
+    cache.set(digest, "k1", claims(ttl=-1))
+
+    assert cache.get(digest, {"k1"}) is None
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+def test_entries_of_retired_kid_are_not_served():
+    cache = VerifiedClaimsCache()
+    digest = token_digest("token")
+    cache.set(digest, "old", claims())
+
+    assert cache.get(digest, {"new"}) is None
+    assert cache.get(digest, {"old", "new"}) is None
+
+
+def test_tokens_without_numeric_exp_are_not_cached():
+    cache = VerifiedClaimsCache()
+    cache.set(token_digest("a"), "k1", {"sub": "user-1"})
+    cache.set(token_digest("b"), "k1", {"sub": "user-1", "exp": "soon"})
+
+    assert len(cache) == 0
+
+
+def test_lru_eviction_keeps_recently_used_entries():
+    cache = VerifiedClaimsCache(max_entries=2)
+    a, b, c = (token_digest(token) for token in "abc")
+    cache.set(a, "k1", claims())
+    cache.set(b, "k1", claims())
+    cache.get(a, {"k1"})
+    cache.set(c, "k1", claims())
+
+    assert cache.get(b, {"k1"}) is None
+    assert cache.get(a, {"k1"}) is not None
+    assert cache.get(c, {"k1"}) is not None
+
+
+def test_zero_capacity_disables_cache():
+    cache = VerifiedClaimsCache(max_entries=0)
+    cache.set(token_digest("a"), "k1", claims())
+
+    assert len(cache) == 0
+
+
+# ===== TokenManager.decode_token =====
+
+@pytest.fixture
+def claims_cache(monkeypatch):
+    cache = VerifiedClaimsCache()
+    monkeypatch.setattr(security, "claims_cache", cache)
+    return cache
+
+
+def test_decode_token_verifies_once_then_serves_from_cache(claims_cache):
+    token = TokenManager.create_access_token("user-1")
+
+    first = TokenManager.decode_token(token)
+    second = TokenManager.decode_token(token)
+
+    assert first == second
+    assert first["sub"] == "user-1"
+    assert (claims_cache.hits, claims_cache.misses) == (1, 1)
+
+
+def test_decode_token_rejects_cached_token_after_key_is_retired(claims_cache, monkeypatch):
+    token = TokenManager.create_access_token("user-1")
+    assert TokenManager.decode_token(token) is not None
+
+    # Rotate to a new key and drop the old one from the key ring
+    monkeypatch.setattr(settings.security, "jwt_key_id", "rotated")
+    monkeypatch.setattr(settings.security, "secret_key", "r" * 40)
+    monkeypatch.setattr(settings.security, "jwt_verification_keys", {})
+
+    assert TokenManager.decode_token(token) is None
+
+
+def test_decode_token_does_not_cache_invalid_tokens(claims_cache):
+    token = TokenManager.create_access_token("user-1")
+
+    assert TokenManager.decode_token(token[:-2] + "xx") is None
+    assert len(claims_cache) == 0
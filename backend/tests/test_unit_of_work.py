@@ -0,0 +1,70 @@
+"""Tests for UnitOfWork transaction boundaries."""
+
+import pytest
+from sqlalchemy import func, select
+
+from app.infrastructure.models.kurikulum_models import Kurikulum
+from app.infrastructure.query_stats import track_round_trips
+from app.infrastructure.repositories import KurikulumRepository
+from app.infrastructure.unit_of_work import UnitOfWork, in_unit_of_work
+
+
+def kurikulum_data(kode: str) -> dict:
+    return {
+        "id_prodi": "TI",
+        "kode_kurikulum": kode,
+        "nama_kurikulum": f"Kurikulum {kode}",
+        "tahun_berlaku": 2024,
+    }
+
+
+def count_kurikulum(session) -> int:
+    return session.scalar(select(func.count()).select_from(Kurikulum))
+
+
+def test_nested_units_commit_once(session):
+    repo = KurikulumRepository(session)
+
+    with track_round_trips() as stats:
+        with UnitOfWork(session):
+            repo.create(**kurikulum_data("K1"))
+            with UnitOfWork(session):
+                repo.create(**kurikulum_data("K2"))
+            assert in_unit_of_work(session)
+
+    assert not in_unit_of_work(session)
+    assert stats.commits == 1
+    assert count_kurikulum(session) == 2
+
+
+def test_error_rolls_back_whole_unit(session):
+    repo = KurikulumRepository(session)
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(session):
+            repo.create(**kurikulum_data("K1"))
+            with UnitOfWork(session):
+                repo.create(**kurikulum_data("K2"))
+            raise RuntimeError("gagal")
+
+    assert not in_unit_of_work(session)
+    assert count_kurikulum(session) == 0
+
+
+def test_error_in_nested_unit_propagates_to_outer(session):
+    repo = KurikulumRepository(session)
+
+    with pytest.raises(ValueError):
+        with UnitOfWork(session):
+            repo.create(**kurikulum_data("K1"))
+            with UnitOfWork(session):
+                raise ValueError("gagal")
+
+    assert count_kurikulum(session) == 0
+
+
+def test_repository_commits_outside_unit_of_work(session):
+    with track_round_trips() as stats:
+        KurikulumRepository(session).create(**kurikulum_data("K1"))
+
+    assert stats.commits == 1